@@ -118,6 +118,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"❌ Failed to stop queue processor: {e}")
     
+    # Close shared async Redis connections
+    try:
+        from langflix.core.redis_client import close_async_redis_pools
+        await close_async_redis_pools()
+    except Exception as e:
+        logger.error(f"❌ Redis cleanup failed: {e}")
+    
     # Close database connections
     try:
         from langflix import settings
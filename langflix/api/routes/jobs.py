@@ -3,9 +3,12 @@ Job management endpoints for LangFlix API
 """
 
 from fastapi import APIRouter, UploadFile, File, Form, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 import uuid
+import json
 import logging
 import asyncio
 from pathlib import Path
@@ -36,7 +39,12 @@ LANGUAGE_CODE_MAP = {
 }
 
 # Redis-based job storage for Phase 7 architecture
-from langflix.core.redis_client import get_redis_job_manager
+from langflix.core.redis_client import JOB_SUMMARY_FIELDS, get_async_redis_job_manager, get_redis_job_manager
+from langflix.settings import (
+    get_job_events_keepalive_seconds,
+    get_job_events_max_streams,
+    get_job_events_progress_interval_seconds,
+)
 from langflix.utils.temp_file_manager import get_temp_manager
 from langflix.core.error_handler import handle_error, ErrorContext
 
@@ -393,6 +401,31 @@ async def process_video_task(
         if subtitle_path:  # Dual-subtitle mode: subtitle_path may be empty
             temp_manager.cleanup_temp_file(Path(subtitle_path))
 
+def format_sse(event: Optional[Dict[str, Any]]) -> str:
+    """Format a job event as a server-sent event (None becomes a keepalive comment)."""
+    if event is None:
+        return ": keepalive\n\n"
+    return f"event: {event.get('event', 'message')}\ndata: {json.dumps(event, default=str)}\n\n"
+
+# Job event streams open in this process (each holds a Redis pub/sub connection)
+_open_event_streams = 0
+
+async def _watch_job_counted(job_id: str):
+    """watch_job that counts itself in _open_event_streams from first event until closed."""
+    global _open_event_streams
+    _open_event_streams += 1
+    events = get_async_redis_job_manager().watch_job(
+        job_id,
+        progress_interval=get_job_events_progress_interval_seconds(),
+        keepalive=get_job_events_keepalive_seconds()
+    )
+    try:
+        async for event in events:
+            yield event
+    finally:
+        _open_event_streams -= 1
+        await events.aclose()
+
 @router.post("/jobs")
 async def create_job(
     video_file: UploadFile = File(...),
@@ -497,7 +530,7 @@ async def create_job(
                      logger.warning("Uploaded subtitle file is empty.")
         
         # Get Redis job manager
-        redis_manager = get_redis_job_manager()
+        redis_manager = get_async_redis_job_manager()
         
         # Parse target_languages if provided
         target_languages_list = None
@@ -544,7 +577,7 @@ async def create_job(
             "error": ""
         }
         
-        redis_manager.create_job(job_id, job_data)
+        await redis_manager.create_job(job_id, job_data)
         
         # Start REAL background processing task with file paths (not content)
         # Dual-subtitle mode: subtitle_path may be empty - pipeline discovers from Subs/ folder
@@ -592,33 +625,34 @@ async def create_job(
 async def get_queue_status() -> Dict[str, Any]:
     """Get global queue status (processor state, queue length, etc)."""
     
-    redis_manager = get_redis_job_manager()
+    redis_manager = get_async_redis_job_manager()
     
     # Get processor status (idle, waiting, processing)
-    processor_status = redis_manager.get_processor_status()
+    processor_status = await redis_manager.get_processor_status()
     
     # Get queued jobs
-    queue_length = redis_manager.get_queue_length()
-    queue_job_ids = redis_manager.redis_client.lrange("jobs:queue", 0, -1)
+    queue_length = await redis_manager.get_queue_length()
+    queue_job_ids = await redis_manager.get_queued_job_ids(5)
     queue_jobs = []
     
-    # Fetch details for top 5 queued jobs
-    for job_id in queue_job_ids[:5]:
-        job_data = redis_manager.get_job(job_id)
-        if job_data:
-            queue_jobs.append({
-                "job_id": job_id,
-                "video_file": job_data.get("video_file", "Unknown"),
-                "episode_name": job_data.get("episode_name", ""),
-                "show_name": job_data.get("show_name", ""),
-                "created_at": job_data.get("created_at")
-            })
+    # Fetch summaries of the top 5 queued jobs in one round trip
+    queued = await redis_manager.get_jobs(queue_job_ids, fields=JOB_SUMMARY_FIELDS)
+    for job_id, job_data in queued.items():
+        queue_jobs.append({
+            "job_id": job_id,
+            "video_file": job_data.get("video_file", "Unknown"),
+            "episode_name": job_data.get("episode_name", ""),
+            "show_name": job_data.get("show_name", ""),
+            "created_at": job_data.get("created_at")
+        })
             
-    # Get currently processing job if any
-    current_job_id = redis_manager.get_currently_processing_job()
-    current_job = None
-    if current_job_id:
-        current_job = redis_manager.get_job(current_job_id)
+    # Get jobs currently claimed by workers (oldest first)
+    processing = await redis_manager.get_processing_jobs()
+    processing_jobs = [
+        {**job_data, "worker_id": processing[job_id]}
+        for job_id, job_data in (await redis_manager.get_jobs(list(processing))).items()
+    ]
+    current_job = processing_jobs[0] if processing_jobs else None
 
     # Read recent logs
     logs = read_recent_logs(50)
@@ -631,6 +665,8 @@ async def get_queue_status() -> Dict[str, Any]:
             "next_items_count": max(0, queue_length - len(queue_jobs))
         },
         "current_job": current_job,
+        "processing_jobs": processing_jobs,
+        "workers": await redis_manager.get_workers(),
         "logs": logs
     }
 
@@ -664,8 +700,8 @@ def read_recent_logs(n: int = 50) -> List[str]:
 async def get_job_status(job_id: str) -> Dict[str, Any]:
     """Get job status and details."""
     
-    redis_manager = get_redis_job_manager()
-    job = redis_manager.get_job(job_id)
+    redis_manager = get_async_redis_job_manager()
+    job = await redis_manager.get_job(job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -673,12 +709,50 @@ async def get_job_status(job_id: str) -> Dict[str, Any]:
     # Return actual job status from Redis
     return job
 
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str) -> StreamingResponse:
+    """
+    Stream job progress as server-sent events.
+    
+    The first event ("snapshot") carries the job's summary fields, followed by
+    "progress" events (coalesced to at most one per
+    processing.job_events.progress_interval_seconds) and "status" events. The
+    stream ends after the job reaches a terminal status. Returns 503 while
+    processing.job_events.max_streams streams are open.
+    """
+    if _open_event_streams >= get_job_events_max_streams():
+        logger.warning(f"Refusing event stream of job {job_id}: {_open_event_streams} streams open")
+        raise HTTPException(status_code=503, detail="Too many open job event streams")
+    
+    events = _watch_job_counted(job_id)
+    try:
+        snapshot = await events.__anext__()
+    except StopAsyncIteration:
+        raise HTTPException(status_code=404, detail="Job not found")
+    except RedisError as e:
+        logger.error(f"Cannot stream events of job {job_id}: {e}")
+        raise HTTPException(status_code=503, detail="Job store unavailable")
+    
+    async def event_stream():
+        try:
+            yield format_sse(snapshot)
+            async for event in events:
+                yield format_sse(event)
+        finally:
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/jobs/{job_id}/expressions")
 async def get_job_expressions(job_id: str) -> Dict[str, Any]:
     """Get expressions extracted from the job."""
     
-    redis_manager = get_redis_job_manager()
-    job = redis_manager.get_job(job_id)
+    redis_manager = get_async_redis_job_manager()
+    job = await redis_manager.get_job(job_id)
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -701,11 +775,35 @@ async def get_job_expressions(job_id: str) -> Dict[str, Any]:
     }
 
 @router.get("/jobs")
-async def list_jobs() -> Dict[str, Any]:
-    """List all jobs."""
-    redis_manager = get_redis_job_manager()
-    jobs = redis_manager.get_all_jobs()
+async def list_jobs(
+    status: Optional[str] = None,
+    summary: Optional[bool] = None,
+    cursor: Optional[int] = None,
+    limit: int = 50
+) -> Dict[str, Any]:
+    """
+    List jobs.
+    
+    Without a cursor all jobs are returned. With cursor=0 jobs are returned
+    page by page; pass the returned next_cursor to get the next page until it
+    is null. summary=true returns only JOB_SUMMARY_FIELDS (the default for
+    pages, so large fields such as expressions are not read). Pages filtered
+    by status have a null total (counting matches would read every job).
+    """
+    redis_manager = get_async_redis_job_manager()
+    if cursor is None:
+        jobs = await redis_manager.get_all_jobs(summary=bool(summary))
+        job_list = [job for job in jobs.values() if status is None or job.get("status") == status]
+        return {
+            "jobs": job_list,
+            "total": len(job_list)
+        }
+    
+    jobs, next_cursor, total = await redis_manager.get_jobs_page(
+        cursor=cursor, count=limit, summary=summary is not False, status=status
+    )
     return {
         "jobs": list(jobs.values()),
-        "total": len(jobs)
+        "total": total,
+        "next_cursor": next_cursor
     }
@@ -186,12 +186,24 @@ class CacheManager:
                 return entry.value
             
             # Try disk cache
-            disk_value = self._get_from_disk(key)
-            if disk_value is not None:
+            disk_data = self._read_disk_entry(key)
+            if disk_data is not None:
                 self._stats['hits'] += 1
                 self._stats['disk_reads'] += 1
                 logger.debug(f"Disk cache hit: {key}")
-                return disk_value
+                
+                # Promote to memory so repeated lookups skip unpickling
+                now = datetime.now()
+                self._memory_cache[key] = CacheEntry(
+                    key=key,
+                    value=disk_data['value'],
+                    created_at=datetime.fromisoformat(disk_data['created_at']) if disk_data.get('created_at') else now,
+                    last_accessed=now,
+                    access_count=1,
+                    size_bytes=self._get_entry_size(disk_data['value']),
+                    ttl_seconds=disk_data.get('ttl_seconds')
+                )
+                return disk_data['value']
             
             self._stats['misses'] += 1
             logger.debug(f"Cache miss: {key}")
@@ -228,6 +240,11 @@ class CacheManager:
     
     def _get_from_disk(self, key: str) -> Optional[Any]:
         """Get value from disk cache"""
+        data = self._read_disk_entry(key)
+        return data['value'] if data is not None else None
+    
+    def _read_disk_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a non-expired disk cache record ('value', 'created_at', 'ttl_seconds')"""
         try:
             cache_file = self.cache_dir / f"{key}.cache"
             if not cache_file.exists():
@@ -243,7 +260,7 @@ class CacheManager:
                     cache_file.unlink()  # Remove expired file
                     return None
             
-            return data['value']
+            return data
         except Exception as e:
             logger.warning(f"Failed to read disk cache {key}: {e}")
             return None
@@ -258,8 +275,11 @@ class CacheManager:
                 'ttl_seconds': entry.ttl_seconds
             }
             
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            # Write-then-rename: other processes never read a partial file
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
             
             self._stats['disk_writes'] += 1
             logger.debug(f"Saved to disk cache: {key}")
@@ -322,9 +342,37 @@ class CacheManager:
         """Generate cache key for expression analysis"""
         return self._generate_key("expression", chunk_text, language)
     
-    def get_subtitle_key(self, file_path: str) -> str:
-        """Generate cache key for subtitle parsing"""
-        return self._generate_key("subtitle", file_path)
+    def get_subtitle_key(self, file_path: str, version: Optional[str] = None) -> str:
+        """
+        Generate cache key for subtitle parsing.
+        
+        The key includes the file's modification time and size, so edited
+        or replaced subtitle files are re-parsed.
+        
+        Args:
+            file_path: Subtitle file path
+            version: Format version of the cached value
+        """
+        return self.get_file_key("subtitle", file_path, version)
+    
+    def get_file_key(self, prefix: str, file_path: str, *args) -> str:
+        """
+        Generate cache key for a value derived from a file.
+        
+        The key includes the file's modification time and size, so edited
+        or replaced files miss the cache.
+        
+        Args:
+            prefix: Kind of cached value (e.g. "keyframes")
+            file_path: Source file path
+            *args: Further JSON-serializable key parts (e.g. a format version)
+        """
+        try:
+            path = Path(file_path).resolve()
+            stat = path.stat()
+            return self._generate_key(prefix, str(path), stat.st_mtime_ns, stat.st_size, *args)
+        except OSError:
+            return self._generate_key(prefix, str(file_path), *args)
 
 # Global cache manager instance
 _cache_manager: Optional[CacheManager] = None
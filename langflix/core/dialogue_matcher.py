@@ -0,0 +1,214 @@
+"""
+Subtitle-to-dialogue matching for LangFlix
+
+An expression carries its dialogue lines (from the LLM); subtitle generation
+maps each subtitle cue of the context clip to one of those lines so the right
+translation is shown. DialogueMatcher prepares the dialogue lines once:
+
+- cleaned text and word counts of every line
+- an inverted index word → lines containing it (fuzzy overlap candidates)
+- one concatenated haystack, so "subtitle text is contained in line" checks
+  run as a single str.find scan instead of one test per line
+
+Only lines that can score are visited, and scoring is unchanged from the
+line-by-line scan (same scores, same tie-breaking), so results are identical.
+
+Usage:
+    matcher = get_dialogue_matcher(dialogues)
+    subtitle_to_dialogue = matcher.map_subtitles(subtitles)
+"""
+
+import bisect
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+
+from langflix.utils.expression_utils import clean_text_for_matching, is_non_speech_subtitle
+
+logger = logging.getLogger(__name__)
+
+# Cleaned text never contains newlines, so they separate lines in the haystack
+_SEPARATOR = "\n"
+
+
+class DialogueMatcher:
+    """
+    Matches subtitle cues to a fixed list of dialogue lines.
+    """
+
+    def __init__(self, dialogues: Sequence[str]):
+        """
+        Prepare dialogue lines for matching.
+
+        Args:
+            dialogues: Dialogue lines (source language)
+        """
+        self.dialogues = list(dialogues)
+        self.clean_dialogues = [clean_text_for_matching(dialogue) for dialogue in self.dialogues]
+        self._word_counts = [max(len(clean.split()), 1) for clean in self.clean_dialogues]
+
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for j, clean in enumerate(self.clean_dialogues):
+            for word in set(clean.split()):
+                self._postings[word].append(j)
+
+        self._offsets = []
+        position = 0
+        for clean in self.clean_dialogues:
+            self._offsets.append(position)
+            position += len(clean) + len(_SEPARATOR)
+        self._haystack = _SEPARATOR.join(self.clean_dialogues)
+
+    def __len__(self) -> int:
+        return len(self.dialogues)
+
+    def lines_containing(self, clean_text: str) -> List[int]:
+        """
+        Indices of dialogue lines whose cleaned text contains clean_text.
+
+        Args:
+            clean_text: Cleaned (clean_text_for_matching) text, non-empty
+
+        Returns:
+            Sorted line indices
+        """
+        if not clean_text:
+            return []
+        found = []
+        position = self._haystack.find(clean_text)
+        while position >= 0:
+            j = bisect.bisect_right(self._offsets, position) - 1
+            found.append(j)
+            if j + 1 >= len(self._offsets):
+                break
+            position = self._haystack.find(clean_text, self._offsets[j + 1])
+        return found
+
+    def _best_line(self, clean_subtitle: str, test_accumulated: str, current_dialogue_idx: int):
+        """
+        Best scoring line for a subtitle: (index, score), or (-1, 0).
+
+        Scores per line are the best of:
+        1. subtitle contained in line: subtitle words / line words
+        2. accumulated subtitles contained in line: accumulated words / line words
+        3. word overlap / subtitle words, x1.5 for the expected next line and
+           x1.1 for the current one, if above 0.5
+        The highest score wins; ties go to the lowest line index.
+        """
+        scores: Dict[int, float] = {}
+
+        subtitle_word_count = len(clean_subtitle.split())
+        for j in self.lines_containing(clean_subtitle):
+            scores[j] = subtitle_word_count / self._word_counts[j]
+
+        accumulated_word_count = len(test_accumulated.split())
+        for j in self.lines_containing(test_accumulated):
+            score = accumulated_word_count / self._word_counts[j]
+            if score > scores.get(j, 0):
+                scores[j] = score
+
+        subtitle_words = set(clean_subtitle.split())
+        if subtitle_words:
+            overlaps: Dict[int, int] = defaultdict(int)
+            for word in subtitle_words:
+                for j in self._postings.get(word, ()):
+                    overlaps[j] += 1
+            for j, overlap in overlaps.items():
+                overlap_score = overlap / len(subtitle_words)
+                # Proximity bonus: strong bias to move forward, slight bias to stay
+                if j == current_dialogue_idx + 1:
+                    overlap_score *= 1.5
+                elif j == current_dialogue_idx:
+                    overlap_score *= 1.1
+                # Relaxed threshold (0.5) to catch partial matches like "You can burn bud"
+                if overlap_score > 0.5 and overlap_score > scores.get(j, 0):
+                    scores[j] = overlap_score
+
+        best_match_idx = -1
+        best_score = 0
+        for j in sorted(scores):
+            if scores[j] > best_score:
+                best_score = scores[j]
+                best_match_idx = j
+        return best_match_idx, best_score
+
+    def map_subtitles(self, subtitles: List[Dict[str, Any]]) -> List[int]:
+        """
+        Map each subtitle to its dialogue line index (-1 if none).
+
+        Consecutive subtitles are accumulated so a line spanning several cues
+        is matched as a whole; short unmatched cues continue the current line.
+
+        Args:
+            subtitles: Subtitle dicts with 'text'
+
+        Returns:
+            Dialogue index per subtitle
+        """
+        subtitle_to_dialogue = []
+        accumulated_text = ""
+        current_dialogue_idx = -1
+
+        for subtitle in subtitles:
+            # Strict filter for metadata/credits
+            raw_text = subtitle['text'].lower()
+            if ('sync' in raw_text and 'corrected by' in raw_text) or \
+               ('==' in raw_text and 'elderman' in raw_text) or \
+               ('<font' in raw_text):
+                logger.debug(f"SKIPPING METADATA: Subtitle '{subtitle['text']}' identified as junk metadata.")
+                subtitle_to_dialogue.append(-1)
+                continue
+
+            clean_subtitle = clean_text_for_matching(subtitle['text'])
+            # Current accumulated text + this subtitle may match a full line
+            test_accumulated = (accumulated_text + " " + clean_subtitle).strip()
+
+            best_match_idx, best_score = self._best_line(clean_subtitle, test_accumulated, current_dialogue_idx)
+
+            # Update accumulated text and current dialogue index
+            if best_match_idx >= 0:
+                if best_match_idx != current_dialogue_idx:
+                    # New dialogue detected, reset accumulation
+                    accumulated_text = clean_subtitle
+                    current_dialogue_idx = best_match_idx
+                    logger.debug(f"MATCH: Subtitle '{clean_subtitle[:20]}...' -> Dialogue {best_match_idx} (Score: {best_score:.2f})")
+                else:
+                    # Same dialogue, accumulate
+                    accumulated_text = test_accumulated
+            elif is_non_speech_subtitle(subtitle['text']):
+                # Sound effect or metadata: don't map, keep accumulation state
+                best_match_idx = -1
+            elif current_dialogue_idx >= 0 and len(clean_subtitle.split()) <= 3:
+                # Very short subtitle (1-3 words) that didn't match - likely part of the previous line
+                best_match_idx = current_dialogue_idx
+                accumulated_text = test_accumulated
+                logger.debug(f"FALLBACK: Subtitle '{clean_subtitle[:20]}...' -> Dialogue {best_match_idx} (Short Continuation)")
+            else:
+                # Longer subtitle with no match - keep as -1 (will use fallback translation)
+                best_match_idx = -1
+                accumulated_text = ""
+                logger.debug(f"NO MATCH: Subtitle '{clean_subtitle[:30]}...' (Clean: '{clean_subtitle}')")
+
+            subtitle_to_dialogue.append(best_match_idx)
+
+        return subtitle_to_dialogue
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(dialogues: tuple) -> DialogueMatcher:
+    return DialogueMatcher(dialogues)
+
+
+def get_dialogue_matcher(dialogues: Sequence[str]) -> DialogueMatcher:
+    """
+    Get a (shared) matcher for a list of dialogue lines.
+
+    The same expression's dialogues are matched once per target language;
+    matchers are cached by their lines so the index is built once.
+    """
+    try:
+        return _cached_matcher(tuple(dialogues))
+    except TypeError:
+        # Unhashable entries: build an uncached matcher
+        return DialogueMatcher(dialogues)
@@ -11,12 +11,15 @@ File Structure:
         ├── 6_English.srt
         └── ...
 """
+import bisect
+import itertools
 import logging
 from typing import List, Optional, Tuple, Dict
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from langflix.core.subtitle_parser import parse_srt_file
+from langflix.core.subtitle_store import SubtitleStore
 from langflix.utils.path_utils import (
     get_subtitle_file,
     discover_subtitle_languages,
@@ -78,6 +81,12 @@ def fuzzy_match_by_timestamp(
     """
     Match source and target subtitle entries by overlapping timestamps.
     
+    Each source entry (in order) takes the unused target entry with the
+    largest overlap, or, for entries without overlap, the closest midpoint
+    within tolerance_seconds. Candidates are found by binary search over
+    time-sorted target arrays, so a full episode aligns in O((n + m) log m)
+    instead of comparing every source entry with every target entry.
+    
     Args:
         source_entries: List of SubtitleEntry from source language
         target_entries: List of SubtitleEntry from target language
@@ -89,41 +98,56 @@ def fuzzy_match_by_timestamp(
     matched_pairs = []
     used_target_indices = set()
     
+    # Target times parsed once; candidate lookups by start (overlap) and midpoint (tolerance)
+    target_starts = [t.start_seconds for t in target_entries]
+    target_ends = [t.end_seconds for t in target_entries]
+    target_mids = [(s + e) / 2 for s, e in zip(target_starts, target_ends)]
+    
+    by_start = sorted(range(len(target_entries)), key=target_starts.__getitem__)
+    sorted_starts = [target_starts[i] for i in by_start]
+    # Running max of end times (in start order): targets before this can't reach a later time
+    max_ends = list(itertools.accumulate((target_ends[i] for i in by_start), max))
+    
+    by_mid = sorted(range(len(target_entries)), key=target_mids.__getitem__)
+    sorted_mids = [target_mids[i] for i in by_mid]
+    
     for source in source_entries:
         source_start = source.start_seconds
         source_end = source.end_seconds
         source_mid = (source_start + source_end) / 2
         
-        best_match = None
+        # Targets that may overlap: start < source_end and end > source_start
+        lo = bisect.bisect_right(max_ends, source_start)
+        hi = bisect.bisect_left(sorted_starts, source_end)
+        candidates = set(by_start[lo:hi])
+        # Targets whose midpoint is within tolerance (window padded against rounding;
+        # the exact test is applied below)
+        lo = bisect.bisect_left(sorted_mids, source_mid - tolerance_seconds - 1e-9)
+        hi = bisect.bisect_right(sorted_mids, source_mid + tolerance_seconds + 1e-9)
+        candidates.update(by_mid[lo:hi])
+        
         best_overlap = -1
         best_target_idx = -1
         
-        for idx, target in enumerate(target_entries):
-            if idx in used_target_indices:
-                continue
-                
-            target_start = target.start_seconds
-            target_end = target.end_seconds
-            target_mid = (target_start + target_end) / 2
-            
+        # Lowest index wins ties, as in a front-to-back scan
+        for idx in sorted(candidates - used_target_indices):
             # Calculate overlap
-            overlap_start = max(source_start, target_start)
-            overlap_end = min(source_end, target_end)
+            overlap_start = max(source_start, target_starts[idx])
+            overlap_end = min(source_end, target_ends[idx])
             overlap = max(0, overlap_end - overlap_start)
             
             # Also check midpoint distance for short subtitles
-            mid_distance = abs(source_mid - target_mid)
+            mid_distance = abs(source_mid - target_mids[idx])
             
             # Consider a match if there's overlap OR midpoints are close
             if overlap > 0 or mid_distance < tolerance_seconds:
                 score = overlap if overlap > 0 else (1.0 / (mid_distance + 0.1))
                 if score > best_overlap:
                     best_overlap = score
-                    best_match = target
                     best_target_idx = idx
         
-        if best_match is not None:
-            matched_pairs.append((source, best_match))
+        if best_target_idx >= 0:
+            matched_pairs.append((source, target_entries[best_target_idx]))
             used_target_indices.add(best_target_idx)
     
     logger.info(
@@ -193,6 +217,18 @@ class DualSubtitle(BaseModel):
     source_entries: List[SubtitleEntry] = Field(default_factory=list)
     target_entries: List[SubtitleEntry] = Field(default_factory=list)
     media_path: Optional[str] = Field(default=None, description="Path to associated media file")
+    _source_store: Optional[SubtitleStore] = PrivateAttr(default=None)
+    _source_store_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    
+    @property
+    def source_store(self) -> SubtitleStore:
+        """Time index over the aligned source entries (rebuilt if the entry list is replaced or resized)."""
+        aligned_count = min(self.source_count, self.target_count)
+        key = (id(self.source_entries), aligned_count)
+        if self._source_store is None or self._source_store_key != key:
+            self._source_store = SubtitleStore(self.source_entries[:aligned_count])
+            self._source_store_key = key
+        return self._source_store
     
     @property
     def source_count(self) -> int:
@@ -242,12 +278,10 @@ class DualSubtitle(BaseModel):
             List of AlignedSubtitlePair objects
         """
         pairs = []
-        for i in range(min(self.source_count, self.target_count)):
-            source = self.source_entries[i]
-            if source.start_seconds >= start_time and source.end_seconds <= end_time:
-                pair = self.get_aligned_pair(i)
-                if pair:
-                    pairs.append(pair)
+        for i in self.source_store.contained_indices(start_time, end_time):
+            pair = self.get_aligned_pair(i)
+            if pair:
+                pairs.append(pair)
         return pairs
     
     def to_dialogue_format(self) -> Tuple[List[Dict], List[Dict]]:
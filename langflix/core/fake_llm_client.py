@@ -0,0 +1,106 @@
+"""
+Fake Gemini client for offline benchmarking and tests.
+
+Mimics the subset of ``genai.GenerativeModel`` used by ScriptAgent
+(``generate_content(prompt, generation_config=..., request_options=...)``
+returning an object with ``.text``). Responses are valid expression-analysis JSON built from the
+indexed dialogue lines in the prompt, and each call sleeps for a configurable
+latency so concurrency and rate limiting can be measured without an API key.
+"""
+
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+# Matches "[12] [00:00:01,000 --> 00:00:02,000] text" lines in the prompt
+_INDEXED_LINE_PATTERN = re.compile(r'^\[(\d+)\]\s*\[', re.MULTILINE)
+
+
+class FakeGeminiClient:
+    """Drop-in stand-in for a Gemini GenerativeModel"""
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        expressions_per_chunk: int = 2,
+        context_lines: int = 6
+    ):
+        """
+        Initialize fake client
+
+        Args:
+            latency_seconds: Simulated round-trip time per call
+            expressions_per_chunk: Number of expressions returned per call
+            context_lines: Number of dialogue lines in each expression's context
+        """
+        self.latency_seconds = latency_seconds
+        self.expressions_per_chunk = expressions_per_chunk
+        self.context_lines = context_lines
+
+        self._lock = threading.Lock()
+        self.call_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts: List[str] = []
+
+    def generate_content(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        request_options: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Return a canned analysis response after the configured latency
+
+        A request_options timeout shorter than the latency ends the call with
+        TimeoutError once it elapses, like a request deadline.
+        """
+        timeout = (request_options or {}).get('timeout')
+        with self._lock:
+            self.call_count += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.prompts.append(prompt)
+            call_number = self.call_count
+
+        try:
+            if timeout is not None and self.latency_seconds > timeout:
+                time.sleep(max(0.0, timeout))
+                raise TimeoutError(f"Request timed out after {timeout:.1f}s")
+            if self.latency_seconds:
+                time.sleep(self.latency_seconds)
+            text = json.dumps(self._build_response(prompt, call_number), ensure_ascii=False)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        return SimpleNamespace(text=text, candidates=[], prompt_feedback=None)
+
+    def _build_response(self, prompt: str, call_number: int) -> Dict[str, Any]:
+        indices = [int(i) for i in _INDEXED_LINE_PATTERN.findall(prompt)]
+        max_idx = max(indices) if indices else 0
+
+        expressions = []
+        if indices:
+            span = max(1, self.context_lines)
+            for n in range(self.expressions_per_chunk):
+                start = min(n * span, max_idx)
+                end = min(start + span - 1, max_idx)
+                expressions.append({
+                    "expression": f"fake expression {call_number}-{n + 1}",
+                    "expression_translation": f"fake translation {call_number}-{n + 1}",
+                    "expression_dialogue_index": start,
+                    "context_start_index": start,
+                    "context_end_index": end,
+                    "title": f"Fake title {call_number}-{n + 1}",
+                    "catchy_keywords": ["fake"],
+                    "scene_type": "dialogue",
+                })
+
+        return {
+            "chunk_summary": f"Fake summary for call {call_number}",
+            "expressions": expressions,
+        }
@@ -0,0 +1,250 @@
+"""
+Persistent, content-addressed cache for LLM responses.
+
+Unlike LLMTestCache (a dev-only, single-slot cache controlled by test_llm),
+this cache is meant for production: every response is keyed by a hash of
+(model name, generation config, full prompt text), so re-running an episode
+with identical inputs (e.g. after a font or layout change) costs zero LLM
+calls, while any change to the prompt, model or config is a guaranteed miss.
+
+Entries live in a single SQLite database so several processes (API worker,
+queue processor, CLI) can share it. The cache is bounded by total response
+size and evicts least-recently-used entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_accessed ON llm_responses(last_accessed);
+"""
+
+
+class LLMResponseCache:
+    """SQLite-backed LRU cache of LLM responses"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_size_bytes: int = 512 * 1024 * 1024,
+        enabled: bool = True,
+        bypass: bool = False
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            db_path: SQLite database file (created on first use)
+            max_size_bytes: Maximum total size of cached responses before LRU eviction
+            enabled: If False, every operation is a no-op
+            bypass: If True, lookups always miss but fresh responses are still stored
+                (forces new LLM calls while refreshing the cache)
+        """
+        self.db_path = Path(db_path)
+        self.max_size_bytes = max_size_bytes
+        self.enabled = enabled
+        self.bypass = bypass
+
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'writes': 0,
+            'evictions': 0,
+            'errors': 0
+        }
+
+    @staticmethod
+    def make_key(model_name: str, generation_config: Optional[Dict[str, Any]], prompt: str) -> str:
+        """Build the content-addressed key for a request"""
+        payload = json.dumps(
+            {
+                'model': model_name,
+                'generation_config': generation_config or {},
+                'prompt': prompt
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _ensure_dir(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Returns:
+            Cached response text, or None on miss / bypass / disabled cache
+        """
+        if not self.enabled:
+            return None
+        if self.bypass:
+            with self._lock:
+                self._stats['bypassed'] += 1
+            return None
+
+        with self._lock:
+            try:
+                if not self.db_path.exists():
+                    self._stats['misses'] += 1
+                    return None
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        "SELECT response FROM llm_responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is None:
+                        self._stats['misses'] += 1
+                        return None
+                    with conn:
+                        conn.execute(
+                            "UPDATE llm_responses SET last_accessed = ?, hit_count = hit_count + 1 WHERE key = ?",
+                            (time.time(), key)
+                        )
+                    self._stats['hits'] += 1
+                    return row[0]
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self._stats['errors'] += 1
+                logger.warning(f"LLM response cache read failed: {e}")
+                return None
+
+    def put(self, key: str, response: str, model_name: str = "") -> None:
+        """Store a response and evict least-recently-used entries if over budget"""
+        if not self.enabled:
+            return
+
+        size_bytes = len(response.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            try:
+                self._ensure_dir()
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.execute(
+                            """
+                            INSERT INTO llm_responses (key, model, response, size_bytes, created_at, last_accessed)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                            ON CONFLICT(key) DO UPDATE SET
+                                response = excluded.response,
+                                size_bytes = excluded.size_bytes,
+                                last_accessed = excluded.last_accessed
+                            """,
+                            (key, model_name, response, size_bytes, now, now)
+                        )
+                        self._stats['writes'] += 1
+                        self._evict(conn)
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self._stats['errors'] += 1
+                logger.warning(f"LLM response cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until total size fits the budget"""
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        evicted = 0
+        for key, size_bytes in conn.execute(
+            "SELECT key, size_bytes FROM llm_responses ORDER BY last_accessed ASC"
+        ).fetchall():
+            if total <= self.max_size_bytes:
+                break
+            conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            total -= size_bytes
+            evicted += 1
+
+        self._stats['evictions'] += evicted
+        logger.debug(f"LLM response cache evicted {evicted} entries")
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        if not self.enabled or not self.db_path.exists():
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM llm_responses")
+            finally:
+                conn.close()
+        logger.info("LLM response cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (counters are per-process, sizes are global)"""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = round(stats['hits'] / lookups * 100, 2) if lookups else 0
+            stats['entries'] = 0
+            stats['size_bytes'] = 0
+            if self.enabled and self.db_path.exists():
+                try:
+                    conn = self._connect()
+                    try:
+                        entries, size = conn.execute(
+                            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+                        ).fetchone()
+                        stats['entries'] = entries
+                        stats['size_bytes'] = size
+                    finally:
+                        conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache stats failed: {e}")
+            return stats
+
+
+# Global instance
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get the global LLM response cache configured from settings"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            from langflix import settings
+            bypass_env = os.getenv("LANGFLIX_LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+            _response_cache = LLMResponseCache(
+                db_path=settings.get_llm_response_cache_path(),
+                max_size_bytes=settings.get_llm_response_cache_max_size_mb() * 1024 * 1024,
+                enabled=settings.is_llm_response_cache_enabled(),
+                bypass=settings.get_llm_response_cache_bypass() or bypass_env
+            )
+        return _response_cache
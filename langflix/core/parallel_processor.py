@@ -369,6 +369,32 @@ class ResourceManager:
         available_memory = self.memory_info['available_gb']
         return available_memory / self.cpu_count
 
+    def get_render_workers(self, memory_per_render_gb: float) -> int:
+        """
+        Get number of concurrent video render workers
+        
+        Each render runs a multi-threaded ffmpeg encode, so it is bounded like a
+        CPU-intensive task. A render needing more memory than one worker's share
+        occupies several worker slots.
+        
+        Args:
+            memory_per_render_gb: Estimated peak memory of one render
+            
+        Returns:
+            Number of render workers (at least 1)
+        """
+        # Refresh: available memory changes between batches
+        self.memory_info = self._get_memory_info()
+        cpu_workers = self.get_optimal_workers("cpu_intensive")
+        
+        limit_per_worker = self.get_memory_limit_per_worker()
+        if memory_per_render_gb <= 0 or limit_per_worker <= 0:
+            return cpu_workers
+        
+        slots_per_render = max(1.0, memory_per_render_gb / limit_per_worker)
+        memory_workers = int(self.cpu_count / slots_per_render)
+        return max(1, min(cpu_workers, memory_workers))
+
 # Global instances
 _resource_manager = ResourceManager()
 _expression_processor = ExpressionBatchProcessor()
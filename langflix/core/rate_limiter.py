@@ -0,0 +1,196 @@
+"""
+Rate limiting for LLM API calls.
+
+Gemini enforces per-minute quotas on both request count and token volume.
+When several chunks are analyzed concurrently, every worker must draw from
+the same budget, so this module provides a thread-safe token bucket and a
+limiter that combines a requests/minute and a tokens/minute bucket.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate_per_second`` up to ``capacity``.
+    ``acquire`` reserves tokens immediately (the balance may go negative) and
+    sleeps until the reservation is covered, so concurrent callers are served
+    in arrival order without busy waiting.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        rate_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize token bucket
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            rate_per_second: Refill rate
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if capacity <= 0 or rate_per_second <= 0:
+            raise ValueError("capacity and rate_per_second must be positive")
+
+        self.capacity = float(capacity)
+        self.rate_per_second = float(rate_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Reserve tokens without sleeping.
+
+        Args:
+            amount: Number of tokens (clamped to capacity so it can always be served)
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+            self._last_refill = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def refund(self, amount: float) -> None:
+        """Give back tokens of a reservation that will not be used"""
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Acquire tokens, sleeping until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(amount)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class LLMRateLimiter:
+    """
+    Combined requests/minute and tokens/minute limiter for LLM calls.
+
+    Either limit may be None (unlimited).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize LLM rate limiter
+
+        Args:
+            requests_per_minute: Maximum requests per minute (None = unlimited)
+            tokens_per_minute: Maximum tokens (prompt + expected output) per minute (None = unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._sleep = sleep
+        self._request_bucket = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60.0, clock=clock, sleep=sleep)
+            if requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0, clock=clock, sleep=sleep)
+            if tokens_per_minute else None
+        )
+        self._stats_lock = threading.Lock()
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured"""
+        return self._request_bucket is not None or self._token_bucket is not None
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Rough token estimate for a prompt (~4 characters per token)"""
+        return len(text) // 4 + 1
+
+    def acquire(self, tokens: int = 0, max_wait: Optional[float] = None) -> float:
+        """
+        Block until one request carrying ``tokens`` tokens may be sent.
+
+        Args:
+            tokens: Tokens (prompt + expected output) the request will use
+            max_wait: Longest acceptable wait in seconds (None = unbounded)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the wait would exceed max_wait (nothing is reserved)
+        """
+        wait = 0.0
+        if self._request_bucket:
+            wait = max(wait, self._request_bucket.reserve(1))
+        if self._token_bucket and tokens:
+            wait = max(wait, self._token_bucket.reserve(tokens))
+        if max_wait is not None and wait > max_wait:
+            if self._request_bucket:
+                self._request_bucket.refund(1)
+            if self._token_bucket and tokens:
+                self._token_bucket.refund(tokens)
+            raise TimeoutError(f"LLM rate limit wait of {wait:.1f}s exceeds {max(0.0, max_wait):.1f}s")
+        if wait > 0:
+            logger.info(f"⏳ LLM rate limit: waiting {wait:.1f}s before next request")
+            self._sleep(wait)
+
+        with self._stats_lock:
+            self.total_requests += 1
+            self.total_wait_seconds += wait
+        return wait
+
+
+# Process-wide limiter shared by all agents
+_llm_rate_limiter: Optional[LLMRateLimiter] = None
+_llm_rate_limiter_lock = threading.Lock()
+
+
+def get_llm_rate_limiter() -> LLMRateLimiter:
+    """Get the process-wide LLM rate limiter configured from settings"""
+    global _llm_rate_limiter
+    with _llm_rate_limiter_lock:
+        if _llm_rate_limiter is None:
+            from langflix import settings
+            _llm_rate_limiter = LLMRateLimiter(
+                requests_per_minute=settings.get_llm_requests_per_minute(),
+                tokens_per_minute=settings.get_llm_tokens_per_minute()
+            )
+            if _llm_rate_limiter.enabled:
+                logger.info(
+                    f"LLM rate limiter: {_llm_rate_limiter.requests_per_minute or '∞'} req/min, "
+                    f"{_llm_rate_limiter.tokens_per_minute or '∞'} tokens/min"
+                )
+        return _llm_rate_limiter
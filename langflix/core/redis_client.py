@@ -3,15 +3,352 @@ Redis client for shared job state management in Phase 7 architecture.
 """
 
 import redis
+import asyncio
 import json
 import logging
 import time
-from typing import Dict, Any, Optional, List
+import weakref
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
 from datetime import datetime, timezone
 import os
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel carrying job state changes (JSON: job_id, event, status, ...)
+JOB_EVENTS_CHANNEL = "jobs:events"
+
+# Statuses after which a job does not change anymore
+TERMINAL_JOB_STATUSES = ("COMPLETED", "FAILED", "CANCELLED")
+
+# Small job hash fields read by list/queue views (see RedisJobManager.get_jobs)
+JOB_SUMMARY_FIELDS: Tuple[str, ...] = (
+    "job_id", "status", "progress", "current_step", "error", "media_id",
+    "video_file", "subtitle_file", "show_name", "episode_name", "language_code",
+    "created_at", "updated_at", "completed_at", "failed_at",
+)
+
+
+def _encode_job_updates(updates: Dict[str, Any]) -> Dict[str, str]:
+    """Convert job field values to the strings stored in the job hash."""
+    string_updates = {}
+    for key, value in updates.items():
+        if isinstance(value, (int, float)):
+            string_updates[key] = str(value)
+        elif isinstance(value, bool):
+            string_updates[key] = str(value).lower()
+        elif isinstance(value, datetime):
+            string_updates[key] = value.isoformat()
+        elif isinstance(value, (list, dict)):
+            # Serialize lists and dicts as JSON for proper storage/retrieval
+            string_updates[key] = json.dumps(value, default=str)
+        elif value is None:
+            string_updates[key] = "None"
+        else:
+            string_updates[key] = str(value)
+    return string_updates
+
+
+def _without_backward_progress(job_id: str, updates: Dict[str, Any], current_progress: Optional[str]) -> Dict[str, Any]:
+    """Drop a progress update lower than the stored progress (progress bars never go backwards)."""
+    if 'progress' not in updates or current_progress is None:
+        return updates
+    current = float(current_progress)
+    new_progress = float(updates['progress'])
+    if new_progress >= current:
+        return updates
+    logger.debug(f"⏭️ Skipping progress update for job {job_id}: {new_progress}% < {current}% (preventing backward progress)")
+    # Still update other fields like current_step
+    return {k: v for k, v in updates.items() if k != 'progress'}
+
+
+def job_events_channel(job_id: str) -> str:
+    """Pub/sub channel carrying every event of one job, including progress events."""
+    return f"{JOB_EVENTS_CHANNEL}:{job_id}"
+
+
+def _job_event_message(job_id: str, event: str, data: Dict[str, Any]) -> str:
+    return json.dumps({"job_id": job_id, "event": event, "at": datetime.now(timezone.utc).isoformat(), **data}, default=str)
+
+
+def _job_update_event(updates: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Event to publish for a job update.
+    
+    Returns:
+        ("status", fields) if the status is set, ("progress", fields) if only
+        progress or current step changed, None otherwise
+    """
+    data = {}
+    if 'progress' in updates:
+        data['progress'] = float(updates['progress'])
+    if 'current_step' in updates:
+        data['current_step'] = updates['current_step']
+    if 'status' in updates:
+        if updates.get('error'):
+            data['error'] = updates['error']
+        return "status", {"status": str(updates['status']), **data}
+    if data:
+        return "progress", data
+    return None
+
+
+def _parse_event_message(message: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Decode a pub/sub job event message (None for subscribe confirmations and malformed data)."""
+    if not message or message.get('type') != 'message':
+        return None
+    try:
+        return json.loads(message['data'])
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def _decode_job(job_data: Dict[str, str]) -> Dict[str, Any]:
+    """Convert the string values of a job hash back to their types (in place)."""
+    if 'progress' in job_data:
+        job_data['progress'] = float(job_data['progress'])
+    if 'max_expressions' in job_data:
+        job_data['max_expressions'] = int(job_data['max_expressions'])
+    if 'test_mode' in job_data:
+        job_data['test_mode'] = job_data['test_mode'].lower() == 'true'
+    if 'no_shorts' in job_data:
+        job_data['no_shorts'] = job_data['no_shorts'].lower() == 'true'
+    
+    # Deserialize JSON fields (expressions, educational_videos, short_videos)
+    json_fields = ['expressions', 'educational_videos', 'short_videos']
+    for field in json_fields:
+        if field in job_data:
+            try:
+                # Try to parse as JSON
+                if job_data[field] and job_data[field] != 'None' and job_data[field] != '[]':
+                    job_data[field] = json.loads(job_data[field])
+                else:
+                    job_data[field] = []
+            except (json.JSONDecodeError, TypeError):
+                # If parsing fails, try to handle legacy string format
+                if job_data[field] == '[]' or job_data[field] == 'None':
+                    job_data[field] = []
+                # Otherwise keep as string (for backwards compatibility)
+                pass
+    
+    # Handle final_video field (might be "None" string or JSON)
+    if 'final_video' in job_data:
+        if job_data['final_video'] == 'None' or job_data['final_video'] == '':
+            job_data['final_video'] = None
+        else:
+            try:
+                # Try to parse as JSON in case it's a dict
+                job_data['final_video'] = json.loads(job_data['final_video'])
+            except (json.JSONDecodeError, TypeError):
+                # Keep as string if not valid JSON
+                pass
+    
+    return job_data
+
+
+# Commands shared by RedisJobManager and AsyncRedisJobManager. The _queue_*
+# builders only add commands to a pipeline (sync or asyncio) and return it; the
+# caller executes it, so both managers send exactly the same round trips.
+
+# Job hashes expire after 24 hours
+JOB_TTL_SECONDS = 86400
+
+
+def _processing_key(worker_id: str) -> str:
+    """List of the jobs a worker has claimed (see the lease-based work queue below)."""
+    return f"jobs:processing:{worker_id}"
+
+
+def _queue_create_job(pipe, job_id: str, job_data: Dict[str, Any]):
+    job_data['created_at'] = datetime.now(timezone.utc).isoformat()
+    job_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    pipe.hset(f"job:{job_id}", mapping=job_data)
+    pipe.expire(f"job:{job_id}", JOB_TTL_SECONDS)
+    # Add to job list for tracking
+    pipe.sadd("jobs:active", job_id)
+    return pipe
+
+
+def _queue_job_event(pipe, job_id: str, event: str, data: Dict[str, Any]):
+    message = _job_event_message(job_id, event, data)
+    pipe.publish(JOB_EVENTS_CHANNEL, message)
+    pipe.publish(job_events_channel(job_id), message)
+    return pipe
+
+
+def _queue_job_update(pipe, job_id: str, updates: Dict[str, Any]):
+    """Write a job update and publish its event (updates already checked for backward progress)."""
+    pipe.hset(f"job:{job_id}", mapping=_encode_job_updates(updates))
+    event = _job_update_event(updates)
+    if event is not None:
+        name, data = event
+        if name == "status":
+            _queue_job_event(pipe, job_id, name, data)
+        else:
+            # Progress stays off JOB_EVENTS_CHANNEL (see publish_job_progress)
+            pipe.publish(job_events_channel(job_id), _job_event_message(job_id, name, data))
+    return pipe
+
+
+def _queue_job_reads(pipe, job_ids: List[str], fields: Optional[Tuple[str, ...]]):
+    for job_id in job_ids:
+        if fields:
+            pipe.hmget(f"job:{job_id}", list(fields))
+        else:
+            pipe.hgetall(f"job:{job_id}")
+    return pipe
+
+
+def _decode_job_rows(job_ids: List[str], rows: List[Any], fields: Optional[Tuple[str, ...]]) -> Dict[str, Dict[str, Any]]:
+    jobs = {}
+    for job_id, row in zip(job_ids, rows):
+        if fields:
+            row = {field: value for field, value in zip(fields, row) if value is not None}
+        if row:
+            jobs[job_id] = _decode_job(row)
+    return jobs
+
+
+def _queue_jobs_page_reads(pipe, job_ids: List[str], fields: Optional[Tuple[str, ...]], status: Optional[str]):
+    if status is None:
+        # Filtered pages have no total: counting matches would take a full scan
+        pipe.scard("jobs:active")
+    return _queue_job_reads(pipe, job_ids, fields)
+
+
+def _decode_jobs_page(
+    job_ids: List[str],
+    results: List[Any],
+    fields: Optional[Tuple[str, ...]],
+    status: Optional[str]
+) -> Tuple[Dict[str, Dict[str, Any]], Optional[int]]:
+    """Decode _queue_jobs_page_reads results into (jobs with the given status, total or None)."""
+    if status is None:
+        return _decode_job_rows(job_ids, results[1:], fields), results[0]
+    jobs = _decode_job_rows(job_ids, results, fields)
+    return {job_id: job for job_id, job in jobs.items() if job.get('status') == status}, None
+
+
+def _processor_status_key(worker_id: str) -> str:
+    return f"jobs:processor_status:{worker_id}"
+
+
+def _processor_status_message(status: str, details: Optional[Dict[str, Any]]) -> str:
+    return json.dumps({
+        "status": status,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        **(details or {})
+    })
+
+
+# Order in which worker states represent the whole processor (first found wins)
+_PROCESSOR_STATUS_PRIORITY = ("processing", "waiting", "paused", "idle")
+
+
+def _aggregate_processor_status(workers: List[str], rows: List[Optional[str]]) -> Dict[str, Any]:
+    """
+    Combine per-worker statuses into one processor status.
+    
+    The top level is the status of the busiest worker (so a busy node is never
+    hidden by an idle one), with job_ids of all processing workers; "workers"
+    maps each live worker to its own status.
+    """
+    statuses = {worker_id: json.loads(row) for worker_id, row in zip(workers, rows) if row}
+    if not statuses:
+        return {"status": "unknown", "updated_at": None, "workers": {}}
+    
+    def rank(item):
+        status = item[1].get('status')
+        order = _PROCESSOR_STATUS_PRIORITY.index(status) if status in _PROCESSOR_STATUS_PRIORITY else len(_PROCESSOR_STATUS_PRIORITY)
+        return order, item[0]
+    
+    _, top = min(statuses.items(), key=rank)
+    aggregate = {**top, "workers": statuses}
+    if top.get('status') == 'processing':
+        job_ids = [job_id for status in statuses.values() if status.get('status') == 'processing'
+                   for job_id in status.get('job_ids', [])]
+        busy = sum(1 for status in statuses.values() if status.get('status') == 'processing')
+        aggregate['job_ids'] = job_ids
+        aggregate['message'] = f"Processing {len(job_ids)} job(s) on {busy} worker(s)"
+    return aggregate
+
+
+def _queue_register_worker(pipe, worker_id: str, ttl_seconds: float):
+    pipe.sadd("jobs:workers", worker_id)
+    pipe.set(f"jobs:worker:{worker_id}", datetime.now(timezone.utc).isoformat(), px=int(ttl_seconds * 1000))
+    return pipe
+
+
+def _queue_unregister_worker(pipe, worker_id: str):
+    pipe.srem("jobs:workers", worker_id)
+    pipe.delete(f"jobs:worker:{worker_id}", _processor_status_key(worker_id))
+    return pipe
+
+
+def _queue_lease(pipe, worker_id: str, job_id: str, lease_ttl_seconds: float):
+    """Take the lease on a job just moved into the worker's processing list."""
+    pipe.set(f"jobs:lease:{job_id}", worker_id, px=int(lease_ttl_seconds * 1000))
+    # Make sure reapers scan this worker's processing list
+    pipe.sadd("jobs:workers", worker_id)
+    return pipe
+
+
+def _queue_heartbeat(pipe, worker_id: str, job_ids: List[str], lease_ttl_seconds: float):
+    """Read the current owner of each job lease, then refresh the worker and status keys."""
+    for job_id in job_ids:
+        pipe.get(f"jobs:lease:{job_id}")
+    pipe.set(f"jobs:worker:{worker_id}", datetime.now(timezone.utc).isoformat(), px=int(lease_ttl_seconds * 1000))
+    # Status is only written on changes, so it lives as long as the worker heartbeats
+    pipe.pexpire(_processor_status_key(worker_id), int(lease_ttl_seconds * 1000))
+    return pipe
+
+
+def _split_lease_owners(worker_id: str, job_ids: List[str], owners: List[Optional[str]]) -> Tuple[List[str], List[str]]:
+    """Split heartbeat results into (held, lost) job IDs."""
+    held = [job_id for job_id, owner in zip(job_ids, owners) if owner == worker_id]
+    lost = [job_id for job_id, owner in zip(job_ids, owners) if owner != worker_id]
+    if lost:
+        logger.warning(f"⚠️ Worker {worker_id} lost leases on jobs: {lost}")
+    return held, lost
+
+
+def _queue_lease_renewals(pipe, job_ids: List[str], lease_ttl_seconds: float):
+    for job_id in job_ids:
+        pipe.pexpire(f"jobs:lease:{job_id}", int(lease_ttl_seconds * 1000))
+    return pipe
+
+
+def _queue_release(pipe, worker_id: str, job_id: str, requeue: bool):
+    """Drop the lease of a job already removed from the worker's processing list."""
+    pipe.delete(f"jobs:lease:{job_id}")
+    if requeue:
+        # RPUSH: consumers pop from the right, so the job is next in line
+        pipe.rpush("jobs:queue", job_id)
+        logger.info(f"↩️ Job {job_id} requeued by worker {worker_id}")
+    return pipe
+
+
+def _processing_by_job(workers: List[str], job_lists: List[List[str]]) -> Dict[str, str]:
+    """Map job ID to worker ID from the workers' processing lists (oldest claim first)."""
+    processing = {}
+    for worker_id, job_ids in zip(workers, job_lists):
+        for job_id in reversed(job_ids):
+            processing[job_id] = worker_id
+    return processing
+
+
+def _lease_expiry_updates(worker_id: str, job_id: str, requeues: int, max_requeues: int) -> Tuple[str, Dict[str, Any]]:
+    """Outcome ("requeued" or "failed") and job update for a job whose lease expired."""
+    if requeues > max_requeues:
+        logger.error(f"❌ Job {job_id} failed after {requeues} lease expiries")
+        return "failed", {
+            "status": "FAILED",
+            "error": f"Job lease expired {requeues} times (worker {worker_id})",
+            "failed_at": datetime.now(timezone.utc).isoformat()
+        }
+    logger.warning(f"↩️ Job {job_id} requeued: lease of worker {worker_id} expired")
+    return "requeued", {"status": "QUEUED", "current_step": "Requeued after worker lease expired"}
+
+
 class RedisJobManager:
     """Redis-based job state management for Flask-FastAPI communication."""
     
@@ -19,6 +356,10 @@ class RedisJobManager:
         """Initialize Redis connection."""
         if redis_url is None:
             redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        self.redis_url = redis_url
+        # redis.asyncio client for async_manager; None uses the running event
+        # loop's shared client (see _get_async_client), so nothing loop-bound is cached
+        self._async_client = None
         
         try:
             self.redis_client = redis.from_url(redis_url, decode_responses=True)
@@ -32,18 +373,7 @@ class RedisJobManager:
     def create_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
         """Create a new job in Redis."""
         try:
-            job_data['created_at'] = datetime.now(timezone.utc).isoformat()
-            job_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-            
-            # Store job data as JSON
-            self.redis_client.hset(f"job:{job_id}", mapping=job_data)
-            
-            # Set expiration (24 hours)
-            self.redis_client.expire(f"job:{job_id}", 86400)
-            
-            # Add to job list for tracking
-            self.redis_client.sadd("jobs:active", job_id)
-            
+            _queue_create_job(self.redis_client.pipeline(), job_id, job_data).execute()
             logger.info(f"✅ Job {job_id} created in Redis")
             return True
         except Exception as e:
@@ -57,40 +387,14 @@ class RedisJobManager:
             
             # Ensure progress only increases (prevent progress bar from going backwards)
             if 'progress' in updates:
-                current_job = self.get_job(job_id)
-                if current_job and 'progress' in current_job:
-                    current_progress = float(current_job['progress'])
-                    new_progress = float(updates['progress'])
-                    # Only update if new progress is greater than current
-                    if new_progress < current_progress:
-                        logger.debug(f"⏭️ Skipping progress update for job {job_id}: {new_progress}% < {current_progress}% (preventing backward progress)")
-                        # Remove progress from updates to prevent backward movement
-                        updates = {k: v for k, v in updates.items() if k != 'progress'}
-                        # But still update other fields like current_step
-                        if not updates:
-                            return True  # Nothing to update
-            
-            # Convert all values to strings for Redis storage
-            string_updates = {}
-            for key, value in updates.items():
-                if isinstance(value, (int, float)):
-                    string_updates[key] = str(value)
-                elif isinstance(value, bool):
-                    string_updates[key] = str(value).lower()
-                elif isinstance(value, datetime):
-                    string_updates[key] = value.isoformat()
-                elif isinstance(value, (list, dict)):
-                    # Serialize lists and dicts as JSON for proper storage/retrieval
-                    string_updates[key] = json.dumps(value, default=str)
-                elif value is None:
-                    string_updates[key] = "None"
-                else:
-                    string_updates[key] = str(value)
+                updates = _without_backward_progress(
+                    job_id, updates, self.redis_client.hget(f"job:{job_id}", "progress")
+                )
             
-            # Update job data
-            self.redis_client.hset(f"job:{job_id}", mapping=string_updates)
+            # Store the fields and publish the matching event in one round trip
+            _queue_job_update(self.redis_client.pipeline(transaction=False), job_id, updates).execute()
             
-            logger.debug(f"✅ Job {job_id} updated: {string_updates}")
+            logger.debug(f"✅ Job {job_id} updated: {updates}")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to update job {job_id}: {e}")
@@ -102,67 +406,87 @@ class RedisJobManager:
             job_data = self.redis_client.hgetall(f"job:{job_id}")
             if not job_data:
                 return None
-            
-            # Convert string values back to appropriate types
-            if 'progress' in job_data:
-                job_data['progress'] = float(job_data['progress'])
-            if 'max_expressions' in job_data:
-                job_data['max_expressions'] = int(job_data['max_expressions'])
-            if 'test_mode' in job_data:
-                job_data['test_mode'] = job_data['test_mode'].lower() == 'true'
-            if 'no_shorts' in job_data:
-                job_data['no_shorts'] = job_data['no_shorts'].lower() == 'true'
-            
-            # Deserialize JSON fields (expressions, educational_videos, short_videos)
-            json_fields = ['expressions', 'educational_videos', 'short_videos']
-            for field in json_fields:
-                if field in job_data:
-                    try:
-                        # Try to parse as JSON
-                        if job_data[field] and job_data[field] != 'None' and job_data[field] != '[]':
-                            job_data[field] = json.loads(job_data[field])
-                        else:
-                            job_data[field] = []
-                    except (json.JSONDecodeError, TypeError):
-                        # If parsing fails, try to handle legacy string format
-                        if job_data[field] == '[]' or job_data[field] == 'None':
-                            job_data[field] = []
-                        # Otherwise keep as string (for backwards compatibility)
-                        pass
-            
-            # Handle final_video field (might be "None" string or JSON)
-            if 'final_video' in job_data:
-                if job_data['final_video'] == 'None' or job_data['final_video'] == '':
-                    job_data['final_video'] = None
-                else:
-                    try:
-                        # Try to parse as JSON in case it's a dict
-                        job_data['final_video'] = json.loads(job_data['final_video'])
-                    except (json.JSONDecodeError, TypeError):
-                        # Keep as string if not valid JSON
-                        pass
-            
-            return job_data
+            return _decode_job(job_data)
         except Exception as e:
             logger.error(f"❌ Failed to get job {job_id}: {e}")
             return None
     
-    def get_all_jobs(self) -> Dict[str, Dict[str, Any]]:
-        """Get all active jobs."""
-        try:
-            job_ids = self.redis_client.smembers("jobs:active")
-            jobs = {}
-            
-            for job_id in job_ids:
-                job_data = self.get_job(job_id)
-                if job_data:
-                    jobs[job_id] = job_data
+    def get_jobs(self, job_ids: List[str], fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many jobs in one pipelined round trip.
+        
+        Args:
+            job_ids: Jobs to fetch
+            fields: Only read these hash fields (e.g. JOB_SUMMARY_FIELDS), so large
+                fields such as expressions are neither transferred nor decoded
             
-            return jobs
+        Returns:
+            Mapping of job ID to decoded job data, in job_ids order (missing jobs omitted)
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        try:
+            pipe = _queue_job_reads(self.redis_client.pipeline(), job_ids, fields)
+            return _decode_job_rows(job_ids, pipe.execute(), fields)
+        except Exception as e:
+            logger.error(f"❌ Failed to get {len(job_ids)} jobs: {e}")
+            return {}
+    
+    def get_all_jobs(self, summary: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all active jobs (two round trips regardless of the number of jobs).
+        
+        Args:
+            summary: Only read JOB_SUMMARY_FIELDS of each job
+        """
+        try:
+            job_ids = sorted(self.redis_client.smembers("jobs:active"))
+            return self.get_jobs(job_ids, JOB_SUMMARY_FIELDS if summary else None)
         except Exception as e:
             logger.error(f"❌ Failed to get all jobs: {e}")
             return {}
     
+    def get_jobs_page(
+        self,
+        cursor: int = 0,
+        count: int = 50,
+        summary: bool = True,
+        status: Optional[str] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[int], Optional[int]]:
+        """
+        Get one page of active jobs by SSCAN cursor.
+        
+        Pages follow Redis SSCAN semantics: every job active for the whole
+        iteration is returned at least once, in no particular order, and a page
+        may hold more or fewer than count jobs.
+        
+        Args:
+            cursor: 0 for the first page, then the returned next cursor
+            count: Page size hint
+            summary: Only read JOB_SUMMARY_FIELDS of each job
+            status: Only return jobs in this status. The scan continues until
+                count jobs matched or the set is exhausted, so a filtered page
+                is only empty when it is the last one
+            
+        Returns:
+            (jobs, next cursor or None after the last page, total active jobs
+            or None when filtered by status)
+        """
+        fields = JOB_SUMMARY_FIELDS if summary else None
+        try:
+            jobs: Dict[str, Dict[str, Any]] = {}
+            while True:
+                cursor, job_ids = self.redis_client.sscan("jobs:active", cursor=cursor, count=max(1, count))
+                results = _queue_jobs_page_reads(self.redis_client.pipeline(), job_ids, fields, status).execute()
+                page, total = _decode_jobs_page(job_ids, results, fields, status)
+                jobs.update(page)
+                if status is None or not int(cursor) or len(jobs) >= count:
+                    return jobs, (int(cursor) or None), total
+        except Exception as e:
+            logger.error(f"❌ Failed to get jobs page at cursor {cursor}: {e}")
+            return {}, None, 0
+    
     def delete_job(self, job_id: str) -> bool:
         """Delete job from Redis."""
         try:
@@ -207,9 +531,9 @@ class RedisJobManager:
             cleaned_count = 0
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
             
-            for job_id in job_ids:
-                job_data = self.get_job(job_id)
-                if job_data and 'created_at' in job_data:
+            jobs = self.get_jobs(list(job_ids), fields=("created_at",))
+            for job_id, job_data in jobs.items():
+                if 'created_at' in job_data:
                     try:
                         created_at = datetime.fromisoformat(job_data['created_at'].replace('Z', '+00:00'))
                         if created_at < cutoff_time:
@@ -330,21 +654,28 @@ class RedisJobManager:
             logger.error(f"❌ Failed to set last job completion time: {e}")
             return False
 
-    def set_processor_status(self, status: str, details: Dict[str, Any] = None) -> bool:
+    def set_processor_status(
+        self,
+        worker_id: str,
+        status: str,
+        details: Dict[str, Any] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> bool:
         """
-        Set the current status of the queue processor.
+        Set the current status of one queue worker.
         
         Args:
+            worker_id: Worker reporting the status
             status: 'idle', 'processing', 'waiting', 'paused'
             details: Additional details (e.g., next_run_time, reason)
+            ttl_seconds: Expiry of the status (renewed by the worker's heartbeat)
         """
         try:
-            data = {
-                "status": status,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                **(details or {})
-            }
-            self.redis_client.set("jobs:processor_status", json.dumps(data))
+            self.redis_client.set(
+                _processor_status_key(worker_id),
+                _processor_status_message(status, details),
+                px=int(ttl_seconds * 1000) if ttl_seconds else None
+            )
             return True
         except Exception as e:
             logger.error(f"❌ Failed to set processor status: {e}")
@@ -352,13 +683,16 @@ class RedisJobManager:
 
     def get_processor_status(self) -> Dict[str, Any]:
         """
-        Get the current status of the queue processor.
+        Get the current status of the queue processor across all live workers.
+        
+        Returns:
+            Status of the busiest worker, with "workers" mapping each worker ID to
+            its own status (see _aggregate_processor_status)
         """
         try:
-            data = self.redis_client.get("jobs:processor_status")
-            if data:
-                return json.loads(data)
-            return {"status": "unknown", "updated_at": None}
+            workers = sorted(self.redis_client.smembers("jobs:workers"))
+            rows = self.redis_client.mget([_processor_status_key(w) for w in workers]) if workers else []
+            return _aggregate_processor_status(workers, rows)
         except Exception as e:
             logger.error(f"❌ Failed to get processor status: {e}")
             return {"status": "error", "error": str(e)}
@@ -446,10 +780,7 @@ class RedisJobManager:
             # Get all job details
             jobs = []
             if 'jobs' in batch_data and isinstance(batch_data['jobs'], list):
-                for job_id in batch_data['jobs']:
-                    job = self.get_job(job_id)
-                    if job:
-                        jobs.append(job)
+                jobs = list(self.get_jobs(batch_data['jobs']).values())
             
             batch_data['job_details'] = jobs
             
@@ -496,6 +827,7 @@ class RedisJobManager:
         try:
             # Add to queue list (FIFO: LPUSH adds to left, RPOP gets from right)
             self.redis_client.lpush("jobs:queue", job_id)
+            self.publish_job_event(job_id, "enqueued")
             logger.debug(f"✅ Job {job_id} added to queue")
             return True
         except Exception as e:
@@ -527,50 +859,238 @@ class RedisJobManager:
             logger.error(f"❌ Failed to get queue length: {e}")
             return 0
     
-    def mark_job_processing(self, job_id: str) -> bool:
+    @property
+    def async_manager(self) -> "AsyncRedisJobManager":
+        """Asyncio-native variant of this manager (same server, async client)."""
+        return AsyncRedisJobManager(self._async_client, redis_url=self.redis_url)
+    
+    def publish_job_event(self, job_id: str, event: str, **data: Any) -> bool:
         """
-        Mark job as currently processing using SETNX (set if not exists).
-        This prevents duplicate processing if multiple processors exist.
+        Publish a job state change on JOB_EVENTS_CHANNEL and the job's own channel.
         
         Args:
-            job_id: Job identifier to mark as processing
+            job_id: Job identifier
+            event: Event type ("status", "enqueued", ...)
+            **data: Additional fields (e.g. status)
+        """
+        try:
+            _queue_job_event(self.redis_client.pipeline(transaction=False), job_id, event, data).execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish {event} event for job {job_id}: {e}")
+            return False
+    
+    def publish_job_progress(self, job_id: str, **data: Any) -> bool:
+        """
+        Publish a progress event (progress, current_step) on the job's own channel only.
+        
+        Progress can change many times a second, so it is kept off
+        JOB_EVENTS_CHANNEL, which every job event listener receives.
+        """
+        try:
+            self.redis_client.publish(job_events_channel(job_id), _job_event_message(job_id, "progress", data))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish progress event for job {job_id}: {e}")
+            return False
+    
+    # Lease-based work queue
+    #
+    # Workers claim jobs by moving them from jobs:queue into their own list
+    # jobs:processing:{worker_id} (LMOVE, atomic) and hold a per-job lease key
+    # jobs:lease:{job_id} with a TTL that is renewed by heartbeats. A job whose
+    # lease expired (worker crashed or lost its connection) is pushed back to the
+    # front of the queue by any worker's reaper.
+    
+    def register_worker(self, worker_id: str, ttl_seconds: float) -> bool:
+        """
+        Register (or refresh) a queue worker.
+        
+        Args:
+            worker_id: Unique worker identifier
+            ttl_seconds: Seconds until the worker is considered gone without a heartbeat
+        """
+        try:
+            _queue_register_worker(self.redis_client.pipeline(), worker_id, ttl_seconds).execute()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to register worker {worker_id}: {e}")
+            return False
+    
+    def unregister_worker(self, worker_id: str) -> bool:
+        """Remove a worker that has no jobs left in its processing list."""
+        try:
+            _queue_unregister_worker(self.redis_client.pipeline(), worker_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to unregister worker {worker_id}: {e}")
+            return False
+    
+    def get_workers(self) -> List[str]:
+        """Get IDs of registered workers (live or with unreaped jobs)."""
+        try:
+            return sorted(self.redis_client.smembers("jobs:workers"))
+        except Exception as e:
+            logger.error(f"❌ Failed to get workers: {e}")
+            return []
+    
+    def claim_next_job(self, worker_id: str, lease_ttl_seconds: float) -> Optional[str]:
+        """
+        Claim the oldest queued job for a worker.
+        
+        The job is moved atomically from jobs:queue into the worker's processing
+        list, so no other worker can claim it, and a lease is taken on it.
+        
+        Args:
+            worker_id: Claiming worker
+            lease_ttl_seconds: Lease duration; renew with renew_leases()
             
         Returns:
-            True if successfully marked (lock acquired), False if already processing
-        """
-        try:
-            # Use SETNX to set only if not exists (atomic lock)
-            result = self.redis_client.setnx("jobs:processing", job_id)
-            if result:
-                # Set expiration (2 hours) in case processor crashes
-                self.redis_client.expire("jobs:processing", 7200)
-                logger.info(f"✅ Job {job_id} marked as processing")
-                return True
-            else:
-                logger.debug(f"⚠️ Job processing lock already held by another job")
+            Job ID, or None if the queue is empty
+        """
+        try:
+            job_id = self.redis_client.lmove("jobs:queue", _processing_key(worker_id), "RIGHT", "LEFT")
+            if job_id:
+                _queue_lease(self.redis_client.pipeline(), worker_id, job_id, lease_ttl_seconds).execute()
+                logger.debug(f"✅ Worker {worker_id} claimed job {job_id}")
+            return job_id
+        except Exception as e:
+            logger.error(f"❌ Failed to claim next job for worker {worker_id}: {e}")
+            return None
+    
+    def renew_leases(self, worker_id: str, job_ids: List[str], lease_ttl_seconds: float) -> List[str]:
+        """
+        Heartbeat: extend the worker's registration and the leases of its jobs.
+        
+        Args:
+            worker_id: Worker holding the leases
+            job_ids: Jobs the worker is processing
+            lease_ttl_seconds: New lease duration
+            
+        Returns:
+            Job IDs whose lease was lost (expired and reaped, or taken over)
+        """
+        try:
+            owners = _queue_heartbeat(self.redis_client.pipeline(), worker_id, job_ids, lease_ttl_seconds).execute()[:len(job_ids)]
+            held, lost = _split_lease_owners(worker_id, job_ids, owners)
+            if held:
+                _queue_lease_renewals(self.redis_client.pipeline(), held, lease_ttl_seconds).execute()
+            return lost
+        except Exception as e:
+            logger.error(f"❌ Failed to renew leases for worker {worker_id}: {e}")
+            return []
+    
+    def release_job(self, worker_id: str, job_id: str, requeue: bool = False) -> bool:
+        """
+        Release a claimed job (finished, failed, or handed back on shutdown).
+        
+        Args:
+            worker_id: Worker holding the job
+            job_id: Job to release
+            requeue: Put the job back at the front of the queue
+            
+        Returns:
+            True if the job was still in the worker's processing list
+        """
+        try:
+            removed = self.redis_client.lrem(_processing_key(worker_id), 0, job_id)
+            if not removed:
+                # Already recovered by a reaper; the lease may belong to another worker now
                 return False
+            _queue_release(self.redis_client.pipeline(), worker_id, job_id, requeue).execute()
+            return True
         except Exception as e:
-            logger.error(f"❌ Failed to mark job {job_id} as processing: {e}")
+            logger.error(f"❌ Failed to release job {job_id} for worker {worker_id}: {e}")
             return False
     
+    def get_worker_jobs(self, worker_id: str) -> List[str]:
+        """Get jobs in a worker's processing list (oldest claim first)."""
+        try:
+            return list(reversed(self.redis_client.lrange(_processing_key(worker_id), 0, -1)))
+        except Exception as e:
+            logger.error(f"❌ Failed to get jobs for worker {worker_id}: {e}")
+            return []
+    
+    def get_processing_jobs(self) -> Dict[str, str]:
+        """
+        Get all claimed jobs across workers.
+        
+        Returns:
+            Mapping of job ID to worker ID
+        """
+        workers = self.get_workers()
+        if not workers:
+            return {}
+        try:
+            pipe = self.redis_client.pipeline()
+            for worker_id in workers:
+                pipe.lrange(_processing_key(worker_id), 0, -1)
+            return _processing_by_job(workers, pipe.execute())
+        except Exception as e:
+            logger.error(f"❌ Failed to get processing jobs: {e}")
+            return {}
+    
     def get_currently_processing_job(self) -> Optional[str]:
-        """Get currently processing job ID."""
+        """Get the longest-running claimed job ID (see get_processing_jobs for all)."""
+        processing = self.get_processing_jobs()
+        return next(iter(processing), None)
+    
+    def find_expired_leases(self) -> List[Tuple[str, str]]:
+        """
+        Find claimed jobs without a live lease.
+        
+        Returns:
+            (worker_id, job_id) pairs
+        """
+        expired = []
         try:
-            job_id = self.redis_client.get("jobs:processing")
-            return job_id if job_id else None
+            for worker_id in self.get_workers():
+                job_ids = self.get_worker_jobs(worker_id)
+                if not job_ids:
+                    # Drop workers that are gone and hold nothing
+                    if not self.redis_client.exists(f"jobs:worker:{worker_id}"):
+                        self.unregister_worker(worker_id)
+                    continue
+                pipe = self.redis_client.pipeline()
+                for job_id in job_ids:
+                    pipe.exists(f"jobs:lease:{job_id}")
+                for job_id, has_lease in zip(job_ids, pipe.execute()):
+                    if not has_lease:
+                        expired.append((worker_id, job_id))
         except Exception as e:
-            logger.error(f"❌ Failed to get currently processing job: {e}")
-            return None
+            logger.error(f"❌ Failed to scan job leases: {e}")
+        return expired
     
-    def remove_from_processing(self) -> bool:
-        """Remove currently processing job marker."""
+    def requeue_expired_job(self, worker_id: str, job_id: str, max_requeues: int = 3) -> Optional[str]:
+        """
+        Take an expired job away from its worker.
+        
+        Safe to call from several reapers at once: only the caller whose LREM
+        removes the job acts on it.
+        
+        Args:
+            worker_id: Worker whose lease expired
+            job_id: Job to recover
+            max_requeues: After this many lease expiries the job is marked FAILED
+            
+        Returns:
+            "requeued", "failed", or None if the job was not recovered by this caller
+        """
         try:
-            result = self.redis_client.delete("jobs:processing")
-            logger.debug(f"✅ Removed processing job marker")
-            return bool(result)
+            if self.redis_client.exists(f"jobs:lease:{job_id}"):
+                return None  # Lease was renewed or re-taken in the meantime
+            if not self.redis_client.lrem(_processing_key(worker_id), 0, job_id):
+                return None  # Already released or recovered by another reaper
+            
+            requeues = self.redis_client.hincrby(f"job:{job_id}", "lease_requeues", 1)
+            outcome, updates = _lease_expiry_updates(worker_id, job_id, requeues, max_requeues)
+            self.update_job(job_id, updates)
+            if outcome == "requeued":
+                self.redis_client.rpush("jobs:queue", job_id)
+            return outcome
         except Exception as e:
-            logger.error(f"❌ Failed to remove processing job marker: {e}")
-            return False
+            logger.error(f"❌ Failed to requeue expired job {job_id}: {e}")
+            return None
     
     def get_all_queued_jobs(self) -> List[str]:
         """
@@ -580,59 +1100,535 @@ class RedisJobManager:
             List of job IDs that are in QUEUED state
         """
         try:
-            queued_jobs = []
-            job_ids = self.redis_client.smembers("jobs:active")
+            job_ids = list(self.redis_client.smembers("jobs:active"))
+            jobs = self.get_jobs(job_ids, fields=("status",))
+            return [job_id for job_id, job in jobs.items() if job.get('status') == 'QUEUED']
+        except Exception as e:
+            logger.error(f"❌ Failed to get queued jobs: {e}")
+            return []
+
+
+class AsyncRedisJobManager:
+    """
+    Asyncio-native job state access on redis.asyncio.
+    
+    Used from async FastAPI handlers and the queue processor's event loop, where
+    the synchronous client would block the loop for every round trip. Stores
+    and decodes jobs exactly like RedisJobManager, which remains the API for
+    scripts, threads and the Flask UI.
+    """
+    
+    def __init__(self, client=None, redis_url: str = None):
+        """
+        Initialize async job manager (no connection is made until first use).
+        
+        Args:
+            client: redis.asyncio client (default: shared pool of redis_url)
+            redis_url: Redis URL (default: REDIS_URL or redis://localhost:6379/0)
+        """
+        self.redis_url = redis_url or os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        self._client = client
+    
+    @property
+    def redis_client(self):
+        """The given client, else the shared client of the running event loop."""
+        if self._client is not None:
+            return self._client
+        return _get_async_client(self.redis_url)
+    
+    @property
+    def pubsub_client(self):
+        """Client for subscriptions: the given client, else the running loop's pub/sub client."""
+        if self._client is not None:
+            return self._client
+        return _get_async_client(self.redis_url, pubsub=True)
+    
+    async def create_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
+        """Create a new job in Redis."""
+        try:
+            await _queue_create_job(self.redis_client.pipeline(), job_id, job_data).execute()
+
+            logger.info(f"✅ Job {job_id} created in Redis")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to create job {job_id}: {e}")
+            return False
+    
+    async def update_job(self, job_id: str, updates: Dict[str, Any]) -> bool:
+        """Update job data in Redis (progress never goes backwards)."""
+        try:
+            updates['updated_at'] = datetime.now(timezone.utc).isoformat()
+            if 'progress' in updates:
+                updates = _without_backward_progress(
+                    job_id, updates, await self.redis_client.hget(f"job:{job_id}", "progress")
+                )
             
-            for job_id in job_ids:
-                job = self.get_job(job_id)
-                if job and job.get('status') == 'QUEUED':
-                    queued_jobs.append(job_id)
+            await _queue_job_update(self.redis_client.pipeline(transaction=False), job_id, updates).execute()
             
-            return queued_jobs
+            logger.debug(f"✅ Job {job_id} updated: {updates}")
+            return True
         except Exception as e:
-            logger.error(f"❌ Failed to get queued jobs: {e}")
+            logger.error(f"❌ Failed to update job {job_id}: {e}")
+            return False
+    
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job data from Redis."""
+        try:
+            job_data = await self.redis_client.hgetall(f"job:{job_id}")
+            if not job_data:
+                return None
+            return _decode_job(job_data)
+        except Exception as e:
+            logger.error(f"❌ Failed to get job {job_id}: {e}")
+            return None
+    
+    async def get_jobs(self, job_ids: List[str], fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get many jobs in one pipelined round trip (see RedisJobManager.get_jobs)."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        try:
+            pipe = _queue_job_reads(self.redis_client.pipeline(), job_ids, fields)
+            return _decode_job_rows(job_ids, await pipe.execute(), fields)
+        except Exception as e:
+            logger.error(f"❌ Failed to get {len(job_ids)} jobs: {e}")
+            return {}
+    
+    async def get_all_jobs(self, summary: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Get all active jobs (see RedisJobManager.get_all_jobs)."""
+        try:
+            job_ids = sorted(await self.redis_client.smembers("jobs:active"))
+            return await self.get_jobs(job_ids, JOB_SUMMARY_FIELDS if summary else None)
+        except Exception as e:
+            logger.error(f"❌ Failed to get all jobs: {e}")
+            return {}
+    
+    async def get_jobs_page(
+        self,
+        cursor: int = 0,
+        count: int = 50,
+        summary: bool = True,
+        status: Optional[str] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[int], Optional[int]]:
+        """Get one page of active jobs by SSCAN cursor (see RedisJobManager.get_jobs_page)."""
+        fields = JOB_SUMMARY_FIELDS if summary else None
+        try:
+            jobs: Dict[str, Dict[str, Any]] = {}
+            while True:
+                cursor, job_ids = await self.redis_client.sscan("jobs:active", cursor=cursor, count=max(1, count))
+                pipe = _queue_jobs_page_reads(self.redis_client.pipeline(), job_ids, fields, status)
+                page, total = _decode_jobs_page(job_ids, await pipe.execute(), fields, status)
+                jobs.update(page)
+                if status is None or not int(cursor) or len(jobs) >= count:
+                    return jobs, (int(cursor) or None), total
+        except Exception as e:
+            logger.error(f"❌ Failed to get jobs page at cursor {cursor}: {e}")
+            return {}, None, 0
+    
+    async def get_queued_job_ids(self, count: int = 5) -> List[str]:
+        """Get the first count job IDs of the queue list (LRANGE 0 count-1)."""
+        try:
+            return await self.redis_client.lrange("jobs:queue", 0, count - 1)
+        except Exception as e:
+            logger.error(f"❌ Failed to read queue: {e}")
+            return []
+    
+    async def get_queue_length(self) -> int:
+        """Get number of jobs in queue."""
+        try:
+            return await self.redis_client.llen("jobs:queue")
+        except Exception as e:
+            logger.error(f"❌ Failed to get queue length: {e}")
+            return 0
+    
+    async def add_job_to_queue(self, job_id: str) -> bool:
+        """Add job to the FIFO queue (see RedisJobManager.add_job_to_queue)."""
+        try:
+            await self.redis_client.lpush("jobs:queue", job_id)
+            await self.publish_job_event(job_id, "enqueued")
+            logger.debug(f"✅ Job {job_id} added to queue")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to add job {job_id} to queue: {e}")
+            return False
+    
+    async def invalidate_video_cache(self) -> bool:
+        """Invalidate (delete) video cache."""
+        try:
+            await self.redis_client.delete("langflix:video_cache:all")
+            logger.info("✅ Video cache invalidated")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to invalidate video cache: {e}")
+            return False
+    
+    async def get_last_job_completion_time(self) -> Optional[datetime]:
+        """Get the timestamp of the last successfully completed job."""
+        try:
+            timestamp_str = await self.redis_client.get("jobs:last_completion_time")
+            if timestamp_str:
+                return datetime.fromisoformat(timestamp_str)
+            return None
+        except Exception as e:
+            logger.error(f"❌ Failed to get last job completion time: {e}")
+            return None
+    
+    async def set_last_job_completion_time(self) -> bool:
+        """Set the last job completion time to now."""
+        try:
+            await self.redis_client.set("jobs:last_completion_time", datetime.now(timezone.utc).isoformat())
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to set last job completion time: {e}")
+            return False
+    
+    async def set_processor_status(
+        self,
+        worker_id: str,
+        status: str,
+        details: Dict[str, Any] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> bool:
+        """Set the current status of one queue worker (see RedisJobManager.set_processor_status)."""
+        try:
+            await self.redis_client.set(
+                _processor_status_key(worker_id),
+                _processor_status_message(status, details),
+                px=int(ttl_seconds * 1000) if ttl_seconds else None
+            )
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to set processor status: {e}")
+            return False
+    
+    async def get_processor_status(self) -> Dict[str, Any]:
+        """Get the processor status across all live workers (see RedisJobManager.get_processor_status)."""
+        try:
+            workers = sorted(await self.redis_client.smembers("jobs:workers"))
+            rows = await self.redis_client.mget([_processor_status_key(w) for w in workers]) if workers else []
+            return _aggregate_processor_status(workers, rows)
+        except Exception as e:
+            logger.error(f"❌ Failed to get processor status: {e}")
+            return {"status": "error", "error": str(e)}
+    
+    async def publish_job_event(self, job_id: str, event: str, **data: Any) -> bool:
+        """Publish a job state change on JOB_EVENTS_CHANNEL and the job's own channel."""
+        try:
+            await _queue_job_event(self.redis_client.pipeline(transaction=False), job_id, event, data).execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish {event} event for job {job_id}: {e}")
+            return False
+    
+    async def publish_job_progress(self, job_id: str, **data: Any) -> bool:
+        """Publish a progress event on the job's own channel only (see RedisJobManager.publish_job_progress)."""
+        try:
+            await self.redis_client.publish(job_events_channel(job_id), _job_event_message(job_id, "progress", data))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish progress event for job {job_id}: {e}")
+            return False
+    
+    async def listen_job_events(
+        self,
+        job_id: Optional[str] = None,
+        include_progress: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async iterator over job state change events.
+        
+        Args:
+            job_id: Only yield events of this job, read from its own channel
+                (default: all jobs, from JOB_EVENTS_CHANNEL)
+            include_progress: Also yield progress events (only published on job channels)
+            
+        Yields:
+            Event dicts as published by publish_job_event / publish_job_progress
+        """
+        channel = job_events_channel(job_id) if job_id else JOB_EVENTS_CHANNEL
+        pubsub = self.pubsub_client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                event = _parse_event_message(message)
+                if event is None or (event.get('event') == 'progress' and not include_progress):
+                    continue
+                yield event
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+    
+    async def watch_job(
+        self,
+        job_id: str,
+        progress_interval: float = 0.5,
+        keepalive: float = 15.0
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Follow one job: a snapshot of its summary fields, then its events until it finishes.
+        
+        Progress updates are coalesced: at most one progress event is yielded per
+        progress_interval, carrying the latest progress and step (the first one
+        after a quiet period is yielded right away). Status changes are yielded
+        immediately, after any pending progress.
+        
+        Args:
+            job_id: Job identifier
+            progress_interval: Minimum seconds between yielded progress events
+            keepalive: Seconds without events after which None is yielded, so
+                callers can keep idle connections open
+            
+        Yields:
+            {"event": "snapshot", ...summary fields} first (nothing if the job
+            does not exist), then event dicts (status events repeating the
+            current status count as progress), or None on idle
+            
+        Raises:
+            redis.RedisError: If Redis is unavailable or no pub/sub connection is
+                free (a missing job yields nothing instead)
+        """
+        channel = job_events_channel(job_id)
+        pubsub = self.pubsub_client.pubsub()
+        # Subscribe before reading the snapshot so no update falls in between
+        await pubsub.subscribe(channel)
+        try:
+            # Read directly (not get_jobs, which hides errors) so an outage is not reported as a missing job
+            row = await self.redis_client.hmget(f"job:{job_id}", list(JOB_SUMMARY_FIELDS))
+            job = _decode_job_rows([job_id], [row], JOB_SUMMARY_FIELDS).get(job_id)
+            if job is None:
+                return
+            yield {"job_id": job_id, "event": "snapshot", **job}
+            status = job.get('status')
+            if status in TERMINAL_JOB_STATUSES:
+                return
+            
+            pending: Optional[Dict[str, Any]] = None
+            last_progress = last_yield = time.monotonic() - progress_interval
+            while True:
+                now = time.monotonic()
+                if pending is not None:
+                    wait = last_progress + progress_interval - now
+                else:
+                    wait = last_yield + keepalive - now
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=max(0.0, wait))
+                event = _parse_event_message(message)
+                now = time.monotonic()
+                
+                if event is not None:
+                    if event.get('event') == 'progress' or (
+                        event.get('event') == 'status' and event.get('status') == status
+                    ):
+                        pending = {**(pending or {}), **event, "event": "progress"}
+                    else:
+                        if pending is not None:
+                            yield pending
+                            pending = None
+                        yield event
+                        last_yield = now
+                        if event.get('event') == 'status':
+                            status = event.get('status')
+                            if status in TERMINAL_JOB_STATUSES:
+                                return
+                        continue
+                
+                if pending is not None:
+                    if now - last_progress >= progress_interval:
+                        yield pending
+                        pending = None
+                        last_progress = last_yield = now
+                elif now - last_yield >= keepalive:
+                    yield None
+                    last_yield = now
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+    
+    # Lease-based work queue (see RedisJobManager for the key layout)
+    
+    async def register_worker(self, worker_id: str, ttl_seconds: float) -> bool:
+        """Register (or refresh) a queue worker."""
+        try:
+            await _queue_register_worker(self.redis_client.pipeline(), worker_id, ttl_seconds).execute()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to register worker {worker_id}: {e}")
+            return False
+    
+    async def unregister_worker(self, worker_id: str) -> bool:
+        """Remove a worker that has no jobs left in its processing list."""
+        try:
+            await _queue_unregister_worker(self.redis_client.pipeline(), worker_id).execute()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to unregister worker {worker_id}: {e}")
+            return False
+    
+    async def get_workers(self) -> List[str]:
+        """Get IDs of registered workers (live or with unreaped jobs)."""
+        try:
+            return sorted(await self.redis_client.smembers("jobs:workers"))
+        except Exception as e:
+            logger.error(f"❌ Failed to get workers: {e}")
+            return []
+    
+    async def get_worker_jobs(self, worker_id: str) -> List[str]:
+        """Get jobs in a worker's processing list (oldest claim first)."""
+        try:
+            return list(reversed(await self.redis_client.lrange(_processing_key(worker_id), 0, -1)))
+        except Exception as e:
+            logger.error(f"❌ Failed to get jobs for worker {worker_id}: {e}")
             return []
     
-    def acquire_processor_lock(self) -> bool:
+    async def get_processing_jobs(self) -> Dict[str, str]:
+        """Get all claimed jobs across workers as a mapping of job ID to worker ID."""
+        workers = await self.get_workers()
+        if not workers:
+            return {}
+        try:
+            pipe = self.redis_client.pipeline()
+            for worker_id in workers:
+                pipe.lrange(_processing_key(worker_id), 0, -1)
+            return _processing_by_job(workers, await pipe.execute())
+        except Exception as e:
+            logger.error(f"❌ Failed to get processing jobs: {e}")
+            return {}
+    
+    async def claim_next_job_blocking(
+        self,
+        worker_id: str,
+        lease_ttl_seconds: float,
+        timeout_seconds: float = 5.0
+    ) -> Optional[str]:
         """
-        Acquire processor lock to ensure only one queue processor runs.
-        Uses SETNX with expiration for safety.
+        Claim the oldest queued job, waiting up to timeout_seconds for one to arrive.
+        
+        Same semantics as RedisJobManager.claim_next_job, but blocks server-side
+        (BRPOPLPUSH, i.e. BLMOVE RIGHT LEFT) instead of polling.
         
         Returns:
-            True if lock acquired, False if already held
+            Job ID, or None if no job arrived within the timeout
+            
+        Raises:
+            redis.RedisError: If Redis is unavailable
         """
+        job_id = await self.redis_client.brpoplpush(
+            "jobs:queue", _processing_key(worker_id), timeout=max(1, int(timeout_seconds))
+        )
+        if job_id:
+            await _queue_lease(self.redis_client.pipeline(), worker_id, job_id, lease_ttl_seconds).execute()
+            logger.debug(f"✅ Worker {worker_id} claimed job {job_id}")
+        return job_id
+    
+    async def renew_leases(self, worker_id: str, job_ids: List[str], lease_ttl_seconds: float) -> List[str]:
+        """Heartbeat (see RedisJobManager.renew_leases); returns job IDs whose lease was lost."""
+        try:
+            pipe = _queue_heartbeat(self.redis_client.pipeline(), worker_id, job_ids, lease_ttl_seconds)
+            held, lost = _split_lease_owners(worker_id, job_ids, (await pipe.execute())[:len(job_ids)])
+            if held:
+                await _queue_lease_renewals(self.redis_client.pipeline(), held, lease_ttl_seconds).execute()
+            return lost
+        except Exception as e:
+            logger.error(f"❌ Failed to renew leases for worker {worker_id}: {e}")
+            return []
+    
+    async def release_job(self, worker_id: str, job_id: str, requeue: bool = False) -> bool:
+        """Release a claimed job (see RedisJobManager.release_job)."""
         try:
-            result = self.redis_client.setnx("jobs:processor_lock", "1")
-            if result:
-                # Set expiration (1 hour) - processor should renew periodically
-                self.redis_client.expire("jobs:processor_lock", 3600)
-                logger.info("✅ Processor lock acquired")
-                return True
-            else:
-                logger.debug("⚠️ Processor lock already held by another instance")
+            removed = await self.redis_client.lrem(_processing_key(worker_id), 0, job_id)
+            if not removed:
+                # Already recovered by a reaper; the lease may belong to another worker now
                 return False
+            await _queue_release(self.redis_client.pipeline(), worker_id, job_id, requeue).execute()
+            return True
         except Exception as e:
-            logger.error(f"❌ Failed to acquire processor lock: {e}")
+            logger.error(f"❌ Failed to release job {job_id} for worker {worker_id}: {e}")
             return False
     
-    def release_processor_lock(self) -> bool:
-        """Release processor lock."""
+    async def find_expired_leases(self) -> List[Tuple[str, str]]:
+        """Find claimed jobs without a live lease as (worker_id, job_id) pairs."""
+        expired = []
         try:
-            result = self.redis_client.delete("jobs:processor_lock")
-            logger.info("✅ Processor lock released")
-            return bool(result)
+            for worker_id in await self.get_workers():
+                job_ids = await self.get_worker_jobs(worker_id)
+                if not job_ids:
+                    # Drop workers that are gone and hold nothing
+                    if not await self.redis_client.exists(f"jobs:worker:{worker_id}"):
+                        await self.unregister_worker(worker_id)
+                    continue
+                pipe = self.redis_client.pipeline()
+                for job_id in job_ids:
+                    pipe.exists(f"jobs:lease:{job_id}")
+                for job_id, has_lease in zip(job_ids, await pipe.execute()):
+                    if not has_lease:
+                        expired.append((worker_id, job_id))
         except Exception as e:
-            logger.error(f"❌ Failed to release processor lock: {e}")
-            return False
+            logger.error(f"❌ Failed to scan job leases: {e}")
+        return expired
     
-    def renew_processor_lock(self) -> bool:
-        """Renew processor lock expiration."""
+    async def requeue_expired_job(self, worker_id: str, job_id: str, max_requeues: int = 3) -> Optional[str]:
+        """Take an expired job away from its worker (see RedisJobManager.requeue_expired_job)."""
         try:
-            result = self.redis_client.expire("jobs:processor_lock", 3600)
-            return bool(result)
+            if await self.redis_client.exists(f"jobs:lease:{job_id}"):
+                return None  # Lease was renewed or re-taken in the meantime
+            if not await self.redis_client.lrem(_processing_key(worker_id), 0, job_id):
+                return None  # Already released or recovered by another reaper
+            
+            requeues = await self.redis_client.hincrby(f"job:{job_id}", "lease_requeues", 1)
+            outcome, updates = _lease_expiry_updates(worker_id, job_id, requeues, max_requeues)
+            await self.update_job(job_id, updates)
+            if outcome == "requeued":
+                await self.redis_client.rpush("jobs:queue", job_id)
+            return outcome
         except Exception as e:
-            logger.error(f"❌ Failed to renew processor lock: {e}")
-            return False
+            logger.error(f"❌ Failed to requeue expired job {job_id}: {e}")
+            return None
+
+
+# Shared redis.asyncio clients, one per event loop, Redis URL and kind. asyncio
+# connections belong to the loop that opened them, so each loop (app lifespan,
+# asyncio.run in a script or test) gets its own pools; entries of a loop are
+# dropped when the loop is garbage collected.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, bool], Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_client(redis_url: str, pubsub: bool = False):
+    """
+    Get the redis.asyncio client of redis_url for the running event loop.
+    
+    The command pool is shared by the queue processor and every API route, so
+    it blocks (up to REDIS_ASYNC_POOL_TIMEOUT seconds) for a free connection
+    under load instead of failing with "Too many connections". Subscriptions
+    hold their connection for as long as they last (an open job event stream),
+    so they get a separate pool of REDIS_ASYNC_PUBSUB_MAX_CONNECTIONS.
+    
+    Args:
+        redis_url: Redis URL
+        pubsub: Get the client for subscriptions instead of commands
+    """
+    import redis.asyncio as aioredis
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((redis_url, pubsub))
+    if client is None:
+        max_connections_var = 'REDIS_ASYNC_PUBSUB_MAX_CONNECTIONS' if pubsub else 'REDIS_ASYNC_MAX_CONNECTIONS'
+        pool = aioredis.BlockingConnectionPool.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=int(os.getenv(max_connections_var, '100' if pubsub else '50')),
+            timeout=float(os.getenv('REDIS_ASYNC_POOL_TIMEOUT', '10'))
+        )
+        client = aioredis.Redis(connection_pool=pool)
+        clients[(redis_url, pubsub)] = client
+    return client
+
+
+async def close_async_redis_pools() -> None:
+    """Close the running event loop's redis.asyncio clients (call on application shutdown)."""
+    global _async_redis_job_manager
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    _async_redis_job_manager = None
+    for client in clients.values():
+        await client.aclose(close_connection_pool=True)
+
 
 # Global Redis job manager instance
 _redis_job_manager: Optional[RedisJobManager] = None
@@ -649,3 +1645,13 @@ def init_redis_job_manager(redis_url: str = None) -> RedisJobManager:
     global _redis_job_manager
     _redis_job_manager = RedisJobManager(redis_url)
     return _redis_job_manager
+
+# Global async Redis job manager instance (shares the async connection pool)
+_async_redis_job_manager: Optional[AsyncRedisJobManager] = None
+
+def get_async_redis_job_manager() -> AsyncRedisJobManager:
+    """Get global asyncio Redis job manager instance."""
+    global _async_redis_job_manager
+    if _async_redis_job_manager is None:
+        _async_redis_job_manager = AsyncRedisJobManager()
+    return _async_redis_job_manager
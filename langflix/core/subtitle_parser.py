@@ -1,9 +1,11 @@
+import io
 import pysrt
 import re
 import logging
 import xml.etree.ElementTree as ET
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
 from datetime import timedelta
 from langflix import settings
 from langflix.core.subtitle_exceptions import (
@@ -18,6 +20,32 @@ logger = logging.getLogger(__name__)
 # Supported subtitle formats
 SUPPORTED_FORMATS = {'.srt', '.vtt', '.ass', '.ssa', '.smi'}
 
+# Bytes sampled from the start of a file for encoding detection
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# SRT timestamps: (HH:MM:SS)[.,](mmm) plus optional extra digits
+_TIMESTAMP_NORMALIZE_RE = re.compile(r'(\d{2}:\d{2}:\d{2})[.,](\d{3})\d*')
+_SRT_TIMESTAMP = r'(\d\d):(\d\d):(\d\d)[.,](\d{3})\d*'
+_SRT_TIMING_LINE_RE = re.compile(
+    r'\s*' + _SRT_TIMESTAMP + r'\s*-->\s*' + _SRT_TIMESTAMP + r'(?: (?:(?!-->).)*)?'
+)
+_TIME_SEPARATOR_RE = re.compile(r'\:|\.|\,')
+_LEADING_INT_RE = re.compile(r'^(\d+)')
+
+# SMI markup
+_SMI_SYNC_RE = re.compile(r'<SYNC\s+Start=(\d+)>(.*?)</SYNC>', re.DOTALL | re.IGNORECASE)
+_SMI_SYNC_OPEN_RE = re.compile(r'<SYNC\s+Start=(\d+)>(.*?)(?=<SYNC|</BODY>|$)', re.DOTALL | re.IGNORECASE)
+_SMI_P_RE = re.compile(r'<P[^>]*>(.*?)</P>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_HTML_ENTITIES = (
+    ('&nbsp;', ' '),
+    ('&amp;', '&'),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+    ('&quot;', '"'),
+    ('&apos;', "'"),
+)
+
 
 def validate_subtitle_file(file_path: str) -> tuple[bool, Optional[str]]:
     """
@@ -59,12 +87,16 @@ def validate_subtitle_file(file_path: str) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-def detect_encoding(file_path: str) -> str:
+def detect_encoding(file_path: str, sample_bytes: Optional[int] = ENCODING_SAMPLE_BYTES) -> str:
     """
     Detect file encoding using chardet library.
     
+    Only a bounded prefix of the file is sampled (subtitle files are
+    consistently encoded, and chardet cost grows with input size).
+    
     Args:
         file_path: Path to the subtitle file
+        sample_bytes: Bytes to sample from the start of the file (None = whole file)
         
     Returns:
         Detected encoding (e.g., 'utf-8', 'cp949', 'euc-kr')
@@ -80,7 +112,7 @@ def detect_encoding(file_path: str) -> str:
     
     try:
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
+            raw_data = f.read() if sample_bytes is None else f.read(sample_bytes)
             result = chardet.detect(raw_data)
             
             if result['encoding'] is None:
@@ -103,6 +135,138 @@ def detect_encoding(file_path: str) -> str:
         )
 
 
+class SubtitleCue(NamedTuple):
+    """Compact parsed subtitle entry"""
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+def _srt_time_to_ms(time_str: str) -> Optional[int]:
+    """
+    Parse an SRT timestamp ("HH:MM:SS,mmm") into milliseconds, pysrt-compatible.
+    
+    Returns:
+        Milliseconds, or None if the string does not have four fields
+    """
+    items = _TIME_SEPARATOR_RE.split(time_str)
+    if len(items) != 4:
+        return None
+    values = []
+    for item in items:
+        try:
+            values.append(int(item))
+        except ValueError:
+            match = _LEADING_INT_RE.match(item)
+            values.append(int(match.group()) if match else 0)
+    hours, minutes, seconds, milliseconds = values
+    return hours * 3600000 + minutes * 60000 + seconds * 1000 + milliseconds
+
+
+def _normalize_timestamps(line: str) -> str:
+    """00:00:01.500123 -> 00:00:01,500"""
+    if ':' in line:
+        return _TIMESTAMP_NORMALIZE_RE.sub(r'\1,\2', line)
+    return line
+
+
+def _srt_block_to_cue(block: List[str]) -> Optional[SubtitleCue]:
+    """Build a cue from the non-blank lines of one SRT block (None if malformed)"""
+    if len(block) < 2:
+        return None
+    lines = [line.rstrip() for line in block]
+    if '-->' not in lines[0]:
+        lines.pop(0)  # Index line
+    text = '\n'.join([_normalize_timestamps(line) for line in lines[1:]])
+    
+    # Fast path: well-formed "HH:MM:SS,mmm --> HH:MM:SS,mmm [position]" line
+    match = _SRT_TIMING_LINE_RE.fullmatch(lines[0])
+    if match:
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups())
+        return SubtitleCue(
+            h1 * 3600000 + m1 * 60000 + s1 * 1000 + ms1,
+            h2 * 3600000 + m2 * 60000 + s2 * 1000 + ms2,
+            text
+        )
+    
+    timestamps = _normalize_timestamps(lines[0]).split('-->')
+    if len(timestamps) != 2:
+        return None
+    start, end_and_position = timestamps
+    end = end_and_position.lstrip().split(' ', 1)[0]
+    # Empty timestamps count as 0 (pysrt behavior)
+    start_ms = _srt_time_to_ms(start.strip()) if start.strip() else 0
+    end_ms = _srt_time_to_ms(end.strip()) if end.strip() else 0
+    if start_ms is None or end_ms is None:
+        return None
+    return SubtitleCue(start_ms, end_ms, text)
+
+
+def iter_srt_cues(lines: Iterable[str]) -> Iterator[SubtitleCue]:
+    """
+    Incrementally parse SRT content.
+    
+    Blocks are separated by blank lines; the index line is optional and
+    malformed blocks are skipped (same rules as pysrt). Timestamps may use
+    '.' or ',' before the milliseconds, and extra sub-millisecond digits are
+    ignored.
+    
+    Args:
+        lines: Text lines (e.g. an open text file)
+        
+    Yields:
+        SubtitleCue per valid block
+    """
+    block: List[str] = []
+    for raw_line in chain(lines, ('\n',)):
+        for line in raw_line.splitlines(True):
+            if not line.isspace():
+                block.append(line)
+            elif block:
+                cue = _srt_block_to_cue(block)
+                block = []
+                if cue is not None:
+                    yield cue
+
+
+def _ms_to_time_string(ms: int) -> str:
+    """
+    Format milliseconds like str(datetime.time): "HH:MM:SS" or "HH:MM:SS.mmm000".
+    
+    Raises:
+        ValueError: If the time is negative or not below 24 hours
+    """
+    hours, remainder = divmod(ms, 3600000)
+    if not 0 <= hours < 24:
+        raise ValueError(f"hour must be in 0..23, got {hours}")
+    minutes, remainder = divmod(remainder, 60000)
+    seconds, milliseconds = divmod(remainder, 1000)
+    if milliseconds:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}000"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def _ms_to_smi_time_string(ms: int) -> str:
+    """Format milliseconds as "HH:MM:SS.mmm" (same output as _seconds_to_time_string)"""
+    hours, remainder = divmod(ms, 3600000)
+    minutes, remainder = divmod(remainder, 60000)
+    seconds, milliseconds = divmod(remainder, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+def _decode_with_fallbacks(data: bytes, file_path: str, encoding: str, fallback_encodings: List[str]) -> Tuple[str, str]:
+    """Decode file content with the first working fallback encoding (no re-reads)"""
+    for fallback in fallback_encodings:
+        try:
+            return data.decode(fallback), fallback
+        except (UnicodeDecodeError, ValueError):
+            continue
+    raise SubtitleEncodingError(
+        path=file_path,
+        attempted_encodings=[encoding] + fallback_encodings
+    )
+
+
 def parse_srt_file(file_path: str, validate: bool = True) -> List[Dict[str, Any]]:
     """
     Parses a .srt subtitle file into a list of dictionaries.
@@ -130,60 +294,34 @@ def parse_srt_file(file_path: str, validate: bool = True) -> List[Dict[str, Any]
         except SubtitleEncodingError:
             logger.warning(f"Failed to detect encoding, trying UTF-8")
             encoding = 'utf-8'
+        if encoding.lower() == 'ascii':
+            # The sample may end before the first non-ASCII character
+            encoding = 'utf-8'
         
-        # Parse with detected encoding
+        # Stream cues straight from the file
         try:
-            # Read file content first to normalize timestamps
             with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-
-            # Normalize timestamps:
-            # 1. Replace dot with comma (00:00:00.000 -> 00:00:00,000)
-            # 2. Truncate microseconds to milliseconds (000000 -> 000)
-            # Pattern matches: 00:00:00 followed by DOT or COMMA, then 3 digits, then optional extra digits
-            import re
-            def normalize_timestamp(match):
-                # group(1): HH:MM:SS
-                # group(2): mmm (first 3 digits)
-                return f"{match.group(1)},{match.group(2)}"
-            
-            # Regex: (HH:MM:SS)[.,](\d{3})\d*
-            # We look for lines starting with digit or arrow to be safe, but global replacement on timestamp-like patterns is usually safe in SRT
-            # Standard SRT timestamp: 00:00:00,000 --> 00:00:00,000
-            content = re.sub(r'(\d{2}:\d{2}:\d{2})[.,](\d{3})\d*', normalize_timestamp, content)
-            
-            subs = pysrt.from_string(content)
+                cues = list(iter_srt_cues(f))
         except UnicodeDecodeError:
-            # Fallback to common encodings
+            # Fallback to common encodings, decoding the bytes in memory
             fallback_encodings = ['utf-8', 'cp949', 'euc-kr', 'latin-1']
             logger.warning(f"Failed with {encoding}, trying fallback encodings")
             
-            for fallback in fallback_encodings:
-                try:
-                    with open(file_path, 'r', encoding=fallback) as f:
-                        content = f.read()
-                    
-                    # Apply normalization to fallback content
-                    content = re.sub(r'(\d{2}:\d{2}:\d{2})[.,](\d{3})\d*', normalize_timestamp, content)
-                    
-                    subs = pysrt.from_string(content)
-                    logger.info(f"Successfully parsed with fallback encoding: {fallback}")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise SubtitleEncodingError(
-                    path=file_path,
-                    attempted_encodings=[encoding] + fallback_encodings
-                )
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            content, fallback = _decode_with_fallbacks(data, file_path, encoding, fallback_encodings)
+            # Same newline handling as reading in text mode
+            cues = list(iter_srt_cues(io.StringIO(content, newline=None)))
+            logger.info(f"Successfully parsed with fallback encoding: {fallback}")
         
-        result = []
-        for sub in subs:
-            result.append({
-                'start_time': str(sub.start.to_time()),
-                'end_time': str(sub.end.to_time()),
-                'text': sub.text
-            })
+        result = [
+            {
+                'start_time': _ms_to_time_string(cue.start_ms),
+                'end_time': _ms_to_time_string(cue.end_ms),
+                'text': cue.text
+            }
+            for cue in cues
+        ]
         
         logger.info(f"Parsed {len(result)} subtitle entries from {file_path}")
         return result
@@ -198,6 +336,58 @@ def parse_srt_file(file_path: str, validate: bool = True) -> List[Dict[str, Any]
             reason=str(e)
         )
 
+
+def _smi_text(fragment: str) -> str:
+    """Strip tags and decode entities of an SMI text fragment"""
+    text = _TAG_RE.sub('', fragment)
+    for entity, char in _HTML_ENTITIES:
+        if entity in text:
+            text = text.replace(entity, char)
+    return text.strip()
+
+
+def iter_smi_cues(content: str) -> Iterator[SubtitleCue]:
+    """
+    Incrementally parse SMI (SAMI) content.
+    
+    Each <SYNC Start=ms> block ends where the next one starts (the last one
+    lasts 2 seconds). Text of its <P> tags is joined with newlines; blocks
+    without text are skipped.
+    
+    Args:
+        content: Decoded SMI file content
+        
+    Yields:
+        SubtitleCue per SYNC block with text
+    """
+    # Regex is more tolerant of malformed markup than an XML parser
+    matches = _SMI_SYNC_RE.finditer(content)
+    first = next(matches, None)
+    if first is None:
+        # Try alternative pattern without closing tag
+        matches = _SMI_SYNC_OPEN_RE.finditer(content)
+        first = next(matches, None)
+        if first is None:
+            return
+    
+    current = first
+    for following in chain(matches, (None,)):
+        start_ms = int(current.group(1))
+        end_ms = int(following.group(1)) if following is not None else start_ms + 2000
+        sync_content = current.group(2)
+        
+        text_parts = [text for text in map(_smi_text, _SMI_P_RE.findall(sync_content)) if text]
+        if not text_parts:
+            # If no P tags found, try to extract any text content
+            text = _smi_text(sync_content)
+            if text:
+                text_parts.append(text)
+        
+        if text_parts:
+            yield SubtitleCue(start_ms, end_ms, '\n'.join(text_parts))
+        current = following
+
+
 def parse_smi_file(file_path: str, validate: bool = True) -> List[Dict[str, Any]]:
     """
     Parses a .smi subtitle file into a list of dictionaries.
@@ -227,122 +417,29 @@ def parse_smi_file(file_path: str, validate: bool = True) -> List[Dict[str, Any]
             logger.warning(f"Failed to detect encoding, trying UTF-8")
             encoding = 'utf-8'
         
-        # Parse SMI file using regex (more tolerant of malformed XML)
-        # Many SMI files have complex HTML structures that break XML parsers
-        # So we use regex to extract SYNC blocks and text content directly
+        # SYNC blocks may span lines, so the file is read once and decoded in memory
+        with open(file_path, 'rb') as f:
+            data = f.read()
         try:
-            # Read file with detected encoding
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
+            content = data.decode(encoding)
         except (UnicodeDecodeError, ValueError):
             # Try common Korean encodings
             fallback_encodings = ['euc-kr', 'cp949', 'utf-8', 'latin-1']
             logger.warning(f"Failed with {encoding}, trying fallback encodings")
-            
-            for fallback in fallback_encodings:
-                try:
-                    with open(file_path, 'r', encoding=fallback) as f:
-                        content = f.read()
-                    logger.info(f"Successfully read with fallback encoding: {fallback}")
-                    break
-                except (UnicodeDecodeError, ValueError):
-                    continue
-            else:
-                raise SubtitleEncodingError(
-                    path=file_path,
-                    attempted_encodings=[encoding] + fallback_encodings
-                )
-        
-        # Extract SYNC blocks using regex
-        # Pattern: <SYNC Start=123><P Class=...>text</P></SYNC>
-        # More tolerant of malformed XML
-        import re
-        
-        # Find all SYNC blocks
-        sync_pattern = r'<SYNC\s+Start=(\d+)>(.*?)</SYNC>'
-        sync_matches = re.findall(sync_pattern, content, re.DOTALL | re.IGNORECASE)
+            content, fallback = _decode_with_fallbacks(data, file_path, encoding, fallback_encodings)
+            logger.info(f"Successfully read with fallback encoding: {fallback}")
+        # Same newline handling as reading in text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
-        if not sync_matches:
-            # Try alternative pattern without closing tag
-            sync_pattern_alt = r'<SYNC\s+Start=(\d+)>(.*?)(?=<SYNC|</BODY>|$)'
-            sync_matches = re.findall(sync_pattern_alt, content, re.DOTALL | re.IGNORECASE)
-        
-        result = []
-        
-        for i, (start_attr, sync_content) in enumerate(sync_matches):
-            try:
-                start_time_ms = int(start_attr)
-            except ValueError:
-                logger.warning(f"Invalid Start attribute: {start_attr}, skipping")
-                continue
-            
-            start_time_seconds = start_time_ms / 1000.0
-            
-            # Calculate end_time from next sync or use default duration
-            if i + 1 < len(sync_matches):
-                next_start_attr = sync_matches[i + 1][0]
-                try:
-                    next_start_ms = int(next_start_attr)
-                    end_time_seconds = next_start_ms / 1000.0
-                except ValueError:
-                    end_time_seconds = start_time_seconds + 2.0
-            else:
-                # Default duration for last subtitle
-                end_time_seconds = start_time_seconds + 2.0
-            
-            # Extract text from P tags using regex
-            # Remove all HTML tags and extract text
-            # Handle HTML entities
-            html_entities = {
-                '&nbsp;': ' ',
-                '&amp;': '&',
-                '&lt;': '<',
-                '&gt;': '>',
-                '&quot;': '"',
-                '&apos;': "'",
+        result = [
+            {
+                'start_time': _ms_to_smi_time_string(cue.start_ms),
+                'end_time': _ms_to_smi_time_string(cue.end_ms),
+                'text': cue.text
             }
-            
-            # Extract P tag content
-            p_pattern = r'<P[^>]*>(.*?)</P>'
-            p_matches = re.findall(p_pattern, sync_content, re.DOTALL | re.IGNORECASE)
-            
-            text_parts = []
-            for p_content in p_matches:
-                # Remove HTML tags
-                text = re.sub(r'<[^>]+>', '', p_content)
-                # Replace HTML entities
-                for entity, char in html_entities.items():
-                    text = text.replace(entity, char)
-                # Replace <br> tags with newline
-                text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-                text = text.strip()
-                if text:
-                    text_parts.append(text)
-            
-            # If no P tags found, try to extract any text content
-            if not text_parts:
-                # Remove all tags and extract text
-                text = re.sub(r'<[^>]+>', '', sync_content)
-                for entity, char in html_entities.items():
-                    text = text.replace(entity, char)
-                text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-                text = text.strip()
-                if text:
-                    text_parts.append(text)
-            
-            if text_parts:
-                # Join multiple P tags with newline
-                text = '\n'.join(text_parts)
-                
-                # Convert seconds to "HH:MM:SS.mmm" format (compatible with SRT)
-                start_time_str = _seconds_to_time_string(start_time_seconds)
-                end_time_str = _seconds_to_time_string(end_time_seconds)
-                
-                result.append({
-                    'start_time': start_time_str,
-                    'end_time': end_time_str,
-                    'text': text
-                })
+            for cue in iter_smi_cues(content)
+        ]
         
         logger.info(f"Parsed {len(result)} SMI subtitle entries from {file_path}")
         return result
@@ -3,6 +3,7 @@ Subtitle processing module for LangFlix
 Handles subtitle extraction, translation, and file generation
 """
 import os
+import sys
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -11,11 +12,33 @@ import re
 
 from .models import ExpressionAnalysis
 from .subtitle_parser import parse_srt_file, parse_subtitle_file_by_extension
+from .subtitle_store import SubtitleStore
+from .dialogue_matcher import get_dialogue_matcher
+from .cache_manager import get_cache_manager
 from langflix import settings
 from langflix.utils.expression_utils import get_expr_attr, clean_text_for_matching, is_non_speech_subtitle
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsing or cleaning output changes, so cached entries are not reused
+SUBTITLE_CACHE_VERSION = "1"
+
+
+def _compact_subtitles(subtitles: List[Dict[str, Any]]) -> tuple:
+    """Cache representation: one (start_time, end_time, text) tuple per entry"""
+    return tuple(
+        (sys.intern(s['start_time']), sys.intern(s['end_time']), s['text'])
+        for s in subtitles
+    )
+
+
+def _expand_subtitles(compact: tuple) -> List[Dict[str, Any]]:
+    """Fresh subtitle dicts from the cache representation (callers may mutate them)"""
+    return [
+        {'start_time': start_time, 'end_time': end_time, 'text': text}
+        for start_time, end_time, text in compact
+    ]
+
 
 class SubtitleProcessor:
     """
@@ -36,22 +59,60 @@ class SubtitleProcessor:
         """
         Load and parse subtitle file
         
+        Parsed and cleaned subtitles are cached by (path, mtime, size), so
+        processors created for the same file (and, with the disk cache, other
+        worker processes) skip encoding detection and parsing.
+        
         Returns:
             List of subtitle dictionaries
         """
         try:
-            # Use extension-based parser to support multiple formats (SRT, SMI, etc.)
-            subtitles = parse_subtitle_file_by_extension(self.subtitle_file_path)
-            logger.info(f"Loaded {len(subtitles)} subtitle entries")
+            if not settings.is_subtitle_parse_cache_enabled() or not os.path.isfile(self.subtitle_file_path):
+                return self._parse_and_clean()
             
-            # Clean subtitles (remove hearing-impaired descriptions like [sound])
-            cleaned_subtitles = self._clean_subtitles(subtitles)
-            logger.info(f"Cleaned subtitles: {len(cleaned_subtitles)} entries remaining")
+            cache = get_cache_manager()
+            cache_key = cache.get_subtitle_key(self.subtitle_file_path, SUBTITLE_CACHE_VERSION)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Loaded {len(cached)} cleaned subtitle entries from cache")
+                return _expand_subtitles(cached)
             
+            cleaned_subtitles = self._parse_and_clean()
+            try:
+                cache.set(
+                    cache_key,
+                    _compact_subtitles(cleaned_subtitles),
+                    persist_to_disk=settings.is_subtitle_parse_cache_persistent()
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache parsed subtitles: {e}")
             return cleaned_subtitles
         except Exception as e:
             logger.error(f"Error loading subtitles: {e}")
             return []
+    
+    def _parse_and_clean(self) -> List[Dict[str, Any]]:
+        """Parse the subtitle file and clean its entries"""
+        # Use extension-based parser to support multiple formats (SRT, SMI, etc.)
+        subtitles = parse_subtitle_file_by_extension(self.subtitle_file_path)
+        logger.info(f"Loaded {len(subtitles)} subtitle entries")
+        
+        # Clean subtitles (remove hearing-impaired descriptions like [sound])
+        cleaned_subtitles = self._clean_subtitles(subtitles)
+        logger.info(f"Cleaned subtitles: {len(cleaned_subtitles)} entries remaining")
+        
+        return cleaned_subtitles
+
+    @property
+    def subtitle_store(self) -> SubtitleStore:
+        """Time index over self.subtitles (rebuilt if the list is replaced)"""
+        store = getattr(self, '_subtitle_store', None)
+        if store is None or getattr(self, '_subtitle_store_source', None) is not self.subtitles \
+                or len(store) != len(self.subtitles):
+            store = SubtitleStore(self.subtitles)
+            self._subtitle_store = store
+            self._subtitle_store_source = self.subtitles
+        return store
 
     def _clean_subtitles(self, subtitles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -97,15 +158,8 @@ class SubtitleProcessor:
             context_end = get_expr_attr(expression, 'context_end_time')
             logger.info(f"Extracting subtitles from {context_start} to {context_end}")
             
-            matching_subtitles = []
-            
-            for subtitle in self.subtitles:
-                sub_start = self._time_to_seconds(subtitle['start_time'])
-                sub_end = self._time_to_seconds(subtitle['end_time'])
-                
-                # Check if subtitle overlaps with the expression's context time
-                if (sub_start < end_time and sub_end > start_time):
-                    matching_subtitles.append(subtitle)
+            # Subtitles overlapping the expression's context time
+            matching_subtitles = self.subtitle_store.overlapping(start_time, end_time)
             
             logger.info(f"Found {len(matching_subtitles)} matching subtitles")
             return matching_subtitles
@@ -135,10 +189,12 @@ class SubtitleProcessor:
         # This prevents some expressions passing at 0.5 while others fail at 0.7
         MATCH_THRESHOLD = 0.65
 
+        # Cleaned text of each subtitle, shared by the strategies below
+        clean_texts = [clean_text_for_matching(subtitle['text']) for subtitle in context_subtitles]
+
         # Strategy 2: Fuzzy word sequence matching
         expression_word_list = expression_clean.split()
-        for i, subtitle in enumerate(context_subtitles):
-            subtitle_clean = clean_text_for_matching(subtitle['text'])
+        for subtitle, subtitle_clean in zip(context_subtitles, clean_texts):
             subtitle_word_list = subtitle_clean.split()
 
             # Check for consecutive word sequence match
@@ -149,11 +205,8 @@ class SubtitleProcessor:
                 logger.debug(f"Found sequence match (score {score:.2f}): {subtitle['text']}")
 
         # Strategy 3: Word overlap with position weighting (always try, not conditional)
-        for subtitle in context_subtitles:
-            subtitle_clean = clean_text_for_matching(subtitle['text'])
-            subtitle_words = set(subtitle_clean.split())
-
-            if expression_words and subtitle_words:
+        for subtitle, subtitle_clean in zip(context_subtitles, clean_texts):
+            if expression_words and subtitle_clean.split():
                 # Calculate weighted overlap considering word position
                 overlap_score = self._calculate_weighted_overlap(expression_clean, subtitle_clean)
                 if overlap_score > best_score and overlap_score > MATCH_THRESHOLD:
@@ -163,7 +216,7 @@ class SubtitleProcessor:
         
         # Strategy 4: Multi-subtitle span matching for longer expressions
         if not best_match and len(expression_word_list) > 3:
-            best_match = self._find_multi_subtitle_match(context_subtitles, expression_word_list)
+            best_match = self._find_multi_subtitle_match(context_subtitles, expression_word_list, clean_texts)
         
         return best_match
     
@@ -212,20 +265,19 @@ class SubtitleProcessor:
         
         return min(1.0, base_score + order_bonus)
     
-    def _find_multi_subtitle_match(self, context_subtitles, expression_words):
+    def _find_multi_subtitle_match(self, context_subtitles, expression_words, clean_texts=None):
         """Find matches that span multiple subtitles for longer expressions"""
         if len(context_subtitles) < 2:
             return None
+        if clean_texts is None:
+            clean_texts = [clean_text_for_matching(sub['text']) for sub in context_subtitles]
 
         # Use consistent threshold (0.65) across all matching strategies
         MATCH_THRESHOLD = 0.65
 
         # Try to find expression across 2-3 consecutive subtitles
         for i in range(min(len(context_subtitles), 3)):
-            combined_text = " ".join([
-                clean_text_for_matching(sub['text'])
-                for sub in context_subtitles[i:i+2]
-            ])
+            combined_text = " ".join(clean_texts[i:i+2])
             combined_words = combined_text.split()
 
             score = self._calculate_sequence_match_score(expression_words, combined_words)
@@ -618,112 +670,10 @@ class SubtitleProcessor:
         1. Accumulates consecutive subtitle chunks
         2. Matches accumulated text to full dialogue lines
         3. Handles cases where dialogue spans multiple subtitles
-        """
-        subtitle_to_dialogue = []
-        
-        # Clean dialogues for matching
-        clean_dialogues = [clean_text_for_matching(dialogue) for dialogue in dialogues]
         
-        # Accumulate subtitle text to match against full dialogues
-        accumulated_text = ""
-        current_dialogue_idx = -1
-        
-        # Pre-filter subtitles to ignore junk metadata
-        # We process them but mark them as -1 immediately in the loop
-        
-        for i, subtitle in enumerate(subtitles):
-            # Strict filter for metadata/credits
-            raw_text = subtitle['text'].lower()
-            if ('sync' in raw_text and 'corrected by' in raw_text) or \
-               ('==' in raw_text and 'elderman' in raw_text) or \
-               ('<font' in raw_text):
-                logger.debug(f"SKIPPING METADATA: Subtitle '{subtitle['text']}' identified as junk metadata.")
-                subtitle_to_dialogue.append(-1)
-                continue
-
-            clean_subtitle = clean_text_for_matching(subtitle['text'])
-            
-            # Try to find which dialogue this subtitle belongs to
-            best_match_idx = -1
-            best_score = 0
-            match_type = None  # Track which matching strategy succeeded
-
-            # Strategy 1: Check if current accumulated text + this subtitle matches a dialogue
-            test_accumulated = (accumulated_text + " " + clean_subtitle).strip()
-
-            # First pass: Exact and substring matches (most reliable)
-            for j, clean_dialogue in enumerate(clean_dialogues):
-                # 1. Exact/Substring Match
-                if clean_subtitle in clean_dialogue:
-                    score = len(clean_subtitle.split()) / max(len(clean_dialogue.split()), 1)
-                    if score > best_score:
-                        best_score = score
-                        best_match_idx = j
-                
-                # 2. Accumulated Match
-                if test_accumulated in clean_dialogue:
-                    accumulated_score = len(test_accumulated.split()) / max(len(clean_dialogue.split()), 1)
-                    if accumulated_score > best_score:
-                        best_score = accumulated_score
-                        best_match_idx = j
-
-                # 3. Fuzzy Match (Integrated with Proximity Bias)
-                subtitle_words = set(clean_subtitle.split())
-                dialogue_words = set(clean_dialogue.split())
-                
-                if subtitle_words and dialogue_words:
-                    overlap = len(subtitle_words.intersection(dialogue_words))
-                    overlap_score = overlap / len(subtitle_words)
-                    
-                    # Proximity Bonus: Boost score if it matches the expected next dialogue
-                    if j == current_dialogue_idx + 1:
-                        overlap_score *= 1.5  # Strong bias to move forward
-                    elif j == current_dialogue_idx:
-                        overlap_score *= 1.1  # Slight bias to stay current
-                        
-                    # Relaxed threshold (0.5) to catch partial matches like "You can burn bud"
-                    if overlap_score > 0.5 and overlap_score > best_score:
-                        best_score = overlap_score
-                        best_match_idx = j
-            
-            # Update accumulated text and current dialogue index
-            if best_match_idx >= 0:
-                if best_match_idx != current_dialogue_idx:
-                    # New dialogue detected, reset accumulation
-                    accumulated_text = clean_subtitle
-                    current_dialogue_idx = best_match_idx
-                    logger.debug(f"MATCH: Subtitle '{clean_subtitle[:20]}...' -> Dialogue {best_match_idx} (Score: {best_score:.2f})")
-                else:
-                    # Same dialogue, accumulate
-                    accumulated_text = test_accumulated
-                    # logger.debug(f"MATCH: Subtitle '{clean_subtitle[:20]}...' -> Dialogue {best_match_idx} (Accumulating)")
-            else:
-                # No match found - don't reuse previous dialogue for non-speech subtitles
-                # Check if this looks like a sound effect or metadata
-                if is_non_speech_subtitle(subtitle['text']):
-                    # This is likely metadata/sound effect, don't map to any dialogue
-                    best_match_idx = -1
-                    # Don't update accumulated_text or current_dialogue_idx
-                elif current_dialogue_idx >= 0 and len(clean_subtitle.split()) <= 3:
-                    # Very short subtitle (1-3 words) that didn't match - might be continuation
-                    # Only reuse if subtitle is very short (likely part of previous line)
-                    best_match_idx = current_dialogue_idx
-                    accumulated_text = test_accumulated
-                    logger.debug(f"FALLBACK: Subtitle '{clean_subtitle[:20]}...' -> Dialogue {best_match_idx} (Short Continuation)")
-                else:
-                    # Longer subtitle with no match - keep as -1 (will use fallback translation)
-                    best_match_idx = -1
-                    # Reset accumulation
-                    accumulated_text = ""
-                    logger.debug(f"NO MATCH: Subtitle '{clean_subtitle[:30]}...' (Clean: '{clean_subtitle}')")
-
-            subtitle_to_dialogue.append(best_match_idx)
-
-            # Debug logging for mismatches (only log failures)
-            if best_match_idx == -1 and not is_non_speech_subtitle(subtitle['text']):
-                pass # Already logged above as info
-                
-        return subtitle_to_dialogue
+        See DialogueMatcher (indexed once per dialogue list and shared across languages).
+        """
+        return get_dialogue_matcher(dialogues).map_subtitles(subtitles)
     
     def _get_translation_for_subtitle(self, subtitle_idx: int, subtitle: Dict[str, Any],
                                     subtitle_to_dialogue_map: List[int], expression: ExpressionAnalysis) -> str:
@@ -929,8 +879,6 @@ def create_subtitle_file_for_expression(expression: ExpressionAnalysis,
 
 if __name__ == "__main__":
     # Test the subtitle processor
-    import sys
-    
     if len(sys.argv) > 1:
         subtitle_path = sys.argv[1]
         processor = SubtitleProcessor(subtitle_path)
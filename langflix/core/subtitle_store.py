@@ -0,0 +1,108 @@
+"""
+Time-indexed subtitle store for LangFlix
+
+Subtitle timestamps are strings ("HH:MM:SS,mmm"). Range lookups used to
+parse both timestamps of every cue for every expression and language; a
+SubtitleStore parses them once into parallel arrays and answers time-range
+queries with binary search:
+
+    store = SubtitleStore(subtitles)
+    store.overlapping(12.0, 30.5)   # cues with start < 30.5 and end > 12.0
+    store.contained(12.0, 30.5)     # cues with start >= 12.0 and end <= 30.5
+
+Queries cost O(log n + k) for the usual subtitle layout (cues sorted by
+start and at most briefly overlapping each other).
+"""
+
+import bisect
+import logging
+import sys
+from array import array
+from typing import Any, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def time_to_seconds(time_str: str) -> float:
+    """
+    Convert "HH:MM:SS,mmm" (or "HH:MM:SS.mmm") to seconds.
+
+    Returns:
+        Time in seconds (0.0 if the string cannot be parsed)
+    """
+    try:
+        hours, minutes, seconds = time_str.replace(',', '.').split(':')
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except (AttributeError, ValueError) as e:
+        logger.error(f"Error parsing time string '{time_str}': {e}")
+        return 0.0
+
+
+def _field(item: Any, name: str, default: str = '') -> Any:
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+class SubtitleStore:
+    """
+    Immutable, time-sorted view of a subtitle list.
+
+    Items may be subtitle dicts ('start_time', 'end_time', 'text') or objects
+    with the same attributes (e.g. SubtitleEntry). Query results are the
+    original items, in their original order.
+    """
+
+    def __init__(self, items: Sequence[Any]):
+        """
+        Build the store.
+
+        Args:
+            items: Subtitle dicts or objects with start_time/end_time/text
+        """
+        self.items = list(items)
+        starts = [time_to_seconds(_field(item, 'start_time')) for item in self.items]
+        ends = [time_to_seconds(_field(item, 'end_time')) for item in self.items]
+
+        # Cue positions sorted by start time (stable: ties keep file order)
+        order = sorted(range(len(self.items)), key=starts.__getitem__)
+        self._order = array('l', order)
+        self.starts = array('d', (starts[i] for i in order))
+        self.ends = array('d', (ends[i] for i in order))
+        self.texts = tuple(sys.intern(str(_field(self.items[i], 'text'))) for i in order)
+
+        # Running maximum of end times: first cue that may still be "open" at t
+        self._max_ends = array('d')
+        running = float('-inf')
+        for end in self.ends:
+            running = max(running, end)
+            self._max_ends.append(running)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def overlapping_indices(self, start: float, end: float) -> List[int]:
+        """
+        Positions (in the original list) of cues overlapping (start, end).
+
+        A cue overlaps if cue_start < end and cue_end > start.
+        """
+        lo = bisect.bisect_right(self._max_ends, start)
+        hi = bisect.bisect_left(self.starts, end)
+        ends = self.ends
+        return sorted(self._order[i] for i in range(lo, hi) if ends[i] > start)
+
+    def contained_indices(self, start: float, end: float) -> List[int]:
+        """Positions (in the original list) of cues with cue_start >= start and cue_end <= end."""
+        lo = bisect.bisect_left(self.starts, start)
+        hi = bisect.bisect_right(self.starts, end)
+        ends = self.ends
+        return sorted(self._order[i] for i in range(lo, hi) if ends[i] <= end)
+
+    def overlapping(self, start: float, end: float) -> List[Any]:
+        """Cues overlapping (start, end), in original order."""
+        return [self.items[i] for i in self.overlapping_indices(start, end)]
+
+    def contained(self, start: float, end: float) -> List[Any]:
+        """Cues lying entirely within [start, end], in original order."""
+        return [self.items[i] for i in self.contained_indices(start, end)]
@@ -0,0 +1,312 @@
+"""
+Long-Form Compositor - Builds a long-form expression video in one ffmpeg pass.
+
+The multi-pass path in VideoEditor.create_long_form_video writes and re-decodes
+an intermediate file for every step (context extract, timestamp reset,
+expression extract, repeat, concat, logo, loudness). This module expresses the
+whole layout as a single filter graph instead:
+
+    source ─ trim ─ setpts ─ subtitles ─ split ─┬─ context ───────────────┐
+                                                 ├─ trim(expr) ─ setpts ×N ┤
+    transition image + sound effect ─────────────┤ (optional)             ├─ concat ─ logo ─ out
+    educational slide ───────────────────────────┘ (optional)             │
+    audio: asetpts ─ asplit ─ atrim ×N ─ aformat ──────────────── concat ─ loudnorm ─┘
+
+so the source is decoded once and the final output is encoded once.
+
+build_multi_output renders several variants (e.g. one per target language)
+from the same decode by splitting the context before the subtitle burn-in.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import ffmpeg
+
+logger = logging.getLogger(__name__)
+
+# Audio format every segment is converted to before concat
+_AUDIO_FORMAT = {'sample_fmts': 'fltp', 'sample_rates': 48000, 'channel_layouts': 'stereo'}
+
+
+@dataclass
+class LongFormSpec:
+    """Timeline of one long-form expression video"""
+    source_path: str
+    context_start: float  # Seconds into source_path where the context begins
+    context_duration: float
+    expression_start: float  # Seconds, relative to context start
+    expression_duration: float
+    width: int = 1920
+    height: int = 1080
+    fps: float = 25.0
+    repeat_count: int = 2
+    # SRT with timestamps relative to the context start, burned into the context
+    subtitle_path: Optional[str] = None
+    subtitle_force_style: Optional[str] = None
+    fonts_dir: Optional[str] = None
+    # Optional context → expression transition (static image + sound effect)
+    transition_image: Optional[str] = None
+    transition_sound: Optional[str] = None
+    transition_duration: float = 0.0
+    # Optional educational slide appended after the expression repeats
+    slide_path: Optional[str] = None
+    logo_path: Optional[str] = None
+    logo_height: int = 80
+    logo_margin: int = 20
+    logo_opacity: float = 0.5
+    target_lufs: Optional[float] = -16.0
+
+    @property
+    def has_transition(self) -> bool:
+        return bool(self.transition_image and self.transition_sound and self.transition_duration > 0)
+
+    @property
+    def slide_start(self) -> float:
+        """Offset where the slide starts (= duration of context + transition + repeats)"""
+        transition = self.transition_duration if self.has_transition else 0.0
+        return self.context_duration + transition + self.repeat_count * self.expression_duration
+
+
+def _conform_video(stream, spec: LongFormSpec):
+    """Scale/pad a segment to the source geometry so concat accepts it"""
+    return (
+        stream
+        .filter('scale', spec.width, spec.height, force_original_aspect_ratio='decrease')
+        .filter('pad', spec.width, spec.height, '(ow-iw)/2', '(oh-ih)/2')
+        .filter('fps', fps=spec.fps)
+        .filter('setsar', '1')
+    )
+
+
+def _conform_audio(stream):
+    return stream.filter('aformat', **_AUDIO_FORMAT)
+
+
+def _shared_transition(spec: LongFormSpec):
+    """Conformed (video, audio) transition segment, or None"""
+    if not spec.has_transition:
+        return None
+    image = ffmpeg.input(spec.transition_image, loop=1, t=spec.transition_duration, framerate=spec.fps)
+    sound = ffmpeg.input(spec.transition_sound)
+    transition_audio = (
+        sound['a']
+        .filter('atrim', duration=spec.transition_duration)
+        .filter('asetpts', 'PTS-STARTPTS')
+        .filter('apad', whole_dur=spec.transition_duration)
+    )
+    return _conform_video(image['v'], spec), _conform_audio(transition_audio)
+
+
+def _shared_logo(spec: LongFormSpec):
+    """Scaled, semi-transparent logo stream, or None"""
+    if not spec.logo_path:
+        return None
+    return (
+        ffmpeg.input(spec.logo_path)['v']
+        .filter('scale', -1, spec.logo_height)
+        .filter('format', 'rgba')
+        .filter('colorchannelmixer', aa=spec.logo_opacity)
+    )
+
+
+def _build_branch(spec: LongFormSpec, video, audio, transition=None, logo=None):
+    """
+    Build the layout for one output from the decoded context streams.
+
+    Args:
+        spec: Timeline description (subtitle, slide and logo settings of this output)
+        video: Context video stream, timestamps starting at 0
+        audio: Context audio stream, timestamps starting at 0
+        transition: Optional conformed (video, audio) transition segment
+        logo: Optional logo stream
+
+    Returns:
+        (video, audio) streams ready for encoding
+    """
+    if spec.subtitle_path:
+        subtitle_kwargs = {}
+        if spec.fonts_dir:
+            subtitle_kwargs['fontsdir'] = spec.fonts_dir
+        if spec.subtitle_force_style:
+            subtitle_kwargs['force_style'] = spec.subtitle_force_style
+        video = video.filter('subtitles', spec.subtitle_path, **subtitle_kwargs)
+    video = video.filter('setsar', '1')
+
+    video_branches = video.filter_multi_output('split', spec.repeat_count + 1)
+    audio_branches = audio.filter_multi_output('asplit', spec.repeat_count + 1)
+
+    segments = [(video_branches[0], _conform_audio(audio_branches[0]))]
+
+    if transition is not None:
+        segments.append(transition)
+
+    expression_end = spec.expression_start + spec.expression_duration
+    for i in range(1, spec.repeat_count + 1):
+        expr_video = (
+            video_branches[i]
+            .filter('trim', start=spec.expression_start, end=expression_end)
+            .filter('setpts', 'PTS-STARTPTS')
+        )
+        expr_audio = (
+            audio_branches[i]
+            .filter('atrim', start=spec.expression_start, end=expression_end)
+            .filter('asetpts', 'PTS-STARTPTS')
+        )
+        segments.append((expr_video, _conform_audio(expr_audio)))
+
+    if spec.slide_path:
+        slide = ffmpeg.input(spec.slide_path)
+        segments.append((_conform_video(slide['v'], spec), _conform_audio(slide['a'])))
+
+    concat_inputs: List[Any] = []
+    for seg_video, seg_audio in segments:
+        concat_inputs.extend([seg_video, seg_audio])
+    joined = ffmpeg.concat(*concat_inputs, v=1, a=1).node
+    out_video, out_audio = joined[0], joined[1]
+
+    if logo is not None:
+        out_video = ffmpeg.overlay(out_video, logo, x=f'W-w-{spec.logo_margin}', y=spec.logo_margin)
+
+    if spec.target_lufs is not None:
+        out_audio = out_audio.filter('loudnorm', I=spec.target_lufs, LRA=11, TP=-1.5)
+
+    return out_video, out_audio
+
+
+def _encode_output(video, audio, output_path: str, encode_args: Dict[str, Any]):
+    return ffmpeg.output(
+        video,
+        audio,
+        str(output_path),
+        vcodec=encode_args.get('vcodec', 'libx264'),
+        preset=encode_args.get('preset', 'medium'),
+        crf=encode_args.get('crf', 18),
+        pix_fmt='yuv420p',
+        acodec='aac',
+        ac=2,
+        ar=48000,
+        **{'b:a': '320k'}
+    )
+
+
+def _validate(spec: LongFormSpec) -> None:
+    if spec.expression_duration <= 0:
+        raise ValueError(f"Expression duration must be positive, got {spec.expression_duration:.2f}s")
+    if spec.repeat_count < 1:
+        raise ValueError(f"repeat_count must be >= 1, got {spec.repeat_count}")
+
+
+def _decode_context(spec: LongFormSpec):
+    # Input seeking: timestamps restart at 0 at context_start, so a context-relative SRT is in sync
+    source = ffmpeg.input(spec.source_path, ss=spec.context_start, t=spec.context_duration)
+    video = source['v'].filter('setpts', 'PTS-STARTPTS')
+    audio = source['a'].filter('asetpts', 'PTS-STARTPTS')
+    return video, audio
+
+
+def build_long_form_output(spec: LongFormSpec, output_path: str, encode_args: Dict[str, Any]):
+    """
+    Build the ffmpeg-python output node for a long-form video.
+
+    Args:
+        spec: Timeline description
+        output_path: Final video path
+        encode_args: Video encoder args (vcodec, preset, crf)
+
+    Returns:
+        ffmpeg-python OutputStream (call .run() or .compile())
+    """
+    _validate(spec)
+    video, audio = _decode_context(spec)
+    out_video, out_audio = _build_branch(spec, video, audio, _shared_transition(spec), _shared_logo(spec))
+    return _encode_output(out_video, out_audio, output_path, encode_args).overwrite_output()
+
+
+def build_multi_output(specs: List[LongFormSpec], output_paths: List[str], encode_args: Dict[str, Any]):
+    """
+    Build one ffmpeg invocation rendering several variants of the same timeline.
+
+    The context is decoded once and split; each output burns its own subtitles
+    and appends its own slide (e.g. one output per target language). Transition
+    and logo inputs are read once and shared.
+
+    Args:
+        specs: One spec per output; source, context and expression timing must match
+        output_paths: Output path per spec
+        encode_args: Video encoder args (vcodec, preset, crf)
+
+    Returns:
+        ffmpeg-python merged output (call .run() or .compile())
+    """
+    if not specs or len(specs) != len(output_paths):
+        raise ValueError("specs and output_paths must be non-empty and of equal length")
+    if len(specs) == 1:
+        return build_long_form_output(specs[0], output_paths[0], encode_args)
+
+    base = specs[0]
+    for spec in specs:
+        _validate(spec)
+        timeline = (spec.source_path, spec.context_start, spec.context_duration,
+                    spec.expression_start, spec.expression_duration, spec.has_transition, bool(spec.logo_path))
+        if timeline != (base.source_path, base.context_start, base.context_duration,
+                        base.expression_start, base.expression_duration, base.has_transition, bool(base.logo_path)):
+            raise ValueError("Multi-output render requires specs sharing one source timeline")
+
+    count = len(specs)
+    video, audio = _decode_context(base)
+    video_branches = video.filter_multi_output('split', count)
+    audio_branches = audio.filter_multi_output('asplit', count)
+
+    transitions = [None] * count
+    transition = _shared_transition(base)
+    if transition is not None:
+        transition_video = transition[0].filter_multi_output('split', count)
+        transition_audio = transition[1].filter_multi_output('asplit', count)
+        transitions = [(transition_video[i], transition_audio[i]) for i in range(count)]
+
+    logos = [None] * count
+    logo = _shared_logo(base)
+    if logo is not None:
+        logo_branches = logo.filter_multi_output('split', count)
+        logos = [logo_branches[i] for i in range(count)]
+
+    outputs = []
+    for i, (spec, output_path) in enumerate(zip(specs, output_paths)):
+        out_video, out_audio = _build_branch(spec, video_branches[i], audio_branches[i], transitions[i], logos[i])
+        outputs.append(_encode_output(out_video, out_audio, output_path, encode_args))
+    return ffmpeg.merge_outputs(*outputs).overwrite_output()
+
+
+def render_long_form(spec: LongFormSpec, output_path: str, encode_args: Dict[str, Any]) -> Path:
+    """
+    Render a long-form video with a single ffmpeg invocation.
+
+    Raises:
+        ffmpeg.Error: If ffmpeg fails (stderr attached)
+    """
+    stream = build_long_form_output(spec, output_path, encode_args)
+    logger.debug(f"Single-pass long-form command: {' '.join(stream.compile())}")
+    stream.run(capture_stdout=True, capture_stderr=True)
+    logger.info(
+        f"✅ Single-pass long-form video rendered: {output_path} "
+        f"(context {spec.context_duration:.2f}s + {spec.repeat_count}x{spec.expression_duration:.2f}s"
+        f"{' + slide' if spec.slide_path else ''})"
+    )
+    return Path(output_path)
+
+
+def render_multi_output(specs: List[LongFormSpec], output_paths: List[str], encode_args: Dict[str, Any]) -> List[Path]:
+    """
+    Render several long-form variants of one timeline with a single ffmpeg invocation.
+
+    Raises:
+        ffmpeg.Error: If ffmpeg fails (stderr attached)
+    """
+    stream = build_multi_output(specs, output_paths, encode_args)
+    logger.debug(f"Multi-output long-form command: {' '.join(stream.compile())}")
+    stream.run(capture_stdout=True, capture_stderr=True)
+    logger.info(f"✅ Rendered {len(output_paths)} long-form variants from one decode: {[Path(p).name for p in output_paths]}")
+    return [Path(p) for p in output_paths]
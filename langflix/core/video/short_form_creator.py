@@ -12,6 +12,8 @@ Extracted from video_editor.py lines 663-1739
 
 import logging
 import os
+import shutil
+import subprocess
 import textwrap
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -325,25 +327,42 @@ class ShortFormCreator:
             target_width, target_height = settings.get_short_video_dimensions()
             long_form_video_height = settings.get_long_form_video_height()
 
-            # Step 1: Scale and pad the long-form video
-            scaled_path = self._scale_and_pad_video(
-                long_form_video_path,
-                target_width,
-                target_height,
-                long_form_video_height,
-                safe_expression,
-                settings
-            )
+            overlayed_path = None
+            if settings.get_short_form_renderer() == 'single_pass':
+                # Steps 1+2 in one graph: scale/pad and overlays, one encode
+                try:
+                    overlayed_path = self._render_single_pass(
+                        long_form_video_path,
+                        expression,
+                        target_width,
+                        target_height,
+                        long_form_video_height,
+                        safe_expression,
+                        settings
+                    )
+                except RuntimeError as e:
+                    logger.warning(f"Single-pass short render failed, falling back to multi-pass: {e}")
+
+            if overlayed_path is None:
+                # Step 1: Scale and pad the long-form video
+                scaled_path = self._scale_and_pad_video(
+                    long_form_video_path,
+                    target_width,
+                    target_height,
+                    long_form_video_height,
+                    safe_expression,
+                    settings
+                )
 
-            # Step 2: Apply all overlays
-            overlayed_path = self._apply_overlays(
-                scaled_path,
-                expression,
-                expression_index,
-                target_width,
-                target_height,
-                settings
-            )
+                # Step 2: Apply all overlays
+                overlayed_path = self._apply_overlays(
+                    scaled_path,
+                    expression,
+                    expression_index,
+                    target_width,
+                    target_height,
+                    settings
+                )
 
             # Step 3: Final output with optional ending credit
             self._finalize_output(
@@ -370,28 +389,27 @@ class ShortFormCreator:
             logger.error(f"Error creating short-form video: {e}")
             raise
 
-    def _scale_and_pad_video(
+    def _build_scaled_stream(
         self,
         input_video: str,
         target_width: int,
         target_height: int,
-        long_form_video_height: int,
-        safe_expression: str,
-        settings
-    ) -> Path:
+        long_form_video_height: int
+    ):
         """
-        Scale video and add black padding for 9:16 format.
+        Build the crop/scale part of the short-form graph.
+
+        Black bars are cropped, the content is scaled to long_form_video_height
+        and center-cropped to target_width.
 
         Args:
             input_video: Input video path
             target_width: Target width (1080)
-            target_height: Target height (1920)
+            target_height: Target height (1920), fallback if the input cannot be probed
             long_form_video_height: Height for the video content (1040)
-            safe_expression: Sanitized expression for filename
-            settings: Settings module
 
         Returns:
-            Path to scaled and padded video
+            (input_stream, video_stream) ffmpeg-python nodes
         """
         from langflix.media.ffmpeg_utils import detect_black_bars
 
@@ -435,10 +453,6 @@ class ShortFormCreator:
             f"   - Crop Width: {crop_x*2}px (Total from sides)"
         )
 
-        # Create scaled video
-        scaled_path = self.output_dir / f"temp_scaled_{safe_expression}.mkv"
-        self._register_temp_file(scaled_path)
-
         input_stream = ffmpeg.input(str(input_video))
         video_stream = input_stream['v']
 
@@ -457,6 +471,39 @@ class ShortFormCreator:
                 target_width, scaled_height, crop_x, 0
             )
 
+        return input_stream, video_stream
+
+    def _scale_and_pad_video(
+        self,
+        input_video: str,
+        target_width: int,
+        target_height: int,
+        long_form_video_height: int,
+        safe_expression: str,
+        settings
+    ) -> Path:
+        """
+        Scale video and add black padding for 9:16 format.
+
+        Args:
+            input_video: Input video path
+            target_width: Target width (1080)
+            target_height: Target height (1920)
+            long_form_video_height: Height for the video content (1040)
+            safe_expression: Sanitized expression for filename
+            settings: Settings module
+
+        Returns:
+            Path to scaled and padded video
+        """
+        input_stream, video_stream = self._build_scaled_stream(
+            input_video, target_width, target_height, long_form_video_height
+        )
+
+        # Create scaled video
+        scaled_path = self.output_dir / f"temp_scaled_{safe_expression}.mkv"
+        self._register_temp_file(scaled_path)
+
         # Get audio stream
         audio_stream = None
         try:
@@ -532,6 +579,45 @@ class ShortFormCreator:
         input_stream = ffmpeg.input(str(scaled_path))
         video_stream = input_stream['v']
 
+        video_stream = self._build_overlay_stream(
+            video_stream, expression, target_width, target_height, settings
+        )
+
+        # Get audio
+        audio_stream = None
+        try:
+            audio_stream = input_stream['a']
+        except (KeyError, AttributeError):
+            pass
+
+        # Output with overlays
+        overlayed_path = self.output_dir / f"temp_overlayed_{safe_expression}.mkv"
+        self._register_temp_file(overlayed_path)
+
+        self._encode_overlayed(video_stream, audio_stream, overlayed_path)
+        return overlayed_path
+
+    def _build_overlay_stream(
+        self,
+        video_stream,
+        expression: ExpressionAnalysis,
+        target_width: int,
+        target_height: int,
+        settings
+    ):
+        """
+        Add black padding and all OverlayRenderer overlays to a scaled video stream.
+
+        Args:
+            video_stream: Scaled video stream (ffmpeg-python node)
+            expression: Expression data
+            target_width: Video width
+            target_height: Video height
+            settings: Settings module
+
+        Returns:
+            Video stream with padding and overlays
+        """
         # Get the actual scaled height and padding
         # Use explicit top padding for y_offset to ensure correct placement
         # irrespective of whether top/bottom padding are symmetric
@@ -671,17 +757,15 @@ class ShortFormCreator:
                 position="top-center", scale_height=59, opacity=0.5
             )
 
-        # Get audio
-        audio_stream = None
-        try:
-            audio_stream = input_stream['a']
-        except (KeyError, AttributeError):
-            pass
+        return video_stream
 
-        # Output with overlays
-        overlayed_path = self.output_dir / f"temp_overlayed_{safe_expression}.mkv"
-        self._register_temp_file(overlayed_path)
+    def _encode_overlayed(self, video_stream, audio_stream, overlayed_path: Path) -> None:
+        """
+        Encode the overlay graph to overlayed_path.
 
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
         # Use faster preset for complex overlay operations to avoid timeouts
         video_args = self._get_encoding_args(fast_fallback=True)
         try:
@@ -721,6 +805,49 @@ class ShortFormCreator:
             logger.error(f"FFmpeg error applying overlays: {stderr}")
             raise RuntimeError(f"Failed to apply overlays to short video: {stderr}") from e
 
+    def _render_single_pass(
+        self,
+        input_video: str,
+        expression: ExpressionAnalysis,
+        target_width: int,
+        target_height: int,
+        long_form_video_height: int,
+        safe_expression: str,
+        settings
+    ) -> Path:
+        """
+        Crop/scale, pad and overlay the input in one ffmpeg invocation.
+
+        Same graph as _scale_and_pad_video followed by _apply_overlays, without
+        the intermediate scaled encode (one decode, one encode).
+
+        Args:
+            input_video: Input video path
+            expression: Expression data
+            target_width: Target width (1080)
+            target_height: Target height (1920)
+            long_form_video_height: Height for the video content (1040)
+            safe_expression: Sanitized expression for filename
+            settings: Settings module
+
+        Returns:
+            Path to video with overlays
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        input_stream, video_stream = self._build_scaled_stream(
+            input_video, target_width, target_height, long_form_video_height
+        )
+        video_stream = self._build_overlay_stream(
+            video_stream, expression, target_width, target_height, settings
+        )
+
+        overlayed_path = self.output_dir / f"temp_overlayed_{safe_expression}.mkv"
+        self._register_temp_file(overlayed_path)
+
+        self._encode_overlayed(video_stream, input_stream['a'], overlayed_path)
+        logger.info(f"Rendered short-form graph in a single pass: {overlayed_path.name}")
         return overlayed_path
 
     def _finalize_output(
@@ -740,9 +867,6 @@ class ShortFormCreator:
             source_video_path: Original source video for encoding args
             settings: Settings module
         """
-        import shutil
-        import subprocess
-
         # Check for ending credit
         should_add_credit = settings.is_ending_credit_enabled()
         if add_ending_credit is not None:
@@ -751,75 +875,10 @@ class ShortFormCreator:
         if should_add_credit:
             ending_credit_path = settings.get_ending_credit_video_path()
             if ending_credit_path and os.path.exists(ending_credit_path):
-                try:
-                    ending_duration = settings.get_ending_credit_duration()
-                    logger.info(f"Appending ending credit ({ending_duration}s)")
-
-                    temp_with_credit = output_path.parent / f"temp_with_credit_{output_path.name}"
-
-                    credit_has_audio = False
-                    try:
-                        probe = ffmpeg.probe(ending_credit_path)
-                        if any(s.get('codec_type') == 'audio' for s in probe.get('streams', [])):
-                            credit_has_audio = True
-                    except Exception as probe_err:
-                        logger.warning(f"Failed to probe ending credit file: {probe_err}. Assuming no audio.")
-
-                    logger.info(f"Appending ending credit ({ending_duration}s) - Has Audio: {credit_has_audio}")
-
-                    filter_complex = (
-                        f'[1:v]scale=1080:1920:force_original_aspect_ratio=decrease,'
-                        f'pad=1080:1920:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=30[credit_v];'
-                    )
-                    
-                    if credit_has_audio:
-                        filter_complex += f'[0:v][0:a][credit_v][1:a]concat=n=2:v=1:a=1[outv][outa]'
-                    else:
-                        # Generate silence for the duration of the credit
-                        # We use a trick: anullsrc to generate silence, atrim to cut it
-                        filter_complex += (
-                            f'aevalsrc=0:d={ending_duration}[credit_a];'
-                            f'[0:v][0:a][credit_v][credit_a]concat=n=2:v=1:a=1[outv][outa]'
-                        )
-
-                    cmd = [
-                        'ffmpeg', '-y',
-                        '-i', str(overlayed_path),
-                        '-i', ending_credit_path,
-                        '-filter_complex', filter_complex,
-                        '-map', '[outv]',
-                        '-map', '[outa]',
-                        '-c:v', 'libx264',
-                        '-c:a', 'aac',
-                        '-preset', 'medium',
-                        '-crf', '18',
-                        str(temp_with_credit)
-                    ]
-
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-
-                    if result.returncode == 0 and temp_with_credit.exists():
-                        try:
-                            shutil.move(str(temp_with_credit), str(output_path))
-                        except OSError as move_err:
-                            if hasattr(move_err, 'errno') and move_err.errno == 1:
-                                logger.warning(f"Move failed (EPERM), trying copy+unlink: {move_err}")
-                                shutil.copyfile(str(temp_with_credit), str(output_path))
-                                temp_with_credit.unlink()
-                            else:
-                                raise
-                        logger.info("✅ Ending credit appended")
-                        return
-                    else:
-                        logger.warning("Ending credit failed, using video without credit")
-                        # Clean up failed temp file
-                        if temp_with_credit.exists():
-                            temp_with_credit.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to append ending credit: {e}")
-                    # Clean up failed temp file
-                    if temp_with_credit.exists():
-                        temp_with_credit.unlink()
+                if self._append_prepared_credit(overlayed_path, output_path, ending_credit_path):
+                    return
+                if self._append_credit_reencode(overlayed_path, output_path, ending_credit_path, settings):
+                    return
 
         # Final copy
         try:
@@ -839,6 +898,125 @@ class ShortFormCreator:
             else:
                 raise
 
+    def _append_prepared_credit(self, overlayed_path: Path, output_path: Path, ending_credit_path: str) -> bool:
+        """
+        Append the ending credit with stream copy.
+
+        The credit is encoded once with the overlay pass's parameters (cached
+        across shorts and runs) and joined with the concat demuxer, so the
+        short itself is not re-encoded.
+
+        Returns:
+            True if the credit was appended
+        """
+        from langflix.media.ending_credit import (
+            append_with_concat_copy,
+            credit_params_for,
+            get_prepared_ending_credit,
+        )
+
+        temp_with_credit = output_path.parent / f"temp_with_credit_{output_path.name}"
+        try:
+            params = credit_params_for(str(overlayed_path), self._get_encoding_args(fast_fallback=True))
+            if params is None:
+                return False
+            prepared_credit = get_prepared_ending_credit(ending_credit_path, params)
+            append_with_concat_copy(str(overlayed_path), prepared_credit, str(temp_with_credit))
+            shutil.move(str(temp_with_credit), str(output_path))
+        except Exception as e:
+            stderr = getattr(e, 'stderr', None)
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8', errors='replace')
+            logger.warning(f"Ending credit concat copy failed, re-encoding instead: {stderr or e}")
+            if temp_with_credit.exists():
+                temp_with_credit.unlink()
+            return False
+
+        logger.info("✅ Ending credit appended (stream copy)")
+        return True
+
+    def _append_credit_reencode(
+        self,
+        overlayed_path: Path,
+        output_path: Path,
+        ending_credit_path: str,
+        settings
+    ) -> bool:
+        """
+        Append the ending credit by re-encoding the short through a concat filter.
+
+        Returns:
+            True if the credit was appended
+        """
+        temp_with_credit = output_path.parent / f"temp_with_credit_{output_path.name}"
+        try:
+            ending_duration = settings.get_ending_credit_duration()
+
+            credit_has_audio = False
+            try:
+                probe = ffmpeg.probe(ending_credit_path)
+                if any(s.get('codec_type') == 'audio' for s in probe.get('streams', [])):
+                    credit_has_audio = True
+            except Exception as probe_err:
+                logger.warning(f"Failed to probe ending credit file: {probe_err}. Assuming no audio.")
+
+            logger.info(f"Appending ending credit ({ending_duration}s) - Has Audio: {credit_has_audio}")
+
+            filter_complex = (
+                f'[1:v]scale=1080:1920:force_original_aspect_ratio=decrease,'
+                f'pad=1080:1920:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=30[credit_v];'
+            )
+
+            if credit_has_audio:
+                filter_complex += f'[0:v][0:a][credit_v][1:a]concat=n=2:v=1:a=1[outv][outa]'
+            else:
+                # Generate silence for the duration of the credit
+                # We use a trick: anullsrc to generate silence, atrim to cut it
+                filter_complex += (
+                    f'aevalsrc=0:d={ending_duration}[credit_a];'
+                    f'[0:v][0:a][credit_v][credit_a]concat=n=2:v=1:a=1[outv][outa]'
+                )
+
+            cmd = [
+                'ffmpeg', '-y',
+                '-i', str(overlayed_path),
+                '-i', ending_credit_path,
+                '-filter_complex', filter_complex,
+                '-map', '[outv]',
+                '-map', '[outa]',
+                '-c:v', 'libx264',
+                '-c:a', 'aac',
+                '-preset', 'medium',
+                '-crf', '18',
+                str(temp_with_credit)
+            ]
+
+            result = subprocess.run(cmd, capture_output=True, text=True)
+
+            if result.returncode == 0 and temp_with_credit.exists():
+                try:
+                    shutil.move(str(temp_with_credit), str(output_path))
+                except OSError as move_err:
+                    if hasattr(move_err, 'errno') and move_err.errno == 1:
+                        logger.warning(f"Move failed (EPERM), trying copy+unlink: {move_err}")
+                        shutil.copyfile(str(temp_with_credit), str(output_path))
+                        temp_with_credit.unlink()
+                    else:
+                        raise
+                logger.info("✅ Ending credit appended")
+                return True
+            else:
+                logger.warning("Ending credit failed, using video without credit")
+                # Clean up failed temp file
+                if temp_with_credit.exists():
+                    temp_with_credit.unlink()
+        except Exception as e:
+            logger.warning(f"Failed to append ending credit: {e}")
+            # Clean up failed temp file
+            if temp_with_credit.exists():
+                temp_with_credit.unlink()
+        return False
+
     def _write_metadata_file(self, video_path: Path, expression: 'ExpressionAnalysis') -> None:
         """Write metadata file for YouTube upload.
         
@@ -195,7 +195,8 @@ class VideoEditor:
         pre_extracted_context_clip: Optional[Path] = None,
         language_code: Optional[str] = None,
         subtitle_path: Optional[str] = None,
-        include_slides: bool = True
+        include_slides: bool = True,
+        context_subtitle_path: Optional[str] = None
     ) -> str:
         """
         Create long-form video with unified layout:
@@ -211,6 +212,8 @@ class VideoEditor:
             pre_extracted_context_clip: Optional pre-extracted context clip path (Clean)
             language_code: Optional language code for language-specific subtitle paths
             subtitle_path: Optional path to SRT/ASS file to burn into context
+            context_subtitle_path: Optional context-relative dual subtitle SRT to burn into a
+                raw pre_extracted_context_clip (same style as a VideoFactory "Master Clip")
             
         Returns:
             Path to created long-form video
@@ -219,60 +222,52 @@ class VideoEditor:
             from langflix.utils.filename_utils import sanitize_for_expression_filename
             expr_text = get_expr_attr(expression, 'expression', '')
             safe_expression = sanitize_for_expression_filename(expr_text)
-            # Use index to ensure uniqueness and order (e.g., "expression_01_throw_em_off.mkv")
-            # Truncate safe_expression to avoid too long filenames
-            output_filename = f"expression_{expression_index+1:02d}_{safe_expression[:50]}.mkv"
-            
-            # Use expressions/ directory from paths (created by output_manager)
-            if hasattr(self, 'output_dir') and hasattr(self.output_dir, 'parent'):
-                # Try to find expressions directory in parent structure
-                lang_dir = self.output_dir.parent
-                if lang_dir.name in ['ko', 'ja', 'zh', 'en']:  # Language code
-                    expressions_dir = lang_dir / "expressions"
-                else:
-                    expressions_dir = self.output_dir.parent / "expressions"
-            else:
-                # Fallback: create in output_dir parent
-                expressions_dir = Path(self.output_dir).parent / "expressions"
-                expressions_dir.mkdir(parents=True, exist_ok=True)
-            
-            output_path = expressions_dir / output_filename
+            output_path = self._get_long_form_output_path(expression, expression_index)
             
             logger.info(f"Creating long-form video for: {expr_text}")
             
             # Step 1: Extract expression video clip from context and repeat it (2회)
-            context_start_seconds = self._time_to_seconds(get_expr_attr(expression, 'context_start_time'))
-            expression_start_seconds = self._time_to_seconds(get_expr_attr(expression, 'expression_start_time'))
-            expression_end_seconds = self._time_to_seconds(get_expr_attr(expression, 'expression_end_time'))
-            
-            # Apply padding to ensure audio is fully captured (TICKET-FIX-SLICING)
-            # Subtitles are often tight, and ffmpeg frame boundaries can cut off start/end
-            AUDIO_PADDING = 0.1
-            padded_start = max(0, expression_start_seconds - AUDIO_PADDING)
-            padded_end = expression_end_seconds + AUDIO_PADDING
-            
-            # Update extraction times
-            logger.info(f"Applying padding to expression: {expression_start_seconds:.3f}-{expression_end_seconds:.3f} -> {padded_start:.3f}-{padded_end:.3f} (+/-{AUDIO_PADDING}s)")
-            expression_start_seconds = padded_start
-            expression_end_seconds = padded_end
-            
-            # Validate expression is within context bounds (should be guaranteed by script_agent validation)
-            if expression_start_seconds < context_start_seconds:
-                raise ValueError(
-                    f"Expression start ({expression_start_seconds:.2f}s) is before context start ({context_start_seconds:.2f}s). "
-                    f"This indicates invalid data from LLM - expression_dialogue_index must be within context bounds."
-                )
-            
-            relative_start = expression_start_seconds - context_start_seconds
-            relative_end = expression_end_seconds - context_start_seconds
-            expression_duration = relative_end - relative_start
-            
-            if expression_duration <= 0:
-                logger.error(f"Invalid expression duration: {expression_duration:.2f}s")
-                raise ValueError(f"Expression duration must be positive, got {expression_duration:.2f}s")
-            
-            logger.info(f"Expression relative: {relative_start:.2f}s - {relative_end:.2f}s ({expression_duration:.2f}s)")
+            context_start_seconds, relative_start, expression_duration = self._get_expression_window(expression)
+            relative_end = relative_start + expression_duration
+            expression_start_seconds = context_start_seconds + relative_start
+            expression_end_seconds = context_start_seconds + relative_end
             
+            # Single-pass compositor: one decode of the source, one encode of the output
+            if settings.get_long_form_compositor() == "single_pass":
+                try:
+                    return self._create_long_form_single_pass(
+                        expression,
+                        output_path,
+                        context_video_path,
+                        expression_video_path,
+                        expression_index=expression_index,
+                        context_start_seconds=context_start_seconds,
+                        relative_start=relative_start,
+                        expression_duration=expression_duration,
+                        pre_extracted_context_clip=pre_extracted_context_clip,
+                        context_subtitle_path=context_subtitle_path,
+                        subtitle_path=subtitle_path,
+                        include_slides=include_slides
+                    )
+                except Exception as e:
+                    stderr = e.stderr.decode('utf-8', errors='replace')[-2000:] if isinstance(e, ffmpeg.Error) and e.stderr else str(e)
+                    logger.warning(f"Single-pass long-form render failed, falling back to multi-pass: {stderr}")
+
+            # Burn subtitles into a raw pre-extracted clip first ("Master Clip")
+            if context_subtitle_path and pre_extracted_context_clip and pre_extracted_context_clip.exists():
+                master_clip_path = self.output_dir / f"temp_master_clip_{safe_expression}.mkv"
+                self._register_temp_file(master_clip_path)
+                subs_overlay.apply_dual_subtitle_layers(
+                    str(pre_extracted_context_clip),
+                    str(context_subtitle_path),
+                    "",
+                    str(master_clip_path),
+                    0.0,
+                    get_duration_seconds(str(pre_extracted_context_clip)),
+                    encoding_params={'preset': 'ultrafast', 'crf': 28} if self.test_mode else None
+                )
+                pre_extracted_context_clip = master_clip_path
+
             # Step 1a: Extract context clip from original video WITH subtitles (or reuse pre-extracted)
             if pre_extracted_context_clip and pre_extracted_context_clip.exists():
                 # Reuse pre-extracted context clip (for multi-language support)
@@ -295,42 +290,7 @@ class VideoEditor:
                 logger.info(f"Extracting context clip with subtitles: {context_start_seconds:.2f}s - {context_end_seconds:.2f}s ({context_duration:.2f}s)")
 
                 # Find and apply subtitle file
-                subtitle_file = None
-                # Try to find subtitle file in subtitles directory (language-specific if paths available)
-                if hasattr(self, 'paths') and self.paths:
-                    lang_paths = self.paths
-                    if 'subtitles' in lang_paths:
-                        subtitles_dir = lang_paths['subtitles']
-                    else:
-                        subtitles_dir = self.output_dir.parent / "subtitles"
-                else:
-                    subtitles_dir = self.output_dir.parent / "subtitles"
-                
-                if subtitles_dir.exists():
-                    from langflix.utils.filename_utils import sanitize_for_expression_filename
-                    safe_expression_short = sanitize_for_expression_filename(get_expr_attr(expression, 'expression', ''))[:30]
-                    subtitle_filename = f"expression_{expression_index+1:02d}_{safe_expression_short}.srt"
-                    subtitle_file_path = Path(subtitles_dir) / subtitle_filename
-                    
-                    if subtitle_file_path.exists():
-                        subtitle_file = subtitle_file_path
-                        logger.info(f"Found subtitle file: {subtitle_file}")
-                    else:
-                        # Try to find any subtitle file matching the expression
-                        pattern = f"expression_*_{safe_expression_short}*.srt"
-                        matching_files = list(Path(subtitles_dir).glob(pattern))
-                        if matching_files:
-                            subtitle_file = matching_files[0]
-                            logger.info(f"Found matching subtitle file: {subtitle_file}")
-                        else:
-                            # Fallback: Try to find by index only (most reliable if order is preserved)
-                            pattern_index = f"expression_{expression_index+1:02d}_*.srt"
-                            matching_files_index = list(Path(subtitles_dir).glob(pattern_index))
-                            if matching_files_index:
-                                subtitle_file = matching_files_index[0]
-                                logger.info(f"Found subtitle file by index: {subtitle_file}")
-                            else:
-                                logger.warning(f"No subtitle file found for expression '{get_expr_attr(expression, 'expression', '')}' (index {expression_index+1})")
+                subtitle_file = self._find_expression_subtitle_file(expression, expression_index)
                 
                 if subtitle_file and subtitle_file.exists():
                     logger.info(f"Applying subtitles from: {subtitle_file}")
@@ -751,6 +711,331 @@ class VideoEditor:
             logger.error(f"Error creating long-form video: {e}")
             raise
 
+    def _find_expression_subtitle_file(self, expression: ExpressionAnalysis, expression_index: int) -> Optional[Path]:
+        """Find the context-relative dual subtitle file generated for an expression"""
+        # Try to find subtitle file in subtitles directory (language-specific if paths available)
+        if hasattr(self, 'paths') and self.paths:
+            lang_paths = self.paths
+            if 'subtitles' in lang_paths:
+                subtitles_dir = lang_paths['subtitles']
+            else:
+                subtitles_dir = self.output_dir.parent / "subtitles"
+        else:
+            subtitles_dir = self.output_dir.parent / "subtitles"
+        
+        if not Path(subtitles_dir).exists():
+            return None
+        
+        safe_expression_short = sanitize_for_expression_filename(get_expr_attr(expression, 'expression', ''))[:30]
+        subtitle_filename = f"expression_{expression_index+1:02d}_{safe_expression_short}.srt"
+        subtitle_file_path = Path(subtitles_dir) / subtitle_filename
+        
+        if subtitle_file_path.exists():
+            logger.info(f"Found subtitle file: {subtitle_file_path}")
+            return subtitle_file_path
+        
+        # Try to find any subtitle file matching the expression
+        pattern = f"expression_*_{safe_expression_short}*.srt"
+        matching_files = list(Path(subtitles_dir).glob(pattern))
+        if matching_files:
+            logger.info(f"Found matching subtitle file: {matching_files[0]}")
+            return matching_files[0]
+        
+        # Fallback: Try to find by index only (most reliable if order is preserved)
+        pattern_index = f"expression_{expression_index+1:02d}_*.srt"
+        matching_files_index = list(Path(subtitles_dir).glob(pattern_index))
+        if matching_files_index:
+            logger.info(f"Found subtitle file by index: {matching_files_index[0]}")
+            return matching_files_index[0]
+        
+        logger.warning(f"No subtitle file found for expression '{get_expr_attr(expression, 'expression', '')}' (index {expression_index+1})")
+        return None
+
+    def _get_long_form_output_path(self, expression: ExpressionAnalysis, expression_index: int) -> Path:
+        """Output path of an expression's long-form video (e.g. expressions/expression_01_throw_em_off.mkv)"""
+        from langflix.utils.filename_utils import sanitize_for_expression_filename
+        safe_expression = sanitize_for_expression_filename(get_expr_attr(expression, 'expression', ''))
+        # Use index to ensure uniqueness and order
+        # Truncate safe_expression to avoid too long filenames
+        output_filename = f"expression_{expression_index+1:02d}_{safe_expression[:50]}.mkv"
+        
+        # Use expressions/ directory from paths (created by output_manager)
+        if hasattr(self, 'output_dir') and hasattr(self.output_dir, 'parent'):
+            # Try to find expressions directory in parent structure
+            lang_dir = self.output_dir.parent
+            if lang_dir.name in ['ko', 'ja', 'zh', 'en']:  # Language code
+                expressions_dir = lang_dir / "expressions"
+            else:
+                expressions_dir = self.output_dir.parent / "expressions"
+        else:
+            # Fallback: create in output_dir parent
+            expressions_dir = Path(self.output_dir).parent / "expressions"
+            expressions_dir.mkdir(parents=True, exist_ok=True)
+        
+        return expressions_dir / output_filename
+
+    def _get_expression_window(self, expression: ExpressionAnalysis) -> Tuple[float, float, float]:
+        """
+        Padded expression window of an expression.
+        
+        Returns:
+            (context_start_seconds, relative_start, expression_duration), where
+            relative_start is relative to the context start
+            
+        Raises:
+            ValueError: If the expression lies before the context or has no duration
+        """
+        context_start_seconds = self._time_to_seconds(get_expr_attr(expression, 'context_start_time'))
+        expression_start_seconds = self._time_to_seconds(get_expr_attr(expression, 'expression_start_time'))
+        expression_end_seconds = self._time_to_seconds(get_expr_attr(expression, 'expression_end_time'))
+        
+        # Apply padding to ensure audio is fully captured (TICKET-FIX-SLICING)
+        # Subtitles are often tight, and ffmpeg frame boundaries can cut off start/end
+        AUDIO_PADDING = 0.1
+        padded_start = max(0, expression_start_seconds - AUDIO_PADDING)
+        padded_end = expression_end_seconds + AUDIO_PADDING
+        
+        logger.info(f"Applying padding to expression: {expression_start_seconds:.3f}-{expression_end_seconds:.3f} -> {padded_start:.3f}-{padded_end:.3f} (+/-{AUDIO_PADDING}s)")
+        
+        # Validate expression is within context bounds (should be guaranteed by script_agent validation)
+        if padded_start < context_start_seconds:
+            raise ValueError(
+                f"Expression start ({padded_start:.2f}s) is before context start ({context_start_seconds:.2f}s). "
+                f"This indicates invalid data from LLM - expression_dialogue_index must be within context bounds."
+            )
+        
+        relative_start = padded_start - context_start_seconds
+        relative_end = padded_end - context_start_seconds
+        expression_duration = relative_end - relative_start
+        
+        if expression_duration <= 0:
+            logger.error(f"Invalid expression duration: {expression_duration:.2f}s")
+            raise ValueError(f"Expression duration must be positive, got {expression_duration:.2f}s")
+        
+        logger.info(f"Expression relative: {relative_start:.2f}s - {relative_end:.2f}s ({expression_duration:.2f}s)")
+        return context_start_seconds, relative_start, expression_duration
+
+    def prepare_long_form_render(
+        self,
+        expression: ExpressionAnalysis,
+        original_video_path: str,
+        expression_index: int = 0,
+        pre_extracted_context_clip: Optional[Path] = None,
+        include_slides: bool = True,
+        context_subtitle_path: Optional[str] = None
+    ):
+        """
+        Prepare a single-pass long-form render without running it.
+        
+        Used to render several languages of the same expression in one ffmpeg
+        invocation (see long_form_compositor.render_multi_output).
+
+        Args:
+            expression: ExpressionAnalysis object
+            original_video_path: Original video (context source without a pre-extracted clip, slide audio)
+            expression_index: Index of expression
+            pre_extracted_context_clip: Clip starting at the context start
+            include_slides: Whether to append the educational slide
+            context_subtitle_path: Optional context-relative SRT to burn
+
+        Returns:
+            (LongFormSpec, output_path, encode_args)
+        """
+        output_path = self._get_long_form_output_path(expression, expression_index)
+        context_start_seconds, relative_start, expression_duration = self._get_expression_window(expression)
+        spec = self._build_long_form_spec(
+            expression,
+            original_video_path,
+            original_video_path,
+            expression_index=expression_index,
+            context_start_seconds=context_start_seconds,
+            relative_start=relative_start,
+            expression_duration=expression_duration,
+            pre_extracted_context_clip=pre_extracted_context_clip,
+            context_subtitle_path=context_subtitle_path,
+            include_slides=include_slides
+        )
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        return spec, output_path, self._get_video_output_args(source_video_path=spec.source_path)
+
+    def _create_long_form_single_pass(
+        self,
+        expression: ExpressionAnalysis,
+        output_path: Path,
+        context_video_path: str,
+        expression_video_path: str,
+        expression_index: int,
+        context_start_seconds: float,
+        relative_start: float,
+        expression_duration: float,
+        pre_extracted_context_clip: Optional[Path] = None,
+        context_subtitle_path: Optional[str] = None,
+        subtitle_path: Optional[str] = None,
+        include_slides: bool = True
+    ) -> str:
+        """
+        Render the long-form layout (context → transition → expression x2 → slide, logo,
+        loudness normalization) with one ffmpeg filter graph instead of one encode per step.
+
+        Args:
+            expression: ExpressionAnalysis object
+            output_path: Final long-form video path
+            context_video_path: Original video (used when no pre-extracted clip)
+            expression_video_path: Video used for the educational slide audio
+            expression_index: Index of expression
+            context_start_seconds: Context start in the original video
+            relative_start: Padded expression start, relative to context start
+            expression_duration: Padded expression duration
+            pre_extracted_context_clip: Optional clip starting at the context start
+            context_subtitle_path: Optional context-relative SRT to burn (Master Clip style)
+            subtitle_path: Optional SRT/ASS to burn (long-form style)
+            include_slides: Whether to append the educational slide
+
+        Returns:
+            Path to created long-form video
+        """
+        from langflix.core.video.long_form_compositor import render_long_form
+
+        spec = self._build_long_form_spec(
+            expression,
+            context_video_path,
+            expression_video_path,
+            expression_index=expression_index,
+            context_start_seconds=context_start_seconds,
+            relative_start=relative_start,
+            expression_duration=expression_duration,
+            pre_extracted_context_clip=pre_extracted_context_clip,
+            context_subtitle_path=context_subtitle_path,
+            subtitle_path=subtitle_path,
+            include_slides=include_slides
+        )
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        render_long_form(spec, str(output_path), self._get_video_output_args(source_video_path=spec.source_path))
+
+        from langflix.services.output_manager import OutputManager
+        OutputManager.ensure_write_permissions(output_path, is_file=True)
+        return str(output_path)
+
+    def _build_long_form_spec(
+        self,
+        expression: ExpressionAnalysis,
+        context_video_path: str,
+        expression_video_path: str,
+        expression_index: int,
+        context_start_seconds: float,
+        relative_start: float,
+        expression_duration: float,
+        pre_extracted_context_clip: Optional[Path] = None,
+        context_subtitle_path: Optional[str] = None,
+        subtitle_path: Optional[str] = None,
+        include_slides: bool = True
+    ):
+        """Build the LongFormSpec for a single-pass render (creates the educational slide if enabled)"""
+        from langflix.config.font_utils import get_fonts_dir
+        from langflix.core.video.long_form_compositor import LongFormSpec
+        from langflix.media.ffmpeg_utils import get_video_params
+
+        if pre_extracted_context_clip and pre_extracted_context_clip.exists():
+            source_path = str(pre_extracted_context_clip)
+            context_start = 0.0
+            context_duration = get_duration_seconds(source_path)
+            # Without context_subtitle_path the clip is a Master Clip with subtitles already burned
+            dual_subtitle_file = context_subtitle_path
+        else:
+            source_path = str(context_video_path)
+            context_start = context_start_seconds
+            context_end_seconds = self._time_to_seconds(get_expr_attr(expression, 'context_end_time'))
+            context_duration = context_end_seconds - context_start_seconds
+            dual_subtitle_file = context_subtitle_path or self._find_expression_subtitle_file(expression, expression_index)
+
+        subtitle_file = None
+        force_style = None
+        fonts_dir = None
+        if dual_subtitle_file and Path(dual_subtitle_file).exists():
+            # Same wrapping and style as apply_dual_subtitle_layers
+            subtitle_file = str(dual_subtitle_file)
+            try:
+                path_obj = Path(dual_subtitle_file)
+                wrapped_path = self.output_dir / f"temp_wrapped_{path_obj.stem}.srt"
+                self._register_temp_file(wrapped_path)
+                subtitle_file = str(subs_overlay.wrap_subtitle_lines(path_obj, wrapped_path, max_chars=25))
+            except Exception as e:
+                logger.warning(f"Failed to wrap subtitles for single-pass render: {e}")
+            force_style = subs_overlay.build_ass_force_style(is_expression=False)
+            fonts_dir = get_fonts_dir()
+        elif subtitle_path and Path(subtitle_path).exists():
+            from langflix.settings import FONTS_DIR
+            subtitle_file = str(subtitle_path)
+            force_style = "FontSize=16,MarginV=35,Outline=1,Shadow=1"
+            fonts_dir = str(FONTS_DIR)
+
+        params = get_video_params(source_path)
+        try:
+            num, _, den = (params.r_frame_rate or "25/1").partition('/')
+            fps = float(num) / float(den or 1)
+        except (ValueError, ZeroDivisionError):
+            fps = 25.0
+
+        project_root = Path(__file__).parent.parent.parent
+        transition_image = transition_sound = None
+        transition_duration = 0.0
+        transition_config = settings.get_transitions_config().get('context_to_expression_transition', {})
+        if transition_config.get('enabled', False):
+            image = project_root / transition_config.get('image_path_16_9', 'assets/images/transition_16_9.png')
+            sound = project_root / transition_config.get('sound_effect_path', 'assets/audio/sound_effect.mp3')
+            if image.exists() and sound.exists():
+                transition_image, transition_sound = str(image), str(sound)
+                transition_duration = transition_config.get('duration', 0.3)
+            else:
+                logger.warning(f"Transition assets not found ({image}, {sound}), skipping transition")
+
+        logo_path = project_root / "assets" / "top_logo.png"
+
+        spec = LongFormSpec(
+            source_path=source_path,
+            context_start=context_start,
+            context_duration=context_duration,
+            expression_start=relative_start,
+            expression_duration=expression_duration,
+            width=params.width or 1920,
+            height=params.height or 1080,
+            fps=fps,
+            repeat_count=2,
+            subtitle_path=subtitle_file,
+            subtitle_force_style=force_style,
+            fonts_dir=fonts_dir,
+            transition_image=transition_image,
+            transition_sound=transition_sound,
+            transition_duration=transition_duration,
+            logo_path=str(logo_path) if logo_path.exists() else None,
+            target_lufs=-16.0
+        )
+
+        # Store for downstream services (TICKET-VIDEO-001)
+        context_expr_duration = spec.slide_start
+        try:
+            if isinstance(expression, dict):
+                expression['educational_slide_start_time'] = context_expr_duration
+            else:
+                setattr(expression, 'educational_slide_start_time', context_expr_duration)
+        except Exception:
+            pass
+
+        if include_slides and settings.is_educational_slide_enabled():
+            educational_slide = self._create_educational_slide(
+                expression_video_path,
+                expression,
+                expression_index,
+                target_duration=context_expr_duration,
+                use_expression_audio=True,
+                expression_video_clip_path=str(expression_video_path)
+            )
+            if educational_slide:
+                spec.slide_path = str(educational_slide)
+
+        return spec
+
     def create_short_form_from_long_form(
         self,
         long_form_video_path: str,
@@ -899,11 +1184,13 @@ class VideoEditor:
         # ASS uses BGR format
         return f"&H{b:02x}{g:02x}{r:02x}"
     
-    def _cleanup_temp_files(self, preserve_short_format: bool = False) -> None:
+    def _cleanup_temp_files(self, preserve_short_format: bool = False, owned_only: bool = False) -> None:
         """Clean up all temporary files created by this VideoEditor instance.
         
         Args:
             preserve_short_format: If True, preserve short format expression videos
+            owned_only: If True, skip the temp_* sweep of output_dir (other editors
+                may be rendering into the same directory concurrently)
         """
         try:
             # Get list of files to preserve
@@ -941,7 +1228,7 @@ class VideoEditor:
             
             # Also clean up any temp_* files in output_dir (long_form_videos)
             # But exclude short format files if preserving
-            if hasattr(self, 'output_dir') and self.output_dir.exists():
+            if not owned_only and hasattr(self, 'output_dir') and self.output_dir.exists():
                 temp_files = list(self.output_dir.glob("temp_*.mkv"))
                 temp_files.extend(list(self.output_dir.glob("temp_*.txt")))
                 temp_files.extend(list(self.output_dir.glob("temp_*.wav")))
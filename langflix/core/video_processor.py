@@ -160,6 +160,8 @@ class VideoProcessor:
         TICKET-035: Implements adaptive clip extraction with stream copy fallback.
         - 'auto': Try stream copy first, fallback to re-encode (fastest, recommended)
         - 'copy': Stream copy only (fastest, may fail)
+        - 'smart': Re-encode only the head GOP, stream copy the rest (frame-accurate),
+                   fallback to re-encode
         - 'encode': Always re-encode (slowest, most compatible)
         
         Args:
@@ -167,7 +169,7 @@ class VideoProcessor:
             start_time: Start time in format "HH:MM:SS.mmm"
             end_time: End time in format "HH:MM:SS.mmm"
             output_path: Path for output clip
-            strategy: Extraction strategy ('auto', 'copy', 'encode'). 
+            strategy: Extraction strategy ('auto', 'copy', 'smart', 'encode'). 
                      If None, uses configuration setting.
             encoding_params: Optional dict with 'preset', 'crf', 'audio_bitrate' to override defaults.
             
@@ -194,6 +196,12 @@ class VideoProcessor:
             effective_strategy = strategy or settings.get_clip_extraction_strategy() or 'encode'
             copy_threshold = settings.get_clip_copy_threshold_seconds()
             
+            if effective_strategy == 'smart':
+                if self._extract_clip_smart(video_path, start_seconds, end_seconds, output_path, encoding_params):
+                    return True
+                logger.info("Smart cut not possible for this range, using re-encode")
+                return self._extract_clip_encode(video_path, start_seconds, duration, output_path, encoding_params)
+            
             # Decide whether to attempt stream copy
             should_try_copy = (
                 effective_strategy in ('auto', 'copy') and 
@@ -262,6 +270,33 @@ class VideoProcessor:
             logger.debug(f"Stream copy failed: {stderr[:200]}")
             return False
     
+    def _extract_clip_smart(self, video_path: Path, start_seconds: float,
+                            end_seconds: float, output_path: Path,
+                            encoding_params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Extract clip with a smart cut: re-encode up to the first keyframe, stream copy the rest.
+        
+        Frame-accurate like re-encode, but only the head GOP and the audio are encoded.
+        Uses the cached keyframe index of the source.
+        
+        Args:
+            video_path: Source video path
+            start_seconds: Start time in seconds
+            end_seconds: End time in seconds
+            output_path: Output clip path
+            encoding_params: Optional dict with 'preset', 'crf', 'audio_bitrate'
+            
+        Returns:
+            True if successful, False if the caller should fall back to re-encode
+        """
+        try:
+            from langflix.media.smart_cut import smart_cut_extract
+            success = smart_cut_extract(str(video_path), start_seconds, end_seconds, str(output_path), encoding_params)
+            return success and output_path.exists() and output_path.stat().st_size > 1000
+        except Exception as e:
+            logger.warning(f"Smart cut extraction failed: {e}")
+            return False
+    
     def _extract_clip_encode(self, video_path: Path, start_seconds: float, 
                             duration: float, output_path: Path,
                             encoding_params: Optional[Dict[str, Any]] = None) -> bool:
@@ -4,10 +4,32 @@ CRUD operations for LangFlix database models.
 This module provides database operations for Media, Expression, and ProcessingJob models.
 """
 
-from typing import Optional, List
+import uuid
+from typing import Any, Dict, Iterable, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from langflix.db.models import Media, Expression, ProcessingJob
+from sqlalchemy.dialects import postgresql, sqlite
+from langflix.db.models import Media, Expression, ProcessingJob, EXPRESSION_NATURAL_KEY
+
+# Expression columns filled from ExpressionAnalysis data (object or dict)
+_ANALYSIS_FIELDS = (
+    'expression',
+    'expression_translation',
+    'expression_dialogue',
+    'expression_dialogue_translation',
+    'similar_expressions',
+    'context_start_time',
+    'context_end_time',
+    'scene_type',
+    'context_video_path',
+    'slide_video_path',
+)
+
+# Dialects with INSERT ... ON CONFLICT ... RETURNING
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
 
 
 class MediaCRUD:
@@ -86,6 +108,85 @@ class ExpressionCRUD:
         db.refresh(expression)
         return expression
     
+    @staticmethod
+    def _row_from_analysis(media_id: uuid.UUID, analysis_data) -> Dict[str, Any]:
+        """Column values for one ExpressionAnalysis (object or dict)."""
+        if isinstance(analysis_data, dict):
+            row = {name: analysis_data.get(name) for name in _ANALYSIS_FIELDS}
+        else:
+            row = {name: getattr(analysis_data, name, None) for name in _ANALYSIS_FIELDS}
+        row['media_id'] = media_id
+        return row
+    
+    @staticmethod
+    def bulk_upsert_from_analyses(db: Session, media_id: str, analyses: Iterable[Any],
+                                  batch_size: int = 500) -> List[uuid.UUID]:
+        """
+        Insert or update many expressions with one statement per batch.
+        
+        Rows are keyed by (media_id, expression, context_start_time): saving
+        the same expressions again (re-runs, retried chunks) updates the
+        existing rows instead of duplicating them. On PostgreSQL/SQLite this
+        is a multi-row INSERT ... ON CONFLICT DO UPDATE ... RETURNING id;
+        other databases fall back to per-row lookups in one transaction.
+        
+        Args:
+            db: Database session
+            media_id: Media ID
+            analyses: ExpressionAnalysis objects or expression dicts
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            Expression IDs in input order (duplicates within the input collapse to one row)
+        """
+        media_uuid = media_id if isinstance(media_id, uuid.UUID) else uuid.UUID(str(media_id))
+        
+        # One row per key: a statement may not update the same row twice
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for analysis_data in analyses:
+            row = ExpressionCRUD._row_from_analysis(media_uuid, analysis_data)
+            rows[tuple(row[name] for name in EXPRESSION_NATURAL_KEY)] = row
+        if not rows:
+            return []
+        
+        insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if insert is None:
+            return ExpressionCRUD._upsert_rows_individually(db, list(rows.values()))
+        
+        update_columns = [name for name in _ANALYSIS_FIELDS if name not in EXPRESSION_NATURAL_KEY]
+        row_list = list(rows.values())
+        ids: List[uuid.UUID] = []
+        for start in range(0, len(row_list), batch_size):
+            batch = [{'id': uuid.uuid4(), **row} for row in row_list[start:start + batch_size]]
+            stmt = insert(Expression).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[getattr(Expression, name) for name in EXPRESSION_NATURAL_KEY],
+                set_={name: stmt.excluded[name] for name in update_columns}
+            ).returning(Expression.id)
+            ids.extend(db.execute(stmt).scalars().all())
+        db.commit()
+        return ids
+    
+    @staticmethod
+    def _upsert_rows_individually(db: Session, rows: List[Dict[str, Any]]) -> List[uuid.UUID]:
+        """Upsert fallback for dialects without ON CONFLICT (one commit)."""
+        expressions = []
+        for row in rows:
+            expression = db.query(Expression).filter(
+                *(getattr(Expression, name) == row[name] for name in EXPRESSION_NATURAL_KEY)
+            ).first()
+            if expression is None:
+                expression = Expression(**row)
+                db.add(expression)
+            else:
+                for name, value in row.items():
+                    setattr(expression, name, value)
+            expressions.append(expression)
+        db.flush()
+        ids = [expression.id for expression in expressions]
+        db.commit()
+        return ids
+    
     @staticmethod
     def create(db: Session, media_id: str, expression: str, expression_translation: str = None,
                expression_dialogue: str = None, expression_dialogue_translation: str = None,
@@ -0,0 +1,38 @@
+"""Unique expression per media and context start (upsert target)
+
+Revision ID: 0003_expression_natural_key
+Revises: 0002_add_expression_fields
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_expression_natural_key'
+down_revision = '0002_add_expression_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Remove duplicate expressions from earlier re-runs, then add the unique key."""
+    # Keep the oldest row of each (media_id, expression, context_start_time)
+    op.execute("""
+        DELETE FROM expressions a
+        USING expressions b
+        WHERE a.media_id = b.media_id
+          AND a.expression = b.expression
+          AND a.context_start_time = b.context_start_time
+          AND (a.created_at, a.id) > (b.created_at, b.id)
+    """)
+    op.create_unique_constraint(
+        'uq_expressions_media_expression_start',
+        'expressions',
+        ['media_id', 'expression', 'context_start_time']
+    )
+
+
+def downgrade() -> None:
+    """Drop the unique key (duplicates removed by upgrade are not restored)."""
+    op.drop_constraint('uq_expressions_media_expression_start', 'expressions', type_='unique')
@@ -6,13 +6,16 @@ This module defines SQLAlchemy models for storing metadata and structured data.
 
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Integer, Text, ForeignKey, CheckConstraint, func, Float, Boolean, Date
+from sqlalchemy import Column, String, DateTime, Integer, Text, ForeignKey, CheckConstraint, UniqueConstraint, func, Float, Boolean, Date
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+# Identifies an expression of a media across runs (upsert conflict target)
+EXPRESSION_NATURAL_KEY = ('media_id', 'expression', 'context_start_time')
+
 
 class Media(Base):
     """Media table for storing episode/show metadata."""
@@ -62,6 +65,11 @@ class Expression(Base):
     usage_notes = Column(Text)                # Additional usage context
     score = Column(Float)                     # Ranking score for selection
     
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint(*EXPRESSION_NATURAL_KEY, name="uq_expressions_media_expression_start"),
+    )
+    
     # Relationships
     media = relationship("Media", back_populates="expressions")
     
@@ -31,6 +31,7 @@ from langflix.core.video_processor import VideoProcessor
 from langflix.core.subtitle_processor import SubtitleProcessor
 from langflix.services.output_manager import create_output_structure, OutputManager
 from langflix.profiling import PipelineProfiler, profile_stage
+from langflix.pipeline.prefetch import ChunkPrefetcher
 from langflix import settings
 
 # New Services
@@ -129,13 +130,17 @@ class LangFlixPipeline:
                  progress_callback: Optional[Callable[[int, str], None]] = None,
                  series_name: str = None, episode_name: str = None,
                  video_file: str = None,
-                 profiler: Optional[PipelineProfiler] = None):
+                 profiler: Optional[PipelineProfiler] = None,
+                 source_media_path: str = None):
         
         # Subtitle file may be empty - subtitles discovered from Subs/ folder
         self.subtitle_file = Path(subtitle_file) if subtitle_file and subtitle_file.strip() else None
         self.video_dir = Path(video_dir)
         self.output_dir = Path(output_dir)
         self.video_file = Path(video_file) if video_file else None
+        # Where subtitle folders are looked up (differs from video_file when the
+        # job input was staged into a private directory)
+        self.media_path = Path(source_media_path) if source_media_path else (self.video_file or self.video_dir)
         
         # If series_name is not provided, try to extract it from video filename
         if not series_name and self.video_file:
@@ -252,7 +257,7 @@ class LangFlixPipeline:
             no_shorts: bool = False, no_long_form: bool = False, include_slides: bool = False,
             short_form_max_duration: float = 180.0, 
             target_languages: Optional[List[str]] = None, schedule_upload: bool = False,
-            target_duration: float = 120.0) -> Dict[str, Any]:
+            target_duration: float = 120.0, prefetch_chunks: Optional[int] = None) -> Dict[str, Any]:
         
         if target_languages:
             self.target_languages = target_languages
@@ -271,6 +276,7 @@ class LangFlixPipeline:
         if self.profiler:
             self.profiler.start(metadata={"subtitle": str(self.subtitle_file)})
 
+        prefetcher = None
         try:
             logger.info("🎬 Starting LangFlix Pipeline (Orchestrator Mode)")
             
@@ -298,6 +304,13 @@ class LangFlixPipeline:
                 target_duration=target_duration,
                 test_mode=test_mode
             )
+
+            # Pipelined Mode: analyze the next chunk(s) while ffmpeg renders the current one
+            if prefetch_chunks is None:
+                prefetch_chunks = settings.get_streaming_prefetch_chunks()
+            if prefetch_chunks > 0 and not dry_run:
+                prefetcher = ChunkPrefetcher(chunk_stream, max_prefetch=prefetch_chunks, name="llm-chunk-prefetch")
+                chunk_stream = prefetcher
             
             # Track global index for short videos to ensure sequential naming (e.g. short_01, short_02)
             expression_counter = 1
@@ -311,6 +324,10 @@ class LangFlixPipeline:
                 
                 # Accumulate for final report
                 self.expressions.extend(chunk_expressions)
+
+                # Persist this chunk right away (idempotent upsert: re-runs update, not duplicate)
+                if media_id:
+                    self._save_expressions_to_db(media_id, chunk_expressions)
                 
                 # Process translations for this chunk
                 chunk_translated = {lang: [] for lang in self.target_languages}
@@ -393,10 +410,6 @@ class LangFlixPipeline:
                 gc.collect()
 
 
-            # DB Save (At end)
-            if media_id and self.expressions:
-                self._save_expressions_to_db(media_id)
-
             # Upload (At end - batch upload is safer)
             if schedule_upload and not dry_run and self.expressions:
                  self._update_progress(95, "Uploading videos...")
@@ -426,6 +439,8 @@ class LangFlixPipeline:
             logger.error(f"Pipeline failed: {e}", exc_info=True)
             raise
         finally:
+             if prefetcher:
+                prefetcher.close()
              if self.profiler:
                 self.profiler.stop()
                 self.profiler.save_report()
@@ -444,7 +459,7 @@ class LangFlixPipeline:
         from langflix.utils.path_utils import get_subtitle_folder
 
         # Determine media path
-        media_path = self.video_file if self.video_file else self.video_dir
+        media_path = self.media_path
 
         subtitle_folder = None
 
@@ -671,16 +686,17 @@ class LangFlixPipeline:
             logger.error(f"DB Error: {e}")
             return None
 
-    def _save_expressions_to_db(self, media_id):
+    def _save_expressions_to_db(self, media_id, expressions=None):
+        """Upsert expressions (default: all collected so far) in one bulk statement."""
+        expressions = self.expressions if expressions is None else expressions
+        if not expressions:
+            return
         try:
-             with db_manager.session() as db:
-                for expr in self.expressions:
-                    try:
-                        ExpressionCRUD.create_from_analysis(db=db, media_id=media_id, analysis_data=expr)
-                    except Exception as e:
-                        logger.error(f"Failed to save expression to DB: {e}")
+            with db_manager.session() as db:
+                ids = ExpressionCRUD.bulk_upsert_from_analyses(db=db, media_id=media_id, analyses=expressions)
+            logger.info(f"💾 Saved {len(ids)} expressions to DB")
         except Exception as e:
-             logger.error(f"DB Error saving expressions: {e}")
+            logger.error(f"DB Error saving expressions: {e}")
 
     def _generate_summary(self, output_stats: Dict[str, int] = None):
         summary = {
@@ -835,7 +851,7 @@ class LangFlixPipeline:
         self._update_progress(10, "Loading dual-language subtitles...")
         
         # Get media path from video file
-        media_path = self.video_file if self.video_file else self.video_dir
+        media_path = self.media_path
         
         # Try to discover subtitle folder from media path
         subtitle_folder = get_subtitle_folder(media_path)
@@ -1154,7 +1170,7 @@ class LangFlixPipeline:
 
         # New workflow: Discover subtitle folder with both source and target
         from langflix.utils.path_utils import get_subtitle_folder, discover_subtitle_languages
-        media_path = self.video_file if self.video_file else self.video_dir
+        media_path = self.media_path
         subtitle_folder = get_subtitle_folder(media_path)
 
         if not subtitle_folder:
@@ -1429,7 +1445,7 @@ class LangFlixPipeline:
             target_subtitles = []
         else:
             # Discover subtitle folder with both source and target
-            media_path = self.video_file if self.video_file else self.video_dir
+            media_path = self.media_path
             subtitle_folder = get_subtitle_folder(media_path)
 
             if not subtitle_folder:
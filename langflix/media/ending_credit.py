@@ -0,0 +1,252 @@
+"""
+Pre-encoded ending credit for LangFlix short videos
+
+Every short ends with the same credit clip. Instead of re-encoding each whole
+short through a concat filter to append it, the credit is normalized once to
+the shorts' exact stream parameters (codec, preset/crf, resolution, frame rate,
+pixel format, AAC sample rate/channels) and appended with the concat demuxer
+and stream copy:
+
+    short.mkv  [------------ copy ------------]
+    credit     [copy]  <- encoded once per (credit content, encode params)
+
+Prepared credits are stored in the credit cache directory, named by the
+credit file's content hash and the encode parameters, so later shorts, render
+workers and runs reuse them. Content hashes and prepared paths are looked up
+through the CacheManager.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import ffmpeg
+
+from langflix import settings
+from langflix.core.cache_manager import get_cache_manager
+from langflix.media.ffmpeg_utils import get_audio_params, get_video_params
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CreditEncodeParams:
+    """Stream parameters the credit must share with the short it is appended to"""
+    width: int
+    height: int
+    frame_rate: str  # ffprobe r_frame_rate, e.g. "24000/1001"
+    pix_fmt: str
+    vcodec: str
+    preset: str
+    crf: int
+    has_audio: bool
+    sample_rate: int = 48000
+    channels: int = 2
+
+
+# Encoders whose output we can stream-copy after the short, and the ffprobe codec name
+_COPYABLE_ENCODERS: Dict[str, str] = {
+    "libx264": "h264",
+}
+
+def _file_digest(path: str) -> str:
+    """sha256 of the file content, cached per (path, mtime, size)"""
+    cache = get_cache_manager()
+    cache_key = cache.get_file_key("sha256", path)
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    hexdigest = digest.hexdigest()
+    cache.set(cache_key, hexdigest, persist_to_disk=True)
+    return hexdigest
+
+
+def credit_params_for(video_path: str, encoding_args: Dict[str, Any]) -> Optional[CreditEncodeParams]:
+    """
+    Read the stream parameters a credit must match to be appended to video_path.
+
+    Args:
+        video_path: Encoded short (before the credit)
+        encoding_args: 'vcodec'/'preset'/'crf' the short was encoded with
+
+    Returns:
+        CreditEncodeParams, or None if the short cannot take a stream-copied credit
+    """
+    vcodec = encoding_args.get('vcodec', 'libx264')
+    video = get_video_params(video_path)
+    if _COPYABLE_ENCODERS.get(vcodec) != video.codec:
+        logger.debug(f"Ending credit concat copy unsupported for {vcodec}/{video.codec}")
+        return None
+    if not (video.width and video.height and video.pix_fmt and video.r_frame_rate):
+        return None
+    if video.r_frame_rate in ("0/0", "0/1"):
+        return None
+
+    audio = get_audio_params(video_path)
+    return CreditEncodeParams(
+        width=video.width,
+        height=video.height,
+        frame_rate=video.r_frame_rate,
+        pix_fmt=video.pix_fmt,
+        vcodec=vcodec,
+        preset=str(encoding_args.get('preset', 'medium')),
+        crf=int(encoding_args.get('crf', 18)),
+        has_audio=audio.codec is not None,
+        sample_rate=audio.sample_rate or 48000,
+        channels=audio.channels or 2,
+    )
+
+
+def _disk_cache_path(content_hash: str, params: CreditEncodeParams) -> Optional[Path]:
+    cache_dir = settings.get_ending_credit_cache_dir()
+    if not cache_dir:
+        return None
+    key = json.dumps({'content': content_hash, **asdict(params)}, sort_keys=True)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return Path(cache_dir) / f"ending_credit_{digest[:24]}.mkv"
+
+
+def _credit_has_audio(credit_path: str) -> bool:
+    try:
+        return get_audio_params(credit_path).codec is not None
+    except Exception as e:
+        logger.warning(f"Failed to probe ending credit file: {e}. Assuming no audio.")
+        return False
+
+
+def _encode_credit(credit_path: str, params: CreditEncodeParams, output_path: Path) -> None:
+    """Normalize the credit clip to the given stream parameters"""
+    credit_in = ffmpeg.input(credit_path)
+    video = (
+        credit_in['v:0']
+        .filter('scale', params.width, params.height, force_original_aspect_ratio='decrease')
+        .filter('pad', params.width, params.height, '(ow-iw)/2', '(oh-ih)/2')
+        .filter('setsar', 1)
+        .filter('fps', params.frame_rate)
+        .filter('format', params.pix_fmt)
+    )
+    streams = [video]
+    output_args: Dict[str, Any] = {
+        'vcodec': params.vcodec,
+        'preset': params.preset,
+        'crf': params.crf,
+        # Parameter sets in-band: the credit is decodable after the short's headers
+        'x264-params': 'repeat-headers=1',
+    }
+    if params.has_audio:
+        if _credit_has_audio(credit_path):
+            streams.append(credit_in['a:0'])
+        else:
+            # Silence for the length of the credit video
+            streams.append(ffmpeg.input(
+                f"anullsrc=channel_layout={'stereo' if params.channels == 2 else 'mono'}:sample_rate={params.sample_rate}",
+                format='lavfi'
+            )['a'])
+            output_args['shortest'] = None
+        output_args.update({'acodec': 'aac', 'ac': params.channels, 'ar': params.sample_rate})
+
+    (
+        ffmpeg
+        .output(*streams, str(output_path), **output_args)
+        .overwrite_output()
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+
+
+def get_prepared_ending_credit(credit_path: str, params: CreditEncodeParams) -> str:
+    """
+    Get the credit clip encoded with params, encoding it on first use.
+
+    Args:
+        credit_path: Original ending credit clip (MP4 or GIF)
+        params: Stream parameters of the shorts it will be appended to
+
+    Returns:
+        Path to the prepared credit (.mkv)
+
+    Raises:
+        ffmpeg.Error: If encoding the credit fails
+    """
+    content_hash = _file_digest(credit_path)
+    # Memory only: prepared files outside the credit cache dir live for this run
+    cache = get_cache_manager()
+    cache_key = cache.get_file_key("ending_credit", credit_path, content_hash, asdict(params))
+    cached = cache.get(cache_key)
+    if cached and os.path.exists(cached):
+        return cached
+
+    disk_path = _disk_cache_path(content_hash, params)
+    if disk_path and disk_path.exists():
+        cache.set(cache_key, str(disk_path))
+        return str(disk_path)
+
+    if disk_path:
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        target_dir = disk_path.parent
+    else:
+        target_dir = Path(tempfile.mkdtemp(prefix="ending_credit_"))
+
+    # Encode next to the target and replace atomically: render workers may race
+    fd, tmp_name = tempfile.mkstemp(dir=target_dir, suffix=".mkv")
+    os.close(fd)
+    try:
+        _encode_credit(credit_path, params, Path(tmp_name))
+        final_path = disk_path or target_dir / "ending_credit.mkv"
+        os.replace(tmp_name, final_path)
+    except Exception:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    logger.info(
+        f"🎬 Prepared ending credit {Path(credit_path).name} for "
+        f"{params.width}x{params.height}@{params.frame_rate} ({params.preset}, crf {params.crf})"
+    )
+    cache.set(cache_key, str(final_path))
+    return str(final_path)
+
+
+def append_with_concat_copy(video_path: str, credit_path: str, output_path: str) -> None:
+    """
+    Concatenate video and prepared credit with the concat demuxer (stream copy).
+
+    Args:
+        video_path: Encoded short
+        credit_path: Credit prepared with get_prepared_ending_credit for this short
+        output_path: Output video
+
+    Raises:
+        ffmpeg.Error / subprocess.CalledProcessError: If ffmpeg fails
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="credit_concat_", dir=Path(output_path).parent))
+    try:
+        list_file = work_dir / "segments.txt"
+        list_file.write_text(
+            "".join(f"file '{Path(p).resolve()}'\n" for p in (video_path, credit_path)),
+            encoding="utf-8"
+        )
+        cmd = [
+            'ffmpeg', '-y',
+            '-f', 'concat', '-safe', '0',
+            '-i', str(list_file),
+            '-map', '0',
+            '-c', 'copy',
+            str(output_path),
+        ]
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
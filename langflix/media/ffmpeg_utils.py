@@ -16,14 +16,17 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import ffmpeg
 
 from langflix import settings
+from langflix.media.probe_index import get_probe_index
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +53,20 @@ def _get_ffprobe_cache_key(path: str) -> Tuple[str, float, int]:
     return (str(p.resolve()), stat.st_mtime, stat.st_size)
 
 
+# ffprobe processes actually spawned by this process (in-process and index misses)
+_probe_counter = {'probes': 0}
+_probe_counter_lock = threading.Lock()
+
+
 @lru_cache(maxsize=512)
 def _cached_ffprobe_result(cache_key: Tuple[str, float, int], timeout: int) -> Dict[str, Any]:
     """
     Cached ffprobe execution with LRU eviction.
     
     This is the actual cached function. Cache key includes file metadata
-    (mtime, size) to ensure automatic invalidation on file changes.
+    (mtime, size) to ensure automatic invalidation on file changes. On an
+    in-process miss the persistent probe index (shared by all processes) is
+    consulted before spawning ffprobe.
     
     Args:
         cache_key: Tuple of (path, mtime, size) from _get_ffprobe_cache_key
@@ -72,8 +82,34 @@ def _cached_ffprobe_result(cache_key: Tuple[str, float, int], timeout: int) -> D
         json.JSONDecodeError: If output cannot be parsed as JSON
     """
     path = cache_key[0]  # Extract actual path from cache key
+    probe_index = get_probe_index()
+    indexed = probe_index.get(cache_key)
+    if indexed is not None:
+        logger.debug(f"📇 FFprobe index HIT for {Path(path).name}")
+        return indexed
+    
     logger.debug(f"🔍 FFprobe cache MISS for {Path(path).name} (mtime={cache_key[1]}, size={cache_key[2]})")
+    result = _probe_file(path, timeout)
+    probe_index.put(cache_key, result)
+    return result
+
+
+def _probe_file(path: str, timeout: int) -> Dict[str, Any]:
+    """
+    Run ffprobe on a file (ffmpeg-python probe as fallback).
     
+    Args:
+        path: Path to media file
+        timeout: Timeout in seconds for ffprobe execution
+        
+    Returns:
+        Parsed ffprobe JSON output as dictionary
+        
+    Raises:
+        Same as _cached_ffprobe_result
+    """
+    with _probe_counter_lock:
+        _probe_counter['probes'] += 1
     try:
         cmd = [
             "ffprobe",
@@ -113,14 +149,82 @@ def _cached_ffprobe_result(cache_key: Tuple[str, float, int], timeout: int) -> D
         raise
 
 
-def clear_ffprobe_cache() -> None:
+def probe_many(
+    paths: Iterable[str],
+    timeout: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Probe many files: one index lookup for all of them, ffprobe in parallel for the rest.
+    
+    New results are written to the persistent probe index, so later run_ffprobe
+    calls (in this or any other process) are served without spawning ffprobe.
+    
+    Args:
+        paths: Media files to probe
+        timeout: Timeout in seconds per file (if None, use configuration value)
+        max_workers: Parallel ffprobe processes (if None, use configuration value)
+        
+    Returns:
+        Mapping of each input path to its parsed ffprobe JSON; files that cannot
+        be accessed or probed are left out (and logged)
+    """
+    effective_timeout = timeout if timeout is not None else settings.get_ffprobe_timeout_seconds()
+    
+    keys: Dict[str, Tuple[str, float, int]] = {}
+    for path in paths:
+        try:
+            keys[str(path)] = _get_ffprobe_cache_key(str(path))
+        except OSError as e:
+            logger.warning(f"Failed to stat {path} for probing: {e}")
+    if not keys:
+        return {}
+    
+    probe_index = get_probe_index()
+    indexed = probe_index.get_many(keys.values())
+    results = {path: indexed[key] for path, key in keys.items() if key in indexed}
+    missing = [path for path in keys if path not in results]
+    
+    if missing:
+        workers = max(1, min(max_workers or settings.get_ffprobe_probe_workers(), len(missing)))
+        probed = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffprobe") as executor:
+            futures = {
+                executor.submit(_probe_file, keys[path][0], effective_timeout): path
+                for path in missing
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to probe {path}: {e}")
+                    continue
+                results[path] = result
+                probed.append((keys[path], result))
+        probe_index.put_many(probed)
+    
+    logger.info(
+        f"📇 Probed {len(keys)} files: {len(indexed)} from index, "
+        f"{len(missing)} with ffprobe ({len(keys) - len(results)} failed)"
+    )
+    return results
+
+
+def clear_ffprobe_cache(persistent: bool = True) -> None:
     """
     Clear all cached ffprobe results.
     
     Useful for testing or when you know files have been modified
     outside of the normal detection mechanism.
+    
+    Args:
+        persistent: Also clear the probe index shared with other processes
+            (False clears only this process's in-memory cache)
     """
     _cached_ffprobe_result.cache_clear()
+    if persistent:
+        get_probe_index().clear()
     logger.info("🗑️ FFprobe cache cleared")
 
 
@@ -129,14 +233,23 @@ def get_ffprobe_cache_info() -> Dict[str, int]:
     Get cache statistics for monitoring and debugging.
     
     Returns:
-        Dictionary with 'hits', 'misses', 'size', and 'maxsize'
+        Dictionary with in-process LRU 'hits', 'misses', 'size' and 'maxsize',
+        persistent index 'index_hits', 'index_misses' and 'index_entries', and
+        'probes' (ffprobe processes spawned by this process)
     """
     info = _cached_ffprobe_result.cache_info()
+    index_stats = get_probe_index().get_stats()
+    with _probe_counter_lock:
+        probes = _probe_counter['probes']
     return {
         'hits': info.hits,
         'misses': info.misses,
         'size': info.currsize,
-        'maxsize': info.maxsize
+        'maxsize': info.maxsize,
+        'index_hits': index_stats['hits'],
+        'index_misses': index_stats['misses'],
+        'index_entries': index_stats['entries'],
+        'probes': probes
     }
 
 
@@ -157,6 +270,7 @@ class AudioParams:
     codec: Optional[str]
     channels: Optional[int]
     sample_rate: Optional[int]
+    duration: Optional[float] = None
 
 
 # --------------------------- Probe helpers ---------------------------
@@ -228,6 +342,8 @@ def _run_ffprobe_uncached(path: str, timeout: int) -> Dict[str, Any]:
         subprocess.CalledProcessError: If ffprobe command fails
         json.JSONDecodeError: If output cannot be parsed as JSON
     """
+    with _probe_counter_lock:
+        _probe_counter['probes'] += 1
     try:
         cmd = [
             "ffprobe",
@@ -492,6 +608,15 @@ def get_duration_seconds(path: str) -> float:
         return 0.0
 
 
+def get_start_time_seconds(path: str) -> float:
+    """Container start time (format.start_time): offset of packet timestamps from the file start"""
+    try:
+        start = run_ffprobe(path).get("format", {}).get("start_time")
+        return float(start) if start not in (None, "N/A") else 0.0
+    except Exception:
+        return 0.0
+
+
 # --------------------------- Standardization helpers ---------------------------
 
 def standardize_for_concat(input_path: str, target_video: Optional[VideoParams] = None) -> Tuple[Dict[str, Any], str]:
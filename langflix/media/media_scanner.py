@@ -49,9 +49,13 @@ class MediaScanner:
             else:
                 video_files = self._scan_flat()
             
+            # Probe all files at once: indexed files need no ffprobe, the rest run in parallel
+            from langflix.media.ffmpeg_utils import probe_many
+            probes = probe_many(str(p) for p in video_files)
+            
             for video_path in video_files:
                 try:
-                    media_info = self._build_media_info(video_path)
+                    media_info = self._build_media_info(video_path, probes.get(str(video_path)))
                     if media_info:
                         media_files.append(media_info)
                 except Exception as e:
@@ -79,12 +83,13 @@ class MediaScanner:
             video_files.extend(self.media_directory.glob(f"*{ext}"))
         return sorted(video_files)
     
-    def _build_media_info(self, video_path: Path) -> Optional[Dict[str, Any]]:
+    def _build_media_info(self, video_path: Path, probe: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Build media information dictionary for a video file
         
         Args:
             video_path: Path to video file
+            probe: ffprobe JSON already read for this file (e.g. by probe_many)
             
         Returns:
             Media info dictionary or None if failed
@@ -97,7 +102,7 @@ class MediaScanner:
             subtitle_path = self._find_subtitle_file(video_path)
             
             # Get video metadata using ffprobe
-            metadata = self._get_video_metadata(video_path)
+            metadata = self._get_video_metadata(video_path, probe)
             
             return {
                 "id": str(video_path.relative_to(self.media_directory)),
@@ -275,12 +280,13 @@ class MediaScanner:
         
         return True, None
     
-    def _get_video_metadata(self, video_path: Path) -> Dict[str, Any]:
+    def _get_video_metadata(self, video_path: Path, probe: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extract video metadata using ffprobe
         
         Args:
             video_path: Path to video file
+            probe: ffprobe JSON already read for this file (skips running ffprobe)
             
         Returns:
             Dictionary with video metadata
@@ -295,7 +301,8 @@ class MediaScanner:
         try:
             from langflix.media.ffmpeg_utils import run_ffprobe
             
-            probe = run_ffprobe(str(video_path))
+            if probe is None:
+                probe = run_ffprobe(str(video_path))
             video_stream = next((s for s in probe.get('streams', []) if s.get('codec_type') == 'video'), None)
             
             if not video_stream:
@@ -0,0 +1,211 @@
+"""
+Persistent ffprobe metadata index shared across processes.
+
+run_ffprobe memoizes results in-process, which is lost on restart and not
+shared between the FastAPI app, the web UI, the queue worker and render
+workers. This index keeps ffprobe JSON in a SQLite database next to the
+media (by default in the local storage root) with the same invalidation key:
+an entry is only valid for the exact (resolved path, mtime, size) it was
+probed for, so a modified or replaced file is probed again.
+
+One row is kept per path; re-probing a changed file overwrites it.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (resolved path, mtime, size), as built by ffmpeg_utils._get_ffprobe_cache_key
+ProbeKey = Tuple[str, float, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ffprobe_results (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    probed_at REAL NOT NULL
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_LOOKUP_BATCH_SIZE = 500
+
+
+class ProbeIndex:
+    """SQLite-backed index of ffprobe results keyed by (path, mtime, size)"""
+
+    def __init__(self, db_path: Union[str, Path], enabled: bool = True):
+        """
+        Initialize probe index
+
+        Args:
+            db_path: SQLite database file (created on first write)
+            enabled: If False, every operation is a no-op
+        """
+        self.db_path = Path(db_path)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'errors': 0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def get(self, key: ProbeKey) -> Optional[Dict[str, Any]]:
+        """
+        Look up the probe result for a file version
+
+        Returns:
+            Parsed ffprobe JSON, or None on miss / disabled index
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[ProbeKey]) -> Dict[ProbeKey, Dict[str, Any]]:
+        """
+        Look up probe results for many files with one query per batch of paths
+
+        Returns:
+            Mapping of the keys found (with matching mtime and size) to their results
+        """
+        keys = list(keys)
+        if not self.enabled or not keys:
+            return {}
+
+        found: Dict[ProbeKey, Dict[str, Any]] = {}
+        with self._lock:
+            try:
+                if self.db_path.exists():
+                    conn = self._connect()
+                    try:
+                        wanted = {key[0]: key for key in keys}
+                        paths = list(wanted)
+                        for start in range(0, len(paths), _LOOKUP_BATCH_SIZE):
+                            batch = paths[start:start + _LOOKUP_BATCH_SIZE]
+                            rows = conn.execute(
+                                f"SELECT path, mtime, size, result FROM ffprobe_results "
+                                f"WHERE path IN ({','.join('?' * len(batch))})",
+                                batch
+                            ).fetchall()
+                            for path, mtime, size, result in rows:
+                                key = wanted[path]
+                                if key[1] == mtime and key[2] == size:
+                                    found[key] = json.loads(result)
+                    finally:
+                        conn.close()
+            except Exception as e:
+                # A broken index must never fail a probe: treat as a miss
+                self._stats['errors'] += 1
+                logger.warning(f"FFprobe index read failed: {e}")
+            self._stats['hits'] += len(found)
+            self._stats['misses'] += len(keys) - len(found)
+        return found
+
+    def put(self, key: ProbeKey, result: Dict[str, Any]) -> None:
+        """Store the probe result for a file version"""
+        self.put_many([(key, result)])
+
+    def put_many(self, items: List[Tuple[ProbeKey, Dict[str, Any]]]) -> None:
+        """Store many probe results in one transaction"""
+        if not self.enabled or not items:
+            return
+
+        now = time.time()
+        rows = [(key[0], key[1], key[2], json.dumps(result), now) for key, result in items]
+        with self._lock:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.executemany(
+                            """
+                            INSERT INTO ffprobe_results (path, mtime, size, result, probed_at)
+                            VALUES (?, ?, ?, ?, ?)
+                            ON CONFLICT(path) DO UPDATE SET
+                                mtime = excluded.mtime,
+                                size = excluded.size,
+                                result = excluded.result,
+                                probed_at = excluded.probed_at
+                            """,
+                            rows
+                        )
+                    self._stats['writes'] += len(rows)
+                finally:
+                    conn.close()
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.warning(f"FFprobe index write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all indexed probe results"""
+        if not self.enabled or not self.db_path.exists():
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM ffprobe_results")
+            finally:
+                conn.close()
+        logger.info("FFprobe index cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics (counters are per-process, entries are global)"""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = round(stats['hits'] / lookups * 100, 2) if lookups else 0
+            stats['entries'] = 0
+            if self.enabled and self.db_path.exists():
+                try:
+                    conn = self._connect()
+                    try:
+                        stats['entries'] = conn.execute("SELECT COUNT(*) FROM ffprobe_results").fetchone()[0]
+                    finally:
+                        conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"FFprobe index stats failed: {e}")
+            return stats
+
+
+# Global instance
+_probe_index: Optional[ProbeIndex] = None
+_probe_index_lock = threading.Lock()
+
+
+def get_probe_index() -> ProbeIndex:
+    """Get the global ffprobe index configured from settings"""
+    global _probe_index
+    with _probe_index_lock:
+        if _probe_index is None:
+            from langflix import settings
+            _probe_index = ProbeIndex(
+                db_path=settings.get_ffprobe_index_path(),
+                enabled=settings.is_ffprobe_index_enabled()
+            )
+        return _probe_index
+
+
+def set_probe_index(index: Optional[ProbeIndex]) -> None:
+    """Replace the global ffprobe index (None = rebuild from settings on next use)"""
+    global _probe_index
+    with _probe_index_lock:
+        _probe_index = index
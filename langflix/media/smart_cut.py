@@ -0,0 +1,280 @@
+"""
+Smart-cut clip extraction for LangFlix
+
+A frame-accurate clip normally needs a full re-encode because the requested
+start rarely falls on a keyframe. A smart cut only re-encodes the "head" from
+the requested start up to the next keyframe, stream-copies everything from
+that keyframe to the end, and re-encodes the (cheap) audio track:
+
+    source:  ... K .......s...K..........K..........e... K ...
+    output:                [enc][------- copy --------]
+
+The keyframe index of a source is read once with ffprobe (packet flags, no
+decoding) and kept in the CacheManager (memory and disk), so parallel render
+workers and later runs do not re-scan multi-GB episodes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import ffmpeg
+
+from langflix import settings
+from langflix.core.cache_manager import get_cache_manager
+from langflix.media.ffmpeg_utils import (
+    get_audio_params,
+    get_duration_seconds,
+    get_start_time_seconds,
+    get_video_params,
+)
+
+logger = logging.getLogger(__name__)
+
+# Codecs whose head GOP we can re-encode with a compatible encoder, and the
+# bitstream filter that keeps parameter sets in-band for concatenation
+_SMART_CUT_CODECS: Dict[str, Tuple[str, str]] = {
+    "h264": ("libx264", "h264_mp4toannexb"),
+    "hevc": ("libx265", "hevc_mp4toannexb"),
+}
+
+# A start within this distance of a keyframe is treated as keyframe-aligned
+_ALIGN_TOLERANCE_SECONDS = 0.002
+
+
+# --------------------------- Keyframe index ---------------------------
+
+# Bump when the cached keyframe list changes meaning
+KEYFRAME_CACHE_VERSION = "1"
+
+
+def _probe_keyframes(path: str, timeout: int) -> List[float]:
+    """Read keyframe timestamps of the first video stream from packet flags (no decode)"""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        path,
+    ]
+    completed = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=timeout)
+    return parse_keyframe_packets(completed.stdout)
+
+
+def parse_keyframe_packets(output: str) -> List[float]:
+    """
+    Parse `ffprobe -show_entries packet=pts_time,flags -of csv=p=0` output.
+
+    Returns:
+        Sorted keyframe timestamps in seconds
+    """
+    keyframes = []
+    for line in output.splitlines():
+        parts = line.strip().split(",")
+        if len(parts) < 2 or not parts[1].startswith("K"):
+            continue
+        try:
+            keyframes.append(float(parts[0]))
+        except ValueError:
+            continue  # pts_time=N/A
+    keyframes.sort()
+    return keyframes
+
+
+def get_keyframe_times(path: str, use_cache: bool = True) -> List[float]:
+    """
+    Get keyframe timestamps (seconds) of a video file.
+
+    Cached in the CacheManager by (path, mtime, size); persisted to its disk
+    cache unless clip_extraction.persist_keyframe_index is false.
+
+    Note that these are stream timestamps: for sources with a non-zero
+    container start time they are offset from the seek positions used by -ss
+    (see smart_cut_extract).
+
+    Args:
+        path: Video file path
+        use_cache: If False, always re-probe
+
+    Returns:
+        Sorted keyframe timestamps (empty if the file has no video stream)
+    """
+    cache = get_cache_manager()
+    cache_key = cache.get_file_key("keyframes", path, KEYFRAME_CACHE_VERSION)
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    keyframes = _probe_keyframes(path, settings.get_ffprobe_timeout_seconds() * 10)
+    logger.info(f"🔑 Indexed {len(keyframes)} keyframes in {Path(path).name}")
+    cache.set(cache_key, keyframes, persist_to_disk=settings.is_keyframe_index_persisted())
+    return keyframes
+
+
+# --------------------------- Planning ---------------------------
+
+@dataclass
+class SmartCutPlan:
+    """How to serve a [start, end] range"""
+    start: float
+    end: float
+    copy_from: float  # First keyframe inside the range; head [start, copy_from) is re-encoded
+
+    @property
+    def head_duration(self) -> float:
+        return max(0.0, self.copy_from - self.start)
+
+    @property
+    def needs_head(self) -> bool:
+        return self.head_duration > _ALIGN_TOLERANCE_SECONDS
+
+
+def plan_smart_cut(keyframes: List[float], start: float, end: float) -> Optional[SmartCutPlan]:
+    """
+    Plan a smart cut.
+
+    Returns:
+        SmartCutPlan, or None if no keyframe falls inside [start, end)
+        (the clip must be fully re-encoded)
+    """
+    if end <= start or not keyframes:
+        return None
+    idx = bisect.bisect_left(keyframes, start - _ALIGN_TOLERANCE_SECONDS)
+    if idx >= len(keyframes) or keyframes[idx] >= end:
+        return None
+    copy_from = max(start, keyframes[idx])
+    return SmartCutPlan(start=start, end=end, copy_from=copy_from)
+
+
+# --------------------------- Extraction ---------------------------
+
+def smart_cut_extract(
+    video_path: str,
+    start: float,
+    end: float,
+    output_path: str,
+    encoding_params: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Extract [start, end] with stream copy plus a re-encoded head GOP.
+
+    Args:
+        video_path: Source video
+        start: Start time in seconds
+        end: End time in seconds
+        output_path: Output clip (any container accepting the source codec, e.g. .mkv)
+        encoding_params: Optional 'preset'/'crf'/'audio_bitrate' for the re-encoded parts
+
+    Returns:
+        True if the smart cut succeeded; False if the caller should fully re-encode
+    """
+    video_params = get_video_params(video_path)
+    codec_info = _SMART_CUT_CODECS.get(video_params.codec or "")
+    if codec_info is None:
+        logger.debug(f"Smart cut unsupported for codec {video_params.codec}")
+        return False
+    encoder, annexb_bsf = codec_info
+
+    try:
+        # Keyframe pts are stream timestamps, -ss seeks relative to the file start
+        start_offset = get_start_time_seconds(video_path)
+        keyframes = [t - start_offset for t in get_keyframe_times(video_path)]
+    except Exception as e:
+        logger.warning(f"Keyframe index unavailable for {video_path}: {e}")
+        return False
+
+    plan = plan_smart_cut(keyframes, start, end)
+    if plan is None:
+        logger.debug(f"No keyframe inside [{start:.3f}, {end:.3f}], smart cut not possible")
+        return False
+
+    video_config = settings.get_video_config()
+    params = encoding_params or {}
+    preset = params.get('preset') or video_config.get('preset', 'slow')
+    crf = params.get('crf') if params.get('crf') is not None else video_config.get('crf', 18)
+    audio_bitrate = params.get('audio_bitrate') or video_config.get('audio_bitrate', '256k')
+
+    work_dir = Path(tempfile.mkdtemp(prefix="smartcut_", dir=Path(output_path).parent))
+    try:
+        segments = []
+        # MPEG-TS keeps SPS/PPS in-band, so head and tail may use different parameter sets
+        if plan.needs_head:
+            head_path = work_dir / "head.ts"
+            head_args = {
+                'vcodec': encoder,
+                'preset': preset,
+                'crf': crf,
+                'an': None,
+            }
+            if video_params.pix_fmt:
+                head_args['pix_fmt'] = video_params.pix_fmt
+            (
+                ffmpeg
+                .input(video_path, ss=plan.start, t=plan.head_duration)
+                .output(str(head_path), **head_args)
+                .overwrite_output()
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+            segments.append(head_path)
+
+        tail_path = work_dir / "tail.ts"
+        (
+            ffmpeg
+            .input(video_path, ss=plan.copy_from, t=plan.end - plan.copy_from)
+            .output(str(tail_path), vcodec='copy', an=None, **{'bsf:v': annexb_bsf})
+            .overwrite_output()
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+        segments.append(tail_path)
+
+        list_file = work_dir / "segments.txt"
+        list_file.write_text("".join(f"file '{p.resolve()}'\n" for p in segments), encoding="utf-8")
+
+        # Video: concat copy; audio: re-encoded for the exact range (cheap, avoids splice gaps)
+        video_in = ffmpeg.input(str(list_file), format="concat", safe=0)
+        audio_in = ffmpeg.input(video_path, ss=plan.start, t=plan.end - plan.start)
+        streams = [video_in['v']]
+        if get_audio_params(video_path).codec:
+            streams.append(audio_in['a:0'])
+        (
+            ffmpeg
+            .output(
+                *streams,
+                str(output_path),
+                vcodec='copy',
+                acodec='aac',
+                audio_bitrate=audio_bitrate,
+                ac=2,
+                ar=48000,
+                avoid_negative_ts='make_zero'
+            )
+            .overwrite_output()
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+    except ffmpeg.Error as e:
+        stderr = e.stderr.decode('utf-8', errors='replace') if e.stderr else str(e)
+        logger.warning(f"Smart cut failed, falling back to re-encode: {stderr[-500:]}")
+        return False
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    expected = plan.end - plan.start
+    actual = get_duration_seconds(str(output_path))
+    if abs(actual - expected) > 0.5:
+        logger.warning(f"Smart cut duration mismatch ({actual:.2f}s vs {expected:.2f}s), falling back to re-encode")
+        return False
+
+    logger.info(
+        f"✂️ Smart cut {expected:.2f}s clip: re-encoded {plan.head_duration:.2f}s head, "
+        f"stream-copied {plan.end - plan.copy_from:.2f}s"
+    )
+    return True
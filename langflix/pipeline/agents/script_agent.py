@@ -5,12 +5,16 @@ Show Bible-aware extraction + chunk summaries
 import logging
 import json
 import re
+import time
 import yaml
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 from pathlib import Path
 
 from langflix.pipeline.models import ChunkResult
 from langflix.core.llm_client import get_gemini_client
+from langflix.core.rate_limiter import LLMRateLimiter, get_llm_rate_limiter
+from langflix.core.llm_response_cache import LLMResponseCache, get_llm_response_cache
 from langflix import settings
 
 logger = logging.getLogger(__name__)
@@ -22,7 +26,15 @@ class ScriptAgent:
     Uses Show Bible for speaker inference and context understanding
     """
 
-    def __init__(self, model_name: Optional[str] = None, output_dir: Optional[str] = None, show_name: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        show_name: Optional[str] = None,
+        client: Optional[Any] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
         """
         Initialize Script Agent
 
@@ -30,11 +42,16 @@ class ScriptAgent:
             model_name: LLM model to use (defaults to settings)
             output_dir: Optional output directory for debug logs
             show_name: Show name (defaults to settings if not provided)
+            client: Optional pre-built LLM client (e.g. FakeGeminiClient for offline benchmarks)
+            rate_limiter: Optional rate limiter (defaults to the process-wide limiter from settings)
+            response_cache: Optional response cache (defaults to the global cache from settings)
         """
         self.model_name = model_name or settings.get_llm_model_name()
         self.output_dir = output_dir
         self.show_name = show_name
-        self.client = get_gemini_client()
+        self.client = client if client is not None else get_gemini_client()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_llm_rate_limiter()
+        self.response_cache = response_cache if response_cache is not None else get_llm_response_cache()
 
         # Load prompt template
         # Load prompt template from settings (YAML)
@@ -68,7 +85,8 @@ class ScriptAgent:
         target_language_code: Optional[str] = None,
         source_language: Optional[str] = None,
         source_language_code: Optional[str] = None,
-        target_duration: Optional[float] = None
+        target_duration: Optional[float] = None,
+        timeout: Optional[float] = None
     ) -> ChunkResult:
         """
         Analyze a single script chunk with Show Bible context
@@ -80,11 +98,14 @@ class ScriptAgent:
             show_bible: Show Bible content for context
             language_level: Target difficulty level
             max_expressions_per_chunk: Max expressions to extract
+            timeout: Seconds the rate limit wait and LLM request may take
+                (None = unbounded); past it the chunk fails and no request is left running
 
         Returns:
             ChunkResult with expressions and chunk summary
         """
         logger.info(f"📝 Analyzing chunk {chunk_id} with Script Agent")
+        deadline = time.monotonic() + timeout if timeout is not None else None
 
         # Get language level descriptions from settings
         language_level_descriptions = self._get_language_level_descriptions()
@@ -132,8 +153,11 @@ class ScriptAgent:
 
         # Call LLM
         try:
-            response = self._call_llm(prompt)
+            response, cache_key = self._call_llm(prompt, deadline)
             result_data = self._parse_response(response)
+            # Only cache responses that parsed, so a malformed reply is retried next run
+            if cache_key is not None:
+                self._cache_response(cache_key, response)
 
             # Parse subtitle lines from script_chunk to get timestamps
             subtitle_lines = self._parse_script_chunk_times(script_chunk)
@@ -185,15 +209,20 @@ class ScriptAgent:
                 expressions=[]
             )
 
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, deadline: Optional[float] = None) -> Tuple[str, Optional[str]]:
         """
         Call LLM with the prepared prompt
 
         Args:
             prompt: Formatted prompt
+            deadline: time.monotonic() by which the response must be in (None = unbounded)
 
         Returns:
-            LLM response text
+            (LLM response text, response cache key to store it under once it
+            parsed; None if the response came from the cache)
+
+        Raises:
+            TimeoutError: If the deadline passes before or during the request
         """
         # Create a NEW dict to avoid mutating shared/cached config
         base_config = settings.get_generation_config()
@@ -204,10 +233,34 @@ class ScriptAgent:
         # Log config at INFO level for visibility during debugging
         logger.info(f"🔧 ScriptAgent LLM config: max_output_tokens={generation_config.get('max_output_tokens')}")
 
+        # Identical (model, config, prompt) was answered before: skip the API call
+        cache_key = LLMResponseCache.make_key(self.model_name, generation_config, prompt)
+        cached_text = self.response_cache.get(cache_key)
+        if cached_text is not None:
+            logger.info(f"♻️ ScriptAgent LLM response cache hit ({cache_key[:12]})")
+            self._save_debug_files(prompt, cached_text)
+            return cached_text, None
+
+        # Respect requests/minute and tokens/minute quotas shared by concurrent chunk analyses
+        tokens = LLMRateLimiter.estimate_tokens(prompt) + settings.get_llm_expected_output_tokens()
+        if deadline is None:
+            if self.rate_limiter.enabled:
+                self.rate_limiter.acquire(tokens)
+            request_kwargs = {}
+        else:
+            # Don't reserve quota for a request that could not be sent in time
+            if self.rate_limiter.enabled:
+                self.rate_limiter.acquire(tokens, max_wait=deadline - time.monotonic())
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Chunk timeout reached before the LLM request was sent")
+            request_kwargs = {'request_options': {'timeout': remaining}}
+
         # self.client is already a GenerativeModel from get_gemini_client()
         response = self.client.generate_content(
             prompt,
-            generation_config=generation_config
+            generation_config=generation_config,
+            **request_kwargs
         )
 
         # Check for empty or blocked response
@@ -236,7 +289,17 @@ class ScriptAgent:
             logger.error(f"Response object: {response}")
             raise ValueError("LLM response has no text content")
         
-        # Save prompt and response for debugging
+        self._save_debug_files(prompt, text)
+        
+        logger.debug(f"LLM response length: {len(text)} chars")
+        return text, cache_key
+
+    def _cache_response(self, cache_key: str, response: str) -> None:
+        """Store a successfully parsed response in the persistent response cache"""
+        self.response_cache.put(cache_key, response, model_name=self.model_name)
+
+    def _save_debug_files(self, prompt: str, text: str) -> None:
+        """Save prompt and response for debugging"""
         import time
         if self.output_dir:
             debug_dir = Path(self.output_dir) / "debug"
@@ -244,7 +307,8 @@ class ScriptAgent:
             debug_dir = Path(__file__).parent.parent / "artifacts" / "debug"
             
         debug_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = int(time.time())
+        # Nanosecond timestamp keeps files from concurrent chunk analyses apart
+        timestamp = time.time_ns()
         
         prompt_file = debug_dir / f"script_agent_prompt_{timestamp}.txt"
         with open(prompt_file, "w", encoding="utf-8") as f:
@@ -256,9 +320,6 @@ class ScriptAgent:
         
         logger.info(f"💾 Saved ScriptAgent host prompt to: {prompt_file.absolute()}")
         logger.info(f"💾 Saved ScriptAgent LLM response to: {response_file.absolute()}")
-        
-        logger.debug(f"LLM response length: {len(text)} chars")
-        return text
 
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """
@@ -391,27 +452,29 @@ class ScriptAgent:
         target_language_code: Optional[str] = None,
         source_language: Optional[str] = None,
         source_language_code: Optional[str] = None,
-        target_duration: Optional[float] = None
+        target_duration: Optional[float] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
-        Analyze multiple chunks in sequence yielding results
-        """
-        total_expressions = 0
+        Analyze multiple chunks yielding results in chunk order
 
-        for idx, (chunk, target_chunk) in enumerate(zip(chunks, target_chunks)):
-            chunk_id = idx + 1
-
-            # Check if we've hit the total expression limit (test mode)
-            if max_total_expressions and total_expressions >= max_total_expressions:
-                logger.info(
-                    f"🛑 Reached max_total_expressions limit ({max_total_expressions}), "
-                    f"stopping at chunk {chunk_id}"
-                )
-                break
+        With max_concurrency > 1, up to that many chunks are analyzed at once on a
+        thread pool (LLM calls still go through the shared rate limiter). Results
+        are always yielded in chunk order and the max_total_expressions cap is
+        applied in that order, so output is identical to sequential analysis.
 
-            # Analyze chunk
-            result = self.analyze_chunk(
-                chunk_id=chunk_id,
+        Args:
+            max_concurrency: Chunks analyzed in parallel (defaults to
+                expression.llm.parallel_processing settings; 1 = sequential)
+        """
+        chunk_pairs = list(zip(chunks, target_chunks))
+        concurrency = self._resolve_concurrency(max_concurrency, len(chunk_pairs))
+        chunk_timeout = settings.get_parallel_llm_timeout() if concurrency > 1 else None
+
+        def analyze(idx: int) -> ChunkResult:
+            chunk, target_chunk = chunk_pairs[idx]
+            return self.analyze_chunk(
+                chunk_id=idx + 1,
                 script_chunk=self._format_chunk_text(chunk),
                 target_script_chunk=self._format_chunk_text(target_chunk),
                 show_bible=show_bible,
@@ -421,27 +484,106 @@ class ScriptAgent:
                 target_language_code=target_language_code,
                 source_language=source_language,
                 source_language_code=source_language_code,
-                target_duration=target_duration
+                target_duration=target_duration,
+                timeout=chunk_timeout
             )
 
-            # Truncate expressions if we've exceeded the total limit
-            if max_total_expressions:
-                remaining = max_total_expressions - total_expressions
-                if remaining < len(result.expressions):
-                    logger.info(
-                        f"✂️ Truncating chunk {chunk_id} expressions from {len(result.expressions)} to {remaining} "
-                        f"(max_total_expressions={max_total_expressions})"
-                    )
-                    result.expressions = result.expressions[:remaining]
+        if concurrency > 1:
+            logger.info(f"🔀 Analyzing {len(chunk_pairs)} chunks with concurrency={concurrency}")
+            results = self._analyze_concurrently(analyze, len(chunk_pairs), concurrency)
+        else:
+            results = (analyze(idx) for idx in range(len(chunk_pairs)))
 
-            yield result
-            total_expressions += len(result.expressions)
+        total_expressions = 0
+        try:
+            for idx, result in enumerate(results):
+                chunk_id = idx + 1
+
+                # Truncate expressions if we've exceeded the total limit
+                if max_total_expressions:
+                    remaining = max_total_expressions - total_expressions
+                    if remaining < len(result.expressions):
+                        logger.info(
+                            f"✂️ Truncating chunk {chunk_id} expressions from {len(result.expressions)} to {remaining} "
+                            f"(max_total_expressions={max_total_expressions})"
+                        )
+                        result.expressions = result.expressions[:remaining]
+
+                yield result
+                total_expressions += len(result.expressions)
+
+                # Check if we've hit the total expression limit (test mode)
+                if max_total_expressions and total_expressions >= max_total_expressions:
+                    if chunk_id < len(chunk_pairs):
+                        logger.info(
+                            f"🛑 Reached max_total_expressions limit ({max_total_expressions}), "
+                            f"stopping at chunk {chunk_id + 1}"
+                        )
+                    break
+        finally:
+            close = getattr(results, "close", None)
+            if close:
+                close()
 
         logger.info(
             f"📊 Batch analysis complete: "
             f"{total_expressions} total expressions extracted"
         )
 
+    def _resolve_concurrency(self, max_concurrency: Optional[int], num_chunks: int) -> int:
+        """Resolve the number of chunks to analyze in parallel"""
+        if max_concurrency is None:
+            if settings.get_parallel_llm_processing_enabled():
+                max_concurrency = settings.get_parallel_llm_max_workers() or 1
+            else:
+                max_concurrency = 1
+        return max(1, min(int(max_concurrency), num_chunks or 1))
+
+    def _analyze_concurrently(
+        self,
+        analyze: Callable[[int], ChunkResult],
+        num_chunks: int,
+        concurrency: int
+    ) -> Iterator[ChunkResult]:
+        """
+        Run analyze(idx) for each chunk on a thread pool, yielding in chunk order.
+
+        Keeps at most `concurrency` chunks in flight, submitting the next chunk only
+        when an earlier one has been consumed, so stopping early (expression cap)
+        wastes at most `concurrency - 1` LLM calls. The per-chunk timeout is
+        enforced inside analyze (rate limit wait and request deadline), so a
+        chunk reported as failed has no LLM call left running.
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="script-agent")
+        futures = {}
+        next_to_submit = 0
+        try:
+            while next_to_submit < min(concurrency, num_chunks):
+                futures[next_to_submit] = executor.submit(analyze, next_to_submit)
+                next_to_submit += 1
+
+            for idx in range(num_chunks):
+                future = futures.pop(idx)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Failed to analyze chunk {idx + 1}: {e}")
+                    result = ChunkResult(
+                        chunk_id=idx + 1,
+                        chunk_summary=f"[Error analyzing chunk: {str(e)}]",
+                        expressions=[]
+                    )
+
+                if next_to_submit < num_chunks:
+                    futures[next_to_submit] = executor.submit(analyze, next_to_submit)
+                    next_to_submit += 1
+
+                yield result
+        finally:
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _format_chunk_text(self, chunk: Dict[str, Any]) -> str:
         """
         Format subtitle chunk for prompt
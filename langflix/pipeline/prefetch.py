@@ -0,0 +1,137 @@
+"""
+Chunk Prefetcher: overlap LLM chunk analysis with video rendering
+
+The streaming pipeline pulls one chunk of expressions from the Script Agent,
+renders every clip for it, and only then asks for the next chunk. The LLM
+round trip and the ffmpeg work are independent, so this module runs the
+chunk generator on a background thread and lets it run ahead of the consumer
+by a bounded number of chunks.
+"""
+import logging
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sentinel marking the end of the producer stream
+_DONE = object()
+
+# How often a blocked producer re-checks whether it has been cancelled (seconds)
+_POLL_INTERVAL = 0.5
+
+
+class _ProducerError:
+    """Wraps an exception raised by the source generator"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class ChunkPrefetcher:
+    """
+    Bounded producer/consumer wrapper around a chunk generator.
+
+    At most ``max_prefetch`` items are produced ahead of the consumer
+    (counting both finished items waiting in the queue and the one currently
+    being produced). Items are yielded in source order and exceptions raised
+    by the source are re-raised in the consumer thread.
+
+    Example:
+        with ChunkPrefetcher(pipeline_generator, max_prefetch=2) as chunks:
+            for chunk in chunks:
+                render(chunk)
+    """
+
+    def __init__(self, source: Iterable[Any], max_prefetch: int = 1, name: str = "chunk-prefetch"):
+        """
+        Initialize Chunk Prefetcher
+
+        Args:
+            source: Iterable/generator producing chunks (consumed on a background thread)
+            max_prefetch: Maximum number of chunks produced ahead of the consumer (>= 1)
+            name: Name of the background thread (for logs)
+        """
+        if max_prefetch < 1:
+            raise ValueError(f"max_prefetch must be >= 1, got {max_prefetch}")
+
+        self.source = source
+        self.max_prefetch = max_prefetch
+        self.name = name
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._slots = threading.Semaphore(max_prefetch)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._finished = False
+
+    def __enter__(self) -> "ChunkPrefetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        self._start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _DONE:
+                    self._finished = True
+                    return
+                if isinstance(item, _ProducerError):
+                    self._finished = True
+                    raise item.error
+                # Free a slot so the producer can start on the next chunk
+                self._slots.release()
+                yield item
+        finally:
+            if not self._finished:
+                self.close()
+
+    def close(self) -> None:
+        """Stop the producer thread (pending chunks are discarded)"""
+        self._stop.set()
+        # Unblock a producer waiting for a free slot
+        self._slots.release()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            # The producer may be inside a long LLM call; don't block the caller on it.
+            self._thread.join(timeout=_POLL_INTERVAL)
+            if self._thread.is_alive():
+                logger.info(f"⏳ {self.name}: producer still busy, it will exit after its current chunk")
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("ChunkPrefetcher can only be iterated once")
+        self._thread = threading.Thread(target=self._produce, name=self.name, daemon=True)
+        self._thread.start()
+        logger.info(f"🔀 {self.name}: prefetching up to {self.max_prefetch} chunk(s) ahead of rendering")
+
+    def _acquire_slot(self) -> bool:
+        while not self._stop.is_set():
+            if self._slots.acquire(timeout=_POLL_INTERVAL):
+                return not self._stop.is_set()
+        return False
+
+    def _produce(self) -> None:
+        iterator = iter(self.source)
+        try:
+            while self._acquire_slot():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                if self._stop.is_set():
+                    break
+                self._queue.put(item)
+            self._queue.put(_DONE)
+        except BaseException as e:  # Propagate everything (incl. KeyboardInterrupt) to the consumer
+            logger.error(f"❌ {self.name}: chunk producer failed: {e}")
+            self._queue.put(_ProducerError(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"{self.name}: error closing source generator: {e}")
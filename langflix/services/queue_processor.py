@@ -1,77 +1,110 @@
 """
 Queue Processor
-Sequentially processes jobs from Redis queue.
+Processes jobs from the Redis queue with lease-based multi-worker claiming.
 """
 
 import asyncio
 import logging
 import os
-from typing import Optional
+from contextlib import ExitStack
+from typing import Dict, Optional, Set, Tuple
 from datetime import datetime, timezone, timedelta
 
 from langflix.core.redis_client import get_redis_job_manager
-from langflix.utils.temp_file_manager import get_temp_manager
+from langflix.utils.file_intake import stage_input, check_free_space
 from langflix.core.error_handler import handle_error, ErrorContext
-from langflix.settings import get_short_video_max_duration
+from langflix.settings import (
+    get_short_video_max_duration,
+    get_job_intake_mode,
+    get_job_min_free_space_gb,
+    get_job_output_space_factor,
+    get_queue_worker_id,
+    get_queue_max_concurrent_jobs,
+    get_queue_lease_ttl_seconds,
+    get_queue_heartbeat_interval_seconds,
+    get_queue_reap_interval_seconds,
+    get_queue_max_lease_requeues,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class QueueProcessor:
     """
-    Processes jobs from Redis queue sequentially.
-    Only one instance should run at a time (enforced via Redis lock).
+    Processes jobs from the Redis queue.
+    
+    Any number of processors (nodes) may run against the same Redis. Each claims
+    jobs into its own processing list and holds a per-job lease renewed by a
+    heartbeat; jobs of a processor that stops heartbeating are requeued by the
+    others. Up to max_concurrent_jobs jobs run at once per processor.
     """
     
-    POLL_INTERVAL = 1.0  # Seconds to wait when queue is empty
-    PROCESSING_POLL_INTERVAL = 2.0  # Seconds to wait when job is processing
-    LOCK_RENEWAL_INTERVAL = 1800.0  # Renew lock every 30 minutes
-    JOB_TIMEOUT_HOURS = 1  # Jobs processing >1 hour are considered stuck
+    POLL_INTERVAL = 1.0  # Seconds to back off after a Redis error
+    CLAIM_TIMEOUT = 5.0  # Seconds a blocking claim waits before re-checking the stop flag
+    JOB_TIMEOUT_HOURS = 1  # Unleased jobs processing >1 hour are considered stuck
     
-    def __init__(self):
-        """Initialize queue processor."""
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        max_concurrent_jobs: Optional[int] = None
+    ):
+        """
+        Initialize queue processor.
+        
+        Args:
+            worker_id: Unique worker ID (default: from settings, "{hostname}:{pid}")
+            max_concurrent_jobs: Jobs processed at once (default: from settings)
+        """
         self.redis_manager = get_redis_job_manager()
+        # Calls made on the event loop go through the asyncio client; the sync
+        # manager is only used from executor threads (progress callbacks)
+        self.redis = self.redis_manager.async_manager
+        self.worker_id = worker_id or get_queue_worker_id()
+        self.max_concurrent_jobs = max_concurrent_jobs or get_queue_max_concurrent_jobs()
+        self.lease_ttl = get_queue_lease_ttl_seconds()
+        self.heartbeat_interval = get_queue_heartbeat_interval_seconds()
+        self.reap_interval = get_queue_reap_interval_seconds()
         self._running = False
-        self._current_task: Optional[asyncio.Task] = None
-        self._lock_renewal_task: Optional[asyncio.Task] = None
+        self._active_jobs: Dict[str, asyncio.Task] = {}
+        # Jobs this worker no longer owns (lease lost, or handed back on shutdown)
+        # whose pipeline thread is still running; their results are discarded
+        self._abandoned_jobs: Set[str] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._reaper_task: Optional[asyncio.Task] = None
+        # Jobs seen without a lease on the previous reaper pass (claim/lease race guard)
+        self._lease_suspects: Set[Tuple[str, str]] = set()
+        # Last processor status written, so it is only written on transitions
+        self._last_status: Optional[Tuple] = None
     
     async def start(self):
         """
         Start the queue processor loop.
         Runs until explicitly stopped or cancelled.
         """
-        # Try to acquire processor lock
-        if not self.redis_manager.acquire_processor_lock():
-            logger.warning("⚠️ Processor lock already held, another instance may be running")
-            logger.info("Queue processor not started (lock unavailable)")
-            return
-        
         self._running = True
-        logger.info("🚀 Queue processor started")
+        await self.redis.register_worker(self.worker_id, self.lease_ttl)
+        logger.info(f"🚀 Queue processor started (worker {self.worker_id}, {self.max_concurrent_jobs} job slot(s))")
         
-        # Start lock renewal task
-        self._lock_renewal_task = asyncio.create_task(self._renew_lock_loop())
-        
-        # Recover stuck jobs on startup
+        # Recover jobs left behind by a previous run of this worker, and stuck jobs
         await self._recover_stuck_jobs()
         
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._reaper_task = asyncio.create_task(self._reaper_loop())
+        
         try:
             while self._running:
-                # Check if any job is currently processing
-                current_job = self.redis_manager.get_currently_processing_job()
-                
-                if current_job:
-                    # Job is processing, wait and check again
-                    logger.debug(f"Job {current_job} is processing, waiting...")
-                    await asyncio.sleep(self.PROCESSING_POLL_INTERVAL)
+                if len(self._active_jobs) >= self._job_slots():
+                    # All slots busy: wait for a job to finish (no Redis traffic)
+                    await asyncio.wait(
+                        list(self._active_jobs.values()),
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
                     continue
                 
-                # No job processing, try to get next from queue
-                
                 # Check for rate limiting (e.g. 1 job per 24h)
                 interval_hours = float(os.getenv('JOB_INTERVAL_HOURS', '0'))
                 if interval_hours > 0:
-                    last_completion = self.redis_manager.get_last_job_completion_time()
+                    last_completion = await self.redis.get_last_job_completion_time()
                     if last_completion:
                         # Ensure timezone awareness
                         if last_completion.tzinfo is None:
@@ -83,61 +116,43 @@ class QueueProcessor:
                         if elapsed < required_wait:
                             remaining = (required_wait - elapsed).total_seconds()
                             hours_remaining = remaining / 3600
+                            next_run = (last_completion + required_wait).isoformat()
                             
                             # Only log occasionally to avoid spamming
                             logger.info(f"⏳ Daily Quota Limit: Waiting {hours_remaining:.2f} hours for next slot (Interval: {interval_hours}h)")
                             
                             # Report status
-                            self.redis_manager.set_processor_status('waiting', {
+                            await self._set_status('waiting', {
+                                'worker_id': self.worker_id,
                                 'reason': 'quota_limit',
                                 'message': f"Daily Limit: Waiting {hours_remaining:.2f}h",
-                                'next_run': (datetime.now(timezone.utc) + timedelta(seconds=remaining)).isoformat(),
+                                'next_run': next_run,
                                 'interval_hours': interval_hours
-                            })
+                            }, key=('quota_limit', next_run))
                             
                             # Sleep for 5 minutes or remaining time, whichever is smaller
                             # This allows checking for shutdown signals
                             await asyncio.sleep(min(300, remaining))
                             continue
-
-                next_job_id = self.redis_manager.get_next_job_from_queue()
                 
-                if next_job_id:
-                    # Try to claim the job (atomic lock)
-                    if self.redis_manager.mark_job_processing(next_job_id):
-                        # Successfully claimed, process it
-                        logger.info(f"📦 Processing job {next_job_id} from queue (queue length: {self.redis_manager.get_queue_length()})")
-                        
-                        # Report status
-                        self.redis_manager.set_processor_status('processing', {
-                            'job_id': next_job_id,
-                            'message': f"Processing job {next_job_id}"
-                        })
-                        
-                        try:
-                            await self._process_job(next_job_id)
-                            logger.info(f"✅ Job {next_job_id} completed successfully")
-                        except Exception as e:
-                            logger.error(f"❌ Error processing job {next_job_id}: {e}", exc_info=True)
-                            # Mark job as failed
-                            try:
-                                self.redis_manager.update_job(next_job_id, {
-                                    "status": "FAILED",
-                                    "error": f"Processing error: {str(e)}",
-                                    "failed_at": datetime.now(timezone.utc).isoformat()
-                                })
-                                self.redis_manager.remove_from_processing()
-                            except Exception as cleanup_error:
-                                logger.error(f"Failed to cleanup after job {next_job_id} error: {cleanup_error}")
-                    else:
-                        # Failed to claim (another processor got it first)
-                        logger.debug(f"⚠️ Failed to claim job {next_job_id}, may be claimed by another processor")
-                else:
-                    # No jobs in queue, wait
-                    self.redis_manager.set_processor_status('idle', {
-                        'message': "No jobs in queue"
-                    })
+                await self._report_status()
+                
+                # Block until a job is enqueued, then atomically move it into this
+                # worker's processing list
+                try:
+                    next_job_id = await self.redis.claim_next_job_blocking(
+                        self.worker_id, self.lease_ttl, self.CLAIM_TIMEOUT
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to claim next job: {e}")
                     await asyncio.sleep(self.POLL_INTERVAL)
+                    continue
+                
+                if next_job_id:
+                    logger.info(f"📦 Worker {self.worker_id} processing job {next_job_id} from queue")
+                    await self.redis.update_job(next_job_id, {"status": "PROCESSING", "worker_id": self.worker_id})
+                    self._active_jobs[next_job_id] = asyncio.create_task(self._run_job(next_job_id))
+                    await self._report_status()
                     
         except asyncio.CancelledError:
             logger.info("Queue processor cancelled")
@@ -148,48 +163,119 @@ class QueueProcessor:
         finally:
             await self._cleanup()
     
+    def _job_slots(self) -> int:
+        # A job interval (daily quota) is about finished jobs, so don't start several at once
+        if float(os.getenv('JOB_INTERVAL_HOURS', '0')) > 0:
+            return 1
+        return self.max_concurrent_jobs
+    
+    async def _set_status(self, status: str, details: Dict, key: Optional[Tuple] = None) -> None:
+        """
+        Write this worker's status if it changed (key identifies the state, default: status).
+        
+        The status expires with the lease TTL; the heartbeat keeps it alive.
+        """
+        state = (status,) + (key or ())
+        if state == self._last_status:
+            return
+        try:
+            await self.redis.set_processor_status(self.worker_id, status, details, self.lease_ttl)
+            self._last_status = state
+        except Exception as e:
+            logger.warning(f"Failed to report processor status: {e}")
+    
+    async def _report_status(self) -> None:
+        job_ids = list(self._active_jobs)
+        if not job_ids:
+            await self._set_status('idle', {
+                'worker_id': self.worker_id,
+                'message': "No jobs in queue"
+            })
+            return
+        await self._set_status('processing', {
+            'worker_id': self.worker_id,
+            'job_id': job_ids[0],
+            'job_ids': job_ids,
+            'message': f"Processing {len(job_ids)} job(s): {', '.join(job_ids)}"
+        }, key=tuple(job_ids))
+    
+    async def _run_job(self, job_id: str):
+        """Process one claimed job, then release it (finished or failed jobs are not requeued)."""
+        try:
+            await self._process_job(job_id)
+            logger.info(f"✅ Job {job_id} completed successfully")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error processing job {job_id}: {e}", exc_info=True)
+            if job_id in self._abandoned_jobs:
+                return
+            # Mark job as failed
+            try:
+                await self.redis.update_job(job_id, {
+                    "status": "FAILED",
+                    "error": f"Processing error: {str(e)}",
+                    "failed_at": datetime.now(timezone.utc).isoformat()
+                })
+            except Exception as cleanup_error:
+                logger.error(f"Failed to mark job {job_id} as failed: {cleanup_error}")
+        finally:
+            abandoned = job_id in self._abandoned_jobs
+            self._abandoned_jobs.discard(job_id)
+            if self._active_jobs.pop(job_id, None) is not None and not abandoned:
+                await self.redis.release_job(self.worker_id, job_id)
+                if self._running:
+                    await self._report_status()
+    
     async def stop(self):
         """Stop the queue processor gracefully."""
         logger.info("Stopping queue processor...")
         self._running = False
         
-        # Cancel lock renewal
-        if self._lock_renewal_task:
-            self._lock_renewal_task.cancel()
-            try:
-                await self._lock_renewal_task
-            except asyncio.CancelledError:
-                pass
-        
-        # Release processor lock
-        self.redis_manager.release_processor_lock()
+        for task in (self._heartbeat_task, self._reaper_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
-        # If currently processing a job, mark it as QUEUED so it can be retried
-        current_job = self.redis_manager.get_currently_processing_job()
-        if current_job:
-            logger.info(f"Requeuing job {current_job} due to shutdown")
-            self.redis_manager.update_job(current_job, {
+        # Hand in-flight jobs back to the queue so another worker can pick them up.
+        # Their pipeline threads can't be interrupted, so flag them to drop their results
+        for job_id in list(self._active_jobs):
+            self._active_jobs.pop(job_id, None)
+            self._abandoned_jobs.add(job_id)
+            logger.info(f"Requeuing job {job_id} due to shutdown")
+            await self.redis.update_job(job_id, {
                 "status": "QUEUED"
             })
-            # Re-add to queue
-            self.redis_manager.add_job_to_queue(current_job)
-            self.redis_manager.remove_from_processing()
+            await self.redis.release_job(self.worker_id, job_id, requeue=True)
         
+        await self.redis.unregister_worker(self.worker_id)
         logger.info("✅ Queue processor stopped")
     
     async def _recover_stuck_jobs(self):
         """
         Recover stuck jobs on startup.
-        Jobs in PROCESSING state for >1 hour are marked as FAILED.
+        
+        Jobs still in this worker's processing list (previous run with the same
+        worker ID crashed) are requeued. Jobs in PROCESSING state for >1 hour
+        that no worker holds a lease on are marked as FAILED.
         """
         logger.info("Checking for stuck jobs...")
         
         try:
-            all_jobs = self.redis_manager.get_all_jobs()
+            for job_id in await self.redis.get_worker_jobs(self.worker_id):
+                logger.warning(f"Requeuing job {job_id} left over from a previous run of worker {self.worker_id}")
+                await self.redis.update_job(job_id, {"status": "QUEUED"})
+                await self.redis.release_job(self.worker_id, job_id, requeue=True)
+            
+            claimed = await self.redis.get_processing_jobs()
+            all_jobs = await self.redis.get_all_jobs(summary=True)
             stuck_count = 0
             
             for job_id, job_data in all_jobs.items():
-                if job_data.get('status') == 'PROCESSING':
+                if job_data.get('status') == 'PROCESSING' and job_id not in claimed:
                     # Check if job is stuck (processing >1 hour)
                     updated_at = job_data.get('updated_at')
                     if updated_at:
@@ -199,7 +285,7 @@ class QueueProcessor:
                             
                             if time_diff > timedelta(hours=self.JOB_TIMEOUT_HOURS):
                                 logger.warning(f"Found stuck job {job_id} (processing for {time_diff})")
-                                self.redis_manager.update_job(job_id, {
+                                await self.redis.update_job(job_id, {
                                     "status": "FAILED",
                                     "error": f"Job timeout: processing for >{self.JOB_TIMEOUT_HOURS} hour(s)",
                                     "failed_at": datetime.now(timezone.utc).isoformat()
@@ -208,14 +294,6 @@ class QueueProcessor:
                         except (ValueError, TypeError) as e:
                             logger.warning(f"Invalid updated_at for job {job_id}: {e}")
             
-            # Clear processing marker if no job is actually processing
-            current_processing = self.redis_manager.get_currently_processing_job()
-            if current_processing:
-                processing_job = self.redis_manager.get_job(current_processing)
-                if not processing_job or processing_job.get('status') != 'PROCESSING':
-                    logger.info("Clearing stale processing marker")
-                    self.redis_manager.remove_from_processing()
-            
             if stuck_count > 0:
                 logger.info(f"Recovered {stuck_count} stuck jobs")
             else:
@@ -224,6 +302,58 @@ class QueueProcessor:
         except Exception as e:
             logger.error(f"Error recovering stuck jobs: {e}", exc_info=True)
     
+    async def _reap_expired_leases(self) -> int:
+        """
+        Requeue jobs whose lease expired (on any worker).
+        
+        A job must be seen without a lease on two consecutive passes: a worker
+        sets the lease right after claiming, so a single observation may just be
+        a claim in progress.
+        
+        Returns:
+            Number of jobs requeued or failed
+        """
+        expired = set(await self.redis.find_expired_leases())
+        confirmed = expired & self._lease_suspects
+        self._lease_suspects = expired - confirmed
+        
+        recovered = 0
+        for worker_id, job_id in confirmed:
+            if await self.redis.requeue_expired_job(worker_id, job_id, get_queue_max_lease_requeues()):
+                recovered += 1
+        return recovered
+    
+    async def _heartbeat_loop(self):
+        """Periodically renew this worker's registration and job leases."""
+        try:
+            while self._running:
+                await asyncio.sleep(self.heartbeat_interval)
+                if self._running:
+                    held = [job_id for job_id in self._active_jobs if job_id not in self._abandoned_jobs]
+                    lost = await self.redis.renew_leases(self.worker_id, held, self.lease_ttl)
+                    for job_id in lost:
+                        # Another worker may already run it: keep the slot busy until
+                        # our pipeline thread returns, but never report its outcome
+                        logger.warning(f"Lease on job {job_id} lost; its result will be discarded")
+                        self._abandoned_jobs.add(job_id)
+        except asyncio.CancelledError:
+            logger.debug("Heartbeat task cancelled")
+            raise
+    
+    async def _reaper_loop(self):
+        """Periodically requeue jobs of workers that stopped heartbeating."""
+        try:
+            while self._running:
+                await asyncio.sleep(self.reap_interval)
+                if self._running:
+                    try:
+                        await self._reap_expired_leases()
+                    except Exception as e:
+                        logger.warning(f"Lease reaper pass failed: {e}")
+        except asyncio.CancelledError:
+            logger.debug("Lease reaper task cancelled")
+            raise
+    
     async def _process_job(self, job_id: str):
         """
         Process a single job from the queue.
@@ -233,15 +363,14 @@ class QueueProcessor:
         """
         try:
             # Get job data
-            job_data = self.redis_manager.get_job(job_id)
+            job_data = await self.redis.get_job(job_id)
             if not job_data:
                 logger.error(f"Job {job_id} not found")
-                self.redis_manager.remove_from_processing()
                 return
             
-            # Job should already be marked as PROCESSING by mark_job_processing
+            # Job was marked as PROCESSING when it was claimed
             # But update progress to show we're starting
-            self.redis_manager.update_job(job_id, {
+            await self.redis.update_job(job_id, {
                 "status": "PROCESSING",
                 "progress": 10,
                 "current_step": "Initializing video processing..."
@@ -270,114 +399,99 @@ class QueueProcessor:
             if not subtitle_path or not os.path.exists(subtitle_path):
                 raise ValueError(f"Subtitle file not found: {subtitle_path}")
             
-            logger.info(f"📥 Loading video and subtitle files for job {job_id}")
+            logger.info(f"📥 Preparing input files for job {job_id}")
             
-            # Get temp file manager
-            temp_manager = get_temp_manager()
+            # Source files are handed to the pipeline by path (no read/re-write of
+            # multi-GB episodes); "link" mode gives the job a private hardlink/reflink
+            # of the video. Subtitles are read in place: the pipeline discovers
+            # and writes subtitle folders next to the originals
+            intake_mode = get_job_intake_mode()
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._check_disk_space, job_id, video_path, output_dir)
             
-            # Read file contents (blocking I/O - but files are small, so acceptable)
-            # For large files, consider async file I/O
-            def read_files():
-                """Read video and subtitle files"""
-                with open(video_path, 'rb') as vf:
-                    video_content = vf.read()
+            with ExitStack() as job_inputs:
+                job_video_path = await loop.run_in_executor(
+                    None, job_inputs.enter_context,
+                    stage_input(video_path, mode=intake_mode, prefix=f'{job_id}_video_')
+                )
                 
-                subtitle_content = b''
-                if subtitle_path:
-                    with open(subtitle_path, 'rb') as sf:
-                        subtitle_content = sf.read()
+                logger.info(f"🎬 Starting video processing for job {job_id}")
+                logger.info(f"   Video: {video_path}")
+                logger.info(f"   Subtitle: {subtitle_path}")
                 
-                return video_content, subtitle_content
-            
-            # Read files (small delay acceptable for small files)
-            loop = asyncio.get_event_loop()
-            video_content, subtitle_content = await loop.run_in_executor(None, read_files)
-            
-            logger.info(f"📁 Files loaded: video={len(video_content)} bytes, subtitle={len(subtitle_content)} bytes")
-            
-            # Save to temp files for processing
-            with temp_manager.create_temp_file(suffix='.mkv', prefix=f'{job_id}_video_') as temp_video_path:
-                with temp_manager.create_temp_file(suffix='.srt', prefix=f'{job_id}_subtitle_') as temp_subtitle_path:
-                    # Write file contents (blocking, but small files)
-                    def write_temp_files():
-                        temp_video_path.write_bytes(video_content)
-                        temp_subtitle_path.write_bytes(subtitle_content)
-                    
-                    await loop.run_in_executor(None, write_temp_files)
-                    
-                    logger.info(f"🎬 Starting video processing for job {job_id}")
-                    logger.info(f"   Video: {video_path}")
-                    logger.info(f"   Subtitle: {subtitle_path}")
-                    
-                    # Progress callback wrapper for Redis updates
-                    def update_progress(progress: int, message: str):
-                        """Update job progress in Redis"""
-                        try:
-                            self.redis_manager.update_job(job_id, {
-                                "progress": progress,
-                                "current_step": message,
-                                "updated_at": datetime.now(timezone.utc).isoformat()
-                            })
-                        except Exception as e:
-                            logger.warning(f"Failed to update progress for job {job_id}: {e}")
-                    
-                    # Use unified pipeline service
-                    # IMPORTANT: process_video is a synchronous blocking function
-                    # We must run it in a thread executor to avoid blocking the event loop
-                    from langflix.services.video_pipeline_service import VideoPipelineService
-                    
-                    service = VideoPipelineService(
-                        language_code=language_code,
-                        output_dir=output_dir
-                    )
-                    
-                    # Process video using unified service in thread executor
-                    # This prevents blocking the async event loop
-                    logger.info(f"🚀 Running video pipeline in background thread for job {job_id}")
-                    result = await loop.run_in_executor(
-                        None,  # Use default ThreadPoolExecutor
-                        lambda: service.process_video(
-                            video_path=str(temp_video_path),
-                            subtitle_path=str(temp_subtitle_path),
-                            show_name=show_name,
-                            episode_name=episode_name,
-                            max_expressions=max_expressions,
-                            language_level=language_level,
-                            test_mode=test_mode,
-                            no_shorts=no_shorts,
-                            short_form_max_duration=short_form_max_duration,
-                            create_long_form=create_long_form,
-                            create_short_form=create_short_form,
-                            progress_callback=update_progress
-                        )
+                # Progress callback wrapper for Redis updates
+                def update_progress(progress: int, message: str):
+                    """Update job progress in Redis"""
+                    if job_id in self._abandoned_jobs:
+                        return
+                    try:
+                        self.redis_manager.update_job(job_id, {
+                            "progress": progress,
+                            "current_step": message,
+                            "updated_at": datetime.now(timezone.utc).isoformat()
+                        })
+                    except Exception as e:
+                        logger.warning(f"Failed to update progress for job {job_id}: {e}")
+                
+                # Use unified pipeline service
+                # IMPORTANT: process_video is a synchronous blocking function
+                # We must run it in a thread executor to avoid blocking the event loop
+                from langflix.services.video_pipeline_service import VideoPipelineService
+                
+                service = VideoPipelineService(
+                    language_code=language_code,
+                    output_dir=output_dir
+                )
+                
+                # Process video using unified service in thread executor
+                # This prevents blocking the async event loop
+                logger.info(f"🚀 Running video pipeline in background thread for job {job_id}")
+                result = await loop.run_in_executor(
+                    None,  # Use default ThreadPoolExecutor
+                    lambda: service.process_video(
+                        video_path=str(job_video_path),
+                        subtitle_path=subtitle_path,
+                        source_video_path=video_path,
+                        show_name=show_name,
+                        episode_name=episode_name,
+                        max_expressions=max_expressions,
+                        language_level=language_level,
+                        test_mode=test_mode,
+                        no_shorts=no_shorts,
+                        short_form_max_duration=short_form_max_duration,
+                        create_long_form=create_long_form,
+                        create_short_form=create_short_form,
+                        progress_callback=update_progress
                     )
-                    
-                    logger.info(f"✅ Video processing completed for job {job_id}")
-                    
-                    # Update job with results
-                    self.redis_manager.update_job(job_id, {
-                        "status": "COMPLETED",
-                        "progress": 100,
-                        "current_step": "Completed successfully!",
-                        "expressions": result.get("expressions", []),
-                        "educational_videos": result.get("educational_videos", []),
-                        "short_videos": result.get("short_videos", []),
-                        "final_video": result.get("final_video"),
-                        "completed_at": datetime.now(timezone.utc).isoformat()
-                    })
-                    
-                    # Invalidate video cache since new videos were created
-                    logger.info("Invalidating video cache after job completion...")
-                    self.redis_manager.invalidate_video_cache()
-                    
-                    # Set last completion time for rate limiting
-                    self.redis_manager.set_last_job_completion_time()
-                    
-                    logger.info(f"✅ Completed processing for job {job_id}")
-                    # Temp files automatically cleaned up when context exits
-            
-            # Remove from processing marker
-            self.redis_manager.remove_from_processing()
+                )
+                
+                logger.info(f"✅ Video processing completed for job {job_id}")
+                
+                if job_id in self._abandoned_jobs:
+                    logger.warning(f"Discarding result of job {job_id}: this worker no longer owns it")
+                    return
+                
+                # Update job with results
+                await self.redis.update_job(job_id, {
+                    "status": "COMPLETED",
+                    "progress": 100,
+                    "current_step": "Completed successfully!",
+                    "expressions": result.get("expressions", []),
+                    "educational_videos": result.get("educational_videos", []),
+                    "short_videos": result.get("short_videos", []),
+                    "final_video": result.get("final_video"),
+                    "completed_at": datetime.now(timezone.utc).isoformat()
+                })
+                
+                # Invalidate video cache since new videos were created
+                logger.info("Invalidating video cache after job completion...")
+                await self.redis.invalidate_video_cache()
+                
+                # Set last completion time for rate limiting
+                await self.redis.set_last_job_completion_time()
+                
+                logger.info(f"✅ Completed processing for job {job_id}")
+                # Staged inputs (link mode) are removed when the context exits
             
             # Update batch status if this job is part of a batch
             batch_id = job_data.get('batch_id')
@@ -400,42 +514,43 @@ class QueueProcessor:
             )
             handle_error(e, error_context, retry=False, fallback=False)
             
+            if job_id in self._abandoned_jobs:
+                logger.warning(f"Not marking job {job_id} as failed: this worker no longer owns it")
+                return
+            
             # Update job with error
-            self.redis_manager.update_job(job_id, {
+            await self.redis.update_job(job_id, {
                 "status": "FAILED",
                 "error": str(e),
                 "failed_at": datetime.now(timezone.utc).isoformat()
             })
             
-            # Remove from processing marker
-            self.redis_manager.remove_from_processing()
-            
             # Update batch status if this job is part of a batch
             if 'job_data' in locals() and job_data.get('batch_id'):
                 from langflix.services.batch_queue_service import BatchQueueService
                 batch_service = BatchQueueService()
                 batch_service.get_batch_status(job_data['batch_id'])
     
-    async def _renew_lock_loop(self):
-        """Periodically renew processor lock to prevent expiration."""
-        try:
-            while self._running:
-                await asyncio.sleep(self.LOCK_RENEWAL_INTERVAL)
-                if self._running:
-                    success = self.redis_manager.renew_processor_lock()
-                    if success:
-                        logger.debug("Processor lock renewed")
-                    else:
-                        logger.warning("Failed to renew processor lock")
-        except asyncio.CancelledError:
-            logger.debug("Lock renewal task cancelled")
-            raise
+    def _check_disk_space(self, job_id: str, video_path: str, output_dir: str) -> None:
+        """
+        Pre-flight check that the output directory can hold the job's results.
+        
+        Raises:
+            InsufficientDiskSpaceError: If free space is below the expected output
+                size (source size * output_space_factor) plus min_free_space_gb
+        """
+        video_size = os.path.getsize(video_path)
+        required = int(video_size * get_job_output_space_factor() + get_job_min_free_space_gb() * 1024 ** 3)
+        free = check_free_space(output_dir, required)
+        logger.info(
+            f"💾 Disk check passed for job {job_id}: {free / 1024 ** 3:.1f} GB free, "
+            f"{required / 1024 ** 3:.1f} GB required"
+        )
     
     async def _cleanup(self):
         """Cleanup resources on shutdown."""
         self._running = False
-        if self._lock_renewal_task:
-            self._lock_renewal_task.cancel()
-        self.redis_manager.release_processor_lock()
+        for task in (self._heartbeat_task, self._reaper_task):
+            if task:
+                task.cancel()
         logger.info("Queue processor cleanup complete")
-
@@ -0,0 +1,424 @@
+"""
+Process-pool scheduler for per-expression long-form rendering.
+
+Each expression's long-form video (VideoEditor.create_long_form_video on the
+raw clip plus its subtitles) is an independent ffmpeg job. A single libx264
+encode cannot keep a many-core box busy, so the scheduler runs several
+expressions at once in worker processes, bounded by CPU count and the
+per-worker memory budget from ResourceManager.
+
+Output naming is derived from the expression index only, and results are
+returned in task order, so the output of a parallel run is identical to a
+sequential one.
+
+Tasks rendering the same raw clip in different languages are rendered by one
+ffmpeg invocation (render_expression_languages), so each slice is decoded
+once no matter how many target languages there are.
+
+Workers render a pickled copy of each expression, so values the editor stores
+on it (educational_slide_start_time, read by ShortFormCreator) are returned in
+RenderResult and copied back onto the parent's expression.
+"""
+
+import functools
+import logging
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from langflix import settings
+from langflix.core.parallel_processor import get_resource_manager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderTask:
+    """Everything a worker process needs to render one expression"""
+    index: int  # 1-based expression number used in output filenames
+    expression: Any
+    language_code: str
+    episode_name: str
+    original_video: str
+    raw_clip_path: Path
+    subtitle_path: Path  # Context-relative dual subtitles, burned during rendering
+    final_videos_dir: Path
+    lang_paths: Dict[str, Any] = field(default_factory=dict)
+    test_mode: bool = False
+    include_slides: bool = False
+    source_subtitle_file: Optional[str] = None  # Episode subtitles for the editor's SubtitleProcessor
+
+    @property
+    def conflict_key(self) -> str:
+        """
+        VideoEditor names its intermediates after the sanitized expression text
+        (without the index), so two tasks with the same text must not overlap.
+        """
+        from langflix.utils.expression_utils import get_expr_attr
+        from langflix.utils.filename_utils import sanitize_for_expression_filename
+        return sanitize_for_expression_filename(get_expr_attr(self.expression, 'expression', ''))
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one expression"""
+    index: int
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+    slide_start: Optional[float] = None  # Expression's educational_slide_start_time after rendering
+
+    @property
+    def success(self) -> bool:
+        return self.output_path is not None and self.error is None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_subtitle_processor(subtitle_file: str):
+    # One parse per worker process and file (the subtitle parse cache makes it cheap)
+    from langflix.core.subtitle_processor import SubtitleProcessor
+    return SubtitleProcessor(subtitle_file)
+
+
+def _create_editor(task: RenderTask):
+    from langflix.core.video_editor import VideoEditor
+    editor = VideoEditor(
+        str(task.final_videos_dir),
+        task.language_code,
+        task.episode_name,
+        subtitle_processor=_get_subtitle_processor(task.source_subtitle_file) if task.source_subtitle_file else None,
+        test_mode=task.test_mode
+    )
+    editor.paths = task.lang_paths
+    return editor
+
+
+def _get_logging_config() -> Dict[str, Any]:
+    """Root logging setup of this process, in a picklable form for worker processes"""
+    root = logging.getLogger()
+    formatter = next((h.formatter for h in root.handlers if h.formatter), None)
+    return {
+        'level': root.level,
+        'format': formatter._fmt if formatter else None,
+        'log_files': [h.baseFilename for h in root.handlers if isinstance(h, logging.FileHandler)],
+    }
+
+
+def _init_render_worker(logging_config: Dict[str, Any]) -> None:
+    """Process pool initializer: spawned workers start unconfigured, so log like the parent"""
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    handlers += [logging.FileHandler(path, encoding='utf-8') for path in logging_config['log_files']]
+    logging.basicConfig(
+        level=logging_config['level'],
+        format=logging_config['format'] or logging.BASIC_FORMAT,
+        handlers=handlers,
+        force=True
+    )
+
+
+def _get_slide_start(expression: Any) -> Optional[float]:
+    from langflix.utils.expression_utils import get_expr_attr
+    return get_expr_attr(expression, 'educational_slide_start_time')
+
+
+def _set_slide_start(expression: Any, slide_start: float) -> None:
+    if isinstance(expression, dict):
+        expression['educational_slide_start_time'] = slide_start
+    else:
+        setattr(expression, 'educational_slide_start_time', slide_start)
+
+
+def _format_error(e: Exception) -> str:
+    import ffmpeg
+    if isinstance(e, ffmpeg.Error):
+        stderr = e.stderr.decode('utf8', errors='replace') if e.stderr else str(e)
+        return f"FFmpeg error: {stderr}"
+    return str(e)
+
+
+def render_expression(task: RenderTask) -> RenderResult:
+    """
+    Build the long-form video for one expression from its raw clip and subtitles.
+
+    Runs in a worker process, so it only uses picklable inputs and creates its
+    own VideoEditor. Never raises: failures are reported in RenderResult.error.
+    """
+    start = time.time()
+    editor = None
+    try:
+        editor = _create_editor(task)
+
+        # Subtitles are burned into the raw clip by the editor (in the same pass in single_pass mode)
+        output_path = editor.create_long_form_video(
+            task.expression,
+            task.original_video,
+            task.original_video,
+            expression_index=task.index - 1,
+            pre_extracted_context_clip=task.raw_clip_path,
+            include_slides=task.include_slides,
+            context_subtitle_path=str(task.subtitle_path)
+        )
+        return RenderResult(
+            index=task.index,
+            output_path=str(output_path),
+            duration=time.time() - start,
+            slide_start=_get_slide_start(task.expression)
+        )
+    except Exception as e:
+        return RenderResult(index=task.index, error=_format_error(e), duration=time.time() - start)
+    finally:
+        # Other workers share the output directory, so only remove files this editor created
+        if editor is not None:
+            editor._cleanup_temp_files(owned_only=True)
+
+
+def render_expression_languages(tasks: List[RenderTask]) -> List[RenderResult]:
+    """
+    Render one expression (one raw clip) in several languages with a single ffmpeg
+    invocation: the clip is decoded once and split, and each language burns its own
+    subtitles and slide.
+
+    Falls back to one render_expression call per task if the combined render fails.
+    Never raises.
+
+    Args:
+        tasks: Tasks sharing raw_clip_path, one per language
+
+    Returns:
+        One RenderResult per task, in the same order
+    """
+    from langflix.core.video.long_form_compositor import render_multi_output
+    from langflix.services.output_manager import OutputManager
+
+    if len(tasks) == 1 or settings.get_long_form_compositor() != "single_pass":
+        return [render_expression(task) for task in tasks]
+
+    start = time.time()
+    editors = []
+    try:
+        specs, output_paths = [], []
+        encode_args = None
+        for task in tasks:
+            editor = _create_editor(task)
+            editors.append(editor)
+            spec, output_path, task_encode_args = editor.prepare_long_form_render(
+                task.expression,
+                task.original_video,
+                expression_index=task.index - 1,
+                pre_extracted_context_clip=task.raw_clip_path,
+                include_slides=task.include_slides,
+                context_subtitle_path=str(task.subtitle_path)
+            )
+            specs.append(spec)
+            output_paths.append(str(output_path))
+            encode_args = encode_args or task_encode_args
+
+        render_multi_output(specs, output_paths, encode_args)
+        for output_path in output_paths:
+            OutputManager.ensure_write_permissions(Path(output_path), is_file=True)
+
+        duration = time.time() - start
+        return [
+            RenderResult(
+                index=task.index,
+                output_path=output_path,
+                duration=duration,
+                slide_start=_get_slide_start(task.expression)
+            )
+            for task, output_path in zip(tasks, output_paths)
+        ]
+    except Exception as e:
+        logger.warning(
+            f"Multi-language render of expression {tasks[0].index} failed, "
+            f"rendering {len(tasks)} languages separately: {_format_error(e)[-1000:]}"
+        )
+    finally:
+        for editor in editors:
+            editor._cleanup_temp_files(owned_only=True)
+
+    return [render_expression(task) for task in tasks]
+
+
+def _render_group(
+    tasks: List[RenderTask],
+    render_fn: Callable[[RenderTask], RenderResult],
+    multi_render_fn: Optional[Callable[[List[RenderTask]], List[RenderResult]]] = None
+) -> List[RenderResult]:
+    """
+    Render tasks that share intermediate filenames one after another.
+
+    With multi_render_fn, tasks sharing a raw clip (other languages of the same
+    expression) are rendered together.
+    """
+    if multi_render_fn is None:
+        return [render_fn(task) for task in tasks]
+
+    by_clip: Dict[str, List[RenderTask]] = {}
+    for task in tasks:
+        by_clip.setdefault(str(task.raw_clip_path), []).append(task)
+
+    results: Dict[int, RenderResult] = {}
+    for clip_tasks in by_clip.values():
+        clip_results = multi_render_fn(clip_tasks) if len(clip_tasks) > 1 else [render_fn(clip_tasks[0])]
+        for task, result in zip(clip_tasks, clip_results):
+            results[id(task)] = result
+    return [results[id(task)] for task in tasks]
+
+
+def _group_units(tasks: List[RenderTask], by_clip: bool) -> List[List[RenderTask]]:
+    """
+    Partition tasks into units that must run in the same worker: tasks sharing a
+    conflict key and, if by_clip, tasks sharing a raw clip.
+    """
+    units: Dict[int, List[RenderTask]] = {}
+    unit_of: Dict[Any, int] = {}
+
+    def keys(task: RenderTask) -> List[Any]:
+        task_keys: List[Any] = [('expression', task.conflict_key)]
+        if by_clip:
+            task_keys.append(('clip', str(task.raw_clip_path)))
+        return task_keys
+
+    for position, task in enumerate(tasks):
+        unit_ids = sorted({unit_of[key] for key in keys(task) if key in unit_of})
+        target = unit_ids[0] if unit_ids else position
+        units.setdefault(target, []).append(task)
+        for merged in unit_ids[1:]:
+            units[target].extend(units.pop(merged))
+        for unit_task in units[target]:
+            for key in keys(unit_task):
+                unit_of[key] = target
+
+    return list(units.values())
+
+
+def get_render_worker_count(num_tasks: int, max_workers: Optional[int] = None) -> int:
+    """
+    Number of render workers to use for a batch.
+
+    Args:
+        num_tasks: Number of independent render units in the batch
+        max_workers: Explicit cap (default: from settings, else resource-based)
+
+    Returns:
+        Worker count in [1, num_tasks]
+    """
+    if num_tasks <= 1 or not settings.is_parallel_rendering_enabled():
+        return 1
+
+    if max_workers is None:
+        max_workers = settings.get_parallel_rendering_max_workers()
+    if max_workers is None:
+        max_workers = get_resource_manager().get_render_workers(
+            settings.get_parallel_rendering_memory_per_worker_gb()
+        )
+    return max(1, min(max_workers, num_tasks))
+
+
+class RenderScheduler:
+    """Runs RenderTasks concurrently and returns results in task order"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        render_fn: Callable[[RenderTask], RenderResult] = render_expression,
+        multi_render_fn: Optional[Callable[[List[RenderTask]], List[RenderResult]]] = render_expression_languages
+    ):
+        """
+        Initialize render scheduler
+
+        Args:
+            max_workers: Worker cap (default: derived from CPU count and memory)
+            use_processes: Use worker processes (threads are only useful for tests)
+            render_fn: Module-level function rendering one task (must be picklable)
+            multi_render_fn: Module-level function rendering all languages of one raw
+                clip together (None, or video.multi_language_render: false, disables)
+        """
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.render_fn = render_fn
+        self.multi_render_fn = multi_render_fn
+
+    def run(
+        self,
+        tasks: List[RenderTask],
+        on_result: Optional[Callable[[RenderResult, int, int], None]] = None
+    ) -> List[RenderResult]:
+        """
+        Render all tasks.
+
+        Args:
+            tasks: Tasks to render
+            on_result: Optional callback (result, completed, total), called in the
+                parent process as each expression finishes (in completion order)
+
+        Returns:
+            One RenderResult per task, in the same order as tasks
+        """
+        if not tasks:
+            return []
+
+        multi_render_fn = self.multi_render_fn if settings.is_multi_language_render_enabled() else None
+
+        # Tasks sharing intermediate filenames (or a raw clip) run in the same worker
+        units = _group_units(tasks, by_clip=multi_render_fn is not None)
+
+        workers = get_render_worker_count(len(units), self.max_workers)
+        total = len(tasks)
+        # Keyed by task identity: the same expression index appears once per language
+        results: Dict[int, RenderResult] = {}
+
+        def record(unit: List[RenderTask], unit_results: List[RenderResult]) -> None:
+            for task, result in zip(unit, unit_results):
+                results[id(task)] = result
+                if result.slide_start is not None:
+                    # The worker set it on its own copy of the expression
+                    _set_slide_start(task.expression, result.slide_start)
+                if result.success:
+                    logger.info(
+                        f"✅ Rendered {task.language_code} expression {result.index} in {result.duration:.1f}s "
+                        f"({len(results)}/{total})"
+                    )
+                else:
+                    logger.error(f"❌ Rendering {task.language_code} expression {result.index} failed: {result.error}")
+                if on_result:
+                    on_result(result, len(results), total)
+
+        if workers == 1:
+            logger.info(f"Rendering {total} expressions sequentially")
+            for unit in units:
+                record(unit, _render_group(unit, self.render_fn, multi_render_fn))
+        else:
+            logger.info(f"Rendering {total} expressions with {workers} parallel workers")
+            if self.use_processes:
+                # spawn: forking a parent that runs LLM/prefetch threads can deadlock on held locks
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=mp.get_context("spawn"),
+                    initializer=_init_render_worker,
+                    initargs=(_get_logging_config(),)
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+
+            with executor:
+                pending = {
+                    executor.submit(_render_group, unit, self.render_fn, multi_render_fn): unit
+                    for unit in units
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        unit = pending.pop(future)
+                        try:
+                            unit_results = future.result()
+                        except Exception as e:
+                            # Worker process died (e.g. OOM-killed); the unit's tasks are lost
+                            unit_results = [RenderResult(index=task.index, error=f"Render worker failed: {e}") for task in unit]
+                        record(unit, unit_results)
+
+        return [results[id(task)] for task in tasks]
@@ -2,7 +2,6 @@ import logging
 import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
-import ffmpeg
 
 from langflix.core.models import ExpressionAnalysis
 from langflix.core.video_processor import VideoProcessor
@@ -14,7 +13,7 @@ from langflix.services.output_manager import OutputManager
 from langflix.utils.temp_file_manager import get_temp_manager
 from langflix.media.ffmpeg_utils import get_duration_seconds
 from langflix import settings
-from langflix.subtitles.overlay import apply_dual_subtitle_layers
+from langflix.services.render_scheduler import RenderScheduler, RenderTask, RenderResult
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +61,20 @@ class VideoFactory:
         extracted_slices = self._extract_slices(expressions, video_processor, original_video, test_mode=test_mode)
         logger.debug(f"Extracted {len(extracted_slices)} slices from {len(expressions)} expressions")
         
-        # Step 2: Create videos for each language
+        # Step 2: Prepare subtitles and render tasks for each language
+        # Subtitles are generated here (cheap, sequential); all long-form videos are then
+        # rendered by RenderScheduler in one batch, possibly in parallel. Languages sharing
+        # a raw slice are rendered from a single decode of it (video.multi_language_render).
         all_long_form_videos = {}
+        render_tasks: List[RenderTask] = []
+        rendered_languages: List[str] = []
         
         for lang_idx, lang in enumerate(target_languages):
             logger.info(f"Creating videos for language: {lang}")
             if progress_callback:
-                 # Map 50-80% progress
-                lang_progress = 50 + int((lang_idx / len(target_languages)) * 30)
-                progress_callback(lang_progress, f"Creating videos for {lang} ({lang_idx+1}/{len(target_languages)})...")
+                 # Map 50-55% progress (subtitle preparation)
+                lang_progress = 50 + int((lang_idx / len(target_languages)) * 5)
+                progress_callback(lang_progress, f"Preparing {lang} subtitles ({lang_idx+1}/{len(target_languages)})...")
 
             if lang not in translated_expressions:
                 logger.warning(f"No translations found for language {lang}, skipping")
@@ -78,27 +82,23 @@ class VideoFactory:
             
             lang_expressions = translated_expressions[lang]
             lang_paths = self._ensure_lang_paths(paths, lang, output_dir)
+            rendered_languages.append(lang)
             
-            # Asset Generation & Master Clip Creation
-            # We generate subtitles and create the "Master Clip" (burned subs) here.
-            # This ensures the video passed to VideoEditor ALREADY has perfect internal sync.
+            # Subtitles are relative to the raw clip (starts at 0), so burning them
+            # during rendering keeps perfect sync.
             subtitle_dir = lang_paths.get('subtitles') or lang_paths['language_dir'] / "subtitles"
             subtitle_dir.mkdir(parents=True, exist_ok=True)
             
-            # Helper to store master clips for this language
-            master_clips: Dict[int, Path] = {}
-            
-            logger.info(f"Preparing assets (Subtitles & Master Clips) for {len(lang_expressions)} expressions...")
+            logger.info(f"Preparing subtitles for {len(lang_expressions)} expressions...")
             
             for i, expression in enumerate(lang_expressions, start=start_index):
                 if (i - start_index) not in extracted_slices:
-                    logger.warning(f"Skipping asset generation for expression {i}: No raw slice found")
+                    logger.warning(f"Skipping video creation for expression {i}: No raw slice found")
                     continue
                     
                 raw_clip_path = extracted_slices[i - start_index]
                 
                 try:
-                    # 1. Generate Subtitle File
                     base_expression = expressions[i - start_index] if (i - start_index) < len(expressions) else expression
                     expr_text = get_expr_attr(base_expression, 'expression', '')
                     safe_expression_short = sanitize_for_expression_filename(expr_text)[:30]
@@ -111,109 +111,47 @@ class VideoFactory:
                     )
                     
                     if not success:
-                        logger.warning(f"Failed to generate subtitle file for expression {i}, skipping master clip creation")
+                        logger.warning(f"Failed to generate subtitle file for expression {i}, skipping video creation")
                         continue
-                        
-                    # 2. Create Master Clip (Burn Subtitles into Raw Clip)
-                    # Input: Raw Clip (starts at 0)
-                    # Subtitles: Relative (starts at 0)
-                    # We use apply_dual_subtitle_layers with start=0, duration=full.
-                    # This uses "Input Seeking" (ss=0) which is valid and ensures sync.
-                    
-                    temp_master_clip = lang_paths['videos'] / f"temp_master_clip_burned_{i:02d}_{safe_expression_short}.mkv"
-                    temp_master_clip.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Note: apply_dual_subtitle_layers handles the ffmpeg call
-                    # We pass 0 as start time because the raw clip is already cut.
-                    # We MUST use the duration of the clip.
-                    duration = get_duration_seconds(str(raw_clip_path))
-                    
-                    apply_dual_subtitle_layers(
-                        str(raw_clip_path),
-                        str(subtitle_output_path),
-                        "", 
-                        str(temp_master_clip),
-                        0.0, 
-                        duration,
-                        encoding_params={
-                            'preset': 'ultrafast' if test_mode else 'slow',
-                            'crf': 28 if test_mode else 18
-                        } if test_mode else None
-                    )
                     
-                    if temp_master_clip.exists():
-                        master_clips[i] = temp_master_clip
-                        logger.debug(f"Created Master Clip with burned subtitles: {temp_master_clip.name}")
-                    else:
-                        logger.error(f"Failed to create Master Clip for expression {i}")
-
-                except ffmpeg.Error as e:
-                    logger.error(f"FFmpeg error preparing assets for expression {i}: {e.stderr.decode('utf8') if e.stderr else str(e)}")
+                    render_tasks.append(RenderTask(
+                        index=i,
+                        expression=expression,
+                        language_code=lang,
+                        episode_name=episode_name,
+                        original_video=str(original_video),
+                        raw_clip_path=Path(raw_clip_path),
+                        subtitle_path=subtitle_output_path,
+                        final_videos_dir=Path(lang_paths['final_videos']),
+                        lang_paths=lang_paths,
+                        test_mode=test_mode,
+                        include_slides=include_slides,
+                        source_subtitle_file=subtitle_processor.subtitle_file_path
+                    ))
                 except Exception as e:
                     logger.error(f"Error preparing assets for expression {i}: {e}")
-            
-            lang_video_editor = VideoEditor(
-                str(lang_paths['final_videos']),
-                lang,
-                episode_name,
-                subtitle_processor=subtitle_processor,
-                test_mode=test_mode
-            )
-            lang_video_editor.paths = lang_paths
-            
-            lang_long_form_videos = []
-            
-            for expr_idx, expression in enumerate(lang_expressions, start=start_index):
-                logger.info(f"Processing long video for expression {expr_idx}/{len(lang_expressions) + start_index - 1}")
-                
-                # Debug: Log vocabulary annotations
-                vocab = get_expr_attr(expression, 'vocabulary_annotations', [])
-                logger.debug(f"Expression {expr_idx} vocab annotations raw: {vocab}")
-                if isinstance(vocab, list):
-                    logger.debug(f"Found {len(vocab)} annotations in Factory")
-                else:
-                    logger.debug(f"Vocab annotations is {type(vocab)}")
-                
-                if expr_idx not in master_clips:
-                    logger.warning(f"Skipping video creation for expression {expr_idx}: No master clip")
-                    continue
-                
-                try:
-                    # We pass the MASTER CLIP (with burned subs) as the context clip.
-                    # VideoEditor will see it has a pre-extracted clip and use it.
-                    # Since it already has subs, we don't need to apply them again.
-                    long_form_video = lang_video_editor.create_long_form_video(
-                        expression,
-                        str(original_video), # Still passed for reference/audio extraction if needed
-                        str(original_video),
-                        expression_index=expr_idx - 1,
-                        pre_extracted_context_clip=master_clips[expr_idx],
-                        include_slides=include_slides
-                    )
-                    lang_long_form_videos.append(long_form_video)
-                except Exception as e:
-                    logger.error(f"Error creating long-form video for {lang} - expr {expr_idx+1}: {e}")
-                    continue
-            
-            if lang_long_form_videos:
-                all_long_form_videos[lang] = lang_long_form_videos
-                
-            # Cleanup temp files for this editor
+        
+        # Per-expression progress over the 55-80% band
+        def on_render_result(result: RenderResult, completed: int, total: int):
+            if progress_callback:
+                progress = 55 + int((completed / total) * 25)
+                progress_callback(progress, f"Rendered expression video {completed}/{total}")
+        
+        render_results = RenderScheduler().run(render_tasks, on_result=on_render_result)
+        # Results are in task order (expression order within each language), so the
+        # combined video order is deterministic
+        for task, result in zip(render_tasks, render_results):
+            if result.success:
+                all_long_form_videos.setdefault(task.language_code, []).append(result.output_path)
+        
+        for lang in rendered_languages:
+            # Sweep temp files left in the shared output directory (e.g. by a failed render)
             try:
-                # We could also clean up master_clips here if they are temps
-                # But VideoEditor might track them if we registered them?
-                # We didn't register them in temp_manager explicitly here, but they are in 'videos' dir
-                # VideoEditor.cleanup cleans 'videos' dir usually?
-                lang_video_editor._cleanup_temp_files(preserve_short_format=False)
+                lang_paths = paths['languages'][lang]
+                cleanup_editor = VideoEditor(str(lang_paths['final_videos']), lang, episode_name, test_mode=test_mode)
+                cleanup_editor._cleanup_temp_files(preserve_short_format=False)
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp files for {lang}: {e}")
-                
-            # Explicit cleanup of Master Clips (they are intermediate)
-            for clip in master_clips.values():
-                try:
-                    if clip.exists():
-                        clip.unlink()
-                except: pass
         
         # Step 3: Combine videos
         combined_videos = {}
@@ -323,7 +261,7 @@ class VideoFactory:
                         start_time,
                         end_time,
                         temp_context_clip,
-                        strategy='encode',  # Force encode for frame accuracy (fix sync issues)
+                        strategy='smart',  # Frame-accurate: re-encoded head GOP + stream copy, falls back to encode
                         encoding_params={
                             'preset': 'ultrafast' if test_mode else None,
                             'crf': 28 if test_mode else None
@@ -54,7 +54,8 @@ class VideoPipelineService:
         short_form_max_duration: float = 180.0,
         target_duration: float = 60.0,
         schedule_upload: bool = False,
-        progress_callback: Optional[Callable[[int, str], None]] = None
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        source_video_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process video with unified pipeline
@@ -72,6 +73,8 @@ class VideoPipelineService:
             create_short_form: If True, create short-form videos (default: True)
             schedule_upload: If True, upload generated videos to YouTube
             progress_callback: Optional callback function(progress: int, message: str) -> None
+            source_video_path: Original location of video_path when the job input was
+                staged elsewhere; used as the video directory and for subtitle discovery
             
         Returns:
             Dictionary with processing results:
@@ -95,7 +98,7 @@ class VideoPipelineService:
             # Create pipeline instance
             # Note: LangFlixPipeline expects video_dir (directory), not video_path (file)
             # So we need to pass the directory containing the video
-            video_dir = str(Path(video_path).parent)
+            video_dir = str(Path(source_video_path or video_path).parent)
             
             pipeline = LangFlixPipeline(
                 subtitle_file=subtitle_path,
@@ -107,7 +110,8 @@ class VideoPipelineService:
                 progress_callback=progress_callback,
                 series_name=show_name,  # Pass show_name to pipeline
                 episode_name=episode_name,  # Pass episode_name to pipeline
-                video_file=video_path  # Pass direct video file path
+                video_file=video_path,  # Pass direct video file path
+                source_media_path=source_video_path
             )
             
             if progress_callback:
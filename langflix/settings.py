@@ -78,7 +78,8 @@ def get_clip_extraction_strategy() -> str:
     Get clip extraction strategy.
     
     Returns:
-        str: 'auto' (try copy, fallback to encode), 'copy' (copy only), or 'encode' (always re-encode)
+        str: 'auto' (try copy, fallback to encode), 'copy' (copy only),
+        'smart' (copy + re-encoded head GOP, fallback to encode) or 'encode' (always re-encode)
         Default: 'auto'
     """
     return get_clip_extraction_config().get('strategy', 'auto')
@@ -97,6 +98,16 @@ def get_clip_copy_threshold_seconds() -> float:
     return float(get_clip_extraction_config().get('copy_threshold_seconds', 30.0))
 
 
+def is_keyframe_index_persisted() -> bool:
+    """
+    Check whether smart-cut keyframe indexes are persisted in the disk cache (CacheManager).
+    
+    Returns:
+        bool: True to share indexes across processes and runs (default: True)
+    """
+    return bool(get_clip_extraction_config().get('persist_keyframe_index', True))
+
+
 def get_font_config() -> Dict[str, Any]:
     """Get font configuration"""
     return _config_loader.get_section('font') or {}
@@ -214,6 +225,21 @@ def language_code_to_name(lang_code: str) -> Optional[str]:
     return LANGUAGE_CODE_TO_NAME.get(lang_code)
 
 
+def get_subtitle_parse_cache_config() -> Dict[str, Any]:
+    """Get parsed-subtitle cache configuration"""
+    return get_subtitles_config().get('parse_cache', {}) or {}
+
+
+def is_subtitle_parse_cache_enabled() -> bool:
+    """Check if parsed subtitles are cached by (path, mtime, size) (default: True)"""
+    return bool(get_subtitle_parse_cache_config().get('enabled', True))
+
+
+def is_subtitle_parse_cache_persistent() -> bool:
+    """Check if parsed subtitles are also stored on disk for other processes and restarts (default: True)"""
+    return bool(get_subtitle_parse_cache_config().get('persist_to_disk', True))
+
+
 def get_subtitle_pattern() -> str:
     """Get subtitle filename pattern"""
     return get_subtitles_config().get('subtitle_pattern', '{index}_{Language}.srt')
@@ -270,6 +296,25 @@ def get_force_refresh_bible() -> bool:
     return show_bible_cfg.get('force_refresh', False)
 
 
+def get_streaming_prefetch_chunks() -> int:
+    """
+    Get how many analyzed chunks the LLM stage may run ahead of video rendering.
+
+    In streaming mode the Script Agent analyzes the next chunk(s) on a background
+    thread while ffmpeg renders the current one.
+
+    Returns:
+        int: Number of chunks to prefetch (0 = strictly sequential, default: 2)
+    """
+    config = get_pipeline_config()
+    streaming_cfg = config.get('streaming', {}) or {}
+    try:
+        return max(0, int(streaming_cfg.get('prefetch_chunks', 2)))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid pipeline.streaming.prefetch_chunks value: {streaming_cfg.get('prefetch_chunks')}, using 2")
+        return 2
+
+
 def get_ending_credit_config() -> Dict[str, Any]:
     """Get ending credit configuration"""
     return get_transitions_config().get('ending_credit', {})
@@ -297,6 +342,16 @@ def get_ending_credit_video_path() -> Optional[str]:
     return None
 
 
+def get_ending_credit_cache_dir() -> Optional[str]:
+    """
+    Get directory for ending credits pre-encoded to the shorts' stream parameters.
+    
+    Returns:
+        Directory path (default: 'cache/ending_credits'), or None to keep them in a temp dir for this run only
+    """
+    return get_ending_credit_config().get('cache_dir', 'cache/ending_credits')
+
+
 def get_language_levels() -> Dict[str, Any]:
     """Get language proficiency levels"""
     return _config_loader.get_section('language_levels') or {}
@@ -336,6 +391,54 @@ def get_max_concurrent_slicing() -> int:
     return max(1, cpu_count // 2)
 
 
+def get_long_form_compositor() -> str:
+    """
+    Get long-form video compositor mode.
+    
+    Returns:
+        "single_pass" (one ffmpeg filter graph per expression, default) or
+        "multi_pass" (one encode per step, legacy)
+    """
+    mode = str(get_video_config().get('long_form_compositor', 'single_pass')).lower()
+    if mode not in ('single_pass', 'multi_pass'):
+        logger.warning(f"Unknown video.long_form_compositor '{mode}', using single_pass")
+        return 'single_pass'
+    return mode
+
+
+def is_multi_language_render_enabled() -> bool:
+    """Check if all target languages of an expression are rendered from one decode"""
+    return bool(get_video_config().get('multi_language_render', True))
+
+
+def get_parallel_rendering_config() -> Dict[str, Any]:
+    """Get parallel per-expression rendering configuration"""
+    return get_video_config().get('parallel_rendering', {}) or {}
+
+
+def is_parallel_rendering_enabled() -> bool:
+    """Check if long-form expression videos are rendered in parallel worker processes"""
+    return get_parallel_rendering_config().get('enabled', True)
+
+
+def get_parallel_rendering_max_workers() -> Optional[int]:
+    """
+    Get maximum parallel render workers.
+    
+    Returns:
+        Configured worker cap, or None to derive it from CPU count and memory
+    """
+    max_workers = get_parallel_rendering_config().get('max_workers')
+    if max_workers is None:
+        return None
+    return max(1, int(max_workers))
+
+
+def get_parallel_rendering_memory_per_worker_gb() -> float:
+    """Get estimated peak memory of one expression render in GB (default: 2.0)"""
+    return float(get_parallel_rendering_config().get('memory_per_worker_gb', 2.0))
+
+
 def get_expression_repeat_count() -> int:
     """
     Get unified expression repeat count for all video types.
@@ -471,6 +574,53 @@ def get_retry_backoff_seconds() -> list:
     return get_llm_config().get('retry_backoff_seconds', [3, 6, 12])
 
 
+def get_llm_rate_limit_config() -> Dict[str, Any]:
+    """Get LLM API rate limit configuration"""
+    return get_llm_config().get('rate_limit', {}) or {}
+
+
+def get_llm_requests_per_minute() -> Optional[float]:
+    """Get max LLM requests per minute (None = unlimited)"""
+    value = get_llm_rate_limit_config().get('requests_per_minute')
+    return float(value) if value else None
+
+
+def get_llm_tokens_per_minute() -> Optional[float]:
+    """Get max LLM tokens (prompt + output) per minute (None = unlimited)"""
+    value = get_llm_rate_limit_config().get('tokens_per_minute')
+    return float(value) if value else None
+
+
+def get_llm_expected_output_tokens() -> int:
+    """Get expected output tokens per request, used for tokens/minute budgeting"""
+    return int(get_llm_rate_limit_config().get('expected_output_tokens', 8000))
+
+
+def get_llm_response_cache_config() -> Dict[str, Any]:
+    """Get persistent LLM response cache configuration"""
+    return get_llm_config().get('response_cache', {}) or {}
+
+
+def is_llm_response_cache_enabled() -> bool:
+    """Check if LLM responses are cached on disk (default: True)"""
+    return bool(get_llm_response_cache_config().get('enabled', True))
+
+
+def get_llm_response_cache_path() -> str:
+    """Get SQLite database path for the LLM response cache"""
+    return get_llm_response_cache_config().get('path', 'cache/llm_responses.sqlite3')
+
+
+def get_llm_response_cache_max_size_mb() -> int:
+    """Get max total size of cached LLM responses in MB before LRU eviction (default: 512)"""
+    return int(get_llm_response_cache_config().get('max_size_mb', 512))
+
+
+def get_llm_response_cache_bypass() -> bool:
+    """Check if cache lookups should be skipped (responses are still stored)"""
+    return bool(get_llm_response_cache_config().get('bypass', False))
+
+
 def get_llm_model_name() -> str:
     """Get the Gemini model name for LLM operations"""
     # Check environment variable first
@@ -595,6 +745,96 @@ def get_max_expressions_per_chunk() -> int:
     return get_processing_config().get('max_expressions_per_chunk', 5)
 
 
+def get_job_intake_config() -> Dict[str, Any]:
+    """Get queue job intake configuration"""
+    return get_processing_config().get('job_intake', {}) or {}
+
+
+def get_job_intake_mode() -> str:
+    """
+    Get how queue jobs receive their input files.
+    
+    Returns:
+        "direct" (pipeline reads the original files, default) or
+        "link" (private hardlink/reflink/sendfile copy per job)
+    """
+    mode = str(get_job_intake_config().get('mode', 'direct')).lower()
+    if mode not in ('direct', 'link'):
+        logger.warning(f"Unknown processing.job_intake.mode '{mode}', using direct")
+        return 'direct'
+    return mode
+
+
+def get_job_min_free_space_gb() -> float:
+    """Get free space (GB) that must remain in the output directory after a job (default: 2.0)"""
+    return float(get_job_intake_config().get('min_free_space_gb', 2.0))
+
+
+def get_job_output_space_factor() -> float:
+    """Get expected output size of a job as a multiple of the source video size (default: 1.0)"""
+    return float(get_job_intake_config().get('output_space_factor', 1.0))
+
+
+def get_job_queue_config() -> Dict[str, Any]:
+    """Get queue worker configuration"""
+    return get_processing_config().get('job_queue', {}) or {}
+
+
+def get_queue_worker_id() -> str:
+    """Get this node's queue worker ID (env LANGFLIX_WORKER_ID, config, or "{hostname}:{pid}")"""
+    import os
+    worker_id = os.getenv('LANGFLIX_WORKER_ID') or get_job_queue_config().get('worker_id')
+    if worker_id:
+        return str(worker_id)
+    import socket
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def get_queue_max_concurrent_jobs() -> int:
+    """Get number of queue jobs processed at once on this node (default: 1)"""
+    return max(1, int(get_job_queue_config().get('max_concurrent_jobs', 1)))
+
+
+def get_queue_lease_ttl_seconds() -> float:
+    """Get job lease lifetime in seconds (default: 120)"""
+    return float(get_job_queue_config().get('lease_ttl_seconds', 120))
+
+
+def get_queue_heartbeat_interval_seconds() -> float:
+    """Get job lease renewal interval in seconds (default: 30)"""
+    return float(get_job_queue_config().get('heartbeat_interval_seconds', 30))
+
+
+def get_queue_reap_interval_seconds() -> float:
+    """Get expired lease check interval in seconds (default: 60)"""
+    return float(get_job_queue_config().get('reap_interval_seconds', 60))
+
+
+def get_queue_max_lease_requeues() -> int:
+    """Get number of lease expiries before a job is marked FAILED (default: 3)"""
+    return int(get_job_queue_config().get('max_lease_requeues', 3))
+
+
+def get_job_events_config() -> Dict[str, Any]:
+    """Get job event stream configuration"""
+    return get_processing_config().get('job_events', {}) or {}
+
+
+def get_job_events_progress_interval_seconds() -> float:
+    """Get minimum interval between progress events on a job event stream (default: 0.5)"""
+    return max(0.0, float(get_job_events_config().get('progress_interval_seconds', 0.5)))
+
+
+def get_job_events_keepalive_seconds() -> float:
+    """Get idle time after which a job event stream sends a keepalive (default: 15)"""
+    return max(1.0, float(get_job_events_config().get('keepalive_seconds', 15)))
+
+
+def get_job_events_max_streams() -> int:
+    """Get maximum number of concurrently open job event streams per API process (default: 100)"""
+    return max(1, int(get_job_events_config().get('max_streams', 100)))
+
+
 # ============================================================================
 # TTS Settings
 # ============================================================================
@@ -694,6 +934,21 @@ def get_short_video_expression_repeat_count() -> int:
     return get_expression_repeat_count()
 
 
+def get_short_form_renderer() -> str:
+    """
+    Get short-form video renderer mode.
+    
+    Returns:
+        "single_pass" (scale/pad and overlays in one ffmpeg graph, default) or
+        "multi_pass" (scaled intermediate, then overlay encode; legacy)
+    """
+    mode = str(get_short_video_config().get('renderer', 'single_pass')).lower()
+    if mode not in ('single_pass', 'multi_pass'):
+        logger.warning(f"Unknown short_video.renderer '{mode}', using single_pass")
+        return 'single_pass'
+    return mode
+
+
 def get_short_video_layout_config() -> Dict[str, Any]:
     """Get short-form video layout configuration"""
     return get_short_video_config().get('layout', {})
@@ -1318,6 +1573,70 @@ def get_ffprobe_timeout_seconds() -> int:
     return timeout_value
 
 
+def get_ffprobe_index_config() -> Dict[str, Any]:
+    """Get persistent ffprobe index configuration"""
+    return get_media_ffprobe_config().get('index', {}) or {}
+
+
+def is_ffprobe_index_enabled() -> bool:
+    """Check if ffprobe results are kept in the persistent index (default: True)"""
+    return bool(get_ffprobe_index_config().get('enabled', True))
+
+
+def get_ffprobe_index_path() -> str:
+    """Get SQLite path of the ffprobe index (default: <local storage root>/.ffprobe_index.sqlite3)"""
+    from pathlib import Path
+    path = get_ffprobe_index_config().get('path')
+    if path:
+        return path
+    return str(Path(get_storage_local_path() or 'output') / '.ffprobe_index.sqlite3')
+
+
+def get_ffprobe_probe_workers() -> int:
+    """Get number of parallel ffprobe processes for batch probing (minimum 1, default 8)"""
+    return max(1, int(get_ffprobe_index_config().get('probe_workers', 8)))
+
+
+def get_thumbnail_config() -> Dict[str, Any]:
+    """Get web UI thumbnail store configuration"""
+    return _config_loader.get('expression.media.thumbnails', {}) or {}
+
+
+def get_thumbnail_cache_dir() -> str:
+    """Get directory of the content-addressed thumbnail store (default: 'cache/thumbnails')"""
+    return get_thumbnail_config().get('cache_dir') or 'cache/thumbnails'
+
+
+def get_thumbnail_workers() -> int:
+    """Get maximum number of concurrent thumbnail renders (minimum 1, default 4)"""
+    return max(1, int(get_thumbnail_config().get('workers', 4)))
+
+
+def get_thumbnail_max_age_seconds() -> int:
+    """Get HTTP Cache-Control max-age for served thumbnails (default 300; revalidated by ETag after)"""
+    return max(0, int(get_thumbnail_config().get('max_age_seconds', 300)))
+
+
+def get_video_index_config() -> Dict[str, Any]:
+    """Get web UI video index configuration"""
+    return _config_loader.get('expression.media.video_index', {}) or {}
+
+
+def is_video_index_enabled() -> bool:
+    """Check if video lists are served from the incremental video index (default: True)"""
+    return bool(get_video_index_config().get('enabled', True))
+
+
+def get_video_index_dir() -> str:
+    """Get directory holding the video index databases (default: 'cache/video_index')"""
+    return get_video_index_config().get('dir') or 'cache/video_index'
+
+
+def get_video_index_min_refresh_interval() -> float:
+    """Get seconds during which a video index refresh is reused (default 2.0)"""
+    return max(0.0, float(get_video_index_config().get('min_refresh_interval', 2.0)))
+
+
 def get_media_slicing_config() -> Dict[str, Any]:
     """Get media slicing configuration"""
     return _config_loader.get('expression.media.slicing', {})
@@ -0,0 +1,185 @@
+"""
+Job input intake without copying file contents through Python.
+
+Queue jobs reference source episodes (often several GB on NAS storage). By
+default the pipeline reads them in place; when a job needs its own copy
+(intake mode "link"), the file is staged with the cheapest available method:
+
+    hardlink → reflink (copy-on-write clone) → os.sendfile → shutil.copyfile
+
+Usage:
+    from langflix.utils.file_intake import stage_input, check_free_space
+
+    check_free_space("output", required_bytes=video_size)
+    with stage_input(video_path, mode="link", prefix="job_video_") as path:
+        process(path)
+"""
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INTAKE_MODES = ("direct", "link")
+
+# ioctl request number of FICLONE (linux/fs.h), used for reflink copies
+_FICLONE = 0x40049409
+
+_SENDFILE_CHUNK = 64 * 1024 * 1024
+
+
+class InsufficientDiskSpaceError(OSError):
+    """Not enough free space to run a job"""
+
+    def __init__(self, path: Union[str, Path], required_bytes: int, free_bytes: int):
+        self.path = str(path)
+        self.required_bytes = required_bytes
+        self.free_bytes = free_bytes
+        super().__init__(
+            f"Insufficient disk space at {path}: {required_bytes / 1024**3:.2f} GB required, "
+            f"{free_bytes / 1024**3:.2f} GB free"
+        )
+
+
+def _existing_ancestor(path: Path) -> Path:
+    """Nearest existing directory at or above path (output dirs may not exist yet)"""
+    path = path.resolve()
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path if path.is_dir() else path.parent
+
+
+def check_free_space(path: Union[str, Path], required_bytes: int) -> int:
+    """
+    Ensure the filesystem holding path has at least required_bytes free.
+
+    Args:
+        path: File or directory (need not exist yet)
+        required_bytes: Bytes the job is expected to write there
+
+    Returns:
+        Free bytes on that filesystem
+
+    Raises:
+        InsufficientDiskSpaceError: If free space is below required_bytes
+    """
+    directory = _existing_ancestor(Path(path))
+    free_bytes = shutil.disk_usage(directory).free
+    if free_bytes < required_bytes:
+        raise InsufficientDiskSpaceError(directory, required_bytes, free_bytes)
+    return free_bytes
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    import fcntl
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+def _sendfile_copy(src: Path, dst: Path) -> None:
+    """Kernel-side copy: file data never enters Python"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, min(remaining, _SENDFILE_CHUNK))
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+        if remaining > 0:
+            raise OSError(f"sendfile copied {offset} bytes of {src}, expected {offset + remaining}")
+
+
+def link_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """
+    Materialize src at dst without reading it into memory.
+
+    Args:
+        src: Existing file
+        dst: Destination path (must not exist)
+
+    Returns:
+        Method used: "hardlink", "reflink", "sendfile" or "copy"
+    """
+    src, dst = Path(src), Path(dst)
+
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError as e:
+        logger.debug(f"Hardlink {src} -> {dst} not possible: {e}")
+
+    for method, copy_fn in (("reflink", _reflink), ("sendfile", _sendfile_copy)):
+        try:
+            copy_fn(src, dst)
+            return method
+        except (OSError, AttributeError, ImportError) as e:
+            logger.debug(f"{method} {src} -> {dst} not possible: {e}")
+            dst.unlink(missing_ok=True)
+
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+@contextmanager
+def stage_input(
+    src: Union[str, Path],
+    mode: str = "direct",
+    prefix: str = "langflix_input_",
+    temp_dir: Optional[Union[str, Path]] = None
+) -> Generator[Path, None, None]:
+    """
+    Provide a job input file for the duration of the context.
+
+    Args:
+        src: Source file
+        mode: "direct" yields src itself; "link" yields a private staged copy
+            (hardlink/reflink/sendfile) with the same file name, in its own
+            directory, removed when the context exits. Directories are always
+            yielded as-is
+        prefix: Name prefix of the private staging directory
+        temp_dir: Where to create the staging directory (default: next to src,
+            so a hardlink is possible; falls back to the system temp dir)
+
+    Yields:
+        Path to use as the job input
+    """
+    src = Path(src)
+    if mode == "direct" or src.is_dir():
+        # Subtitle folders (dual-subtitle mode) are always read in place
+        yield src
+        return
+    if mode != "link":
+        raise ValueError(f"Unknown intake mode '{mode}', expected one of {INTAKE_MODES}")
+
+    # The staged file keeps its name (show/episode names and output paths are
+    # derived from it), so each one gets a private directory
+    staged = None
+    for directory in ([Path(temp_dir)] if temp_dir else [src.parent, Path(tempfile.gettempdir())]):
+        stage_dir = None
+        try:
+            stage_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=directory))
+            staged = stage_dir / src.name
+            method = link_or_copy(src, staged)
+            logger.info(f"📎 Staged {src.name} via {method}: {staged}")
+            break
+        except OSError as e:
+            logger.debug(f"Cannot stage {src} in {directory}: {e}")
+            if stage_dir is not None:
+                shutil.rmtree(stage_dir, ignore_errors=True)
+            staged = None
+    if staged is None:
+        raise OSError(f"Failed to stage job input {src}")
+
+    try:
+        yield staged
+    finally:
+        try:
+            shutil.rmtree(staged.parent)
+        except OSError as e:
+            logger.warning(f"Failed to remove staged input {staged}: {e}")
@@ -4,8 +4,8 @@ Manages YouTube upload scheduling with daily limits and smart time allocation
 """
 import logging
 from datetime import datetime, date, timedelta, time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from langflix.db.models import YouTubeSchedule, YouTubeQuotaUsage
@@ -14,6 +14,13 @@ from langflix import settings
 
 logger = logging.getLogger(__name__)
 
+# Days searched for a free slot, starting from today or the preferred date
+SLOT_SEARCH_DAYS = 14
+# YouTube API quota units reserved per upload
+UPLOAD_QUOTA_UNITS = 1600
+# Statuses that occupy a slot (failed/cancelled schedules free it)
+ACTIVE_UPLOAD_STATUSES = ('scheduled', 'uploading', 'completed')
+
 @dataclass
 class ScheduleConfig:
     """Configuration for scheduling preferences"""
@@ -54,6 +61,160 @@ class DailyQuotaStatus:
     quota_remaining: int
     quota_percentage: float
 
+
+@dataclass
+class ScheduleRequest:
+    """One video to schedule in a batch (see YouTubeScheduleManager.schedule_videos)"""
+    video_path: str
+    video_type: str                         # 'final' or 'short'
+    publish_time: Optional[datetime] = None  # None: auto-assign next available slot
+    youtube_video_id: Optional[str] = None   # Set when the video is already uploaded
+
+
+def _parse_slot_times(config: ScheduleConfig) -> List[time]:
+    """Parse the configured slot times (time_slots take precedence over legacy preferred_times)"""
+    slot_times = []
+    source_times = config.time_slots if config.time_slots else config.preferred_times
+    for time_str in source_times:
+        try:
+            hour, minute = map(int, time_str.split(':'))
+            slot_times.append(time(hour, minute))
+        except ValueError:
+            logger.warning(f"Invalid time format: {time_str}")
+            continue
+    return slot_times
+
+
+class SlotPlanner:
+    """
+    In-memory occupancy calendar for a scheduling window.
+
+    Built from the window's schedules and quota records (loaded once), it
+    applies the same rules as a per-day lookup: daily type limits, API quota,
+    the daily hard cap and per-slot capacity. Booking a slot updates the
+    calendar, so a whole batch is assigned in one pass without re-querying.
+    """
+
+    def __init__(
+        self,
+        config: ScheduleConfig,
+        start_date: date,
+        scheduled_times: Iterable[datetime] = (),
+        quota_statuses: Optional[Dict[date, DailyQuotaStatus]] = None,
+        days: int = SLOT_SEARCH_DAYS
+    ):
+        """
+        Args:
+            config: Scheduling limits and slot times
+            start_date: First day searched for free slots
+            scheduled_times: Publish times already occupying slots
+            quota_statuses: Quota status per date (missing dates have no usage)
+            days: Number of days searched from start_date
+        """
+        self.config = config
+        self.start_date = start_date
+        self.days = days
+        self.slot_times = _parse_slot_times(config)
+        self._quota: Dict[date, DailyQuotaStatus] = dict(quota_statuses or {})
+        self._slot_counts: Dict[date, Dict[time, int]] = {}
+        self._daily_totals: Dict[date, int] = {}
+        for scheduled_time in scheduled_times:
+            self._occupy(scheduled_time, 1)
+
+    def _occupy(self, slot: datetime, delta: int):
+        day = slot.date()
+        counts = self._slot_counts.setdefault(day, {})
+        counts[slot.time()] = counts.get(slot.time(), 0) + delta
+        self._daily_totals[day] = self._daily_totals.get(day, 0) + delta
+
+    def quota_for(self, target_date: date) -> DailyQuotaStatus:
+        """Quota status for a date, including slots booked on this planner"""
+        status = self._quota.get(target_date)
+        if status is None:
+            status = DailyQuotaStatus(
+                date=target_date,
+                final_used=0,
+                final_remaining=self.config.daily_limits.get('final', 2),
+                short_used=0,
+                short_remaining=self.config.daily_limits.get('short', 5),
+                quota_used=0,
+                quota_remaining=self.config.quota_limit,
+                quota_percentage=0.0
+            )
+            self._quota[target_date] = status
+        return status
+
+    def _adjust_quota(self, target_date: date, video_type: str, count: int):
+        status = self.quota_for(target_date)
+        units = count * UPLOAD_QUOTA_UNITS
+        changes = {
+            'quota_used': status.quota_used + units,
+            'quota_remaining': max(0, status.quota_remaining - units),
+        }
+        changes[f'{video_type}_used'] = getattr(status, f'{video_type}_used') + count
+        changes[f'{video_type}_remaining'] = max(0, getattr(status, f'{video_type}_remaining') - count)
+        limit = status.quota_used + status.quota_remaining
+        changes['quota_percentage'] = (changes['quota_used'] / limit) * 100 if limit > 0 else 0
+        self._quota[target_date] = replace(status, **changes)
+
+    def has_quota(self, target_date: date, video_type: str) -> bool:
+        """Whether the date has room for another video of this type"""
+        status = self.quota_for(target_date)
+        remaining = status.final_remaining if video_type == 'final' else status.short_remaining
+        return remaining > 0 and status.quota_remaining >= UPLOAD_QUOTA_UNITS
+
+    def available_times(self, target_date: date) -> List[datetime]:
+        """Free slot times for a date (first free hourly slot if all slot times are full)"""
+        if self._daily_totals.get(target_date, 0) >= self.config.daily_max_total:
+            return []
+        counts = self._slot_counts.get(target_date, {})
+        available = [
+            datetime.combine(target_date, slot_time)
+            for slot_time in self.slot_times
+            if counts.get(slot_time, 0) < self.config.slot_capacity
+        ]
+        if not available:
+            # Try every hour from 9 AM to 9 PM
+            for hour in range(9, 22):
+                candidate_time = time(hour, 0)
+                if counts.get(candidate_time, 0) < self.config.slot_capacity:
+                    available.append(datetime.combine(target_date, candidate_time))
+                    break
+        return available
+
+    def next_slot(self, video_type: str) -> Optional[datetime]:
+        """Earliest free slot for video_type in the window, without booking it"""
+        for days_ahead in range(self.days):
+            check_date = self.start_date + timedelta(days=days_ahead)
+            if not self.has_quota(check_date, video_type):
+                continue
+            available = self.available_times(check_date)
+            if available:
+                return available[0]
+        return None
+
+    def book(self, video_type: str) -> Optional[datetime]:
+        """Book the earliest free slot for video_type; None if the window is full"""
+        slot = self.next_slot(video_type)
+        if slot is not None:
+            self.book_at(slot, video_type)
+        return slot
+
+    def book_at(self, slot: datetime, video_type: str):
+        """Book an explicit publish time (capacity is not enforced for explicit times)"""
+        self._occupy(slot, 1)
+        self._adjust_quota(slot.date(), video_type, 1)
+
+    def release(self, slot: datetime, video_type: str):
+        """Return a booked slot, e.g. after its upload failed"""
+        self._occupy(slot, -1)
+        self._adjust_quota(slot.date(), video_type, -1)
+
+    def plan(self, video_types: List[str]) -> List[Optional[datetime]]:
+        """Book a slot for each video type in order"""
+        return [self.book(video_type) for video_type in video_types]
+
+
 class YouTubeScheduleManager:
     """Manages YouTube upload scheduling with daily limits"""
     
@@ -81,47 +242,112 @@ class YouTubeScheduleManager:
         # Start from today or preferred date
         start_date = preferred_date or date.today()
         
-        # Check up to 14 days ahead to ensure distribution for larger batches
-        for days_ahead in range(14):
-            check_date = start_date + timedelta(days=days_ahead)
-            quota_status = self.check_daily_quota(check_date)
-            
-            # If daily hard cap reached, skip this day entirely
-            try:
-                daily_total = self._count_daily_scheduled(check_date)
-                if daily_total >= self.config.daily_max_total:
-                    continue
-            except Exception as e:
-                logger.warning(f"Failed counting daily schedules for {check_date}: {e}")
-            
-            # Check if we have quota for this video type
-            if video_type == 'final' and quota_status.final_remaining > 0:
-                available_times = self._get_available_times_for_date(check_date, video_type)
-                if available_times:
-                    return available_times[0]
-            elif video_type == 'short' and quota_status.short_remaining > 0:
-                available_times = self._get_available_times_for_date(check_date, video_type)
-                if available_times:
-                    return available_times[0]
+        # Check up to 14 days ahead against one in-memory calendar of the window
+        slot = self.load_slot_planner(start_date).next_slot(video_type)
+        if slot is not None:
+            return slot
         
         # If no slots found in 14 days, return a fallback time
-        logger.warning(f"No available slots found for {video_type} in next 14 days")
+        logger.warning(f"No available slots found for {video_type} in next {SLOT_SEARCH_DAYS} days")
         return datetime.combine(start_date + timedelta(days=7), time(8, 0))
     
+    def load_slot_planner(self, start_date: Optional[date] = None, days: int = SLOT_SEARCH_DAYS) -> SlotPlanner:
+        """
+        Load the scheduling window into an in-memory SlotPlanner.
+        
+        Uses one query for the window's schedules and one for its quota records,
+        instead of several queries per day and slot.
+        
+        Args:
+            start_date: First day of the window (default: today)
+            days: Number of days in the window
+        
+        Returns:
+            SlotPlanner for the window (empty calendar when the database is disabled
+            or unreachable)
+        """
+        start_date = start_date or date.today()
+        if not self.db_enabled:
+            return SlotPlanner(self.config, start_date, days=days)
+        
+        end_date = start_date + timedelta(days=days - 1)
+        try:
+            with db_manager.session() as db:
+                scheduled_times, quota_records = self._load_window(db, start_date, end_date)
+                quota_statuses = {
+                    record_date: self._quota_status_from_record(record_date, record)
+                    for record_date, record in quota_records.items()
+                }
+            return SlotPlanner(self.config, start_date, scheduled_times, quota_statuses, days=days)
+        except OperationalError as e:
+            # Database connection error - plan against an empty calendar (assume no usage)
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.warning(f"Database connection error loading schedule window (assuming no usage): {error_msg}")
+            return SlotPlanner(self.config, start_date, days=days)
+        except Exception as e:
+            logger.error(f"Database error loading schedule window from {start_date}: {e}")
+            raise ValueError(f"Unable to connect to database. Please ensure PostgreSQL is running. Error: {str(e)}")
+    
+    def _load_window(
+        self,
+        db: Session,
+        start_date: date,
+        end_date: date,
+        lock: bool = False
+    ) -> Tuple[List[datetime], Dict[date, YouTubeQuotaUsage]]:
+        """
+        Load active schedule times and quota records for a date range.
+        
+        Args:
+            db: Database session
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            lock: If True, lock the rows for update (within a transaction)
+        
+        Returns:
+            (scheduled publish times, quota records by date)
+        """
+        schedule_query = db.query(YouTubeSchedule.scheduled_publish_time).filter(
+            YouTubeSchedule.scheduled_publish_time >= datetime.combine(start_date, time.min),
+            YouTubeSchedule.scheduled_publish_time <= datetime.combine(end_date, time.max),
+            YouTubeSchedule.upload_status.in_(ACTIVE_UPLOAD_STATUSES)
+        )
+        quota_query = db.query(YouTubeQuotaUsage).filter(
+            YouTubeQuotaUsage.date >= start_date,
+            YouTubeQuotaUsage.date <= end_date
+        )
+        if lock:
+            quota_query = quota_query.with_for_update()
+            schedule_query = schedule_query.with_for_update(timeout=5.0)
+        
+        quota_records = {record.date: record for record in quota_query.all()}
+        scheduled_times = [row[0] for row in schedule_query.all() if row[0]]
+        return scheduled_times, quota_records
+    
+    def _quota_status_from_record(self, target_date: date, quota_record: YouTubeQuotaUsage) -> DailyQuotaStatus:
+        """Build DailyQuotaStatus from a quota record"""
+        final_remaining = max(0, self.config.daily_limits['final'] - quota_record.final_videos_uploaded)
+        short_remaining = max(0, self.config.daily_limits['short'] - quota_record.short_videos_uploaded)
+        quota_remaining = max(0, quota_record.quota_limit - quota_record.quota_used)
+        quota_percentage = (quota_record.quota_used / quota_record.quota_limit) * 100 if quota_record.quota_limit > 0 else 0
+        
+        return DailyQuotaStatus(
+            date=target_date,
+            final_used=quota_record.final_videos_uploaded,
+            final_remaining=final_remaining,
+            short_used=quota_record.short_videos_uploaded,
+            short_remaining=short_remaining,
+            quota_used=quota_record.quota_used,
+            quota_remaining=quota_remaining,
+            quota_percentage=quota_percentage
+        )
+    
     def _get_available_times_for_date(self, target_date: date, video_type: str) -> List[datetime]:
         """Get available time slots for a specific date"""
         available_times = []
         
         # Parse preferred times (legacy) and time_slots (new). time_slots take precedence.
-        preferred_times = []
-        source_times = self.config.time_slots if self.config.time_slots else self.config.preferred_times
-        for time_str in source_times:
-            try:
-                hour, minute = map(int, time_str.split(':'))
-                preferred_times.append(time(hour, minute))
-            except ValueError:
-                logger.warning(f"Invalid time format: {time_str}")
-                continue
+        preferred_times = _parse_slot_times(self.config)
         
         # Get existing scheduled times for this date
         try:
@@ -259,21 +485,7 @@ class YouTubeScheduleManager:
                     # Commit happens automatically via context manager
                 
                 # Calculate remaining quotas
-                final_remaining = max(0, self.config.daily_limits['final'] - quota_record.final_videos_uploaded)
-                short_remaining = max(0, self.config.daily_limits['short'] - quota_record.short_videos_uploaded)
-                quota_remaining = max(0, quota_record.quota_limit - quota_record.quota_used)
-                quota_percentage = (quota_record.quota_used / quota_record.quota_limit) * 100 if quota_record.quota_limit > 0 else 0
-                
-                return DailyQuotaStatus(
-                    date=target_date,
-                    final_used=quota_record.final_videos_uploaded,
-                    final_remaining=final_remaining,
-                    short_used=quota_record.short_videos_uploaded,
-                    short_remaining=short_remaining,
-                    quota_used=quota_record.quota_used,
-                    quota_remaining=quota_remaining,
-                    quota_percentage=quota_percentage
-                )
+                return self._quota_status_from_record(target_date, quota_record)
         except OperationalError as e:
             # Database connection error - return default status (assume no usage)
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
@@ -328,21 +540,7 @@ class YouTubeScheduleManager:
             db.add(quota_record)
         
         # Calculate remaining quotas
-        final_remaining = max(0, self.config.daily_limits['final'] - quota_record.final_videos_uploaded)
-        short_remaining = max(0, self.config.daily_limits['short'] - quota_record.short_videos_uploaded)
-        quota_remaining = max(0, quota_record.quota_limit - quota_record.quota_used)
-        quota_percentage = (quota_record.quota_used / quota_record.quota_limit) * 100 if quota_record.quota_limit > 0 else 0
-        
-        return DailyQuotaStatus(
-            date=target_date,
-            final_used=quota_record.final_videos_uploaded,
-            final_remaining=final_remaining,
-            short_used=quota_record.short_videos_uploaded,
-            short_remaining=short_remaining,
-            quota_used=quota_record.quota_used,
-            quota_remaining=quota_remaining,
-            quota_percentage=quota_percentage
-        )
+        return self._quota_status_from_record(target_date, quota_record)
     
     def _reserve_quota_for_date(self, db: Session, target_date: date, video_type: str):
         """
@@ -362,27 +560,44 @@ class YouTubeScheduleManager:
         ).with_for_update().first()
         
         if not quota_record:
-            quota_record = YouTubeQuotaUsage(
-                date=target_date,
-                quota_used=0,
-                quota_limit=self.config.quota_limit,
-                upload_count=0,
-                final_videos_uploaded=0,
-                short_videos_uploaded=0
-            )
-            db.add(quota_record)
+            quota_record = self._new_quota_record(db, target_date)
         
         # Reserve quota (increment counters)
-        quota_record.quota_used += 1600  # Reserve quota units
+        self._apply_quota_reservation(quota_record, video_type)
+        
+        # Note: Don't commit here - let the transaction commit
+        logger.debug(f"Reserved quota for {target_date}: {video_type} video (+{UPLOAD_QUOTA_UNITS} quota units)")
+    
+    def _new_quota_record(self, db: Session, target_date: date) -> YouTubeQuotaUsage:
+        """Add an empty quota record for target_date to the session"""
+        quota_record = YouTubeQuotaUsage(
+            date=target_date,
+            quota_used=0,
+            quota_limit=self.config.quota_limit,
+            upload_count=0,
+            final_videos_uploaded=0,
+            short_videos_uploaded=0
+        )
+        db.add(quota_record)
+        return quota_record
+    
+    def _load_quota_record(self, db: Session, target_date: date) -> YouTubeQuotaUsage:
+        """Get the quota record of a date outside the loaded window, adding it if missing"""
+        quota_record = db.query(YouTubeQuotaUsage).filter(
+            YouTubeQuotaUsage.date == target_date
+        ).with_for_update().first()
+        return quota_record or self._new_quota_record(db, target_date)
+    
+    @staticmethod
+    def _apply_quota_reservation(quota_record: YouTubeQuotaUsage, video_type: str):
+        """Increment a quota record's counters for one scheduled video"""
+        quota_record.quota_used += UPLOAD_QUOTA_UNITS  # Reserve quota units
         quota_record.upload_count += 1
         
         if video_type == 'final':
             quota_record.final_videos_uploaded += 1
         elif video_type == 'short':
             quota_record.short_videos_uploaded += 1
-        
-        # Note: Don't commit here - let the transaction commit
-        logger.debug(f"Reserved quota for {target_date}: {video_type} video (+1600 quota units)")
     
     def _get_schedules_for_date_locked(self, db: Session, target_date: date) -> List[datetime]:
         """
@@ -508,6 +723,130 @@ class YouTubeScheduleManager:
             logger.error(f"Failed to schedule video: {e}", exc_info=True)
             return False, f"Failed to schedule video: {str(e)}", None
     
+    def schedule_videos(
+        self,
+        requests: List[ScheduleRequest],
+        start_date: Optional[date] = None
+    ) -> List[Tuple[bool, str, Optional[datetime]]]:
+        """
+        Schedule a batch of videos in one pass and one transaction.
+        
+        The scheduling window is loaded and locked once, videos without a
+        publish_time are assigned slots from the in-memory calendar in order,
+        and all schedule records and quota reservations are committed together.
+        Videos already uploaded (youtube_video_id set) also have the upload
+        charged to today's quota, as update_quota_usage does, in the same
+        transaction.
+        
+        Args:
+            requests: Videos to schedule
+            start_date: First day searched for free slots (default: today)
+        
+        Returns:
+            (success, message, scheduled_time) for each request, in order
+        """
+        start_date = start_date or date.today()
+        explicit_dates = [r.publish_time.date() for r in requests if r.publish_time]
+        window_start = min([start_date] + explicit_dates)
+        window_end = max([start_date + timedelta(days=SLOT_SEARCH_DAYS - 1)] + explicit_dates)
+        
+        if not self.db_enabled:
+            planner = SlotPlanner(self.config, start_date)
+            results = self._plan_requests(planner, requests)
+            logger.info(f"Database disabled, skipping persistence for {len(requests)} scheduled videos")
+            return [
+                (True, f"Video scheduled for {slot} (stateless)", slot) if ok else (ok, msg, slot)
+                for ok, msg, slot in results
+            ]
+        
+        try:
+            with db_manager.session() as db:
+                # BEGIN TRANSACTION: lock the window's quota records and schedules
+                scheduled_times, quota_records = self._load_window(db, window_start, window_end, lock=True)
+                planner = SlotPlanner(
+                    self.config,
+                    start_date,
+                    scheduled_times,
+                    {d: self._quota_status_from_record(d, r) for d, r in quota_records.items()}
+                )
+                results = self._plan_requests(planner, requests)
+                
+                for schedule_request, (ok, _, scheduled_time) in zip(requests, results):
+                    if not ok:
+                        continue
+                    target_date = scheduled_time.date()
+                    quota_record = quota_records.get(target_date)
+                    if quota_record is None:
+                        quota_record = self._new_quota_record(db, target_date)
+                        quota_records[target_date] = quota_record
+                    self._apply_quota_reservation(quota_record, schedule_request.video_type)
+                    if schedule_request.youtube_video_id:
+                        today = date.today()
+                        upload_record = quota_records.get(today) or self._load_quota_record(db, today)
+                        quota_records[today] = upload_record
+                        self._apply_quota_reservation(upload_record, schedule_request.video_type)
+                    
+                    db.add(YouTubeSchedule(
+                        video_path=schedule_request.video_path,
+                        video_type=schedule_request.video_type,
+                        scheduled_publish_time=scheduled_time,
+                        upload_status='completed' if schedule_request.youtube_video_id else 'scheduled',
+                        youtube_video_id=schedule_request.youtube_video_id
+                    ))
+                
+                # COMMIT TRANSACTION (automatic on exit)
+                scheduled_count = sum(1 for ok, _, _ in results if ok)
+                logger.info(f"📅 Scheduled {scheduled_count}/{len(requests)} videos in one transaction")
+                return results
+                
+        except OperationalError as e:
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.warning(f"Database connection error scheduling batch (PostgreSQL not running): {error_msg.split('(')[0] if '(' in error_msg else error_msg}")
+            return [(False, "Database connection failed. Please ensure PostgreSQL is running.", None)] * len(requests)
+        except (ValueError, SQLAlchemyError) as e:
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.error(f"Database error scheduling batch: {error_msg}")
+            return [(False, f"Database error: {error_msg}", None)] * len(requests)
+        except Exception as e:
+            logger.error(f"Failed to schedule batch: {e}", exc_info=True)
+            return [(False, f"Failed to schedule video: {str(e)}", None)] * len(requests)
+    
+    def _plan_requests(
+        self,
+        planner: SlotPlanner,
+        requests: List[ScheduleRequest]
+    ) -> List[Tuple[bool, str, Optional[datetime]]]:
+        """Assign each request a slot on the planner, applying schedule_video's checks"""
+        results = []
+        for schedule_request in requests:
+            video_type = schedule_request.video_type
+            if video_type not in ['final', 'short']:
+                results.append((False, f"Invalid video_type: {video_type}", None))
+                continue
+            
+            publish_time = schedule_request.publish_time
+            if publish_time is None:
+                publish_time = planner.book(video_type)
+                if publish_time is None:
+                    results.append((False, f"No available slots for {video_type} videos in next {SLOT_SEARCH_DAYS} days", None))
+                    continue
+            else:
+                target_date = publish_time.date()
+                quota_status = planner.quota_for(target_date)
+                if video_type == 'final' and quota_status.final_remaining <= 0:
+                    results.append((False, f"No remaining quota for final videos on {target_date}. Used: {quota_status.final_used}/{self.config.daily_limits['final']}", None))
+                    continue
+                if video_type == 'short' and quota_status.short_remaining <= 0:
+                    results.append((False, f"No remaining quota for short videos on {target_date}. Used: {quota_status.short_used}/{self.config.daily_limits['short']}", None))
+                    continue
+                if quota_status.quota_remaining < UPLOAD_QUOTA_UNITS:
+                    results.append((False, f"Insufficient API quota. Remaining: {quota_status.quota_remaining}/{UPLOAD_QUOTA_UNITS} required", None))
+                    continue
+                planner.book_at(publish_time, video_type)
+            
+            results.append((True, f"Video scheduled for {publish_time}", publish_time))
+        return results
+    
     def get_schedule_calendar(self, start_date: date, days: int = 7) -> Dict[str, List[Dict]]:
         """Get scheduled uploads calendar view for a date range"""
         try:
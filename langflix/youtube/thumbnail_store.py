@@ -0,0 +1,325 @@
+"""
+Content-addressed thumbnail store for the video management web UI
+
+The grid page requests one thumbnail per video. Rendering each one with
+ffmpeg on every request costs a decoder process per tile per refresh, so
+thumbnails are kept on disk under a key derived from
+(resolved path, mtime, size, timestamp, size preset):
+
+    cache_dir/<preset>/<key[:2]>/<key>.jpg
+
+A re-rendered or replaced video gets a new key, so entries never need to be
+invalidated, and the key doubles as a strong HTTP ETag. Missing thumbnails
+are rendered on a bounded worker pool; concurrent requests for the same key
+share one render.
+
+Per-episode contact sheets (sprites) are composed from the cached tiles so
+a grid can load every thumbnail of an episode with one image request.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from PIL import Image
+
+from langflix.media.ffmpeg_utils import get_duration_seconds
+
+logger = logging.getLogger(__name__)
+
+# Output width per size preset (height follows the video's aspect ratio)
+THUMBNAIL_PRESETS: Dict[str, int] = {
+    'small': 320,
+    'medium': 640,
+    'large': 1280,
+}
+
+DEFAULT_PRESET = 'medium'
+DEFAULT_TIMESTAMP = 5.0
+
+# render(video_path, output_path, timestamp, width) -> success
+RenderFunc = Callable[[str, str, float, Optional[int]], bool]
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    """A thumbnail entry (the file exists only once it has been rendered)"""
+    key: str
+    path: Path
+    source_path: str
+    source_mtime: float
+
+
+@dataclass
+class Sprite:
+    """A contact sheet of several thumbnails and where each tile is placed"""
+    key: str
+    path: Path
+    tiles: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ThumbnailStore:
+    """Disk cache of video thumbnails rendered on a bounded worker pool"""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        render: RenderFunc,
+        max_workers: int = 4,
+        render_timeout: float = 60.0
+    ):
+        """
+        Initialize thumbnail store
+
+        Args:
+            cache_dir: Directory for rendered thumbnails and sprites
+            render: Function rendering one frame of a video to a JPEG
+            max_workers: Maximum number of concurrent renders
+            render_timeout: Seconds to wait for one render before giving up
+        """
+        self.cache_dir = Path(cache_dir)
+        self.render_timeout = render_timeout
+        self._render = render
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="thumbnail")
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'renders': 0,
+            'shared_renders': 0,
+            'failures': 0,
+            'sprite_hits': 0,
+            'sprites_composed': 0
+        }
+
+    def describe(self, video_path: str, timestamp: float = DEFAULT_TIMESTAMP,
+                 preset: str = DEFAULT_PRESET) -> Thumbnail:
+        """
+        Compute the thumbnail entry for a video without rendering it
+
+        Args:
+            video_path: Source video
+            timestamp: Frame position in seconds
+            preset: Size preset name (see THUMBNAIL_PRESETS)
+
+        Returns:
+            Thumbnail with its content key and cache path
+
+        Raises:
+            FileNotFoundError: If the video does not exist
+            ValueError: If the preset is unknown
+        """
+        if preset not in THUMBNAIL_PRESETS:
+            raise ValueError(f"Unknown thumbnail preset: {preset}")
+
+        resolved = Path(video_path).resolve()
+        stat = resolved.stat()
+        raw = json.dumps([str(resolved), stat.st_mtime, stat.st_size, round(float(timestamp), 3), preset])
+        key = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        return Thumbnail(
+            key=key,
+            path=self.cache_dir / preset / key[:2] / f"{key}.jpg",
+            source_path=str(resolved),
+            source_mtime=stat.st_mtime
+        )
+
+    def get_thumbnail(self, video_path: str, timestamp: float = DEFAULT_TIMESTAMP,
+                      preset: str = DEFAULT_PRESET) -> Optional[Thumbnail]:
+        """
+        Get the thumbnail of a video, rendering it on first use
+
+        Returns:
+            Thumbnail whose file exists, or None if rendering failed
+
+        Raises:
+            FileNotFoundError: If the video does not exist
+            ValueError: If the preset is unknown
+        """
+        thumbnail = self.describe(video_path, timestamp, preset)
+        return self._ensure([thumbnail], timestamp, preset).get(thumbnail.key)
+
+    def get_thumbnails(self, video_paths: Sequence[str], timestamp: float = DEFAULT_TIMESTAMP,
+                       preset: str = DEFAULT_PRESET) -> Dict[str, Thumbnail]:
+        """
+        Get thumbnails of many videos, rendering the missing ones in parallel
+
+        Missing videos and failed renders are left out of the result.
+
+        Returns:
+            Mapping of video path (as given) to its rendered thumbnail
+        """
+        described: Dict[str, Thumbnail] = {}
+        for video_path in video_paths:
+            try:
+                described[video_path] = self.describe(video_path, timestamp, preset)
+            except FileNotFoundError:
+                logger.warning(f"Skipping thumbnail for missing video: {video_path}")
+
+        ready = self._ensure(list(described.values()), timestamp, preset)
+        return {path: ready[thumb.key] for path, thumb in described.items() if thumb.key in ready}
+
+    def get_sprite(self, video_paths: Sequence[str], timestamp: float = DEFAULT_TIMESTAMP,
+                   preset: str = 'small', columns: int = 10) -> Optional[Sprite]:
+        """
+        Get a contact sheet of the videos' thumbnails, composing it on first use
+
+        Args:
+            video_paths: Videos in tile order (row by row)
+            timestamp: Frame position in seconds
+            preset: Size preset of each tile
+            columns: Tiles per row
+
+        Returns:
+            Sprite with per-tile offsets, or None if no thumbnail could be rendered
+        """
+        thumbnails = self.get_thumbnails(video_paths, timestamp, preset)
+        ordered = [(path, thumbnails[path]) for path in video_paths if path in thumbnails]
+        if not ordered:
+            return None
+
+        columns = max(1, columns)
+        raw = json.dumps([[thumb.key for _, thumb in ordered], columns])
+        key = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        sprite_path = self.cache_dir / 'sprites' / f"{key}.jpg"
+        index_path = sprite_path.with_suffix('.json')
+
+        if sprite_path.exists() and index_path.exists():
+            with self._lock:
+                self._stats['sprite_hits'] += 1
+            return Sprite(key=key, path=sprite_path, tiles=json.loads(index_path.read_text(encoding='utf-8')))
+
+        tiles = self._compose_sprite(ordered, columns, sprite_path)
+        self._write_atomic(index_path, json.dumps(tiles).encode('utf-8'))
+        with self._lock:
+            self._stats['sprites_composed'] += 1
+        logger.info(f"🖼️ Composed thumbnail sprite with {len(tiles)} tiles")
+        return Sprite(key=key, path=sprite_path, tiles=tiles)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._in_flight)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups * 100, 2) if lookups else 0
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the render pool (waits for running renders)"""
+        self._executor.shutdown(wait=True)
+
+    def _ensure(self, thumbnails: List[Thumbnail], timestamp: float, preset: str) -> Dict[str, Thumbnail]:
+        """Render the thumbnails that are not on disk yet and return the ones available"""
+        ready: Dict[str, Thumbnail] = {}
+        pending: Dict[str, Future] = {}
+
+        with self._lock:
+            for thumbnail in thumbnails:
+                if thumbnail.key in ready or thumbnail.key in pending:
+                    continue
+                if thumbnail.path.exists():
+                    self._stats['hits'] += 1
+                    ready[thumbnail.key] = thumbnail
+                    continue
+
+                self._stats['misses'] += 1
+                future = self._in_flight.get(thumbnail.key)
+                if future is not None:
+                    self._stats['shared_renders'] += 1
+                else:
+                    future = self._executor.submit(self._render_to_cache, thumbnail, timestamp, preset)
+                    self._in_flight[thumbnail.key] = future
+                    future.add_done_callback(lambda _, key=thumbnail.key: self._finish(key))
+                pending[thumbnail.key] = future
+
+        if pending:
+            wait(pending.values(), timeout=self.render_timeout)
+            by_key = {thumbnail.key: thumbnail for thumbnail in thumbnails}
+            for key, future in pending.items():
+                if future.done() and not future.exception() and future.result():
+                    ready[key] = by_key[key]
+                elif not future.done():
+                    logger.warning(f"Thumbnail render timed out: {by_key[key].source_path}")
+        return ready
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def _render_to_cache(self, thumbnail: Thumbnail, timestamp: float, preset: str) -> bool:
+        """Render one thumbnail next to its cache path and move it into place"""
+        # Input-side seeking past the end yields no frame: stay inside short clips
+        duration = get_duration_seconds(thumbnail.source_path)
+        if duration > 0:
+            timestamp = min(timestamp, duration / 2)
+
+        thumbnail.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=thumbnail.path.parent, suffix=".jpg")
+        os.close(fd)
+        try:
+            ok = self._render(thumbnail.source_path, tmp_name, timestamp, THUMBNAIL_PRESETS[preset])
+            if ok and os.path.getsize(tmp_name) > 0:
+                os.replace(tmp_name, thumbnail.path)
+                with self._lock:
+                    self._stats['renders'] += 1
+                return True
+        except Exception as e:
+            logger.error(f"Thumbnail render failed for {thumbnail.source_path}: {e}")
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+        with self._lock:
+            self._stats['failures'] += 1
+        return False
+
+    def _compose_sprite(self, ordered: List[tuple], columns: int, sprite_path: Path) -> List[Dict[str, Any]]:
+        """Paste the tiles into one JPEG grid and return their placement"""
+        images = []
+        for video_path, thumbnail in ordered:
+            with Image.open(thumbnail.path) as image:
+                images.append((video_path, image.convert('RGB')))
+
+        cell_width = max(image.width for _, image in images)
+        cell_height = max(image.height for _, image in images)
+        rows = (len(images) + columns - 1) // columns
+        sheet = Image.new('RGB', (cell_width * min(columns, len(images)), cell_height * rows))
+
+        tiles = []
+        for index, (video_path, image) in enumerate(images):
+            x = (index % columns) * cell_width
+            y = (index // columns) * cell_height
+            sheet.paste(image, (x, y))
+            tiles.append({'path': video_path, 'x': x, 'y': y, 'width': image.width, 'height': image.height})
+
+        sprite_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=sprite_path.parent, suffix=".jpg")
+        os.close(fd)
+        try:
+            sheet.save(tmp_name, format='JPEG', quality=85)
+            os.replace(tmp_name, sprite_path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        return tiles
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
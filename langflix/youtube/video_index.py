@@ -0,0 +1,380 @@
+"""
+Incremental index of generated video files for the video management UI
+
+VideoFileManager.scan_all_videos used to walk the whole output tree and read
+every file's metadata whenever its short-lived Redis cache expired or was
+invalidated, and every /api/videos*, /api/statistics and /api/upload-ready
+request went through it. This index keeps one row of file-derived metadata
+per video in a SQLite database and refreshes it incrementally:
+
+- a directory is only re-listed when its mtime changed (entries were added,
+  removed or renamed); files of unchanged directories are only stat'ed
+- a file is only re-read when its (mtime, size) or its .meta.json sidecar's
+  mtime changed; new and changed files are handed to the build callback as
+  one batch so their ffprobe calls run in parallel
+- rows of removed files and directories are dropped
+
+Endpoints then filter and paginate with SQL instead of rebuilding lists.
+Upload status lives in the database and is not stored here.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (mtime, size, sidecar mtime or 0) of a video file
+Fingerprint = Tuple[float, int, float]
+
+# build(paths) -> {path: metadata dict, or None if the file could not be read}
+BuildFunc = Callable[[List[str]], Dict[str, Optional[Dict[str, Any]]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    meta_mtime REAL NOT NULL,
+    video_type TEXT,
+    episode TEXT,
+    size_mb REAL,
+    duration_seconds REAL,
+    ready_for_upload INTEGER NOT NULL DEFAULT 0,
+    uploadable INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_videos_dir ON videos(dir);
+CREATE INDEX IF NOT EXISTS idx_videos_type ON videos(video_type);
+CREATE INDEX IF NOT EXISTS idx_videos_episode ON videos(episode);
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    subdirs TEXT NOT NULL
+);
+"""
+
+
+class VideoIndex:
+    """SQLite-backed index of video metadata, refreshed by directory and file mtimes"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        root: Union[str, Path],
+        build: BuildFunc,
+        extensions: Iterable[str] = ('.mp4', '.mkv', '.avi', '.mov', '.webm'),
+        min_refresh_interval: float = 2.0
+    ):
+        """
+        Initialize video index
+
+        Args:
+            db_path: SQLite database file (created on first refresh)
+            root: Directory tree to index
+            build: Reads metadata for a batch of new or changed video files.
+                Returned dicts must contain video_type, episode, size_mb,
+                duration_seconds, ready_for_upload and uploadable; None marks
+                an unreadable file (retried once it changes)
+            extensions: Video file suffixes (lowercase)
+            min_refresh_interval: Seconds during which refresh() reuses the
+                previous result unless forced
+        """
+        self.db_path = Path(db_path)
+        self.root = os.path.abspath(root)
+        self.build = build
+        self.extensions = {e.lower() for e in extensions}
+        self.min_refresh_interval = min_refresh_interval
+
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._last_refresh = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _under_root(column: str) -> str:
+        # Range instead of LIKE so '_' and '%' in paths are not wildcards
+        return f"{column} = ? OR ({column} >= ? AND {column} < ?)"
+
+    def _root_params(self) -> Tuple[str, str, str]:
+        # One database may hold several roots; chr(ord(os.sep) + 1) ends the subtree range
+        return self.root, self.root + os.sep, self.root + chr(ord(os.sep) + 1)
+
+    def _fingerprint(self, path: str, st: os.stat_result) -> Fingerprint:
+        try:
+            meta_mtime = os.stat(os.path.splitext(path)[0] + '.meta.json').st_mtime
+        except OSError:
+            meta_mtime = 0.0
+        return st.st_mtime, st.st_size, meta_mtime
+
+    def refresh(self, force: bool = False, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index up to date with the filesystem
+
+        Args:
+            force: Refresh even within min_refresh_interval of the last refresh
+            full: Re-list every directory, not only those whose mtime changed
+
+        Returns:
+            Counts of listed directories, (re)indexed files and removed files
+        """
+        stats = {'dirs_listed': 0, 'indexed': 0, 'removed': 0}
+        with self._lock:
+            now = time.monotonic()
+            if not (force or full) and self._last_refresh and now - self._last_refresh < self.min_refresh_interval:
+                return stats
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                known_dirs: Dict[str, Tuple[float, List[str]]] = {
+                    path: (mtime, json.loads(subdirs))
+                    for path, mtime, subdirs in conn.execute(
+                        f"SELECT path, mtime, subdirs FROM directories WHERE {self._under_root('path')}",
+                        self._root_params()
+                    )
+                }
+                known_files: Dict[str, Dict[str, Fingerprint]] = {}
+                for path, directory, mtime, size, meta_mtime in conn.execute(
+                    f"SELECT path, dir, mtime, size, meta_mtime FROM videos WHERE {self._under_root('dir')}",
+                    self._root_params()
+                ):
+                    known_files.setdefault(directory, {})[path] = (mtime, size, meta_mtime)
+
+                dir_rows: List[Tuple[str, float, str]] = []
+                changed: Dict[str, Tuple[str, Fingerprint]] = {}
+                removed: List[str] = []
+                seen_dirs: Set[str] = set()
+
+                stack = [self.root]
+                while stack:
+                    directory = stack.pop()
+                    try:
+                        dir_mtime = os.stat(directory).st_mtime
+                    except OSError:
+                        continue
+                    seen_dirs.add(directory)
+                    files = known_files.get(directory, {})
+                    known = known_dirs.get(directory)
+
+                    if known and known[0] == dir_mtime and not full:
+                        # Same entries as last time: only check the known files for in-place rewrites
+                        subdirs = known[1]
+                        for path, fingerprint in files.items():
+                            try:
+                                current = self._fingerprint(path, os.stat(path))
+                            except OSError:
+                                removed.append(path)
+                                continue
+                            if current != fingerprint:
+                                changed[path] = (directory, current)
+                    else:
+                        stats['dirs_listed'] += 1
+                        subdirs = []
+                        present: Set[str] = set()
+                        try:
+                            with os.scandir(directory) as entries:
+                                for entry in entries:
+                                    if entry.is_dir(follow_symlinks=True):
+                                        subdirs.append(entry.path)
+                                    elif os.path.splitext(entry.name)[1].lower() in self.extensions:
+                                        try:
+                                            current = self._fingerprint(entry.path, entry.stat())
+                                        except OSError:
+                                            continue
+                                        present.add(entry.path)
+                                        if files.get(entry.path) != current:
+                                            changed[entry.path] = (directory, current)
+                        except OSError as e:
+                            logger.warning(f"Cannot list {directory}: {e}")
+                            continue
+                        removed.extend(path for path in files if path not in present)
+                        dir_rows.append((directory, dir_mtime, json.dumps(subdirs)))
+                    stack.extend(subdirs)
+
+                gone_dirs = [d for d in known_dirs if d not in seen_dirs]
+                for directory in gone_dirs:
+                    removed.extend(known_files.get(directory, {}))
+
+                built = self.build(list(changed)) if changed else {}
+                indexed_at = time.time()
+                rows = []
+                for path, (directory, (mtime, size, meta_mtime)) in changed.items():
+                    metadata = built.get(path)
+                    rows.append((
+                        path, directory, mtime, size, meta_mtime,
+                        metadata.get('video_type') if metadata else None,
+                        metadata.get('episode') if metadata else None,
+                        metadata.get('size_mb') if metadata else None,
+                        metadata.get('duration_seconds') if metadata else None,
+                        int(bool(metadata and metadata.get('ready_for_upload'))),
+                        int(bool(metadata and metadata.get('uploadable'))),
+                        json.dumps(metadata, default=str) if metadata else None,
+                        indexed_at
+                    ))
+
+                with conn:
+                    if removed:
+                        conn.executemany("DELETE FROM videos WHERE path = ?", [(p,) for p in removed])
+                    if gone_dirs:
+                        conn.executemany("DELETE FROM directories WHERE path = ?", [(d,) for d in gone_dirs])
+                    if dir_rows:
+                        conn.executemany(
+                            """
+                            INSERT INTO directories (path, mtime, subdirs) VALUES (?, ?, ?)
+                            ON CONFLICT(path) DO UPDATE SET
+                                mtime = excluded.mtime,
+                                subdirs = excluded.subdirs
+                            """,
+                            dir_rows
+                        )
+                    if rows:
+                        conn.executemany(
+                            """
+                            INSERT INTO videos (path, dir, mtime, size, meta_mtime, video_type, episode,
+                                                size_mb, duration_seconds, ready_for_upload, uploadable,
+                                                metadata, indexed_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT(path) DO UPDATE SET
+                                dir = excluded.dir,
+                                mtime = excluded.mtime,
+                                size = excluded.size,
+                                meta_mtime = excluded.meta_mtime,
+                                video_type = excluded.video_type,
+                                episode = excluded.episode,
+                                size_mb = excluded.size_mb,
+                                duration_seconds = excluded.duration_seconds,
+                                ready_for_upload = excluded.ready_for_upload,
+                                uploadable = excluded.uploadable,
+                                metadata = excluded.metadata,
+                                indexed_at = excluded.indexed_at
+                            """,
+                            rows
+                        )
+            finally:
+                conn.close()
+
+            self._last_refresh = time.monotonic()
+
+        stats['indexed'] = len(changed)
+        stats['removed'] = len(removed)
+        if changed or removed:
+            logger.info(
+                f"Video index refreshed: {stats['dirs_listed']} directories listed, "
+                f"{stats['indexed']} files indexed, {stats['removed']} removed"
+            )
+        return stats
+
+    def _where(
+        self,
+        video_type: Optional[str] = None,
+        episode: Optional[str] = None,
+        uploadable: Optional[bool] = None,
+        ready_for_upload: Optional[bool] = None
+    ) -> Tuple[str, List[Any]]:
+        clauses = ["metadata IS NOT NULL", f"({self._under_root('dir')})"]
+        params: List[Any] = list(self._root_params())
+        if video_type is not None:
+            clauses.append("video_type = ?")
+            params.append(video_type)
+        if episode is not None:
+            clauses.append("episode = ?")
+            params.append(episode)
+        if uploadable is not None:
+            clauses.append("uploadable = ?")
+            params.append(int(uploadable))
+        if ready_for_upload is not None:
+            clauses.append("ready_for_upload = ?")
+            params.append(int(ready_for_upload))
+        return " AND ".join(clauses), params
+
+    def query(
+        self,
+        video_type: Optional[str] = None,
+        episode: Optional[str] = None,
+        uploadable: Optional[bool] = None,
+        ready_for_upload: Optional[bool] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read indexed metadata, ordered by path
+
+        Returns:
+            (page of metadata dicts, total number of matching videos)
+        """
+        if not self.db_path.exists():
+            return [], 0
+
+        where, params = self._where(video_type, episode, uploadable, ready_for_upload)
+        with self._lock:
+            conn = self._connect()
+            try:
+                total = conn.execute(f"SELECT COUNT(*) FROM videos WHERE {where}", params).fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT metadata FROM videos WHERE {where} ORDER BY path LIMIT ? OFFSET ?",
+                    params + [-1 if limit is None else max(0, limit), max(0, offset)]
+                ).fetchall()
+            finally:
+                conn.close()
+        return [json.loads(row[0]) for row in rows], total
+
+    def statistics(self) -> Dict[str, Any]:
+        """Aggregate size, duration, type and episode counts over the indexed videos"""
+        if not self.db_path.exists():
+            return {'total_videos': 0, 'total_size_mb': 0, 'total_duration_seconds': 0,
+                    'type_distribution': {}, 'episodes': []}
+
+        where, params = self._where()
+        with self._lock:
+            conn = self._connect()
+            try:
+                total, size_mb, duration = conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(size_mb), 0), COALESCE(SUM(duration_seconds), 0) "
+                    f"FROM videos WHERE {where}",
+                    params
+                ).fetchone()
+                type_counts = dict(conn.execute(
+                    f"SELECT video_type, COUNT(*) FROM videos WHERE {where} GROUP BY video_type", params
+                ).fetchall())
+                episodes = [row[0] for row in conn.execute(
+                    f"SELECT DISTINCT episode FROM videos WHERE {where}", params
+                )]
+            finally:
+                conn.close()
+        return {
+            'total_videos': total,
+            'total_size_mb': size_mb,
+            'total_duration_seconds': duration,
+            'type_distribution': type_counts,
+            'episodes': episodes
+        }
+
+    def clear(self) -> None:
+        """Drop all indexed rows under the root (the next refresh re-reads every file)"""
+        if not self.db_path.exists():
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(f"DELETE FROM videos WHERE {self._under_root('dir')}", self._root_params())
+                    conn.execute(f"DELETE FROM directories WHERE {self._under_root('path')}", self._root_params())
+            finally:
+                conn.close()
+            self._last_refresh = 0.0
+        logger.info(f"Video index cleared for {self.root}")
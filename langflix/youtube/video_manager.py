@@ -5,13 +5,18 @@ Scans and manages generated video files for YouTube upload
 import os
 import re
 import json
+import hashlib
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 import subprocess
 
+from langflix import settings
+from langflix.media.ffmpeg_utils import probe_many, run_ffprobe
+from langflix.youtube.video_index import VideoIndex
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -46,38 +51,39 @@ class VideoFileManager:
         self.output_dir = Path(output_dir)
         self.video_extensions = {'.mp4', '.mkv', '.avi', '.mov', '.webm'}
         self.use_cache = use_cache
+        self._index: Optional[VideoIndex] = None
         
     def scan_all_videos(self, force_refresh: bool = False) -> List[VideoMetadata]:
         """
         Scan all generated video files and extract metadata.
         
+        Served from the incremental video index (only changed directories and
+        files are re-read) unless use_cache is False or the index is disabled.
+        
         Args:
-            force_refresh: If True, bypass cache and force filesystem scan
+            force_refresh: If True, re-list every directory instead of only changed ones
             
         Returns:
             List of VideoMetadata objects
         """
-        # Try to get from cache first (unless force_refresh is True)
-        if self.use_cache and not force_refresh:
+        if self._index_enabled():
             try:
-                from langflix.core.redis_client import get_redis_job_manager
-                redis_manager = get_redis_job_manager()
-                cached_videos = redis_manager.get_video_cache()
-                
-                if cached_videos:
-                    logger.info(f"✅ Loaded {len(cached_videos)} videos from cache")
-                    # Convert cached dictionaries back to VideoMetadata objects
-                    return [self._dict_to_metadata(v) for v in cached_videos]
+                self.refresh_index(full=force_refresh)
+                videos, _ = self.query_videos(refresh=False)
+                return videos
             except Exception as e:
-                logger.warning(f"Cache retrieval failed, falling back to filesystem scan: {e}")
+                logger.warning(f"Video index unavailable, falling back to filesystem scan: {e}")
         
-        # Cache miss or force refresh - scan filesystem
         logger.info(f"Scanning for video files in: {self.output_dir}")
         
+        video_files = self._find_video_files()
+        # Probe everything up front: indexed files need no ffprobe, the rest run in parallel
+        probes = probe_many(str(f) for f in video_files)
+        
         videos = []
-        for video_file in self._find_video_files():
+        for video_file in video_files:
             try:
-                metadata = self._extract_video_metadata(video_file)
+                metadata = self._extract_video_metadata(video_file, probes.get(str(video_file)))
                 if metadata:
                     videos.append(metadata)
             except Exception as e:
@@ -85,19 +91,149 @@ class VideoFileManager:
                 continue
                 
         logger.info(f"Found {len(videos)} video files")
+        return videos
+    
+    def _index_enabled(self) -> bool:
+        return self.use_cache and settings.is_video_index_enabled()
+    
+    @property
+    def index(self) -> VideoIndex:
+        """Incremental metadata index of output_dir (one SQLite file per output directory)"""
+        if self._index is None:
+            root = os.path.abspath(self.output_dir)
+            name = hashlib.sha1(root.encode('utf-8')).hexdigest()[:16]
+            self._index = VideoIndex(
+                Path(settings.get_video_index_dir()) / f"{name}.sqlite3",
+                root,
+                build=self._build_index_entries,
+                extensions=self.video_extensions,
+                min_refresh_interval=settings.get_video_index_min_refresh_interval()
+            )
+        return self._index
+    
+    def refresh_index(self, force: bool = False, full: bool = False) -> Dict[str, int]:
+        """Re-read new and changed video files into the index (see VideoIndex.refresh)"""
+        if not self._index_enabled():
+            return {}
+        return self.index.refresh(force=force, full=full)
+    
+    def query_videos(
+        self,
+        video_type: Optional[str] = None,
+        episode: Optional[str] = None,
+        uploadable: Optional[bool] = None,
+        upload_ready: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        refresh: bool = True
+    ) -> Tuple[List[VideoMetadata], int]:
+        """
+        Filter and paginate indexed videos without rescanning the output tree.
         
-        # Cache the results
-        if self.use_cache and videos:
-            try:
-                from langflix.core.redis_client import get_redis_job_manager
-                redis_manager = get_redis_job_manager()
-                video_dicts = [self._metadata_to_dict(v) for v in videos]
-                redis_manager.set_video_cache(video_dicts, ttl=300)  # 5 minutes TTL
-            except Exception as e:
-                logger.warning(f"Failed to cache video results: {e}")
+        Args:
+            video_type: Only videos of this type
+            episode: Only videos of this episode
+            uploadable: Only videos that are (True) or are not (False) uploadable
+            upload_ready: Only videos ready for upload and not uploaded yet
+            offset: Number of matching videos to skip
+            limit: Maximum number of videos to return (None = all)
+            refresh: Pick up filesystem changes first (throttled by the index)
+            
+        Returns:
+            (page of videos with current upload status, total matching videos)
+        """
+        end = None if limit is None else offset + limit
+        if not self._index_enabled():
+            videos = [
+                v for v in self.scan_all_videos()
+                if (video_type is None or v.video_type == video_type)
+                and (episode is None or v.episode == episode)
+                and (uploadable is None or self._is_uploadable(v) == uploadable)
+                and (not upload_ready or (v.ready_for_upload and not v.uploaded_to_youtube))
+            ]
+            return videos[offset:end], len(videos)
+        
+        if refresh:
+            self.refresh_index()
+        if upload_ready:
+            # Upload status lives in the database, so filter uploaded videos before paginating
+            entries, _ = self.index.query(video_type, episode, uploadable, ready_for_upload=True)
+            videos = [v for v in self._with_upload_status(entries) if not v.uploaded_to_youtube]
+            return videos[offset:end], len(videos)
+        
+        entries, total = self.index.query(video_type, episode, uploadable, offset=offset, limit=limit)
+        return self._with_upload_status(entries), total
+    
+    def get_index_statistics(self) -> Dict[str, Any]:
+        """Same as get_statistics(scan_all_videos()), aggregated by the index"""
+        if not self._index_enabled():
+            return self.get_statistics(self.scan_all_videos())
+        
+        self.refresh_index()
+        stats = self.index.statistics()
+        if not stats['total_videos']:
+            return {}
+        _, upload_ready = self.query_videos(upload_ready=True, refresh=False)
+        return {
+            "total_videos": stats['total_videos'],
+            "total_size_mb": round(stats['total_size_mb'], 2),
+            "total_duration_minutes": round(stats['total_duration_seconds'] / 60, 2),
+            "upload_ready_count": upload_ready,
+            "type_distribution": stats['type_distribution'],
+            "episodes": stats['episodes']
+        }
+    
+    def _build_index_entries(self, paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Read metadata of new or changed files for the index, probing them in parallel"""
+        probes = probe_many(paths)
+        entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        for path in paths:
+            metadata = self._extract_video_metadata(Path(path), probes.get(path), check_upload_status=False)
+            if metadata is None:
+                entries[path] = None
+                continue
+            entry = self._metadata_to_dict(metadata)
+            entry['uploadable'] = self._is_uploadable(metadata)
+            entries[path] = entry
+        return entries
+    
+    def _with_upload_status(self, entries: List[Dict[str, Any]]) -> List[VideoMetadata]:
+        """Convert index entries to VideoMetadata with upload status from one database query"""
+        videos = []
+        for entry in entries:
+            entry = dict(entry)
+            entry.pop('uploadable', None)
+            videos.append(self._dict_to_metadata(entry))
         
+        uploaded = self._get_uploaded_video_ids([v.path for v in videos])
+        for video in videos:
+            video_id = uploaded.get(video.path)
+            video.uploaded_to_youtube = bool(video_id)
+            video.youtube_video_id = video_id
         return videos
     
+    def _get_uploaded_video_ids(self, paths: List[str]) -> Dict[str, str]:
+        """Map video paths to their YouTube video IDs (uploaded videos only)"""
+        if not paths:
+            return {}
+        uploaded: Dict[str, str] = {}
+        try:
+            from langflix.db.session import db_manager
+            from langflix.db.models import YouTubeSchedule
+            
+            with db_manager.session() as db:
+                # SQLite's default limit on host parameters per statement is 999
+                for start in range(0, len(paths), 500):
+                    rows = db.query(YouTubeSchedule.video_path, YouTubeSchedule.youtube_video_id).filter(
+                        YouTubeSchedule.video_path.in_(paths[start:start + 500]),
+                        YouTubeSchedule.youtube_video_id.isnot(None)
+                    ).all()
+                    uploaded.update({path: video_id for path, video_id in rows if video_id})
+        except Exception as e:
+            # Database might not be available - log but don't fail
+            logger.debug(f"Could not check upload status from database: {e}")
+        return uploaded
+    
     def _find_video_files(self) -> List[Path]:
         """Find all video files in the output directory"""
         video_files = []
@@ -109,22 +245,24 @@ class VideoFileManager:
                     
         return video_files
     
-    def _extract_video_metadata(self, video_path: Path) -> Optional[VideoMetadata]:
-        """Extract metadata from a video file using ffprobe"""
+    def _extract_video_metadata(self, video_path: Path, probe: Optional[Dict[str, Any]] = None,
+                                check_upload_status: bool = True) -> Optional[VideoMetadata]:
+        """
+        Extract metadata from a video file using ffprobe
+        
+        Args:
+            video_path: Video file
+            probe: ffprobe JSON already read for this file (e.g. by probe_many)
+            check_upload_status: Look up the upload status in the database
+        """
         try:
             # Get file info
             stat = video_path.stat()
             size_mb = stat.st_size / (1024 * 1024)
             created_at = datetime.fromtimestamp(stat.st_ctime)
             
-            # Get video info using ffprobe
-            ffprobe_cmd = [
-                'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                '-show_format', '-show_streams', str(video_path)
-            ]
-            
-            result = subprocess.run(ffprobe_cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            # Get video info using ffprobe (served from the probe index when unchanged)
+            data = probe if probe is not None else run_ffprobe(str(video_path))
             
             # Extract video stream info
             video_stream = next((s for s in data['streams'] if s['codec_type'] == 'video'), None)
@@ -204,24 +342,10 @@ class VideoFileManager:
                     logger.warning(f"Failed to load metadata for {video_path.name}: {e}")
             
             # Check database for upload status
-            uploaded_to_youtube = False
             youtube_video_id = None
-            try:
-                from langflix.db.session import db_manager
-                from langflix.db.models import YouTubeSchedule
-                
-                with db_manager.session() as db:
-                    schedule = db.query(YouTubeSchedule).filter_by(
-                        video_path=str(video_path)
-                    ).first()
-                    
-                    if schedule and schedule.youtube_video_id:
-                        uploaded_to_youtube = True
-                        youtube_video_id = schedule.youtube_video_id
-                        logger.debug(f"Found upload status for {video_path}: uploaded={uploaded_to_youtube}, video_id={youtube_video_id}")
-            except Exception as e:
-                # Database might not be available - log but don't fail
-                logger.debug(f"Could not check upload status from database: {e}")
+            if check_upload_status:
+                youtube_video_id = self._get_uploaded_video_ids([str(video_path)]).get(str(video_path))
+            uploaded_to_youtube = bool(youtube_video_id)
             
             return VideoMetadata(
                 path=str(video_path),
@@ -453,43 +577,46 @@ class VideoFileManager:
         - context_slide_combined videos (vertical format, ready for upload)
         - Legacy final/short videos (excluding intermediate files)
         """
-        uploadable_videos = []
-        for v in videos:
-            # Only include videos with new naming convention or legacy final videos
-            filename = Path(v.path).stem.lower()
-            parent_dir = Path(v.path).parent.name.lower()
-            
-            # Include long-form and short-form videos (new naming convention)
-            if (filename.startswith("long-form_") or filename.startswith("short-form_")):
-                # Include regardless of uploaded status - we want to show all uploadable videos
-                if v.ready_for_upload:
-                    uploadable_videos.append(v)
-            # Include context_slide_combined videos (vertical format, ready for YouTube Shorts)
-            elif "context_slide_combined" in parent_dir and v.video_type in ["context", "short"]:
-                # Context+slide combined videos are vertical format and ready for upload
-                # Note: These files may have video_type="short" (from filename parsing) but are in context_slide_combined dir
-                if v.ready_for_upload:
-                    uploadable_videos.append(v)
-            # Include legacy final/short videos but exclude intermediate files
-            elif (v.video_type in ['final', 'short', 'long-form', 'short-form'] and 
-                  not any(x in filename for x in ['educational', 'temp_']) and
-                  'context_slide_combined' not in parent_dir):  # Individual context files excluded, only combined
-                # Include regardless of uploaded status - we want to show all uploadable videos
-                if v.ready_for_upload:
-                    uploadable_videos.append(v)
+        uploadable_videos = [v for v in videos if self._is_uploadable(v)]
         
         logger.debug(f"Found {len(uploadable_videos)} uploadable videos (including {sum(1 for v in uploadable_videos if v.uploaded_to_youtube)} already uploaded)")
         logger.debug(f"Uploadable video types: {set(v.video_type for v in uploadable_videos)}")
         return uploadable_videos
     
-    def generate_thumbnail(self, video_path: str, output_path: str, timestamp: float = 5.0) -> bool:
-        """Generate thumbnail from video using ffmpeg"""
+    def _is_uploadable(self, v: VideoMetadata) -> bool:
+        """Check one video against the get_uploadable_videos rules (upload status is not considered)"""
+        # Only include videos with new naming convention or legacy final videos
+        filename = Path(v.path).stem.lower()
+        parent_dir = Path(v.path).parent.name.lower()
+        
+        # Include long-form and short-form videos (new naming convention)
+        if (filename.startswith("long-form_") or filename.startswith("short-form_")):
+            return v.ready_for_upload
+        # Include context_slide_combined videos (vertical format, ready for YouTube Shorts)
+        if "context_slide_combined" in parent_dir and v.video_type in ["context", "short"]:
+            # Note: These files may have video_type="short" (from filename parsing) but are in context_slide_combined dir
+            return v.ready_for_upload
+        # Include legacy final/short videos but exclude intermediate files
+        if (v.video_type in ['final', 'short', 'long-form', 'short-form'] and 
+              not any(x in filename for x in ['educational', 'temp_']) and
+              'context_slide_combined' not in parent_dir):  # Individual context files excluded, only combined
+            return v.ready_for_upload
+        return False
+    
+    def generate_thumbnail(self, video_path: str, output_path: str, timestamp: float = 5.0,
+                           width: Optional[int] = None) -> bool:
+        """Generate thumbnail from video using ffmpeg (width=None keeps the source size)"""
         try:
+            # -ss before -i seeks on the input instead of decoding up to the timestamp
             ffmpeg_cmd = [
-                'ffmpeg', '-i', video_path,
-                '-ss', str(timestamp),
+                'ffmpeg', '-ss', str(timestamp),
+                '-i', video_path,
                 '-vframes', '1',
                 '-q:v', '2',
+            ]
+            if width:
+                ffmpeg_cmd += ['-vf', f'scale={width}:-2']
+            ffmpeg_cmd += [
                 '-y',  # Overwrite output
                 output_path
             ]
@@ -6,14 +6,15 @@ import os
 import json
 from pathlib import Path
 from urllib.parse import unquote
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request, send_file, render_template_string
+from flask import Flask, Response, render_template, jsonify, request, send_file, render_template_string
 from langflix.youtube.video_manager import VideoFileManager, VideoMetadata
 from langflix.youtube.uploader import YouTubeUploader, YouTubeUploadResult, YouTubeUploadManager
 from langflix.youtube.metadata_generator import YouTubeMetadataGenerator
-from langflix.youtube.schedule_manager import YouTubeScheduleManager, ScheduleConfig
+from langflix.youtube.schedule_manager import YouTubeScheduleManager, ScheduleConfig, ScheduleRequest
 from langflix.youtube.last_schedule import YouTubeLastScheduleService
+from langflix.youtube.thumbnail_store import DEFAULT_TIMESTAMP, ThumbnailStore
 from langflix.db.models import YouTubeAccount, YouTubeQuotaUsage
 from langflix.db.session import db_manager
 from langflix import settings
@@ -90,6 +91,11 @@ class VideoManagementUI:
         # Use absolute path for video manager
         abs_output_dir = os.path.abspath(output_dir)
         self.video_manager = VideoFileManager(abs_output_dir)
+        self.thumbnail_store = ThumbnailStore(
+            settings.get_thumbnail_cache_dir(),
+            render=self._render_thumbnail,
+            max_workers=settings.get_thumbnail_workers()
+        )
         
         # Initialize OAuth state storage (use Redis if available)
         oauth_state_storage = None
@@ -270,45 +276,40 @@ class VideoManagementUI:
         
         @self.app.route('/api/videos')
         def get_videos():
-            """Get all videos as JSON (filtered to final and short only)"""
+            """Get uploadable videos as JSON (?offset=&limit=, total in X-Total-Count)"""
             try:
-                all_videos = self.video_manager.scan_all_videos()
-                # Filter to only final and short videos for upload
-                uploadable_videos = self.video_manager.get_uploadable_videos(all_videos)
-                return jsonify([self._video_to_dict(v) for v in uploadable_videos])
+                videos, total = self.video_manager.query_videos(uploadable=True, **self._page_args())
+                return self._video_list_response(videos, total)
             except Exception as e:
                 logger.error(f"Error getting videos: {e}")
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/videos/<video_type>')
         def get_videos_by_type(video_type):
-            """Get videos by type"""
+            """Get videos by type (?offset=&limit=)"""
             try:
-                all_videos = self.video_manager.scan_all_videos()
-                videos = self.video_manager.get_videos_by_type(all_videos, video_type)
-                return jsonify([self._video_to_dict(v) for v in videos])
+                videos, total = self.video_manager.query_videos(video_type=video_type, **self._page_args())
+                return self._video_list_response(videos, total)
             except Exception as e:
                 logger.error(f"Error getting videos by type: {e}")
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/videos/episode/<episode>')
         def get_videos_by_episode(episode):
-            """Get videos by episode"""
+            """Get videos by episode (?offset=&limit=)"""
             try:
-                all_videos = self.video_manager.scan_all_videos()
-                videos = self.video_manager.get_videos_by_episode(all_videos, episode)
-                return jsonify([self._video_to_dict(v) for v in videos])
+                videos, total = self.video_manager.query_videos(episode=episode, **self._page_args())
+                return self._video_list_response(videos, total)
             except Exception as e:
                 logger.error(f"Error getting videos by episode: {e}")
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/upload-ready')
         def get_upload_ready_videos():
-            """Get videos ready for upload"""
+            """Get videos ready for upload (?offset=&limit=)"""
             try:
-                all_videos = self.video_manager.scan_all_videos()
-                videos = self.video_manager.get_upload_ready_videos(all_videos)
-                return jsonify([self._video_to_dict(v) for v in videos])
+                videos, total = self.video_manager.query_videos(upload_ready=True, **self._page_args())
+                return self._video_list_response(videos, total)
             except Exception as e:
                 logger.error(f"Error getting upload ready videos: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -317,8 +318,7 @@ class VideoManagementUI:
         def get_statistics():
             """Get video statistics"""
             try:
-                all_videos = self.video_manager.scan_all_videos()
-                stats = self.video_manager.get_statistics(all_videos)
+                stats = self.video_manager.get_index_statistics()
                 return jsonify(stats)
             except Exception as e:
                 logger.error(f"Error getting statistics: {e}")
@@ -326,53 +326,81 @@ class VideoManagementUI:
         
         @self.app.route('/api/thumbnail/<path:video_path>')
         def generate_thumbnail(video_path):
-            """Generate and serve thumbnail"""
+            """Serve a cached thumbnail (?t=seconds&size=small|medium|large)"""
             try:
-                # Decode URL-encoded path
-                video_path = unquote(video_path)
-                
-                # Ensure the path starts with / (Flask strips it sometimes)
-                if not video_path.startswith('/'):
-                    video_path = '/' + video_path
-                
-                video_file = Path(video_path)
-                
+                video_file = self._resolve_video_path(video_path)
                 if not video_file.exists():
                     return jsonify({"error": "Video file not found"}), 404
                 
-                # Generate thumbnail to temporary file (not saved to disk)
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-                    thumbnail_path = tmp_file.name
-                
+                timestamp = request.args.get('t', DEFAULT_TIMESTAMP, type=float)
+                preset = request.args.get('size', 'medium')
                 try:
-                    success = self.video_manager.generate_thumbnail(
-                        str(video_file), thumbnail_path
-                    )
-                    
-                    if success and Path(thumbnail_path).exists():
-                        # Send file and then delete it
-                        response = send_file(thumbnail_path, mimetype='image/jpeg')
-                        # Delete temporary file after sending
-                        try:
-                            Path(thumbnail_path).unlink()
-                        except Exception:
-                            pass  # Ignore cleanup errors
-                        return response
-                    else:
-                        return jsonify({"error": "Failed to generate thumbnail"}), 500
-                except Exception as e:
-                    # Clean up temp file on error
-                    try:
-                        Path(thumbnail_path).unlink()
-                    except Exception:
-                        pass
-                    raise
+                    thumbnail = self.thumbnail_store.describe(str(video_file), timestamp, preset)
+                except ValueError as e:
+                    return jsonify({"error": str(e)}), 400
+                
+                # The key is derived from the file version: answer revalidations without rendering
+                if self._is_not_modified(thumbnail.key, thumbnail.source_mtime):
+                    return self._not_modified_response(thumbnail.key)
+                
+                thumbnail = self.thumbnail_store.get_thumbnail(str(video_file), timestamp, preset)
+                if thumbnail is None:
+                    return jsonify({"error": "Failed to generate thumbnail"}), 500
+                
+                return send_file(
+                    thumbnail.path,
+                    mimetype='image/jpeg',
+                    etag=thumbnail.key,
+                    last_modified=thumbnail.source_mtime,
+                    max_age=settings.get_thumbnail_max_age_seconds()
+                )
                     
             except Exception as e:
                 logger.error(f"Error generating thumbnail: {e}")
                 return jsonify({"error": str(e)}), 500
         
+        @self.app.route('/api/thumbnails/sprite/<episode>')
+        def get_thumbnail_sprite(episode):
+            """Serve one contact sheet with the thumbnails of an episode's videos"""
+            try:
+                sprite = self._get_episode_sprite(episode)
+                if sprite is None:
+                    return jsonify({"error": "No thumbnails for episode"}), 404
+                
+                if self._is_not_modified(sprite.key):
+                    return self._not_modified_response(sprite.key)
+                
+                return send_file(
+                    sprite.path,
+                    mimetype='image/jpeg',
+                    etag=sprite.key,
+                    max_age=settings.get_thumbnail_max_age_seconds()
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            except Exception as e:
+                logger.error(f"Error generating thumbnail sprite: {e}")
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/thumbnails/sprite/<episode>/index')
+        def get_thumbnail_sprite_index(episode):
+            """Get tile offsets of an episode's contact sheet"""
+            try:
+                sprite = self._get_episode_sprite(episode)
+                if sprite is None:
+                    return jsonify({"error": "No thumbnails for episode"}), 404
+                
+                return jsonify({
+                    "sprite_url": f"/api/thumbnails/sprite/{episode}?{request.query_string.decode()}".rstrip('?'),
+                    "etag": sprite.key,
+                    "tiles": sprite.tiles
+                })
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            except Exception as e:
+                logger.error(f"Error getting thumbnail sprite index: {e}")
+                return jsonify({"error": str(e)}), 500
+        
         @self.app.route('/assets/<path:filename>')
         def serve_static_assets(filename):
             """Serve static assets like icons"""
@@ -1599,10 +1627,12 @@ class VideoManagementUI:
                     yt_scheduler = None
  
                 results = []
+                planner = None  # DB slot calendar, loaded on first use
                 # Schedule videos sequentially, calculating next available slot for each
                 for video in videos:
                     video_path = video.get('video_path')
                     video_type = video.get('video_type')
+                    planned_slot = None
                     
                     if not video_path or not video_type:
                         results.append({
@@ -1616,23 +1646,6 @@ class VideoManagementUI:
                         # Map video_type for schedule_manager
                         schedule_video_type = 'short' if video_type == 'context' else ('final' if video_type == 'long-form' else video_type)
                         
-                        # Determine next publish time.
-                        # Prefer YouTube-based lightweight scheduler; fall back to DB schedule manager.
-                        publish_time = None
-                        if self.yt_scheduler:
-                            try:
-                                publish_time = self.yt_scheduler.get_next_available_slot()
-                            except Exception as e:
-                                logger.warning(f"YouTube scheduler failed, falling back to DB: {e}")
-                                publish_time = None
-                        
-                        if not publish_time:
-                            if not self.schedule_manager:
-                                raise RuntimeError("No scheduler available (YouTube or DB)")
-                            # Fallback to DB-driven slot finding
-                            publish_time = self.schedule_manager.get_next_available_slot(schedule_video_type)
-                        logger.info(f"Next available slot for {video_path} ({schedule_video_type}): {publish_time}")
-                        
                         # Generate metadata
                         from langflix.youtube.video_manager import VideoFileManager
                         from langflix.youtube.metadata_generator import YouTubeMetadataGenerator
@@ -1700,6 +1713,30 @@ class VideoManagementUI:
                             })
                             continue
                         
+                        # Determine next publish time.
+                        # Prefer YouTube-based lightweight scheduler; fall back to DB schedule manager.
+                        publish_time = None
+                        if self.yt_scheduler:
+                            try:
+                                publish_time = self.yt_scheduler.get_next_available_slot()
+                            except Exception as e:
+                                logger.warning(f"YouTube scheduler failed, falling back to DB: {e}")
+                                publish_time = None
+                        
+                        if not publish_time:
+                            if not self.schedule_manager:
+                                raise RuntimeError("No scheduler available (YouTube or DB)")
+                            # Fallback to DB-driven slot finding: the window is loaded once
+                            # and every video of the batch is booked on the same calendar
+                            if planner is None:
+                                planner = self.schedule_manager.load_slot_planner()
+                            publish_time = planner.book(schedule_video_type)
+                            if publish_time:
+                                planned_slot = publish_time
+                            else:
+                                publish_time = self.schedule_manager.get_next_available_slot(schedule_video_type)
+                        logger.info(f"Next available slot for {video_path} ({schedule_video_type}): {publish_time}")
+                        
                         # Upload with publishAt
                         from langflix.youtube.uploader import YouTubeUploader
                         uploader = YouTubeUploader()
@@ -1716,23 +1753,22 @@ class VideoManagementUI:
                             if self.yt_scheduler:
                                 self.yt_scheduler.record_local(publish_time)
                             
-                            # Store schedule in DB for tracking when available
+                            # Store schedule and quota usage in DB right away, so the
+                            # upload stays recorded if a later video of the batch fails
                             actual_scheduled_time = publish_time
                             if self.schedule_manager and settings.get_database_enabled():
-                                try:
-                                    success, message, scheduled_time = self.schedule_manager.schedule_video(
-                                        video_path, schedule_video_type, publish_time
+                                success, message, scheduled_time = self.schedule_manager.schedule_videos([
+                                    ScheduleRequest(
+                                        video_path=video_path,
+                                        video_type=schedule_video_type,
+                                        publish_time=publish_time,
+                                        youtube_video_id=result.video_id
                                     )
-                                    if success and scheduled_time:
-                                        actual_scheduled_time = scheduled_time
-                                        self.schedule_manager.update_schedule_with_video_id(
-                                            video_path, result.video_id, 'completed'
-                                        )
-                                        self.schedule_manager.update_quota_usage(schedule_video_type)
-                                    else:
-                                        logger.warning(f"DB schedule failed: {message}")
-                                except Exception as e:
-                                    logger.warning(f"DB schedule record failed (continuing): {e}")
+                                ])[0]
+                                if success and scheduled_time:
+                                    actual_scheduled_time = scheduled_time
+                                else:
+                                    logger.warning(f"DB schedule failed for {video_path}: {message}, but upload was successful")
                             else:
                                 # Stateless mode: assume success for scheduling
                                 logger.info(f"Stateless mode: Scheduled {video_path} for {publish_time}")
@@ -1770,6 +1806,8 @@ class VideoManagementUI:
                                 "success": False,
                                 "error": result.error_message or "Upload failed"
                             })
+                            if planned_slot:
+                                planner.release(planned_slot, schedule_video_type)
                     except Exception as e:
                         logger.error(f"Error scheduling {video_path}: {e}", exc_info=True)
                         results.append({
@@ -1777,6 +1815,8 @@ class VideoManagementUI:
                             "success": False,
                             "error": str(e)
                         })
+                        if planned_slot:
+                            planner.release(planned_slot, schedule_video_type)
                 
                 return jsonify({
                     "success": all(r.get('success') for r in results),
@@ -1977,6 +2017,66 @@ class VideoManagementUI:
         # Setup content creation routes
         self._setup_content_creation_routes()
     
+    def _render_thumbnail(self, video_path: str, output_path: str, timestamp: float, width: Optional[int]) -> bool:
+        """Render function of the thumbnail store (looked up per call so tests can swap the manager)"""
+        return self.video_manager.generate_thumbnail(video_path, output_path, timestamp, width=width)
+    
+    @staticmethod
+    def _resolve_video_path(video_path: str) -> Path:
+        """Turn a <path:...> route segment back into an absolute file path"""
+        # Decode URL-encoded path
+        video_path = unquote(video_path)
+        
+        # Ensure the path starts with / (Flask strips it sometimes)
+        if not video_path.startswith('/'):
+            video_path = '/' + video_path
+        return Path(video_path)
+    
+    @staticmethod
+    def _is_not_modified(etag: str, last_modified: Optional[float] = None) -> bool:
+        """Check the request's conditional headers (If-None-Match wins over If-Modified-Since)"""
+        if request.if_none_match:
+            return request.if_none_match.contains(etag)
+        if last_modified is not None and request.if_modified_since:
+            return int(last_modified) <= request.if_modified_since.timestamp()
+        return False
+    
+    @staticmethod
+    def _not_modified_response(etag: str) -> Response:
+        """Build a 304 response carrying the same validators and caching headers as the image"""
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = settings.get_thumbnail_max_age_seconds()
+        return response
+    
+    def _get_episode_sprite(self, episode: str):
+        """Compose the contact sheet of an episode's videos (?type=&size=&columns=&t=)"""
+        videos, _ = self.video_manager.query_videos(video_type=request.args.get('type') or None, episode=episode)
+        if not videos:
+            return None
+        
+        return self.thumbnail_store.get_sprite(
+            sorted(v.path for v in videos),
+            timestamp=request.args.get('t', DEFAULT_TIMESTAMP, type=float),
+            preset=request.args.get('size', 'small'),
+            columns=request.args.get('columns', 10, type=int)
+        )
+    
+    @staticmethod
+    def _page_args() -> Dict[str, Any]:
+        """Read ?offset=&limit= pagination arguments (no limit = all videos)"""
+        return {
+            'offset': max(0, request.args.get('offset', 0, type=int)),
+            'limit': request.args.get('limit', None, type=int)
+        }
+    
+    def _video_list_response(self, videos: List[VideoMetadata], total: int) -> Response:
+        """JSON list of videos with the number of matches before pagination in X-Total-Count"""
+        response = jsonify([self._video_to_dict(v) for v in videos])
+        response.headers['X-Total-Count'] = str(total)
+        return response
+    
     def _video_to_dict(self, video: VideoMetadata) -> Dict[str, Any]:
         """Convert VideoMetadata to dictionary"""
         # Determine upload status
@@ -2299,11 +2399,11 @@ class VideoManagementUI:
             """Get job status from Redis (Phase 7 architecture)"""
             try:
                 # Import Redis job manager
-                from langflix.core.redis_client import get_redis_job_manager
+                from langflix.core.redis_client import JOB_SUMMARY_FIELDS, get_redis_job_manager
                 redis_manager = get_redis_job_manager()
                 
-                # Get job from Redis
-                job = redis_manager.get_job(job_id)
+                # Get job from Redis (summary fields only; expressions etc. are not needed)
+                job = redis_manager.get_jobs([job_id], fields=JOB_SUMMARY_FIELDS).get(job_id)
                 
                 if job:
                     return jsonify({
@@ -2311,7 +2411,9 @@ class VideoManagementUI:
                         "status": job.get("status", "UNKNOWN"),
                         "progress": float(job.get("progress", 0)),
                         "current_step": job.get("current_step", ""),
-                        "error_message": job.get("error", None)
+                        "error_message": job.get("error", None),
+                        # Server-sent progress stream (instead of polling this route)
+                        "events_url": self._build_api_url(f"/api/jobs/{job_id}/events")
                     })
                 else:
                     # Try to get from FastAPI backend as fallback
@@ -2382,14 +2484,21 @@ class VideoManagementUI:
         
         @self.app.route('/api/content/jobs')
         def get_all_jobs():
-            """Get all jobs from Redis (Phase 7 architecture)"""
+            """Get job summaries from Redis (?cursor=0&limit= pages, next cursor in X-Next-Cursor)"""
             try:
                 # Import Redis job manager
                 from langflix.core.redis_client import get_redis_job_manager
                 redis_manager = get_redis_job_manager()
                 
-                # Get all jobs from Redis
-                all_jobs = redis_manager.get_all_jobs()
+                # Only summary fields are read, so job results are not transferred or decoded
+                cursor = request.args.get('cursor', None, type=int)
+                next_cursor = None
+                if cursor is None:
+                    all_jobs = redis_manager.get_all_jobs(summary=True)
+                else:
+                    all_jobs, next_cursor, _ = redis_manager.get_jobs_page(
+                        cursor=cursor, count=request.args.get('limit', 50, type=int)
+                    )
                 
                 # Convert to list format
                 jobs_list = []
@@ -2404,7 +2513,10 @@ class VideoManagementUI:
                         "error_message": job_data.get("error", None)
                     })
                 
-                return jsonify(jobs_list)
+                response = jsonify(jobs_list)
+                if cursor is not None:
+                    response.headers['X-Next-Cursor'] = '' if next_cursor is None else str(next_cursor)
+                return response
             except Exception as e:
                 logger.error(f"Error getting jobs: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -2418,14 +2530,10 @@ class VideoManagementUI:
                 
                 # Get queue status
                 queue_length = redis_manager.get_queue_length()
-                queue_job_ids = redis_manager.redis_client.lrange("jobs:queue", 0, -1)
-                queue_jobs = []
+                queue_job_ids = redis_manager.redis_client.lrange("jobs:queue", 0, 4)
                 
-                # Fetch details for top 5 queued jobs
-                for job_id in queue_job_ids[:5]:
-                    job_data = redis_manager.get_job(job_id)
-                    if job_data:
-                        queue_jobs.append(job_data)
+                # Fetch details for top 5 queued jobs in one round trip
+                queue_jobs = list(redis_manager.get_jobs(queue_job_ids).values())
                 
                 # Get currently processing job
                 current_job_id = redis_manager.get_currently_processing_job()
@@ -2437,11 +2545,11 @@ class VideoManagementUI:
                     # check for "ghost" jobs (PROCESSING status but lock lost/zombie)
                     # This happens if backend restarted during processing
                     try:
-                        active_job_ids = redis_manager.redis_client.smembers("jobs:active")
-                        for job_id in active_job_ids:
-                            job_data = redis_manager.get_job(job_id)
-                            if job_data and job_data.get('status') == 'PROCESSING':
-                                current_job = job_data
+                        active_job_ids = list(redis_manager.redis_client.smembers("jobs:active"))
+                        statuses = redis_manager.get_jobs(active_job_ids, fields=("status",))
+                        for job_id, job_data in statuses.items():
+                            if job_data.get('status') == 'PROCESSING':
+                                current_job = redis_manager.get_job(job_id)
                                 logger.info(f"detected ghost processing job: {job_id}")
                                 break
                     except Exception as e:
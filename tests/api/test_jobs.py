@@ -2,18 +2,22 @@
 Tests for job management endpoints.
 """
 
+import json
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
 from datetime import datetime, timezone
 from langflix.api.main import app
+from langflix.api.routes import jobs as jobs_routes
 
 client = TestClient(app)
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_redis_job_manager', MagicMock())
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_create_job_mock(mock_get_manager):
     """Test job creation endpoint with mock data."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     mock_manager.create_job.return_value = True
     
@@ -41,12 +45,12 @@ def test_create_job_mock(mock_get_manager):
     assert "video_size_mb" in result
     assert "subtitle_size_kb" in result
     # Verify Redis create_job was called
-    mock_manager.create_job.assert_called_once()
+    mock_manager.create_job.assert_awaited_once()
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_get_job_status(mock_get_manager):
     """Test job status retrieval."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
     job_id = "test-job-id"
@@ -68,12 +72,12 @@ def test_get_job_status(mock_get_manager):
     assert "progress" in result
     assert result["progress"] == 50
     assert "created_at" in result
-    mock_manager.get_job.assert_called_once_with(job_id)
+    mock_manager.get_job.assert_awaited_once_with(job_id)
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_get_job_expressions_completed(mock_get_manager):
     """Test job expressions retrieval for completed job."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
     job_id = "test-job-id"
@@ -99,12 +103,12 @@ def test_get_job_expressions_completed(mock_get_manager):
     assert len(result["expressions"]) == 1
     assert result["total_expressions"] == 1
     assert "completed_at" in result
-    mock_manager.get_job.assert_called_once_with(job_id)
+    mock_manager.get_job.assert_awaited_once_with(job_id)
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_get_job_expressions_not_completed(mock_get_manager):
     """Test job expressions retrieval for job that's not completed yet."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
     job_id = "test-job-id"
@@ -125,12 +129,12 @@ def test_get_job_expressions_not_completed(mock_get_manager):
     assert result["expressions"] == []
     assert "message" in result
     assert "Processing not completed yet" in result["message"]
-    mock_manager.get_job.assert_called_once_with(job_id)
+    mock_manager.get_job.assert_awaited_once_with(job_id)
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_get_job_expressions_not_found(mock_get_manager):
     """Test job expressions retrieval when job doesn't exist."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
     job_id = "non-existent-job-id"
@@ -144,12 +148,12 @@ def test_get_job_expressions_not_found(mock_get_manager):
     assert "detail" in result or "error" in result
     error_message = result.get("detail") or result.get("error", "")
     assert "Job not found" in error_message
-    mock_manager.get_job.assert_called_once_with(job_id)
+    mock_manager.get_job.assert_awaited_once_with(job_id)
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_list_jobs(mock_get_manager):
     """Test job listing endpoint."""
-    mock_manager = MagicMock()
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
     # Mock jobs
@@ -177,31 +181,139 @@ def test_list_jobs(mock_get_manager):
     assert isinstance(result["jobs"], list)
     assert result["total"] == 2
     assert len(result["jobs"]) == 2
-    mock_manager.get_all_jobs.assert_called_once()
+    mock_manager.get_all_jobs.assert_awaited_once()
 
-@patch('langflix.api.routes.jobs.get_redis_job_manager')
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
 def test_list_jobs_with_filters(mock_get_manager):
-    """Test job listing endpoint (filters are currently ignored, but endpoint works)."""
-    mock_manager = MagicMock()
+    """Test job listing endpoint filters by status."""
+    mock_manager = AsyncMock()
     mock_get_manager.return_value = mock_manager
     
-    # Mock jobs - note: filters are not currently implemented, so all jobs are returned
     mock_jobs = {
         "job1": {
             "job_id": "job1",
             "status": "COMPLETED",
             "created_at": datetime.now(timezone.utc).isoformat()
+        },
+        "job2": {
+            "job_id": "job2",
+            "status": "PENDING",
+            "created_at": datetime.now(timezone.utc).isoformat()
         }
     }
     mock_manager.get_all_jobs.return_value = mock_jobs
     
-    response = client.get("/api/jobs?status=PENDING&limit=10&offset=0")
+    response = client.get("/api/jobs?status=PENDING&summary=true")
     assert response.status_code == 200
     
     result = response.json()
-    assert isinstance(result, dict)
-    assert "jobs" in result
-    assert "total" in result
-    assert isinstance(result["jobs"], list)
-    # Note: Filters are not implemented yet, so all jobs are returned
-    mock_manager.get_all_jobs.assert_called_once()
+    assert [job["job_id"] for job in result["jobs"]] == ["job2"]
+    assert result["total"] == 1
+    mock_manager.get_all_jobs.assert_awaited_once_with(summary=True)
+
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_list_jobs_paginated(mock_get_manager):
+    """Test cursor pagination returns summaries and the next cursor."""
+    mock_manager = AsyncMock()
+    mock_get_manager.return_value = mock_manager
+    mock_manager.get_jobs_page.return_value = (
+        {"job1": {"job_id": "job1", "status": "COMPLETED"}}, 17, 40
+    )
+    
+    response = client.get("/api/jobs?cursor=0&limit=10")
+    assert response.status_code == 200
+    
+    result = response.json()
+    assert result["jobs"] == [{"job_id": "job1", "status": "COMPLETED"}]
+    assert result["total"] == 40
+    assert result["next_cursor"] == 17
+    mock_manager.get_jobs_page.assert_awaited_once_with(cursor=0, count=10, summary=True, status=None)
+    mock_manager.get_all_jobs.assert_not_awaited()
+
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_list_jobs_paginated_with_status(mock_get_manager):
+    """Test the status filter is applied by the page read, which has no total."""
+    mock_manager = AsyncMock()
+    mock_get_manager.return_value = mock_manager
+    mock_manager.get_jobs_page.return_value = (
+        {"job3": {"job_id": "job3", "status": "FAILED"}}, 9, None
+    )
+    
+    response = client.get("/api/jobs?cursor=0&limit=10&status=FAILED")
+    assert response.status_code == 200
+    
+    result = response.json()
+    assert result["jobs"] == [{"job_id": "job3", "status": "FAILED"}]
+    assert result["total"] is None
+    mock_manager.get_jobs_page.assert_awaited_once_with(cursor=0, count=10, summary=True, status="FAILED")
+
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_stream_job_events(mock_get_manager):
+    """Test job events are streamed as server-sent events."""
+    async def watch_job(job_id, **kwargs):
+        yield {"job_id": job_id, "event": "snapshot", "status": "PROCESSING", "progress": 10.0}
+        yield None
+        yield {"job_id": job_id, "event": "progress", "progress": 55.0, "current_step": "Rendering"}
+        yield {"job_id": job_id, "event": "status", "status": "COMPLETED"}
+    mock_manager = MagicMock()
+    mock_manager.watch_job = watch_job
+    mock_get_manager.return_value = mock_manager
+    
+    response = client.get("/api/jobs/job1/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    blocks = response.text.strip().split("\n\n")
+    assert blocks[0].startswith("event: snapshot\ndata: ")
+    assert blocks[1] == ": keepalive"
+    assert json.loads(blocks[2].split("data: ", 1)[1])["progress"] == 55.0
+    assert blocks[3].startswith("event: status")
+
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_stream_job_events_not_found(mock_get_manager):
+    """Test streaming events of an unknown job returns 404."""
+    async def watch_job(job_id, **kwargs):
+        return
+        yield
+    mock_manager = MagicMock()
+    mock_manager.watch_job = watch_job
+    mock_get_manager.return_value = mock_manager
+    
+    response = client.get("/api/jobs/missing/events")
+    assert response.status_code == 404
+
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_stream_job_events_redis_unavailable(mock_get_manager):
+    """Test streaming events while Redis is down returns 503, not 404."""
+    async def watch_job(job_id, **kwargs):
+        raise RedisConnectionError("Connection refused")
+        yield
+    mock_manager = MagicMock()
+    mock_manager.watch_job = watch_job
+    mock_get_manager.return_value = mock_manager
+    
+    response = client.get("/api/jobs/job1/events")
+    assert response.status_code == 503
+    assert jobs_routes._open_event_streams == 0
+
+@patch('langflix.api.routes.jobs.get_job_events_max_streams', return_value=2)
+@patch('langflix.api.routes.jobs.get_async_redis_job_manager')
+def test_stream_job_events_capped(mock_get_manager, mock_max_streams, monkeypatch):
+    """Test a new stream is refused with 503 while the cap is reached, and closed streams free their slot."""
+    watched = []
+    async def watch_job(job_id, **kwargs):
+        watched.append(job_id)
+        yield {"job_id": job_id, "event": "snapshot", "status": "COMPLETED"}
+    mock_manager = MagicMock()
+    mock_manager.watch_job = watch_job
+    mock_get_manager.return_value = mock_manager
+    
+    monkeypatch.setattr(jobs_routes, '_open_event_streams', 2)
+    response = client.get("/api/jobs/job1/events")
+    assert response.status_code == 503
+    assert not watched
+    
+    monkeypatch.setattr(jobs_routes, '_open_event_streams', 1)
+    response = client.get("/api/jobs/job1/events")
+    assert response.status_code == 200
+    assert jobs_routes._open_event_streams == 1
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+
+from langflix.core import cache_manager
+from langflix.core.cache_manager import CacheManager
+from langflix.media.probe_index import ProbeIndex, set_probe_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_probe_index(tmp_path_factory):
+    """Keep ffprobe results written by tests out of the real probe index"""
+    set_probe_index(ProbeIndex(tmp_path_factory.mktemp("probe_index") / "index.sqlite3"))
+    yield
+    set_probe_index(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_manager(tmp_path_factory, monkeypatch):
+    """Give each test its own CacheManager so cached entries never leak between tests"""
+    manager = CacheManager(cache_dir=str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.setattr(cache_manager, "_cache_manager", manager)
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def isolated_video_index(tmp_path_factory, monkeypatch):
+    """Keep video index databases created by tests out of the real cache directory"""
+    from langflix import settings
+    index_dir = tmp_path_factory.mktemp("video_index")
+    monkeypatch.setattr(settings, "get_video_index_dir", lambda: str(index_dir))
@@ -309,3 +309,60 @@ class TestCreateShortFormFromLongForm:
 
         # Just verify the creator is properly set up
         assert callable(creator.create_short_form_from_long_form)
+
+
+class TestSinglePassRender:
+    """Test suite for the single-graph short renderer."""
+
+    def _creator(self, tmp_path):
+        return ShortFormCreator(
+            output_dir=tmp_path,
+            source_language_code="ko",
+            target_language_code="es",
+            paths={'shorts': str(tmp_path / "shorts")}
+        )
+
+    def test_one_invocation_from_long_form(self, tmp_path):
+        """Scale/pad and overlays are compiled into one ffmpeg command."""
+        import ffmpeg
+        from langflix import settings
+        from langflix.media.ffmpeg_utils import VideoParams
+
+        creator = self._creator(tmp_path)
+        encoded = []
+
+        with patch('langflix.core.video.short_form_creator.get_video_params',
+                   return_value=VideoParams("h264", 1920, 1080, "yuv420p", "24/1")), \
+             patch('langflix.media.ffmpeg_utils.detect_black_bars', return_value=None), \
+             patch.object(creator, '_encode_overlayed',
+                          side_effect=lambda v, a, path: encoded.append(ffmpeg.output(v, a, str(path)).compile())):
+            creator._render_single_pass(
+                "long_form.mkv", {'expression': 'break a leg', 'expression_translation': 'mucha suerte'},
+                1080, 1920, 1040, "break_a_leg", settings
+            )
+
+        assert len(encoded) == 1
+        cmd = encoded[0]
+        assert cmd.count('-i') == 1 and cmd[cmd.index('-i') + 1] == "long_form.mkv"
+        graph = cmd[cmd.index('-filter_complex') + 1]
+        assert 'scale=-1:1040' in graph and 'pad=1080:1920' in graph and 'drawtext' in graph
+
+    def test_falls_back_to_multi_pass(self, tmp_path):
+        """A rejected single-pass graph falls back to the two-step render."""
+        creator = self._creator(tmp_path)
+        settings = Mock()
+        settings.get_short_video_dimensions.return_value = (1080, 1920)
+        settings.get_long_form_video_height.return_value = 1040
+        settings.get_short_form_renderer.return_value = 'single_pass'
+
+        with patch.object(creator, '_render_single_pass', side_effect=RuntimeError("bad graph")), \
+             patch.object(creator, '_scale_and_pad_video', return_value=tmp_path / "scaled.mkv") as scale, \
+             patch.object(creator, '_apply_overlays', return_value=tmp_path / "overlayed.mkv") as overlays, \
+             patch.object(creator, '_finalize_output') as finalize, \
+             patch.object(creator, '_write_metadata_file'), \
+             patch('langflix.services.output_manager.OutputManager.ensure_write_permissions'):
+            creator.create_short_form_from_long_form("long.mkv", {'expression': 'hi'}, 0, settings)
+
+        scale.assert_called_once()
+        overlays.assert_called_once()
+        assert finalize.call_args[0][0] == tmp_path / "overlayed.mkv"
@@ -0,0 +1,105 @@
+"""
+Unit tests for ChunkPrefetcher (pipelined LLM analysis + video rendering).
+"""
+import threading
+import time
+
+import pytest
+
+from langflix.pipeline.prefetch import ChunkPrefetcher
+
+
+class TestChunkPrefetcher:
+    """Tests for the bounded producer/consumer chunk prefetcher."""
+
+    def test_preserves_order(self):
+        """Chunks are yielded in source order."""
+        with ChunkPrefetcher(iter(range(10)), max_prefetch=3) as chunks:
+            assert list(chunks) == list(range(10))
+
+    def test_empty_source(self):
+        """An empty generator yields nothing."""
+        assert list(ChunkPrefetcher(iter([]), max_prefetch=2)) == []
+
+    def test_invalid_prefetch(self):
+        """max_prefetch must be at least 1."""
+        with pytest.raises(ValueError):
+            ChunkPrefetcher(iter([]), max_prefetch=0)
+
+    def test_producer_runs_bounded_ahead(self):
+        """Producer never gets more than max_prefetch chunks ahead of the consumer."""
+        produced = []
+        lock = threading.Lock()
+
+        def source():
+            for i in range(6):
+                with lock:
+                    produced.append(i)
+                yield i
+
+        consumed = 0
+        max_ahead = 0
+        for item in ChunkPrefetcher(source(), max_prefetch=2):
+            time.sleep(0.05)  # Give the producer time to run ahead
+            with lock:
+                max_ahead = max(max_ahead, len(produced) - consumed)
+            consumed += 1
+
+        # The chunk being consumed + 2 prefetched
+        assert max_ahead <= 3
+        assert consumed == 6
+
+    def test_overlaps_production_with_consumption(self):
+        """Slow analysis and slow rendering run concurrently."""
+        delay = 0.1
+
+        def slow_source():
+            for i in range(4):
+                time.sleep(delay)  # LLM round trip
+                yield i
+
+        start = time.monotonic()
+        for _ in ChunkPrefetcher(slow_source(), max_prefetch=1):
+            time.sleep(delay)  # ffmpeg render
+        elapsed = time.monotonic() - start
+
+        # Sequential would take 8 * delay; pipelined ~5 * delay
+        assert elapsed < 7 * delay
+
+    def test_producer_exception_is_reraised(self):
+        """Errors in the analysis stage surface in the rendering loop, after earlier chunks."""
+        def failing_source():
+            yield 1
+            raise RuntimeError("LLM failed")
+
+        seen = []
+        with pytest.raises(RuntimeError, match="LLM failed"):
+            for item in ChunkPrefetcher(failing_source(), max_prefetch=2):
+                seen.append(item)
+        assert seen == [1]
+
+    def test_close_stops_producer(self):
+        """Breaking out of the loop stops the producer and closes the source."""
+        closed = threading.Event()
+
+        def source():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.set()
+
+        prefetcher = ChunkPrefetcher(source(), max_prefetch=2)
+        for item in prefetcher:
+            if item == 1:
+                break
+        prefetcher.close()
+
+        assert closed.wait(timeout=2)
+
+    def test_single_iteration_only(self):
+        """A prefetcher cannot be iterated twice."""
+        prefetcher = ChunkPrefetcher(iter([1]), max_prefetch=1)
+        assert list(prefetcher) == [1]
+        with pytest.raises(RuntimeError):
+            list(prefetcher)
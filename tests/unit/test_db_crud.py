@@ -258,3 +258,65 @@ def test_processing_job_crud_get_by_status(db_session):
     assert len(processing_jobs) == 1
     assert pending_jobs[0].id == job2.id
     assert processing_jobs[0].id == job1.id
+
+
+def _upsert_session(dialect):
+    """Mock session bound to a dialect, recording executed statements."""
+    import uuid
+    from unittest.mock import MagicMock
+    session = MagicMock()
+    session.get_bind.return_value.dialect = dialect
+    session.statements = []
+
+    def execute(stmt):
+        session.statements.append(stmt)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [uuid.uuid4() for _ in stmt._multi_values[0]]
+        return result
+
+    session.execute.side_effect = execute
+    return session
+
+
+def test_expression_bulk_upsert_statement():
+    """Test bulk upsert compiles to one multi-row INSERT ... ON CONFLICT ... RETURNING."""
+    import uuid
+    from sqlalchemy.dialects import postgresql
+
+    session = _upsert_session(postgresql.dialect())
+    analyses = [
+        {'expression': 'break a leg', 'context_start_time': '00:01:00,000', 'expression_translation': 'good luck'},
+        {'expression': 'hit the road', 'context_start_time': '00:02:00,000', '_localizations': {'ko': {}}},
+    ]
+
+    ids = ExpressionCRUD.bulk_upsert_from_analyses(session, str(uuid.uuid4()), analyses)
+
+    assert len(session.statements) == 1 and len(ids) == 2
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert 'ON CONFLICT (media_id, expression, context_start_time) DO UPDATE' in sql
+    assert 'expression_translation = excluded.expression_translation' in sql
+    assert sql.rstrip().endswith('RETURNING expressions.id')
+    session.commit.assert_called_once()
+
+
+def test_expression_bulk_upsert_dedupes_and_batches():
+    """Test duplicate keys collapse to one row and rows are split into batches."""
+    import uuid
+    from sqlalchemy.dialects import postgresql
+
+    session = _upsert_session(postgresql.dialect())
+    analyses = [{'expression': f'expr {i % 5}', 'context_start_time': f'00:00:0{i % 5},000'} for i in range(10)]
+
+    ExpressionCRUD.bulk_upsert_from_analyses(session, uuid.uuid4(), analyses, batch_size=2)
+
+    rows_per_statement = [len(stmt._multi_values[0]) for stmt in session.statements]
+    assert rows_per_statement == [2, 2, 1]
+
+
+def test_expression_bulk_upsert_empty():
+    """Test an empty chunk does not touch the database."""
+    from sqlalchemy.dialects import postgresql
+
+    session = _upsert_session(postgresql.dialect())
+    assert ExpressionCRUD.bulk_upsert_from_analyses(session, "00000000-0000-0000-0000-000000000001", []) == []
+    session.execute.assert_not_called()
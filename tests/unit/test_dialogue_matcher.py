@@ -0,0 +1,81 @@
+"""
+Unit tests for subtitle-to-dialogue matching.
+
+Golden outputs in tests/fixtures/subtitles/dialogue_mapping_golden.json were
+recorded with the original line-by-line matcher; the indexed matcher must
+reproduce them exactly.
+"""
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from langflix.core.dialogue_matcher import DialogueMatcher, get_dialogue_matcher
+from langflix.core.subtitle_parser import parse_subtitle_file_by_extension
+from langflix.core.subtitle_processor import SubtitleProcessor
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "subtitles"
+GOLDEN = json.loads((FIXTURES / "dialogue_mapping_golden.json").read_text(encoding="utf-8"))
+
+MAPPING_CASES = [
+    (fixture, name, case)
+    for fixture, cases in GOLDEN.items()
+    for name, case in cases.items()
+    if name != "expression_timing"
+]
+TIMING_CASES = [
+    (fixture, case)
+    for fixture, cases in GOLDEN.items()
+    for case in cases.get("expression_timing", [])
+]
+
+
+@pytest.fixture(autouse=True)
+def no_parse_cache():
+    with patch('langflix.core.subtitle_processor.settings.is_subtitle_parse_cache_enabled', return_value=False):
+        yield
+
+
+class TestDialogueMatcherGolden:
+    """Golden-output tests over the fixture subtitles."""
+
+    @pytest.mark.parametrize("fixture,name,case", MAPPING_CASES, ids=[f"{f}:{n}" for f, n, _ in MAPPING_CASES])
+    def test_subtitle_to_dialogue_mapping(self, fixture, name, case):
+        subtitles = parse_subtitle_file_by_extension(str(FIXTURES / fixture))
+
+        assert DialogueMatcher(case["dialogues"]).map_subtitles(subtitles) == case["mapping"]
+
+    @pytest.mark.parametrize("fixture,case", TIMING_CASES, ids=[c["expression"][:30] for _, c in TIMING_CASES])
+    def test_expression_timing(self, fixture, case):
+        processor = SubtitleProcessor(str(FIXTURES / fixture))
+
+        timing = processor.find_expression_timing({
+            'expression': case["expression"],
+            'context_start_time': case["context_start_time"],
+            'context_end_time': case["context_end_time"],
+        })
+
+        assert list(timing) == case["timing"]
+
+
+class TestDialogueMatcher:
+    """Tests for DialogueMatcher building blocks."""
+
+    def test_lines_containing_does_not_cross_lines(self):
+        matcher = DialogueMatcher(["You can burn bud", "and still be a success", "bud and still"])
+
+        assert matcher.lines_containing("bud and") == [2]
+        assert matcher.lines_containing("still") == [1, 2]
+        assert matcher.lines_containing("") == []
+
+    def test_split_line_accumulates(self):
+        dialogues = ["I've got to get my act together.", "Dude, look at me.", "You can burn bud and still be a success."]
+        subtitles = [{'text': t} for t in ["I've got to get", "my act together.", "Dude, look at me.",
+                                            "You can burn bud", "and still be a success."]]
+
+        assert DialogueMatcher(dialogues).map_subtitles(subtitles) == [0, 0, 1, 2, 2]
+
+    def test_matcher_shared_across_languages(self):
+        dialogues = ["Hello there.", "General Kenobi."]
+        assert get_dialogue_matcher(dialogues) is get_dialogue_matcher(list(dialogues))
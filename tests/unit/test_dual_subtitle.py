@@ -2,6 +2,8 @@
 Unit tests for langflix.core.dual_subtitle module.
 Tests V2 dual-language subtitle models and service.
 """
+import random
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -11,6 +13,7 @@ from langflix.core.dual_subtitle import (
     AlignedSubtitlePair,
     DualSubtitle,
     DualSubtitleService,
+    fuzzy_match_by_timestamp,
     get_dual_subtitle_service,
 )
 
@@ -196,3 +199,72 @@ class TestGetDualSubtitleService:
         service1 = get_dual_subtitle_service()
         service2 = get_dual_subtitle_service()
         assert service1 is service2
+
+
+def _entry(index, start, end, text=""):
+    def ts(seconds):
+        millis = int(round(seconds * 1000))
+        return f"{millis // 3600000:02d}:{millis // 60000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+    return SubtitleEntry(index=index, start_time=ts(start), end_time=ts(end), text=text or str(index))
+
+
+def _all_pairs_match(source_entries, target_entries, tolerance_seconds):
+    """Reference: compare every source entry with every unused target entry."""
+    pairs, used = [], set()
+    for source in source_entries:
+        s_mid = (source.start_seconds + source.end_seconds) / 2
+        best, best_idx = -1, -1
+        for idx, target in enumerate(target_entries):
+            if idx in used:
+                continue
+            overlap = max(0, min(source.end_seconds, target.end_seconds) - max(source.start_seconds, target.start_seconds))
+            mid_distance = abs(s_mid - (target.start_seconds + target.end_seconds) / 2)
+            if overlap > 0 or mid_distance < tolerance_seconds:
+                score = overlap if overlap > 0 else 1.0 / (mid_distance + 0.1)
+                if score > best:
+                    best, best_idx = score, idx
+        if best_idx >= 0:
+            pairs.append((source, target_entries[best_idx]))
+            used.add(best_idx)
+    return pairs
+
+
+class TestFuzzyMatchByTimestamp:
+    """Tests for timestamp-based source/target alignment."""
+    
+    def test_overlap_preferred(self):
+        """Should pair each source with the most-overlapping target."""
+        source = [_entry(1, 0, 2), _entry(2, 3, 5)]
+        target = [_entry(1, 0.2, 2.2, "a"), _entry(2, 2.9, 5.1, "b")]
+        
+        pairs = fuzzy_match_by_timestamp(source, target)
+        
+        assert [t.text for _, t in pairs] == ["a", "b"]
+    
+    def test_midpoint_within_tolerance(self):
+        """Should match short non-overlapping cues by midpoint distance only within tolerance."""
+        source = [_entry(1, 10, 10.5), _entry(2, 20, 20.5)]
+        target = [_entry(1, 10.6, 11.0, "near"), _entry(2, 30, 31, "far")]
+        
+        pairs = fuzzy_match_by_timestamp(source, target, tolerance_seconds=1.0)
+        
+        assert [(s.index, t.text) for s, t in pairs] == [(1, "near")]
+    
+    def test_same_pairs_as_all_pairs_scan(self):
+        """Should produce exactly the pairs of the all-pairs comparison."""
+        rng = random.Random(3)
+        for _ in range(20):
+            source, target, t = [], [], 0.0
+            for i in range(60):
+                t += rng.uniform(0, 2.5)
+                source.append(_entry(i + 1, t, t + rng.uniform(0.1, 4)))
+                if rng.random() < 0.9:
+                    shift = rng.uniform(-1.5, 1.5)
+                    target.append(_entry(i + 1, max(0, t + shift), t + shift + rng.uniform(0.1, 4)))
+            rng.shuffle(target)
+            tolerance = rng.choice([0.5, 1.0, 3.0])
+            
+            expected = _all_pairs_match(source, target, tolerance)
+            actual = fuzzy_match_by_timestamp(source, target, tolerance)
+            
+            assert [(s.index, id(t)) for s, t in actual] == [(s.index, id(t)) for s, t in expected]
@@ -0,0 +1,138 @@
+"""
+Unit tests for the pre-encoded ending credit and its use in ShortFormCreator.
+"""
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langflix.core import cache_manager
+from langflix.core.cache_manager import CacheManager
+from langflix.core.video.short_form_creator import ShortFormCreator
+from langflix.media import ending_credit
+from langflix.media.ending_credit import (
+    CreditEncodeParams,
+    credit_params_for,
+    get_prepared_ending_credit,
+)
+from langflix.media.ffmpeg_utils import AudioParams, VideoParams
+
+PARAMS = CreditEncodeParams(
+    width=1080, height=1920, frame_rate="24000/1001", pix_fmt="yuv420p",
+    vcodec="libx264", preset="fast", crf=18, has_audio=True,
+)
+
+
+@pytest.fixture
+def credit(tmp_path):
+    path = tmp_path / "ending_credit.mp4"
+    path.write_bytes(b"credit" * 100)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def credit_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ending_credit.settings, 'get_ending_credit_cache_dir', lambda: str(tmp_path / "credits"))
+
+
+def _fake_encode(credit_path, params, output_path):
+    Path(output_path).write_bytes(b"encoded")
+
+
+class TestCreditParams:
+    """Tests for reading the short's stream parameters."""
+
+    def test_params_from_short(self):
+        with patch.object(ending_credit, 'get_video_params',
+                          return_value=VideoParams("h264", 1080, 1920, "yuv420p", "24000/1001")), \
+             patch.object(ending_credit, 'get_audio_params', return_value=AudioParams("aac", 2, 48000, 10.0)):
+            params = credit_params_for("short.mkv", {'vcodec': 'libx264', 'preset': 'fast', 'crf': 18})
+
+        assert params == PARAMS
+
+    def test_unsupported_codec(self):
+        with patch.object(ending_credit, 'get_video_params',
+                          return_value=VideoParams("hevc", 1080, 1920, "yuv420p", "30/1")):
+            assert credit_params_for("short.mkv", {'vcodec': 'libx264'}) is None
+
+
+class TestPreparedCredit:
+    """Tests for the prepared-credit cache."""
+
+    def test_encoded_once_per_params(self, credit):
+        with patch.object(ending_credit, '_encode_credit', side_effect=_fake_encode) as encode:
+            first = get_prepared_ending_credit(str(credit), PARAMS)
+            second = get_prepared_ending_credit(str(credit), PARAMS)
+            other = get_prepared_ending_credit(str(credit), CreditEncodeParams(**{**PARAMS.__dict__, 'crf': 28}))
+
+        assert first == second != other
+        assert encode.call_count == 2
+
+    def test_disk_cache_survives_new_process(self, credit, tmp_path, monkeypatch):
+        with patch.object(ending_credit, '_encode_credit', side_effect=_fake_encode):
+            first = get_prepared_ending_credit(str(credit), PARAMS)
+        monkeypatch.setattr(cache_manager, '_cache_manager', CacheManager(cache_dir=str(tmp_path / "fresh_cache")))
+
+        with patch.object(ending_credit, '_encode_credit') as encode:
+            assert get_prepared_ending_credit(str(credit), PARAMS) == first
+        encode.assert_not_called()
+
+    def test_new_credit_content_is_reencoded(self, credit):
+        with patch.object(ending_credit, '_encode_credit', side_effect=_fake_encode):
+            first = get_prepared_ending_credit(str(credit), PARAMS)
+            credit.write_bytes(b"new credit")
+            second = get_prepared_ending_credit(str(credit), PARAMS)
+
+        assert first != second
+
+    def test_failed_encode_leaves_no_file(self, credit, tmp_path):
+        with patch.object(ending_credit, '_encode_credit', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                get_prepared_ending_credit(str(credit), PARAMS)
+
+        assert list((tmp_path / "credits").iterdir()) == []
+
+
+class TestFinalizeOutput:
+    """Tests for appending the credit in ShortFormCreator._finalize_output."""
+
+    @pytest.fixture
+    def creator(self, tmp_path):
+        return ShortFormCreator(output_dir=tmp_path, source_language_code="ko", target_language_code="en")
+
+    @pytest.fixture
+    def settings(self, credit):
+        settings = Mock()
+        settings.is_ending_credit_enabled.return_value = True
+        settings.get_ending_credit_video_path.return_value = str(credit)
+        return settings
+
+    def test_stream_copy_without_reencode(self, creator, settings, tmp_path):
+        overlayed = tmp_path / "overlayed.mkv"
+        overlayed.write_bytes(b"short")
+        output = tmp_path / "short.mkv"
+
+        def concat(video_path, credit_path, out_path):
+            Path(out_path).write_bytes(b"short+credit")
+
+        with patch('langflix.media.ending_credit.credit_params_for', return_value=PARAMS), \
+             patch('langflix.media.ending_credit.get_prepared_ending_credit', return_value="prepared.mkv"), \
+             patch('langflix.media.ending_credit.append_with_concat_copy', side_effect=concat) as append, \
+             patch.object(creator, '_append_credit_reencode') as reencode:
+            creator._finalize_output(overlayed, output, "source.mkv", settings)
+
+        append.assert_called_once()
+        reencode.assert_not_called()
+        assert output.read_bytes() == b"short+credit"
+
+    def test_falls_back_to_reencode(self, creator, settings, tmp_path):
+        overlayed = tmp_path / "overlayed.mkv"
+        overlayed.write_bytes(b"short")
+        output = tmp_path / "short.mkv"
+
+        with patch('langflix.media.ending_credit.credit_params_for', return_value=None), \
+             patch.object(creator, '_append_credit_reencode', return_value=False) as reencode:
+            creator._finalize_output(overlayed, output, "source.mkv", settings)
+
+        reencode.assert_called_once()
+        assert output.read_bytes() == b"short"
@@ -0,0 +1,142 @@
+"""
+Unit tests for zero-copy job intake (file staging and disk-space pre-flight).
+"""
+import asyncio
+import os
+from collections import namedtuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from langflix.utils import file_intake
+from langflix.utils.file_intake import (
+    InsufficientDiskSpaceError,
+    check_free_space,
+    link_or_copy,
+    stage_input,
+)
+
+DiskUsage = namedtuple('DiskUsage', 'total used free')
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "media" / "episode.mkv"
+    path.parent.mkdir()
+    path.write_bytes(os.urandom(4096))
+    return path
+
+
+class TestStageInput:
+    """Tests for stage_input modes."""
+
+    def test_direct_yields_original(self, video):
+        with stage_input(video) as path:
+            assert path == video
+
+    def test_link_stages_private_copy_and_removes_it(self, video):
+        with stage_input(video, mode="link", prefix="job1_video_") as path:
+            assert path != video
+            # Same file name (show/episode parsing), private directory
+            assert path.name == video.name
+            assert path.parent.name.startswith("job1_video_")
+            assert path.read_bytes() == video.read_bytes()
+        assert not path.exists()
+        assert not path.parent.exists()
+        assert video.exists()
+
+    def test_link_keeps_directories_in_place(self, tmp_path):
+        with stage_input(tmp_path, mode="link") as path:
+            assert path == tmp_path
+
+    def test_unknown_mode(self, video):
+        with pytest.raises(ValueError):
+            with stage_input(video, mode="copy"):
+                pass
+
+
+class TestLinkOrCopy:
+    """Tests for the hardlink → reflink → sendfile → copy chain."""
+
+    def test_hardlink_preferred(self, video, tmp_path):
+        dst = tmp_path / "staged.mkv"
+        assert link_or_copy(video, dst) == "hardlink"
+        assert os.stat(dst).st_ino == os.stat(video).st_ino
+
+    def test_sendfile_when_link_and_reflink_unavailable(self, video, tmp_path):
+        dst = tmp_path / "staged.mkv"
+        with patch.object(file_intake.os, 'link', side_effect=OSError("EXDEV")), \
+             patch.object(file_intake, '_reflink', side_effect=OSError("EOPNOTSUPP")):
+            method = link_or_copy(video, dst)
+
+        assert method in ("sendfile", "copy")
+        assert dst.read_bytes() == video.read_bytes()
+
+
+class TestCheckFreeSpace:
+    """Tests for the disk-space pre-flight."""
+
+    def test_missing_output_dir_checks_nearest_parent(self, tmp_path):
+        assert check_free_space(tmp_path / "output" / "new", required_bytes=1) > 0
+
+    def test_insufficient_space(self, tmp_path):
+        with patch.object(file_intake.shutil, 'disk_usage', return_value=DiskUsage(100, 90, 10)):
+            with pytest.raises(InsufficientDiskSpaceError) as exc_info:
+                check_free_space(tmp_path, required_bytes=11)
+
+        assert exc_info.value.free_bytes == 10
+        assert exc_info.value.required_bytes == 11
+
+
+class TestQueueProcessorIntake:
+    """Tests for QueueProcessor._process_job input handling."""
+
+    @pytest.fixture
+    def processor(self):
+        with patch('langflix.services.queue_processor.get_redis_job_manager'):
+            from langflix.services.queue_processor import QueueProcessor
+            processor = QueueProcessor()
+        processor.redis_manager = MagicMock()
+        processor.redis = AsyncMock()
+        return processor
+
+    def _job(self, video, tmp_path):
+        subtitle = video.parent / "episode.smi"
+        subtitle.write_text("<SAMI></SAMI>", encoding="utf-8")
+        return {
+            'video_path': str(video),
+            'subtitle_path': str(subtitle),
+            'language_code': 'ko',
+            'episode_name': 'S01E01',
+            'output_dir': str(tmp_path / "output"),
+        }
+
+    def test_original_paths_passed_to_pipeline(self, processor, video, tmp_path):
+        job = self._job(video, tmp_path)
+        processor.redis.get_job.return_value = job
+        service = MagicMock()
+        service.process_video.return_value = {}
+
+        with patch('langflix.services.video_pipeline_service.VideoPipelineService', return_value=service), \
+             patch('langflix.services.queue_processor.get_job_intake_mode', return_value='direct'), \
+             patch('builtins.open', side_effect=AssertionError("job inputs must not be read")):
+            asyncio.run(processor._process_job("job1"))
+
+        kwargs = service.process_video.call_args.kwargs
+        assert kwargs['video_path'] == str(video)
+        assert kwargs['subtitle_path'] == job['subtitle_path']
+        assert kwargs['source_video_path'] == str(video)
+        assert processor.redis.update_job.call_args_list[-1][0][1]['status'] == 'COMPLETED'
+
+    def test_insufficient_disk_space_fails_job(self, processor, video, tmp_path):
+        processor.redis.get_job.return_value = self._job(video, tmp_path)
+
+        with patch('langflix.services.video_pipeline_service.VideoPipelineService') as service_cls, \
+             patch.object(file_intake.shutil, 'disk_usage', return_value=DiskUsage(100, 100, 0)), \
+             patch('langflix.services.queue_processor.handle_error'):
+            asyncio.run(processor._process_job("job1"))
+
+        service_cls.assert_not_called()
+        final_update = processor.redis.update_job.call_args_list[-1][0][1]
+        assert final_update['status'] == 'FAILED'
+        assert 'Insufficient disk space' in final_update['error']
@@ -0,0 +1,136 @@
+"""
+Unit tests for the persistent LLM response cache.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from langflix.core.fake_llm_client import FakeGeminiClient
+from langflix.core.llm_response_cache import LLMResponseCache
+from langflix.core.rate_limiter import LLMRateLimiter
+from langflix.pipeline.agents.script_agent import ScriptAgent
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(tmp_path / "cache.sqlite3")
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_miss_then_hit(self, cache):
+        key = LLMResponseCache.make_key("gemini", {"temperature": 0.1}, "prompt")
+        assert cache.get(key) is None
+
+        cache.put(key, '{"expressions": []}', model_name="gemini")
+        assert cache.get(key) == '{"expressions": []}'
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+
+    def test_key_depends_on_model_config_and_prompt(self):
+        base = LLMResponseCache.make_key("gemini", {"temperature": 0.1}, "prompt")
+
+        assert base == LLMResponseCache.make_key("gemini", {"temperature": 0.1}, "prompt")
+        assert base != LLMResponseCache.make_key("other-model", {"temperature": 0.1}, "prompt")
+        assert base != LLMResponseCache.make_key("gemini", {"temperature": 0.2}, "prompt")
+        assert base != LLMResponseCache.make_key("gemini", {"temperature": 0.1}, "prompt!")
+
+    def test_key_ignores_config_ordering(self):
+        a = LLMResponseCache.make_key("gemini", {"a": 1, "b": 2}, "prompt")
+        b = LLMResponseCache.make_key("gemini", {"b": 2, "a": 1}, "prompt")
+        assert a == b
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        LLMResponseCache(path).put("k", "value")
+
+        assert LLMResponseCache(path).get("k") == "value"
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_size_bytes=25)
+        cache.put("a", "x" * 10)
+        cache.put("b", "x" * 10)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", "x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_bypass_skips_lookup_but_stores(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = LLMResponseCache(path, bypass=True)
+        cache.put("k", "fresh")
+
+        assert cache.get("k") is None
+        assert cache.get_stats()['bypassed'] == 1
+        assert LLMResponseCache(path).get("k") == "fresh"
+
+    def test_disabled_cache_is_noop(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = LLMResponseCache(path, enabled=False)
+        cache.put("k", "value")
+
+        assert cache.get("k") is None
+        assert not path.exists()
+
+
+class TestScriptAgentResponseCache:
+    """Tests for ScriptAgent integration with the response cache."""
+
+    def _analyze(self, agent):
+        script = "\n".join(
+            f"[{i}] [00:00:{i:02d},000 --> 00:00:{i:02d},900] Line {i}" for i in range(12)
+        )
+        return agent.analyze_chunk(
+            chunk_id=1,
+            script_chunk=script,
+            target_script_chunk=script,
+            show_bible="",
+            target_language="Korean",
+            target_language_code="ko",
+            source_language="English",
+            source_language_code="en"
+        )
+
+    def _make_agent(self, tmp_path, client, cache):
+        return ScriptAgent(
+            show_name="Test Show",
+            output_dir=str(tmp_path),
+            client=client,
+            rate_limiter=LLMRateLimiter(),
+            response_cache=cache
+        )
+
+    def test_second_run_makes_no_llm_calls(self, tmp_path, cache):
+        first_client = FakeGeminiClient()
+        first = self._analyze(self._make_agent(tmp_path, first_client, cache))
+
+        second_client = FakeGeminiClient()
+        second = self._analyze(self._make_agent(tmp_path, second_client, cache))
+
+        assert first_client.call_count == 1
+        assert second_client.call_count == 0
+        assert [e['expression'] for e in second.expressions] == [e['expression'] for e in first.expressions]
+
+    def test_cache_hit_is_not_written_back(self, tmp_path, cache):
+        self._analyze(self._make_agent(tmp_path, FakeGeminiClient(), cache))
+
+        with patch.object(cache, 'put') as put:
+            self._analyze(self._make_agent(tmp_path, FakeGeminiClient(), cache))
+
+        put.assert_not_called()
+
+    def test_unparsable_response_is_not_cached(self, tmp_path, cache):
+        client = FakeGeminiClient()
+        client.generate_content = lambda prompt, generation_config=None: type(
+            "Response", (), {"text": "not json", "candidates": [], "prompt_feedback": None}
+        )()
+        self._analyze(self._make_agent(tmp_path, client, cache))
+
+        assert cache.get_stats()['entries'] == 0
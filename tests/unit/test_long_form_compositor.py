@@ -0,0 +1,181 @@
+"""
+Unit tests for the single-pass long-form compositor.
+
+The ffmpeg command is compiled (not run), so no ffmpeg binary is needed.
+"""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from langflix.core.video.long_form_compositor import LongFormSpec, build_long_form_output, build_multi_output
+from langflix.core.video_editor import VideoEditor
+from langflix.media.ffmpeg_utils import VideoParams
+
+
+def _compile(spec):
+    args = build_long_form_output(spec, "out.mkv", {'vcodec': 'libx264', 'preset': 'slow', 'crf': 18}).compile()
+    return args, args[args.index('-filter_complex') + 1]
+
+
+def _spec(**overrides):
+    values = dict(
+        source_path="source.mkv",
+        context_start=100.0,
+        context_duration=30.0,
+        expression_start=10.0,
+        expression_duration=2.5,
+    )
+    values.update(overrides)
+    return LongFormSpec(**values)
+
+
+class TestLongFormCompositor:
+    """Tests for the filter graph built by build_long_form_output."""
+
+    def test_single_decode_single_encode(self):
+        args, _ = _compile(_spec())
+
+        assert args.count('-i') == 1
+        assert args[args.index('-i') - 4:args.index('-i')] == ['-ss', '100.0', '-t', '30.0']
+        assert args[-2:] == ['out.mkv', '-y']
+
+    def test_expression_repeated_from_split_source(self):
+        _, graph = _compile(_spec(repeat_count=2))
+
+        assert 'split=3' in graph
+        assert 'asplit=3' in graph
+        assert graph.count('trim=end=12.5:start=10.0') == 4  # 2 video trims + 2 audio atrims
+        assert 'concat=a=1:n=3:v=1' in graph
+
+    def test_subtitles_burned_before_split(self):
+        _, graph = _compile(_spec(subtitle_path="subs.srt", subtitle_force_style="FontSize=20", fonts_dir="/fonts"))
+
+        assert graph.index('subtitles=subs.srt') < graph.index('split=')
+
+    def test_transition_slide_and_logo(self):
+        args, graph = _compile(_spec(
+            transition_image="transition.png",
+            transition_sound="sound.mp3",
+            transition_duration=1.2,
+            slide_path="slide.mkv",
+            logo_path="logo.png",
+        ))
+
+        assert args.count('-i') == 5
+        assert 'concat=a=1:n=5:v=1' in graph
+        assert 'overlay=' in graph
+        assert 'colorchannelmixer=aa=0.5' in graph
+        assert 'loudnorm=I=-16.0' in graph
+
+    def test_slide_start_accounts_for_all_segments(self):
+        spec = _spec(transition_image="t.png", transition_sound="s.mp3", transition_duration=1.0)
+        assert spec.slide_start == pytest.approx(30.0 + 1.0 + 2 * 2.5)
+
+        assert _spec().slide_start == pytest.approx(35.0)
+
+    def test_rejects_invalid_expression_duration(self):
+        with pytest.raises(ValueError):
+            build_long_form_output(_spec(expression_duration=0), "out.mkv", {})
+
+
+class TestMultiOutputCompositor:
+    """Tests for rendering several languages from one decode."""
+
+    def test_one_decode_per_language_subtitles_and_slides(self):
+        specs = [
+            _spec(subtitle_path="ko.srt", slide_path="slide_ko.mkv", logo_path="logo.png"),
+            _spec(subtitle_path="ja.srt", slide_path="slide_ja.mkv", logo_path="logo.png"),
+        ]
+        args = build_multi_output(specs, ["ko.mkv", "ja.mkv"], {}).compile()
+        graph = args[args.index('-filter_complex') + 1]
+
+        # source + logo + one slide per language
+        assert args.count('-i') == 4
+        assert args.count('source.mkv') == 1
+        assert args.count('logo.png') == 1
+        assert 'split=2' in graph and 'asplit=2' in graph
+        assert graph.index('split=2') < graph.index('subtitles=ko.srt')
+        assert 'subtitles=ja.srt' in graph
+        assert graph.count('concat=a=1:n=4:v=1') == 2
+        assert args.index('ko.mkv') < args.index('ja.mkv')
+        assert args.count('-map') == 4
+
+    def test_single_spec_is_plain_render(self):
+        spec = _spec()
+        assert build_multi_output([spec], ["out.mkv"], {}).compile() == build_long_form_output(spec, "out.mkv", {}).compile()
+
+    def test_rejects_different_timelines(self):
+        with pytest.raises(ValueError):
+            build_multi_output([_spec(), _spec(context_duration=12.0)], ["a.mkv", "b.mkv"], {})
+
+
+class TestVideoEditorSinglePass:
+    """Tests for VideoEditor.create_long_form_video in single_pass mode."""
+
+    @pytest.fixture
+    def editor(self, tmp_path):
+        return VideoEditor(output_dir=str(tmp_path / "ko" / "expressions"), language_code="ko", episode_name="E01")
+
+    @pytest.fixture
+    def expression(self):
+        return {
+            'expression': 'hold on',
+            'context_start_time': '00:01:00,000',
+            'context_end_time': '00:01:20,000',
+            'expression_start_time': '00:01:05,000',
+            'expression_end_time': '00:01:07,000',
+        }
+
+    def test_renders_once_from_raw_clip(self, editor, expression, tmp_path):
+        raw_clip = tmp_path / "raw.mkv"
+        raw_clip.write_bytes(b"clip")
+        subtitles = tmp_path / "subs.srt"
+        subtitles.write_text("1\n00:00:00,000 --> 00:00:02,000\nhello\n", encoding="utf-8")
+
+        with patch('langflix.core.video.long_form_compositor.render_long_form') as render, \
+             patch('langflix.core.video_editor.get_duration_seconds', return_value=20.0), \
+             patch('langflix.media.ffmpeg_utils.get_video_params',
+                   return_value=VideoParams('h264', 1280, 720, 'yuv420p', '24000/1001')), \
+             patch('langflix.core.video_editor.settings.get_long_form_compositor', return_value='single_pass'), \
+             patch('langflix.core.video_editor.settings.get_transitions_config', return_value={}):
+            output = editor.create_long_form_video(
+                expression, "source.mkv", "source.mkv",
+                expression_index=0,
+                pre_extracted_context_clip=raw_clip,
+                include_slides=False,
+                context_subtitle_path=str(subtitles)
+            )
+
+        render.assert_called_once()
+        spec = render.call_args[0][0]
+        assert spec.source_path == str(raw_clip)
+        assert spec.context_start == 0.0
+        assert spec.subtitle_path is not None
+        assert (spec.width, spec.height) == (1280, 720)
+        assert spec.fps == pytest.approx(23.976, rel=1e-3)
+        # Padded expression: 4.9s..7.1s relative to context start
+        assert spec.expression_start == pytest.approx(4.9)
+        assert spec.expression_duration == pytest.approx(2.2)
+        assert Path(output).name == "expression_01_hold_on.mkv"
+        assert expression['educational_slide_start_time'] == pytest.approx(20.0 + 2 * 2.2)
+
+    def test_falls_back_to_multi_pass_on_ffmpeg_failure(self, editor, expression, tmp_path):
+        raw_clip = tmp_path / "raw.mkv"
+        raw_clip.write_bytes(b"clip")
+
+        with patch('langflix.core.video.long_form_compositor.render_long_form', side_effect=RuntimeError("bad graph")), \
+             patch('langflix.core.video_editor.get_duration_seconds', return_value=20.0), \
+             patch('langflix.media.ffmpeg_utils.get_video_params',
+                   return_value=VideoParams('h264', 1280, 720, 'yuv420p', '25/1')), \
+             patch('langflix.core.video_editor.settings.get_long_form_compositor', return_value='single_pass'), \
+             patch('langflix.core.video_editor.settings.get_transitions_config', return_value={}), \
+             patch('langflix.core.video_editor.subs_overlay.apply_dual_subtitle_layers',
+                   side_effect=RuntimeError("multi-pass reached")):
+            with pytest.raises(RuntimeError, match="multi-pass reached"):
+                editor.create_long_form_video(
+                    expression, "source.mkv", "source.mkv",
+                    pre_extracted_context_clip=raw_clip,
+                    include_slides=False,
+                    context_subtitle_path=str(tmp_path / "subs.srt")
+                )
@@ -0,0 +1,120 @@
+"""
+Unit tests for the persistent ffprobe index and batch probing.
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langflix.media import ffmpeg_utils
+from langflix.media.ffmpeg_utils import (
+    _get_ffprobe_cache_key,
+    clear_ffprobe_cache,
+    get_ffprobe_cache_info,
+    probe_many,
+    run_ffprobe,
+)
+from langflix.media.probe_index import ProbeIndex, set_probe_index
+
+PROBE = {'format': {'duration': '10.0'}, 'streams': [{'codec_type': 'video', 'width': 1080, 'height': 1920}]}
+
+
+@pytest.fixture
+def index(tmp_path):
+    probe_index = ProbeIndex(tmp_path / "probe_index.sqlite3")
+    set_probe_index(probe_index)
+    clear_ffprobe_cache()
+    yield probe_index
+    set_probe_index(None)
+    clear_ffprobe_cache()
+
+
+@pytest.fixture
+def videos(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"clip_{i}.mkv"
+        path.write_bytes(b"video" * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def _completed(stdout=json.dumps(PROBE)):
+    result = MagicMock()
+    result.stdout = stdout
+    return result
+
+
+class TestProbeIndex:
+    """Tests for ProbeIndex."""
+
+    def test_roundtrip_and_invalidation(self, index, videos):
+        key = _get_ffprobe_cache_key(videos[0])
+        assert index.get(key) is None
+
+        index.put(key, PROBE)
+
+        assert index.get(key) == PROBE
+        assert index.get((key[0], key[1] + 1, key[2])) is None
+        assert index.get((key[0], key[1], key[2] + 1)) is None
+        assert index.get_stats()['hits'] == 1
+
+    def test_shared_between_instances(self, tmp_path, videos):
+        key = _get_ffprobe_cache_key(videos[0])
+        ProbeIndex(tmp_path / "shared.sqlite3").put(key, PROBE)
+
+        assert ProbeIndex(tmp_path / "shared.sqlite3").get(key) == PROBE
+
+    def test_disabled_index_is_noop(self, tmp_path, videos):
+        disabled = ProbeIndex(tmp_path / "disabled.sqlite3", enabled=False)
+        key = _get_ffprobe_cache_key(videos[0])
+        disabled.put(key, PROBE)
+
+        assert disabled.get(key) is None
+        assert not (tmp_path / "disabled.sqlite3").exists()
+
+
+class TestRunFfprobeWithIndex:
+    """Tests for run_ffprobe reading through the persistent index."""
+
+    @patch('langflix.media.ffmpeg_utils.subprocess.run')
+    def test_restart_is_served_from_index(self, mock_run, index, videos):
+        mock_run.return_value = _completed()
+        assert run_ffprobe(videos[0]) == PROBE
+
+        clear_ffprobe_cache(persistent=False)  # simulates a new process
+        assert run_ffprobe(videos[0]) == PROBE
+
+        assert mock_run.call_count == 1
+        assert get_ffprobe_cache_info()['index_hits'] == 1
+
+
+class TestProbeMany:
+    """Tests for batch probing."""
+
+    @patch('langflix.media.ffmpeg_utils.subprocess.run')
+    def test_probes_only_unindexed_files(self, mock_run, index, videos):
+        index.put(_get_ffprobe_cache_key(videos[0]), PROBE)
+        mock_run.return_value = _completed()
+
+        results = probe_many(videos, max_workers=2)
+
+        assert set(results) == set(videos)
+        assert mock_run.call_count == 3
+        assert index.get_stats()['entries'] == 4
+
+        mock_run.reset_mock()
+        assert probe_many(videos) == results
+        mock_run.assert_not_called()
+
+    def test_failures_and_missing_files_are_left_out(self, index, videos, tmp_path):
+        def probe(path, timeout):
+            if path.endswith("clip_1.mkv"):
+                raise TimeoutError("slow")
+            return PROBE
+
+        with patch.object(ffmpeg_utils, '_probe_file', side_effect=probe):
+            results = probe_many(videos[:2] + [str(tmp_path / "missing.mkv")])
+
+        assert list(results) == [videos[0]]
+        assert index.get(_get_ffprobe_cache_key(videos[1])) is None
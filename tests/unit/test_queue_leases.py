@@ -0,0 +1,427 @@
+"""
+Unit tests for the lease-based multi-worker job queue (runs against fakeredis).
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from langflix.core.redis_client import RedisJobManager
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _manager(server):
+    with patch('langflix.core.redis_client.redis.from_url',
+               return_value=fakeredis.FakeRedis(server=server, decode_responses=True)):
+        manager = RedisJobManager("redis://fake")
+    manager._async_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    return manager
+
+
+@pytest.fixture
+def manager(server):
+    return _manager(server)
+
+
+def _enqueue(manager, *job_ids):
+    for job_id in job_ids:
+        manager.create_job(job_id, {"status": "QUEUED"})
+        manager.add_job_to_queue(job_id)
+
+
+class TestJobLeases:
+    """Tests for claiming, renewing, releasing and reaping job leases."""
+
+    def test_claims_are_fifo_and_exclusive(self, server):
+        first, second = _manager(server), _manager(server)
+        _enqueue(first, "job1", "job2", "job3")
+
+        assert first.claim_next_job("node-a", 60) == "job1"
+        assert second.claim_next_job("node-b", 60) == "job2"
+        assert first.claim_next_job("node-a", 60) == "job3"
+        assert second.claim_next_job("node-b", 60) is None
+
+        assert first.get_worker_jobs("node-a") == ["job1", "job3"]
+        assert first.get_queue_length() == 0
+
+    def test_processing_jobs_across_workers(self, manager):
+        _enqueue(manager, "job1", "job2")
+        manager.register_worker("node-a", 60)
+        manager.register_worker("node-b", 60)
+        manager.claim_next_job("node-a", 60)
+        manager.claim_next_job("node-b", 60)
+
+        assert manager.get_processing_jobs() == {"job1": "node-a", "job2": "node-b"}
+        assert manager.get_currently_processing_job() == "job1"
+
+    def test_release_removes_claim_and_lease(self, manager):
+        _enqueue(manager, "job1")
+        manager.claim_next_job("node-a", 60)
+
+        assert manager.release_job("node-a", "job1")
+        assert manager.get_worker_jobs("node-a") == []
+        assert not manager.redis_client.exists("jobs:lease:job1")
+        assert not manager.release_job("node-a", "job1")
+
+    def test_release_with_requeue_puts_job_first(self, manager):
+        _enqueue(manager, "job1", "job2")
+        manager.claim_next_job("node-a", 60)
+
+        manager.release_job("node-a", "job1", requeue=True)
+
+        assert manager.claim_next_job("node-b", 60) == "job1"
+
+    def test_expired_lease_requeued_once(self, server):
+        manager, other = _manager(server), _manager(server)
+        _enqueue(manager, "job1")
+        manager.register_worker("node-a", 60)
+        manager.claim_next_job("node-a", 0.05)
+        time.sleep(0.1)
+
+        assert manager.find_expired_leases() == [("node-a", "job1")]
+        assert manager.requeue_expired_job("node-a", "job1") == "requeued"
+        # A second reaper racing on the same job does nothing
+        assert other.requeue_expired_job("node-a", "job1") is None
+
+        assert manager.get_job("job1")["status"] == "QUEUED"
+        assert manager.claim_next_job("node-b", 60) == "job1"
+
+    def test_job_failed_after_max_requeues(self, manager):
+        _enqueue(manager, "job1")
+        for _ in range(2):
+            manager.claim_next_job("node-a", 60)
+            manager.redis_client.delete("jobs:lease:job1")
+            outcome = manager.requeue_expired_job("node-a", "job1", max_requeues=1)
+
+        assert outcome == "failed"
+        assert manager.get_job("job1")["status"] == "FAILED"
+        assert manager.get_queue_length() == 0
+
+    def test_renew_keeps_lease_and_reports_lost(self, manager):
+        _enqueue(manager, "job1", "job2")
+        manager.claim_next_job("node-a", 0.2)
+        manager.claim_next_job("node-a", 0.2)
+        manager.redis_client.set("jobs:lease:job2", "node-b")
+
+        lost = manager.renew_leases("node-a", ["job1", "job2"], 60)
+
+        assert lost == ["job2"]
+        assert manager.redis_client.pttl("jobs:lease:job1") > 1000
+
+    def test_gone_worker_without_jobs_unregistered(self, manager):
+        manager.register_worker("node-a", 0.05)
+        time.sleep(0.1)
+
+        manager.find_expired_leases()
+
+        assert manager.get_workers() == []
+
+    def test_processor_status_aggregated_across_workers(self, manager):
+        manager.register_worker("node-a", 60)
+        manager.register_worker("node-b", 60)
+        manager.set_processor_status("node-a", "processing", {"job_ids": ["job1"]}, 60)
+        # Written last, but must not hide the busy worker
+        manager.set_processor_status("node-b", "idle", {}, 60)
+
+        status = manager.get_processor_status()
+
+        assert status["status"] == "processing"
+        assert status["job_ids"] == ["job1"]
+        assert {w: s["status"] for w, s in status["workers"].items()} == {"node-a": "processing", "node-b": "idle"}
+        assert asyncio.run(manager.async_manager.get_processor_status()) == status
+
+    def test_processor_status_lives_as_long_as_heartbeats(self, manager):
+        manager.register_worker("node-a", 0.2)
+        manager.set_processor_status("node-a", "idle", {}, 0.2)
+
+        manager.renew_leases("node-a", [], 60)
+        time.sleep(0.3)
+        assert manager.get_processor_status()["status"] == "idle"
+
+        manager.unregister_worker("node-a")
+        assert manager.get_processor_status()["status"] == "unknown"
+
+
+class TestMultiWorkerQueueProcessor:
+    """Tests for QueueProcessor with several workers and job slots."""
+
+    @pytest.fixture
+    def make_processor(self, server):
+        from langflix.services.queue_processor import QueueProcessor
+
+        def make(worker_id, slots=1, job_time=0.05, processed=None):
+            with patch('langflix.services.queue_processor.get_redis_job_manager', return_value=_manager(server)):
+                processor = QueueProcessor(worker_id=worker_id, max_concurrent_jobs=slots)
+            processor.POLL_INTERVAL = 0.01
+            processor.CLAIM_TIMEOUT = 1
+
+            async def fake_process(job_id):
+                if processed is not None:
+                    processed.append((worker_id, job_id, len(processor._active_jobs)))
+                await asyncio.sleep(job_time)
+                await processor.redis.update_job(job_id, {"status": "COMPLETED"})
+
+            processor._process_job = fake_process
+            return processor
+        return make
+
+    async def _run_until_drained(self, processors, manager, timeout=5.0):
+        tasks = [asyncio.create_task(p.start()) for p in processors]
+        await asyncio.sleep(0.05)
+        deadline = time.monotonic() + timeout
+        while (manager.get_queue_length() or manager.get_processing_jobs()) and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+        for processor, task in zip(processors, tasks):
+            await processor.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def test_two_nodes_share_the_queue(self, make_processor, manager):
+        _enqueue(manager, *[f"job{i}" for i in range(6)])
+        processed = []
+        processors = [make_processor("node-a", processed=processed), make_processor("node-b", processed=processed)]
+
+        asyncio.run(self._run_until_drained(processors, manager))
+
+        assert sorted(job for _, job, _ in processed) == [f"job{i}" for i in range(6)]
+        assert {worker for worker, _, _ in processed} == {"node-a", "node-b"}
+        assert all(manager.get_job(f"job{i}")["status"] == "COMPLETED" for i in range(6))
+        assert manager.get_processing_jobs() == {}
+
+    def test_concurrent_slots_per_node(self, make_processor, manager):
+        _enqueue(manager, "job1", "job2", "job3")
+        processed = []
+        processor = make_processor("node-a", slots=3, job_time=0.2, processed=processed)
+
+        asyncio.run(self._run_until_drained([processor], manager))
+
+        assert max(active for _, _, active in processed) == 3
+
+    def test_restart_requeues_own_leftover_jobs(self, make_processor, manager):
+        _enqueue(manager, "job1")
+        manager.claim_next_job("node-a", 600)
+        processed = []
+
+        asyncio.run(self._run_until_drained([make_processor("node-a", processed=processed)], manager))
+
+        assert [job for _, job, _ in processed] == ["job1"]
+
+    def test_lost_lease_result_is_discarded(self, server, manager, tmp_path):
+        from langflix.services.queue_processor import QueueProcessor
+
+        video, subtitle = tmp_path / "ep.mkv", tmp_path / "ep.srt"
+        video.write_bytes(b"v")
+        subtitle.write_text("1")
+        manager.create_job("job1", {"status": "QUEUED", "video_path": str(video),
+                                    "subtitle_path": str(subtitle), "output_dir": str(tmp_path)})
+        manager.add_job_to_queue("job1")
+
+        with patch('langflix.services.queue_processor.get_redis_job_manager', return_value=_manager(server)):
+            processor = QueueProcessor(worker_id="node-a")
+        processor.CLAIM_TIMEOUT = 0.1
+        processor.lease_ttl = 0.1
+        processor.heartbeat_interval = 0.3
+        processor.reap_interval = 60
+        processor._check_disk_space = lambda *args: None
+        other = _manager(server)
+        finished = []
+
+        def process_video(**kwargs):
+            # The lease expires mid-run and another node takes the job over
+            time.sleep(0.2)
+            assert other.requeue_expired_job("node-a", "job1") == "requeued"
+            assert other.claim_next_job("node-b", 60) == "job1"
+            time.sleep(0.3)
+            kwargs["progress_callback"](90, "almost done")
+            finished.append(True)
+            return {"final_video": "out.mkv"}
+
+        async def run():
+            task = asyncio.create_task(processor.start())
+            while not finished or processor._active_jobs:
+                await asyncio.sleep(0.02)
+            await processor.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        with patch('langflix.services.video_pipeline_service.VideoPipelineService') as service:
+            service.return_value.process_video.side_effect = process_video
+            asyncio.run(run())
+
+        job = manager.get_job("job1")
+        assert job["status"] != "COMPLETED"
+        assert job.get("progress") != "90"
+        assert manager.redis_client.get("jobs:lease:job1") == "node-b"
+        assert manager.get_worker_jobs("node-b") == ["job1"]
+
+    def test_reaper_needs_two_passes(self, make_processor, manager):
+        _enqueue(manager, "job1")
+        manager.register_worker("crashed", 600)
+        manager.claim_next_job("crashed", 600)
+        manager.redis_client.delete("jobs:lease:job1")
+        processor = make_processor("node-a")
+
+        assert asyncio.run(processor._reap_expired_leases()) == 0
+        assert asyncio.run(processor._reap_expired_leases()) == 1
+        assert manager.get_queue_length() == 1
+
+
+class TestEventDrivenQueue:
+    """Tests for blocking claims, status transitions and job events."""
+
+    def test_blocking_claim_wakes_on_enqueue(self, manager):
+        manager.create_job("job1", {"status": "QUEUED"})
+
+        async def scenario():
+            claim = asyncio.create_task(manager.async_manager.claim_next_job_blocking("node-a", 60, timeout_seconds=5))
+            await asyncio.sleep(0.1)
+            assert not claim.done()
+            started = time.monotonic()
+            manager.add_job_to_queue("job1")
+            job_id = await claim
+            return job_id, time.monotonic() - started
+
+        job_id, latency = asyncio.run(scenario())
+
+        assert job_id == "job1"
+        assert latency < 0.5
+        assert manager.get_processing_jobs() == {"job1": "node-a"}
+        assert manager.redis_client.get("jobs:lease:job1") == "node-a"
+
+    def test_blocking_claim_times_out(self, manager):
+        assert asyncio.run(manager.async_manager.claim_next_job_blocking("node-a", 60, timeout_seconds=1)) is None
+
+    def test_status_changes_published(self, manager):
+        manager.create_job("job1", {"status": "QUEUED"})
+
+        async def scenario():
+            events = []
+
+            async def listen():
+                async for event in manager.async_manager.listen_job_events("job1"):
+                    events.append(event)
+                    if len(events) == 2:
+                        return
+
+            listener = asyncio.create_task(listen())
+            await asyncio.sleep(0.1)
+            manager.add_job_to_queue("job1")
+            manager.update_job("job2", {"status": "PROCESSING"})
+            manager.update_job("job1", {"progress": 50})
+            manager.update_job("job1", {"status": "COMPLETED"})
+            await asyncio.wait_for(listener, timeout=2)
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert [(e["job_id"], e["event"], e.get("status")) for e in events] == [
+            ("job1", "enqueued", None),
+            ("job1", "status", "COMPLETED"),
+        ]
+
+    def test_idle_status_written_once(self, server, manager):
+        from langflix.services.queue_processor import QueueProcessor
+
+        with patch('langflix.services.queue_processor.get_redis_job_manager', return_value=_manager(server)):
+            processor = QueueProcessor(worker_id="node-a")
+        processor.CLAIM_TIMEOUT = 1
+        processor.redis.set_processor_status = AsyncMock(wraps=processor.redis.set_processor_status)
+
+        async def scenario():
+            task = asyncio.create_task(processor.start())
+            await asyncio.sleep(2.5)  # Two idle claim timeouts
+            await processor.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        asyncio.run(scenario())
+
+        statuses = [c.args[1] for c in processor.redis.set_processor_status.call_args_list]
+        assert statuses == ['idle']
+
+    def test_waiting_status_rewritten_when_next_run_changes(self, server):
+        from langflix.services.queue_processor import QueueProcessor
+
+        with patch('langflix.services.queue_processor.get_redis_job_manager', return_value=_manager(server)):
+            processor = QueueProcessor(worker_id="node-a")
+        processor.redis.set_processor_status = AsyncMock(return_value=True)
+
+        async def scenario():
+            for next_run in ("t1", "t1", "t2"):
+                await processor._set_status('waiting', {'next_run': next_run}, key=('quota_limit', next_run))
+
+        asyncio.run(scenario())
+
+        written = [c.args[2]['next_run'] for c in processor.redis.set_processor_status.call_args_list]
+        assert written == ["t1", "t2"]
+
+    def test_progress_published_on_job_channel_only(self, manager):
+        manager.create_job("job1", {"status": "PROCESSING"})
+
+        async def scenario():
+            job_events, all_events = [], []
+
+            async def listen(target, **kwargs):
+                async for event in manager.async_manager.listen_job_events(**kwargs):
+                    target.append(event)
+                    if event.get("event") == "status":
+                        return
+
+            listeners = [
+                asyncio.create_task(listen(job_events, job_id="job1", include_progress=True)),
+                asyncio.create_task(listen(all_events)),
+            ]
+            await asyncio.sleep(0.1)
+            manager.update_job("job1", {"progress": 40, "current_step": "Rendering"})
+            manager.update_job("job1", {"status": "COMPLETED", "progress": 100})
+            await asyncio.wait_for(asyncio.gather(*listeners), timeout=2)
+            return job_events, all_events
+
+        job_events, all_events = asyncio.run(scenario())
+
+        assert [(e["event"], e.get("progress")) for e in job_events] == [("progress", 40.0), ("status", 100.0)]
+        assert job_events[0]["current_step"] == "Rendering"
+        assert [e["event"] for e in all_events] == ["status"]
+
+    def test_watch_job_coalesces_progress(self, manager):
+        manager.create_job("job1", {"job_id": "job1", "status": "PROCESSING", "progress": "0"})
+
+        async def scenario():
+            events = []
+
+            async def watch():
+                async for event in manager.async_manager.watch_job("job1", progress_interval=0.3, keepalive=5):
+                    events.append(event)
+
+            watcher = asyncio.create_task(watch())
+            await asyncio.sleep(0.1)
+            for progress in range(1, 21):
+                manager.update_job("job1", {"progress": progress, "current_step": f"Step {progress}"})
+            await asyncio.sleep(0.5)
+            manager.update_job("job1", {"status": "COMPLETED", "progress": 100})
+            await asyncio.wait_for(watcher, timeout=2)
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert events[0]["event"] == "snapshot" and events[0]["status"] == "PROCESSING"
+        progress = [e for e in events if e["event"] == "progress"]
+        assert 1 <= len(progress) <= 3  # 20 updates coalesced
+        assert progress[-1]["progress"] == 20.0 and progress[-1]["current_step"] == "Step 20"
+        assert events[-1]["event"] == "status" and events[-1]["status"] == "COMPLETED"
+
+    def test_watch_finished_or_missing_job(self, manager):
+        manager.create_job("done", {"job_id": "done", "status": "COMPLETED"})
+
+        async def collect(job_id):
+            return [event async for event in manager.async_manager.watch_job(job_id)]
+
+        assert [e["event"] for e in asyncio.run(collect("done"))] == ["snapshot"]
+        assert asyncio.run(collect("missing")) == []
@@ -0,0 +1,119 @@
+"""
+Unit tests for LLM rate limiting (token buckets).
+"""
+import threading
+
+import pytest
+
+from langflix.core.rate_limiter import TokenBucket, LLMRateLimiter
+
+
+class FakeClock:
+    """Deterministic clock whose sleep() advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_up_to_capacity_without_waiting(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=3, rate_per_second=1, clock=clock, sleep=clock.sleep)
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_waits_when_empty(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, rate_per_second=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire(2)
+
+        waited = bucket.acquire(1)
+        assert waited == pytest.approx(1.0)
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, rate_per_second=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire(2)
+        clock.now += 2.0
+
+        assert bucket.acquire(2) == 0.0
+
+    def test_reservations_queue_in_order(self):
+        """Each over-budget caller waits progressively longer."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=1, rate_per_second=1, clock=clock, sleep=clock.sleep)
+        bucket.reserve(1)
+
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+
+    def test_oversized_request_is_clamped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=10, rate_per_second=10, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire(1000) == 0.0
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0, rate_per_second=1)
+
+
+class TestLLMRateLimiter:
+    """Tests for the combined requests/tokens limiter."""
+
+    def test_unlimited_by_default(self):
+        limiter = LLMRateLimiter()
+        assert not limiter.enabled
+        assert limiter.acquire(tokens=10_000) == 0.0
+        assert limiter.total_requests == 1
+
+    def test_requests_per_minute(self):
+        clock = FakeClock()
+        limiter = LLMRateLimiter(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        waited = limiter.acquire()
+
+        # 2 req/min refills one request every 30s
+        assert waited == pytest.approx(30.0)
+        assert limiter.total_wait_seconds == pytest.approx(30.0)
+
+    def test_tokens_per_minute(self):
+        clock = FakeClock()
+        limiter = LLMRateLimiter(tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(tokens=6000)
+        waited = limiter.acquire(tokens=3000)
+
+        # 6000 tokens/min = 100 tokens/s
+        assert waited == pytest.approx(30.0)
+
+    def test_max_wait_exceeded_reserves_nothing(self):
+        clock = FakeClock()
+        limiter = LLMRateLimiter(requests_per_minute=2, tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire(tokens=6000)
+        with pytest.raises(TimeoutError):
+            limiter.acquire(tokens=3000, max_wait=10.0)
+        waited = limiter.acquire(tokens=3000, max_wait=30.0)
+
+        # The refused request did not push the next one back
+        assert waited == pytest.approx(30.0)
+        assert limiter.total_requests == 2
+
+    def test_estimate_tokens(self):
+        assert LLMRateLimiter.estimate_tokens("") == 1
+        assert LLMRateLimiter.estimate_tokens("x" * 400) == 101
@@ -0,0 +1,185 @@
+"""
+Unit tests for pipelined bulk job reads in RedisJobManager and AsyncRedisJobManager (runs against fakeredis).
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from langflix.core import redis_client
+from langflix.core.redis_client import JOB_SUMMARY_FIELDS, AsyncRedisJobManager, RedisJobManager
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def manager(server):
+    with patch('langflix.core.redis_client.redis.from_url',
+               return_value=fakeredis.FakeRedis(server=server, decode_responses=True)):
+        return RedisJobManager("redis://fake")
+
+
+def _create_jobs(manager, count):
+    for i in range(count):
+        job_id = f"job{i:03d}"
+        manager.create_job(job_id, {"job_id": job_id, "status": "QUEUED", "progress": "0"})
+        manager.update_job(job_id, {"progress": i, "expressions": [{"expression": f"expr {i}"}]})
+
+
+class TestBulkJobReads:
+    """Tests for get_jobs, get_all_jobs and get_jobs_page."""
+
+    def test_get_jobs_matches_get_job(self, manager):
+        _create_jobs(manager, 3)
+
+        jobs = manager.get_jobs(["job002", "missing", "job000"])
+
+        assert list(jobs) == ["job002", "job000"]
+        assert jobs["job002"] == manager.get_job("job002")
+        assert jobs["job002"]["expressions"] == [{"expression": "expr 2"}]
+        assert jobs["job002"]["progress"] == 2.0
+
+    def test_get_jobs_is_one_round_trip(self, manager):
+        _create_jobs(manager, 20)
+
+        with patch.object(manager.redis_client, 'hgetall') as hgetall:
+            jobs = manager.get_jobs([f"job{i:03d}" for i in range(20)])
+
+        hgetall.assert_not_called()  # Reads go through the pipeline
+        assert len(jobs) == 20
+
+    def test_summary_projection_skips_large_fields(self, manager):
+        _create_jobs(manager, 2)
+
+        jobs = manager.get_all_jobs(summary=True)
+
+        assert sorted(jobs) == ["job000", "job001"]
+        assert "expressions" not in jobs["job001"]
+        assert set(jobs["job001"]) <= set(JOB_SUMMARY_FIELDS)
+        assert jobs["job001"]["progress"] == 1.0
+
+    def test_pages_cover_every_job_once(self, manager):
+        _create_jobs(manager, 25)
+
+        seen = []
+        cursor = 0
+        while True:
+            jobs, cursor, total = manager.get_jobs_page(cursor=cursor, count=10)
+            seen.extend(jobs)
+            assert total == 25
+            if cursor is None:
+                break
+
+        assert sorted(set(seen)) == [f"job{i:03d}" for i in range(25)]
+
+    def test_filtered_pages_are_not_empty_until_the_last(self, manager):
+        _create_jobs(manager, 40)
+        failed = [f"job{i:03d}" for i in range(0, 40, 7)]
+        for job_id in failed:
+            manager.update_job(job_id, {"status": "FAILED"})
+
+        seen = []
+        cursor = 0
+        while True:
+            jobs, cursor, total = manager.get_jobs_page(cursor=cursor, count=2, status="FAILED")
+            assert total is None
+            assert all(job["status"] == "FAILED" for job in jobs.values())
+            seen.extend(jobs)
+            if cursor is None:
+                break
+            assert jobs
+
+        assert sorted(set(seen)) == failed
+
+    def test_queued_jobs_and_batch_details(self, manager):
+        _create_jobs(manager, 3)
+        manager.update_job("job001", {"status": "PROCESSING"})
+        manager.create_batch("b1", [{"job_id": "job000"}, {"job_id": "job001"}], {})
+
+        assert sorted(manager.get_all_queued_jobs()) == ["job000", "job002"]
+        details = manager.get_batch_status("b1")["job_details"]
+        assert [job["job_id"] for job in details] == ["job000", "job001"]
+
+
+class TestAsyncJobManager:
+    """Tests for AsyncRedisJobManager against the same data as the sync manager."""
+
+    @pytest.fixture
+    def async_manager(self, server):
+        return AsyncRedisJobManager(fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+
+    def test_reads_match_sync_manager(self, manager, async_manager):
+        _create_jobs(manager, 3)
+
+        async def scenario():
+            return (await async_manager.get_job("job002"),
+                    await async_manager.get_all_jobs(summary=True),
+                    await async_manager.get_jobs_page(cursor=0, count=10))
+
+        job, summaries, (page, next_cursor, total) = asyncio.run(scenario())
+
+        assert job == manager.get_job("job002")
+        assert summaries == manager.get_all_jobs(summary=True)
+        assert sorted(page) == ["job000", "job001", "job002"] and next_cursor is None and total == 3
+
+    def test_update_job_keeps_progress_monotonic(self, manager, async_manager):
+        _create_jobs(manager, 3)
+
+        asyncio.run(async_manager.update_job("job002", {"progress": 1, "current_step": "late callback"}))
+
+        job = manager.get_job("job002")
+        assert job["progress"] == 2.0
+        assert job["current_step"] == "late callback"
+
+    def test_shared_clients_are_per_event_loop(self):
+        manager = AsyncRedisJobManager(redis_url="redis://fake:6379/0")
+
+        async def clients():
+            return manager.redis_client, manager.redis_client
+
+        (first, again), (second, _) = asyncio.run(clients()), asyncio.run(clients())
+
+        assert first is again
+        assert first is not second
+
+    def test_subscriptions_use_their_own_pool(self):
+        manager = AsyncRedisJobManager(redis_url="redis://fake:6379/0")
+
+        async def clients():
+            return manager.redis_client, manager.pubsub_client, manager.pubsub_client
+
+        client, pubsub_client, again = asyncio.run(clients())
+
+        assert pubsub_client is again
+        assert pubsub_client.connection_pool is not client.connection_pool
+        assert pubsub_client.connection_pool.max_connections == 100
+
+    def test_shared_client_waits_for_a_free_connection(self, monkeypatch):
+        import redis.asyncio as aioredis
+        monkeypatch.setenv("REDIS_ASYNC_MAX_CONNECTIONS", "5")
+        monkeypatch.setenv("REDIS_ASYNC_POOL_TIMEOUT", "2.5")
+
+        async def pool():
+            return AsyncRedisJobManager(redis_url="redis://fake:6379/0").redis_client.connection_pool
+
+        pool = asyncio.run(pool())
+
+        assert isinstance(pool, aioredis.BlockingConnectionPool)
+        assert (pool.max_connections, pool.timeout) == (5, 2.5)
+
+    def test_close_drops_clients_of_running_loop(self):
+        async def scenario():
+            manager = redis_client.get_async_redis_job_manager()
+            client = manager.redis_client
+            await redis_client.close_async_redis_pools()
+            return client, manager, redis_client.get_async_redis_job_manager().redis_client
+
+        client, manager, reopened = asyncio.run(scenario())
+
+        assert reopened is not client
+        assert redis_client.get_async_redis_job_manager() is not manager
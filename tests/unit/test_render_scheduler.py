@@ -0,0 +1,304 @@
+"""
+Unit tests for the per-expression render scheduler.
+"""
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from langflix.core.parallel_processor import ResourceManager
+from unittest.mock import patch
+
+from langflix.services import render_scheduler
+from langflix.services.render_scheduler import (
+    RenderScheduler,
+    RenderTask,
+    RenderResult,
+    get_render_worker_count,
+    render_expression_languages,
+)
+
+
+def _task(index, expression_text=None, tmp_path=Path("/tmp"), language_code="ko"):
+    return RenderTask(
+        index=index,
+        expression={'expression': expression_text or f"expression {index}"},
+        language_code=language_code,
+        episode_name="S01E01",
+        original_video=str(tmp_path / "video.mkv"),
+        raw_clip_path=tmp_path / f"raw_{index}.mkv",
+        subtitle_path=tmp_path / language_code / f"sub_{index}.srt",
+        final_videos_dir=tmp_path / language_code / "expressions",
+    )
+
+
+class _Recorder:
+    """Fake render function that tracks concurrency per conflict key."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.active_keys = set()
+        self.key_overlap = False
+
+    def __call__(self, task):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if task.conflict_key in self.active_keys:
+                self.key_overlap = True
+            self.active_keys.add(task.conflict_key)
+        time.sleep(self.delays.get(task.index, 0.02))
+        with self.lock:
+            self.in_flight -= 1
+            self.active_keys.discard(task.conflict_key)
+        if task.index == 99:
+            return RenderResult(index=task.index, error="boom")
+        return RenderResult(index=task.index, output_path=f"expression_{task.index:02d}.mkv")
+
+
+def _render_with_stub_editor(task):
+    """Runs render_expression in a worker process with an editor that only records the slide start."""
+    def create_long_form_video(editor, expression, *args, **kwargs):
+        expression['educational_slide_start_time'] = 12.5
+        return editor.output_dir / f"expression_{task.index:02d}.mkv"
+
+    with patch('langflix.core.video_editor.VideoEditor.create_long_form_video', autospec=True,
+               side_effect=create_long_form_video):
+        return render_scheduler.render_expression(task)
+
+
+@pytest.fixture
+def parallel_enabled(monkeypatch):
+    from langflix import settings
+    monkeypatch.setattr(settings, 'is_parallel_rendering_enabled', lambda: True)
+    monkeypatch.setattr(settings, 'get_parallel_rendering_max_workers', lambda: None)
+    monkeypatch.setattr(settings, 'is_multi_language_render_enabled', lambda: True)
+
+
+class TestRenderScheduler:
+    """Tests for RenderScheduler ordering, concurrency and progress."""
+
+    def test_results_in_task_order(self, parallel_enabled):
+        # Later tasks finish first
+        render = _Recorder(delays={1: 0.15, 2: 0.1, 3: 0.01})
+        scheduler = RenderScheduler(max_workers=3, use_processes=False, render_fn=render)
+
+        results = scheduler.run([_task(1), _task(2), _task(3)])
+
+        assert [r.index for r in results] == [1, 2, 3]
+        assert [r.output_path for r in results] == ["expression_01.mkv", "expression_02.mkv", "expression_03.mkv"]
+        assert render.max_in_flight > 1
+
+    def test_concurrency_bounded(self, parallel_enabled):
+        render = _Recorder()
+        scheduler = RenderScheduler(max_workers=2, use_processes=False, render_fn=render)
+
+        scheduler.run([_task(i) for i in range(1, 7)])
+
+        assert render.max_in_flight <= 2
+
+    def test_same_expression_text_never_overlaps(self, parallel_enabled):
+        render = _Recorder()
+        scheduler = RenderScheduler(max_workers=4, use_processes=False, render_fn=render)
+        tasks = [_task(1, "same"), _task(2, "same"), _task(3, "other"), _task(4, "same")]
+
+        results = scheduler.run(tasks)
+
+        assert not render.key_overlap
+        assert [r.index for r in results] == [1, 2, 3, 4]
+
+    def test_progress_reported_per_expression(self, parallel_enabled):
+        calls = []
+        scheduler = RenderScheduler(max_workers=2, use_processes=False, render_fn=_Recorder())
+
+        scheduler.run(
+            [_task(1), _task(2), _task(99)],
+            on_result=lambda result, completed, total: calls.append((result.index, completed, total))
+        )
+
+        assert sorted(c[0] for c in calls) == [1, 2, 99]
+        assert [c[1] for c in calls] == [1, 2, 3]
+        assert all(c[2] == 3 for c in calls)
+
+    def test_failed_render_reported_not_raised(self, parallel_enabled):
+        scheduler = RenderScheduler(max_workers=2, use_processes=False, render_fn=_Recorder())
+
+        results = scheduler.run([_task(1), _task(99)])
+
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].error == "boom"
+
+    def test_sequential_when_disabled(self, monkeypatch):
+        from langflix import settings
+        monkeypatch.setattr(settings, 'is_parallel_rendering_enabled', lambda: False)
+        render = _Recorder()
+
+        RenderScheduler(max_workers=4, use_processes=False, render_fn=render).run([_task(i) for i in range(1, 4)])
+
+        assert render.max_in_flight == 1
+
+    def test_process_pool_round_trip(self, parallel_enabled, tmp_path):
+        """Tasks and results survive pickling; missing inputs become error results."""
+        results = RenderScheduler(max_workers=2).run([_task(1, tmp_path=tmp_path), _task(2, tmp_path=tmp_path)])
+
+        assert [r.index for r in results] == [1, 2]
+        assert all(not r.success and r.error for r in results)
+
+    def test_slide_start_copied_back_from_worker_process(self, parallel_enabled, tmp_path):
+        """ShortFormCreator reads the slide start from the parent's expression."""
+        tasks = [_task(1, tmp_path=tmp_path), _task(2, tmp_path=tmp_path)]
+
+        results = RenderScheduler(max_workers=2, render_fn=_render_with_stub_editor).run(tasks)
+
+        assert all(r.success for r in results)
+        assert [t.expression['educational_slide_start_time'] for t in tasks] == [12.5, 12.5]
+
+
+    def test_worker_logging_mirrors_parent(self, tmp_path):
+        log_file = tmp_path / "render.log"
+        config = {'level': logging.DEBUG, 'format': "%(name)s|%(message)s", 'log_files': [str(log_file)]}
+        root = logging.getLogger()
+        saved = (root.level, list(root.handlers))
+        try:
+            render_scheduler._init_render_worker(config)
+            logging.getLogger("langflix.worker").debug("rendered")
+            assert render_scheduler._get_logging_config() == config
+        finally:
+            for handler in root.handlers:
+                handler.close()
+            root.handlers[:] = saved[1]
+            root.setLevel(saved[0])
+
+        assert log_file.read_text() == "langflix.worker|rendered\n"
+
+    def test_worker_editor_gets_subtitle_processor(self, tmp_path):
+        subtitle_file = tmp_path / "episode.srt"
+        subtitle_file.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8")
+        task = _task(1, tmp_path=tmp_path)
+        task.source_subtitle_file = str(subtitle_file)
+
+        editor = render_scheduler._create_editor(task)
+
+        assert editor.subtitle_processor.subtitle_file_path == str(subtitle_file)
+
+
+class _MultiRecorder:
+    """Fake multi-language render function recording the task groups it receives."""
+
+    def __init__(self):
+        self.groups = []
+        self.lock = threading.Lock()
+
+    def __call__(self, tasks):
+        with self.lock:
+            self.groups.append([(t.language_code, t.index) for t in tasks])
+        return [RenderResult(index=t.index, output_path=f"{t.language_code}/expression_{t.index:02d}.mkv") for t in tasks]
+
+
+class TestMultiLanguageRendering:
+    """Tests for rendering all languages of a raw clip together."""
+
+    def _language_tasks(self, tmp_path):
+        return [_task(i, tmp_path=tmp_path, language_code=lang) for lang in ("ko", "ja", "es") for i in (1, 2)]
+
+    def test_languages_sharing_a_clip_rendered_together(self, parallel_enabled, tmp_path):
+        multi = _MultiRecorder()
+        render = _Recorder()
+        scheduler = RenderScheduler(max_workers=2, use_processes=False, render_fn=render, multi_render_fn=multi)
+
+        results = scheduler.run(self._language_tasks(tmp_path))
+
+        assert sorted(multi.groups) == [
+            [("ko", 1), ("ja", 1), ("es", 1)],
+            [("ko", 2), ("ja", 2), ("es", 2)],
+        ]
+        assert render.max_in_flight == 0
+        assert [r.output_path for r in results] == [
+            "ko/expression_01.mkv", "ko/expression_02.mkv",
+            "ja/expression_01.mkv", "ja/expression_02.mkv",
+            "es/expression_01.mkv", "es/expression_02.mkv",
+        ]
+
+    def test_disabled_renders_each_language(self, parallel_enabled, monkeypatch, tmp_path):
+        from langflix import settings
+        monkeypatch.setattr(settings, 'is_multi_language_render_enabled', lambda: False)
+        multi = _MultiRecorder()
+        calls = []
+
+        def render(task):
+            calls.append((task.language_code, task.index))
+            return RenderResult(index=task.index, output_path="out.mkv")
+
+        RenderScheduler(max_workers=2, use_processes=False, render_fn=render, multi_render_fn=multi).run(
+            self._language_tasks(tmp_path)
+        )
+
+        assert not multi.groups
+        assert len(calls) == 6
+
+    def test_combined_render_single_ffmpeg_call(self, tmp_path):
+        tasks = [_task(1, tmp_path=tmp_path, language_code=lang) for lang in ("ko", "ja")]
+
+        def prepare(editor, expression, original_video, **kwargs):
+            return f"spec-{editor.language_code}", editor.output_dir / "expression_01.mkv", {'vcodec': 'libx264'}
+
+        with patch('langflix.core.video_editor.VideoEditor.prepare_long_form_render', autospec=True, side_effect=prepare), \
+             patch('langflix.core.video.long_form_compositor.render_multi_output') as render_multi, \
+             patch('langflix.services.output_manager.OutputManager.ensure_write_permissions'), \
+             patch.object(render_scheduler.settings, 'get_long_form_compositor', return_value='single_pass'):
+            results = render_expression_languages(tasks)
+
+        render_multi.assert_called_once()
+        assert render_multi.call_args[0][0] == ["spec-ko", "spec-ja"]
+        assert all(r.success for r in results)
+        assert results[1].output_path == str(tmp_path / "ja" / "expressions" / "expression_01.mkv")
+
+    def test_failed_combined_render_falls_back_per_language(self, tmp_path):
+        tasks = [_task(1, tmp_path=tmp_path, language_code=lang) for lang in ("ko", "ja")]
+        fallback = [RenderResult(index=1, output_path="ko.mkv"), RenderResult(index=1, output_path="ja.mkv")]
+
+        with patch('langflix.core.video_editor.VideoEditor.prepare_long_form_render', side_effect=RuntimeError("no clip")), \
+             patch.object(render_scheduler.settings, 'get_long_form_compositor', return_value='single_pass'), \
+             patch.object(render_scheduler, 'render_expression', side_effect=fallback) as render:
+            results = render_expression_languages(tasks)
+
+        assert render.call_count == 2
+        assert [r.output_path for r in results] == ["ko.mkv", "ja.mkv"]
+
+
+class TestRenderWorkerCount:
+    """Tests for worker sizing."""
+
+    def test_single_task_is_sequential(self, parallel_enabled):
+        assert get_render_worker_count(1, max_workers=8) == 1
+
+    def test_capped_by_task_count(self, parallel_enabled):
+        assert get_render_worker_count(3, max_workers=8) == 3
+
+    def test_resource_manager_memory_bound(self):
+        manager = ResourceManager()
+        manager.cpu_count = 32
+        manager._get_memory_info = lambda: {'total_gb': 64.0, 'available_gb': 16.0, 'percent_used': 75.0}
+
+        # 16GB / 2GB per render = 8 renders, below the 16 CPU-bound workers
+        assert manager.get_render_workers(2.0) == 8
+
+    def test_resource_manager_cpu_bound(self):
+        manager = ResourceManager()
+        manager.cpu_count = 8
+        manager._get_memory_info = lambda: {'total_gb': 256.0, 'available_gb': 200.0, 'percent_used': 20.0}
+
+        assert manager.get_render_workers(2.0) == 4
+
+    def test_resource_manager_low_memory_still_one_worker(self):
+        manager = ResourceManager()
+        manager.cpu_count = 8
+        manager._get_memory_info = lambda: {'total_gb': 2.0, 'available_gb': 0.5, 'percent_used': 75.0}
+
+        assert manager.get_render_workers(2.0) == 1
@@ -0,0 +1,167 @@
+"""
+Unit tests for concurrent chunk analysis in ScriptAgent.
+
+Uses FakeGeminiClient so no API key or network is needed.
+"""
+import time
+
+import pytest
+
+from langflix.core.fake_llm_client import FakeGeminiClient
+from langflix.core.llm_response_cache import LLMResponseCache
+from langflix.core.rate_limiter import LLMRateLimiter
+from langflix.pipeline.agents.script_agent import ScriptAgent
+
+
+def _make_chunks(num_chunks, lines_per_chunk=12):
+    chunks = []
+    for c in range(num_chunks):
+        lines = [
+            f"[{i}] [00:00:{i:02d},000 --> 00:00:{i:02d},900] Chunk {c + 1} line {i}"
+            for i in range(lines_per_chunk)
+        ]
+        chunks.append({'chunk_id': c + 1, 'script': '\n'.join(lines)})
+    return chunks
+
+
+def _run(agent, chunks, **kwargs):
+    return list(agent.analyze_chunks_generator(
+        chunks=chunks,
+        target_chunks=chunks,
+        show_bible="",
+        target_language="Korean",
+        target_language_code="ko",
+        source_language="English",
+        source_language_code="en",
+        **kwargs
+    ))
+
+
+@pytest.fixture
+def make_agent(tmp_path):
+    def _make(client):
+        return ScriptAgent(
+            show_name="Test Show",
+            output_dir=str(tmp_path),
+            client=client,
+            rate_limiter=LLMRateLimiter(),
+            response_cache=LLMResponseCache(tmp_path / "llm_cache.sqlite3", enabled=False)
+        )
+    return _make
+
+
+class TestScriptAgentConcurrency:
+    """Tests for ordered, capped concurrent chunk analysis."""
+
+    def test_yields_in_chunk_order(self, make_agent):
+        client = FakeGeminiClient(latency_seconds=0.02)
+        results = _run(make_agent(client), _make_chunks(5), max_concurrency=3)
+
+        assert [r.chunk_id for r in results] == [1, 2, 3, 4, 5]
+        assert all(len(r.expressions) == 2 for r in results)
+        assert client.max_in_flight > 1
+
+    def test_concurrent_matches_sequential(self, make_agent):
+        chunks = _make_chunks(4)
+        sequential = _run(make_agent(FakeGeminiClient()), chunks, max_concurrency=1)
+        concurrent = _run(make_agent(FakeGeminiClient()), chunks, max_concurrency=4)
+
+        strip = lambda results: [
+            (r.chunk_id, [e['context_start_time'] for e in r.expressions]) for r in results
+        ]
+        assert strip(sequential) == strip(concurrent)
+
+    def test_total_expression_cap_is_deterministic(self, make_agent):
+        """Cap is applied in chunk order regardless of completion order."""
+        results = _run(make_agent(FakeGeminiClient()), _make_chunks(6), max_concurrency=4, max_total_expressions=3)
+
+        assert [r.chunk_id for r in results] == [1, 2]
+        assert [len(r.expressions) for r in results] == [2, 1]
+
+    def test_cap_bounds_wasted_calls(self, make_agent):
+        """Stopping early launches at most `concurrency` calls beyond what's needed."""
+        client = FakeGeminiClient(latency_seconds=0.01)
+        _run(make_agent(client), _make_chunks(10), max_concurrency=2, max_total_expressions=2)
+
+        time.sleep(0.05)
+        assert client.call_count <= 3
+
+    def test_concurrency_bounded(self, make_agent):
+        client = FakeGeminiClient(latency_seconds=0.05)
+        _run(make_agent(client), _make_chunks(6), max_concurrency=2)
+
+        assert client.max_in_flight <= 2
+        assert client.call_count == 6
+
+    def test_failed_chunk_yields_empty_result(self, make_agent):
+        """A failing LLM call produces an empty result without breaking ordering."""
+        client = FakeGeminiClient()
+        original = client.generate_content
+
+        def flaky(prompt, generation_config=None, request_options=None):
+            if "Chunk 2 line" in prompt:
+                raise RuntimeError("quota exceeded")
+            return original(prompt, generation_config, request_options)
+
+        client.generate_content = flaky
+        results = _run(make_agent(client), _make_chunks(3), max_concurrency=3)
+
+        assert [r.chunk_id for r in results] == [1, 2, 3]
+        assert results[1].expressions == []
+        assert "quota exceeded" in results[1].chunk_summary
+
+    def test_chunk_timeout_stops_the_llm_call(self, make_agent, monkeypatch):
+        """A timed-out chunk fails without leaving its request running."""
+        from langflix import settings
+        monkeypatch.setattr(settings, 'get_parallel_llm_timeout', lambda: 0.05)
+
+        client = FakeGeminiClient(latency_seconds=1.0)
+        start = time.monotonic()
+        results = _run(make_agent(client), _make_chunks(2), max_concurrency=2)
+
+        assert time.monotonic() - start < 0.5
+        assert [r.chunk_id for r in results] == [1, 2]
+        assert all(r.expressions == [] and "timed out" in r.chunk_summary for r in results)
+        assert client.in_flight == 0
+
+    def test_chunk_timeout_caps_rate_limit_wait(self, make_agent, monkeypatch):
+        """No quota is reserved for a request that could not be sent before the timeout."""
+        from langflix import settings
+        monkeypatch.setattr(settings, 'get_parallel_llm_timeout', lambda: 0.05)
+
+        client = FakeGeminiClient()
+        agent = make_agent(client)
+        agent.rate_limiter = LLMRateLimiter(requests_per_minute=1)
+        results = _run(agent, _make_chunks(2), max_concurrency=2)
+
+        # Whichever chunk takes the single request slot succeeds; the other fails fast
+        assert sorted(len(r.expressions) for r in results) == [0, 2]
+        assert any("rate limit" in r.chunk_summary for r in results)
+        assert client.call_count == 1
+
+    def test_defaults_to_sequential_when_parallel_disabled(self, make_agent, monkeypatch):
+        from langflix import settings
+        monkeypatch.setattr(settings, 'get_parallel_llm_processing_enabled', lambda: False)
+
+        client = FakeGeminiClient(latency_seconds=0.02)
+        _run(make_agent(client), _make_chunks(3))
+
+        assert client.max_in_flight == 1
+
+    def test_rate_limiter_is_consulted(self, make_agent):
+        class CountingLimiter(LLMRateLimiter):
+            def __init__(self):
+                super().__init__(requests_per_minute=1000)
+                self.tokens_seen = []
+
+            def acquire(self, tokens=0, max_wait=None):
+                self.tokens_seen.append(tokens)
+                return super().acquire(tokens, max_wait)
+
+        limiter = CountingLimiter()
+        agent = make_agent(FakeGeminiClient())
+        agent.rate_limiter = limiter
+        _run(agent, _make_chunks(3), max_concurrency=3)
+
+        assert len(limiter.tokens_seen) == 3
+        assert all(t > 0 for t in limiter.tokens_seen)
@@ -0,0 +1,155 @@
+"""
+Unit tests for smart-cut clip extraction and the keyframe index cache.
+"""
+from pathlib import Path
+from unittest.mock import patch
+
+import ffmpeg
+import pytest
+
+from langflix.core import cache_manager
+from langflix.core.cache_manager import CacheManager
+from langflix.core.video_processor import VideoProcessor
+from langflix.media import smart_cut
+from langflix.media.ffmpeg_utils import AudioParams, VideoParams
+from langflix.media.smart_cut import (
+    get_keyframe_times,
+    parse_keyframe_packets,
+    plan_smart_cut,
+    smart_cut_extract,
+)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "episode.mkv"
+    path.write_bytes(b"x" * 2048)
+    return path
+
+
+class TestKeyframeIndex:
+    """Tests for keyframe parsing and caching."""
+
+    def test_parse_packets(self):
+        output = "0.000000,K__\n0.041708,___\n2.002000,K_\nN/A,K__\n4.004000,__\n"
+        assert parse_keyframe_packets(output) == [0.0, 2.002]
+
+    def test_probed_once_then_cached(self, source):
+        with patch.object(smart_cut, '_probe_keyframes', return_value=[0.0, 2.0, 4.0]) as probe:
+            assert get_keyframe_times(str(source)) == [0.0, 2.0, 4.0]
+            assert get_keyframe_times(str(source)) == [0.0, 2.0, 4.0]
+
+        probe.assert_called_once()
+
+    def test_disk_cache_survives_new_process(self, source, isolated_cache_manager, monkeypatch):
+        with patch.object(smart_cut, '_probe_keyframes', return_value=[0.0, 2.0]):
+            get_keyframe_times(str(source))
+        monkeypatch.setattr(cache_manager, '_cache_manager',
+                            CacheManager(cache_dir=str(isolated_cache_manager.cache_dir)))
+
+        with patch.object(smart_cut, '_probe_keyframes') as probe:
+            assert get_keyframe_times(str(source)) == [0.0, 2.0]
+        probe.assert_not_called()
+
+    def test_modified_file_is_reindexed(self, source):
+        with patch.object(smart_cut, '_probe_keyframes', return_value=[0.0]) as probe:
+            get_keyframe_times(str(source))
+            source.write_bytes(b"y" * 4096)
+            get_keyframe_times(str(source))
+
+        assert probe.call_count == 2
+
+
+class TestPlanSmartCut:
+    """Tests for smart-cut planning."""
+
+    def test_head_until_next_keyframe(self):
+        plan = plan_smart_cut([0.0, 2.0, 4.0, 6.0], 3.1, 9.0)
+        assert plan.copy_from == 4.0
+        assert plan.head_duration == pytest.approx(0.9)
+        assert plan.needs_head
+
+    def test_keyframe_aligned_start_is_pure_copy(self):
+        plan = plan_smart_cut([0.0, 2.0, 4.0], 2.0005, 5.0)
+        assert not plan.needs_head
+
+    def test_no_keyframe_in_range(self):
+        assert plan_smart_cut([0.0, 10.0], 2.0, 8.0) is None
+        assert plan_smart_cut([], 2.0, 8.0) is None
+        assert plan_smart_cut([0.0, 2.0], 5.0, 4.0) is None
+
+
+class TestSmartCutExtract:
+    """Tests for smart_cut_extract command construction and fallbacks."""
+
+    def _run_recorder(self, commands):
+        def run(stream, **kwargs):
+            args = stream.compile()
+            commands.append(args)
+            Path(args[-2]).write_bytes(b"v" * 2048)
+        return run
+
+    def test_head_encode_tail_copy(self, source, tmp_path):
+        commands = []
+        output = tmp_path / "clip.mkv"
+        with patch.object(smart_cut, 'get_video_params', return_value=VideoParams('h264', 1920, 1080, 'yuv420p', '24/1')), \
+             patch.object(smart_cut, 'get_audio_params', return_value=AudioParams('aac', 2, 48000)), \
+             patch.object(smart_cut, 'get_start_time_seconds', return_value=0.0), \
+             patch.object(smart_cut, '_probe_keyframes', return_value=[0.0, 2.0, 4.0, 6.0]), \
+             patch.object(smart_cut, 'get_duration_seconds', return_value=5.0), \
+             patch.object(ffmpeg.nodes.OutputStream, 'run', autospec=True, side_effect=self._run_recorder(commands)):
+            assert smart_cut_extract(str(source), 3.0, 8.0, str(output))
+
+        head, tail, final = commands
+        assert head[head.index('-ss') + 1] == '3.0' and head[head.index('-t') + 1] == '1.0'
+        assert 'libx264' in head
+        assert tail[tail.index('-ss') + 1] == '4.0'
+        assert tail[tail.index('-vcodec') + 1] == 'copy'
+        assert 'h264_mp4toannexb' in tail
+        assert 'concat' in final and final[final.index('-vcodec') + 1] == 'copy'
+        assert final[final.index('-acodec') + 1] == 'aac'
+        assert not list(tmp_path.glob("smartcut_*"))
+
+    def test_keyframes_relative_to_container_start(self, source, tmp_path):
+        commands = []
+        with patch.object(smart_cut, 'get_video_params', return_value=VideoParams('h264', 1920, 1080, 'yuv420p', '24/1')), \
+             patch.object(smart_cut, 'get_audio_params', return_value=AudioParams('aac', 2, 48000)), \
+             patch.object(smart_cut, 'get_start_time_seconds', return_value=1.5), \
+             patch.object(smart_cut, '_probe_keyframes', return_value=[1.5, 3.5, 5.5, 7.5]), \
+             patch.object(smart_cut, 'get_duration_seconds', return_value=5.0), \
+             patch.object(ffmpeg.nodes.OutputStream, 'run', autospec=True, side_effect=self._run_recorder(commands)):
+            assert smart_cut_extract(str(source), 3.0, 8.0, str(tmp_path / "clip.mkv"))
+
+        head, tail, _ = commands
+        assert head[head.index('-ss') + 1] == '3.0' and head[head.index('-t') + 1] == '1.0'
+        assert tail[tail.index('-ss') + 1] == '4.0'
+
+    def test_unsupported_codec(self, source, tmp_path):
+        with patch.object(smart_cut, 'get_video_params', return_value=VideoParams('mpeg4', 640, 480, 'yuv420p', '25/1')):
+            assert not smart_cut_extract(str(source), 1.0, 5.0, str(tmp_path / "clip.mkv"))
+
+    def test_no_keyframe_in_range(self, source, tmp_path):
+        with patch.object(smart_cut, 'get_video_params', return_value=VideoParams('h264', 1920, 1080, 'yuv420p', '24/1')), \
+             patch.object(smart_cut, '_probe_keyframes', return_value=[0.0, 30.0]):
+            assert not smart_cut_extract(str(source), 1.0, 5.0, str(tmp_path / "clip.mkv"))
+
+
+class TestVideoProcessorSmartStrategy:
+    """Tests for extract_clip(strategy='smart')."""
+
+    def test_falls_back_to_encode(self, source, tmp_path):
+        processor = VideoProcessor()
+        with patch.object(processor, '_extract_clip_smart', return_value=False) as smart, \
+             patch.object(processor, '_extract_clip_encode', return_value=True) as encode:
+            assert processor.extract_clip(source, "00:00:01,000", "00:00:05,000", tmp_path / "clip.mkv", strategy='smart')
+
+        smart.assert_called_once()
+        encode.assert_called_once()
+
+    def test_smart_success_skips_encode(self, source, tmp_path):
+        processor = VideoProcessor()
+        with patch.object(processor, '_extract_clip_smart', return_value=True), \
+             patch.object(processor, '_extract_clip_encode') as encode:
+            assert processor.extract_clip(source, "00:00:01,000", "00:00:05,000", tmp_path / "clip.mkv", strategy='smart')
+
+        encode.assert_not_called()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the parsed-subtitle cache shared by SubtitleProcessor instances.
+"""
+import os
+from unittest.mock import patch
+
+import pytest
+
+from langflix.core import subtitle_processor
+from langflix.core.cache_manager import CacheManager
+from langflix.core.subtitle_processor import SubtitleProcessor
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+Hello [door slams] there.
+
+2
+00:00:03,000 --> 00:00:04,000
+[music]
+
+3
+00:00:05,000 --> 00:00:06,000
+How are you?
+"""
+
+
+@pytest.fixture
+def subtitle_file(tmp_path):
+    path = tmp_path / "episode.srt"
+    path.write_text(SRT, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CacheManager(cache_dir=str(tmp_path / "cache"))
+    with patch.object(subtitle_processor, 'get_cache_manager', return_value=cache):
+        yield cache
+
+
+def _count_parses():
+    return patch.object(
+        subtitle_processor, 'parse_subtitle_file_by_extension',
+        wraps=subtitle_processor.parse_subtitle_file_by_extension
+    )
+
+
+class TestSubtitleParseCache:
+    """Tests for parse-once subtitle loading."""
+
+    def test_second_processor_skips_parsing(self, subtitle_file, cache):
+        with _count_parses() as parse:
+            first = SubtitleProcessor(str(subtitle_file))
+            second = SubtitleProcessor(str(subtitle_file))
+
+        assert parse.call_count == 1
+        assert second.subtitles == first.subtitles
+        assert [s['text'] for s in second.subtitles] == ["Hello there.", "How are you?"]
+
+    def test_cached_entries_are_independent_copies(self, subtitle_file, cache):
+        first = SubtitleProcessor(str(subtitle_file))
+        first.subtitles[0]['text'] = "changed"
+
+        assert SubtitleProcessor(str(subtitle_file)).subtitles[0]['text'] == "Hello there."
+
+    def test_modified_file_is_reparsed(self, subtitle_file, cache):
+        SubtitleProcessor(str(subtitle_file))
+        subtitle_file.write_text(SRT.replace("How are you?", "Fine, thanks."), encoding="utf-8")
+        os.utime(subtitle_file, ns=(1, 1))
+
+        with _count_parses() as parse:
+            processor = SubtitleProcessor(str(subtitle_file))
+
+        assert parse.call_count == 1
+        assert processor.subtitles[-1]['text'] == "Fine, thanks."
+
+    def test_disk_cache_survives_restart(self, subtitle_file, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        with patch.object(subtitle_processor, 'get_cache_manager', return_value=CacheManager(cache_dir=cache_dir)):
+            expected = SubtitleProcessor(str(subtitle_file)).subtitles
+
+        # New process: empty memory cache, same cache directory
+        with patch.object(subtitle_processor, 'get_cache_manager', return_value=CacheManager(cache_dir=cache_dir)), \
+             _count_parses() as parse:
+            assert SubtitleProcessor(str(subtitle_file)).subtitles == expected
+
+        parse.assert_not_called()
+
+    def test_disabled(self, subtitle_file, cache):
+        with patch.object(subtitle_processor.settings, 'is_subtitle_parse_cache_enabled', return_value=False), \
+             _count_parses() as parse:
+            SubtitleProcessor(str(subtitle_file))
+            SubtitleProcessor(str(subtitle_file))
+
+        assert parse.call_count == 2
@@ -0,0 +1,100 @@
+"""
+Unit tests for the time-indexed subtitle store.
+"""
+import random
+
+from langflix.core.dual_subtitle import DualSubtitle, SubtitleEntry
+from langflix.core.subtitle_processor import SubtitleProcessor
+from langflix.core.subtitle_store import SubtitleStore, time_to_seconds
+
+
+def _ts(seconds):
+    millis = int(round(seconds * 1000))
+    return f"{millis // 3600000:02d}:{millis // 60000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def _cue(start, end, text="line"):
+    return {'start_time': _ts(start), 'end_time': _ts(end), 'text': text}
+
+
+class TestSubtitleStore:
+    """Tests for SubtitleStore range queries."""
+
+    def test_time_to_seconds(self):
+        assert time_to_seconds("01:02:03,250") == 3723.25
+        assert time_to_seconds("00:00:10.500") == 10.5
+        assert time_to_seconds("garbage") == 0.0
+
+    def test_overlapping_excludes_touching_cues(self):
+        store = SubtitleStore([_cue(0, 2), _cue(2, 4), _cue(4, 6)])
+        assert store.overlapping_indices(2, 4) == [1]
+        assert store.overlapping_indices(1.5, 4.5) == [0, 1, 2]
+        assert store.overlapping_indices(7, 9) == []
+
+    def test_long_cue_spanning_query(self):
+        store = SubtitleStore([_cue(0, 100, "sign"), _cue(10, 12), _cue(50, 52)])
+        assert store.overlapping_indices(60, 70) == [0]
+
+    def test_unsorted_input_keeps_original_order(self):
+        items = [_cue(10, 12, "b"), _cue(0, 2, "a"), _cue(5, 7, "c")]
+        store = SubtitleStore(items)
+        assert [c['text'] for c in store.overlapping(0, 20)] == ["b", "a", "c"]
+
+    def test_contained(self):
+        store = SubtitleStore([_cue(0, 2), _cue(2, 4), _cue(3.5, 6)])
+        assert store.contained_indices(0, 4) == [0, 1]
+        assert store.contained_indices(2, 6) == [1, 2]
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        items, t = [], 0.0
+        for _ in range(500):
+            t += rng.uniform(0, 3)
+            items.append(_cue(t, t + rng.uniform(0.2, 6)))
+        store = SubtitleStore(items)
+        seconds = [(time_to_seconds(c['start_time']), time_to_seconds(c['end_time'])) for c in items]
+
+        for _ in range(200):
+            a = rng.uniform(-5, t + 5)
+            b = a + rng.uniform(0, 30)
+            assert store.overlapping_indices(a, b) == [i for i, (s, e) in enumerate(seconds) if s < b and e > a]
+            assert store.contained_indices(a, b) == [i for i, (s, e) in enumerate(seconds) if s >= a and e <= b]
+
+
+class TestStoreIntegration:
+    """Tests for SubtitleProcessor and DualSubtitle using the store."""
+
+    def test_processor_store_follows_subtitle_list(self):
+        class TestableSubtitleProcessor(SubtitleProcessor):
+            def __init__(self):
+                self.subtitles = [_cue(0, 2, "a")]
+
+        processor = TestableSubtitleProcessor()
+        first = processor.subtitle_store
+        assert processor.subtitle_store is first
+
+        processor.subtitles = [_cue(0, 2, "a"), _cue(3, 5, "b")]
+        assert len(processor.subtitle_store) == 2
+
+    def test_extract_subtitles_for_expression(self):
+        class TestableSubtitleProcessor(SubtitleProcessor):
+            def __init__(self):
+                self.subtitles = [_cue(0, 2, "a"), _cue(3, 5, "b"), _cue(9, 11, "c")]
+
+        expression = {'context_start_time': "00:00:01,000", 'context_end_time': "00:00:09,500"}
+        result = TestableSubtitleProcessor().extract_subtitles_for_expression(expression)
+
+        assert [c['text'] for c in result] == ["a", "b", "c"]
+
+    def test_dual_subtitle_pairs_in_range(self):
+        def entries(prefix):
+            return [
+                SubtitleEntry(index=i + 1, start_time=_ts(i * 3), end_time=_ts(i * 3 + 2), text=f"{prefix}{i}")
+                for i in range(5)
+            ]
+        dual = DualSubtitle(source_language="English", target_language="Korean",
+                            source_entries=entries("en"), target_entries=entries("ko")[:4])
+
+        pairs = dual.get_pairs_in_range(3, 14)
+
+        assert [(p.source_text, p.target_text) for p in pairs] == [("en1", "ko1"), ("en2", "ko2"), ("en3", "ko3")]
@@ -0,0 +1,112 @@
+"""
+Unit tests for the streaming SRT/SMI parsers.
+
+The SRT parser must reproduce the previous pysrt-based output exactly; the
+reference below is that implementation on in-memory content.
+"""
+import re
+from pathlib import Path
+
+import pysrt
+import pytest
+
+from langflix.core.subtitle_parser import (
+    SubtitleCue,
+    iter_smi_cues,
+    iter_srt_cues,
+    parse_smi_file,
+    parse_srt_file,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "subtitles"
+
+
+def _pysrt_reference(content):
+    content = re.sub(r'(\d{2}:\d{2}:\d{2})[.,](\d{3})\d*', lambda m: f"{m.group(1)},{m.group(2)}", content)
+    return [
+        {'start_time': str(sub.start.to_time()), 'end_time': str(sub.end.to_time()), 'text': sub.text}
+        for sub in pysrt.from_string(content)
+    ]
+
+
+SRT_CASES = {
+    "standard": "1\n00:00:01,000 --> 00:00:02,500\nHello.\n\n2\n00:00:03,000 --> 00:00:04,000\nTwo\nlines\n",
+    "no_index": "00:00:01,000 --> 00:00:02,000\nNo index\n\n00:00:03,000 --> 00:00:04,000\nStill none\n",
+    "dot_and_microseconds": "1\n00:00:01.123456 --> 00:00:02.5\nDots\n\n2\n00:00:03.250 --> 00:00:04,000000\nMixed\n",
+    "position_suffix": "1\n00:00:01,000 --> 00:00:02,000 X1:100 X2:200 Y1:10 Y2:20\nPositioned\n",
+    "extra_blank_lines": "\n\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n\n\n2\n00:00:03,000 --> 00:00:04,000\nB",
+    "malformed_blocks": "1\nnot a timestamp\ntext\n\n2\n00:00:01 --> 00:00:02,000\nbad start\n\n3\n00:00:05,000 --> 00:00:06,000\nkept\n\nlonely\n",
+    "whitespace_and_trailing_spaces": "1\n  00:00:01,000   -->   00:00:02,000  \n  indented text   \n\n",
+    "timestamp_in_text": "1\n00:00:01,000 --> 00:00:02,000\nMeet at 12:30:00.5000 sharp\n",
+    "empty_timestamps": "1\n --> \nzero time\n",
+    "long_hours": "1\n10:59:59,999 --> 11:00:00,000\nLate\n",
+}
+
+
+class TestIterSrtCues:
+    """Tests for the line-oriented SRT generator."""
+
+    @pytest.mark.parametrize("name", sorted(SRT_CASES))
+    def test_matches_pysrt(self, name, tmp_path):
+        content = SRT_CASES[name]
+        path = tmp_path / f"{name}.srt"
+        path.write_text(content, encoding="utf-8")
+
+        assert parse_srt_file(str(path)) == _pysrt_reference(content)
+
+    def test_crlf_file(self, tmp_path):
+        path = tmp_path / "crlf.srt"
+        path.write_bytes(b"1\r\n00:00:01,000 --> 00:00:02,000\r\nWindows\r\nline\r\n\r\n")
+
+        assert parse_srt_file(str(path)) == [
+            {'start_time': "00:00:01", 'end_time': "00:00:02", 'text': "Windows\nline"}
+        ]
+
+    def test_yields_compact_cues(self):
+        lines = iter(["1\n", "00:00:01,500 --> 00:00:02,000\n", "Hi\n", "\n"])
+
+        assert list(iter_srt_cues(lines)) == [SubtitleCue(1500, 2000, "Hi")]
+
+    def test_dialogue_fixture_matches_pysrt(self):
+        path = FIXTURES / "dialogue_excerpt.srt"
+
+        assert parse_srt_file(str(path)) == _pysrt_reference(path.read_text(encoding="utf-8"))
+
+    def test_fallback_encoding(self, tmp_path):
+        path = tmp_path / "korean.srt"
+        path.write_bytes("1\n00:00:01,000 --> 00:00:02,000\n안녕하세요\n".encode("cp949"))
+
+        result = parse_srt_file(str(path))
+
+        assert result[0]['text'] == "안녕하세요"
+
+
+class TestIterSmiCues:
+    """Tests for the SMI fast path."""
+
+    def test_sync_blocks(self):
+        content = (
+            "<SAMI><BODY>\n"
+            "<SYNC Start=1000><P Class=KRCC>First<br>line &amp; more</P></SYNC>\n"
+            "<SYNC Start=2500><P Class=KRCC>&nbsp;</P></SYNC>\n"
+            "<SYNC Start=4000><P Class=KRCC>Last</P></SYNC>\n"
+            "</BODY></SAMI>"
+        )
+
+        assert list(iter_smi_cues(content)) == [
+            SubtitleCue(1000, 2500, "Firstline & more"),
+            SubtitleCue(4000, 6000, "Last"),
+        ]
+
+    def test_unclosed_sync_blocks(self):
+        content = "<SYNC Start=0><P>One\n<SYNC Start=1500><P>Two\n</BODY>"
+
+        assert list(iter_smi_cues(content)) == [SubtitleCue(0, 1500, "One"), SubtitleCue(1500, 3500, "Two")]
+
+    def test_parse_smi_file_time_format(self, tmp_path):
+        path = tmp_path / "sample.smi"
+        path.write_bytes("<SYNC Start=3723250><P>안녕</P></SYNC>\r\n".encode("euc-kr"))
+
+        assert parse_smi_file(str(path)) == [
+            {'start_time': "01:02:03.250", 'end_time': "01:02:05.250", 'text': "안녕"}
+        ]
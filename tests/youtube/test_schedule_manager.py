@@ -10,7 +10,9 @@ from typing import List, Dict, Any
 from langflix.youtube.schedule_manager import (
     YouTubeScheduleManager, 
     ScheduleConfig, 
-    DailyQuotaStatus
+    DailyQuotaStatus,
+    ScheduleRequest,
+    SlotPlanner
 )
 from langflix.db.models import YouTubeSchedule, YouTubeQuotaUsage
 
@@ -1089,5 +1091,132 @@ class TestSchedulerConcurrency:
                         assert success is True
 
 
+class TestSlotPlanner:
+    """Test the in-memory occupancy calendar"""
+    
+    START = date(2026, 3, 2)
+    
+    def test_books_slots_in_order_and_respects_capacity(self):
+        """Test batch booking fills slot times in order up to slot capacity"""
+        config = ScheduleConfig(time_slots=['10:00', '14:00'], slot_capacity=2, daily_max_total=6)
+        planner = SlotPlanner(config, self.START)
+        
+        slots = planner.plan(['short'] * 5)
+        
+        assert [s.time() for s in slots] == [time(10, 0), time(10, 0), time(14, 0), time(14, 0), time(9, 0)]
+        assert all(s.date() == self.START for s in slots)
+    
+    def test_existing_schedules_and_daily_cap(self):
+        """Test the calendar counts existing schedules and skips days at the hard cap"""
+        config = ScheduleConfig(time_slots=['10:00'], slot_capacity=3, daily_max_total=3)
+        existing = [datetime.combine(self.START, time(10, 0))] * 3
+        planner = SlotPlanner(config, self.START, existing)
+        
+        assert planner.book('short') == datetime.combine(self.START + timedelta(days=1), time(10, 0))
+    
+    def test_daily_type_limit_and_api_quota(self):
+        """Test days without type or API quota are skipped"""
+        config = ScheduleConfig(daily_limits={'final': 1, 'short': 5})
+        second_day = self.START + timedelta(days=1)
+        quota = {
+            second_day: DailyQuotaStatus(
+                date=second_day, final_used=0, final_remaining=1, short_used=0, short_remaining=5,
+                quota_used=9000, quota_remaining=1000, quota_percentage=90.0
+            )
+        }
+        planner = SlotPlanner(config, self.START, quota_statuses=quota)
+        
+        slots = planner.plan(['final', 'final'])
+        
+        assert [s.date() for s in slots] == [self.START, self.START + timedelta(days=2)]
+    
+    def test_full_window_and_release(self):
+        """Test booking returns None when the window is full and release frees the slot"""
+        config = ScheduleConfig(time_slots=['10:00'], daily_limits={'final': 1, 'short': 1})
+        planner = SlotPlanner(config, self.START, days=1)
+        
+        slot = planner.book('short')
+        assert planner.book('short') is None
+        
+        planner.release(slot, 'short')
+        assert planner.book('short') == slot
+
+
+class TestBatchScheduling:
+    """Test window loading and batch scheduling in one transaction"""
+    
+    @pytest.fixture
+    def schedule_manager(self):
+        manager = YouTubeScheduleManager(ScheduleConfig(time_slots=['10:00'], slot_capacity=1, daily_max_total=1))
+        manager.db_enabled = True
+        return manager
+    
+    @pytest.fixture
+    def mock_db(self):
+        db = MagicMock()
+        # First query: quota records, second query: scheduled times
+        quota_query = MagicMock()
+        quota_query.filter.return_value.with_for_update.return_value.all.return_value = []
+        quota_query.filter.return_value.with_for_update.return_value.first.return_value = None
+        quota_query.filter.return_value.all.return_value = []
+        schedule_query = MagicMock()
+        existing = [(datetime.combine(date.today(), time(10, 0)),)]
+        schedule_query.filter.return_value.with_for_update.return_value.all.return_value = existing
+        schedule_query.filter.return_value.all.return_value = existing
+        db.query.side_effect = lambda entity: quota_query if entity is YouTubeQuotaUsage else schedule_query
+        return db
+    
+    def _patch_session(self, mock_db):
+        from langflix.db.session import db_manager
+        session = patch.object(db_manager, 'session')
+        mock_session = session.start()
+        mock_session.return_value.__enter__.return_value = mock_db
+        mock_session.return_value.__exit__.return_value = None
+        return session
+    
+    def test_next_slot_loads_window_once(self, schedule_manager, mock_db):
+        """Test get_next_available_slot runs two queries for the whole window"""
+        session = self._patch_session(mock_db)
+        try:
+            slot = schedule_manager.get_next_available_slot('short')
+        finally:
+            session.stop()
+        
+        assert slot.date() == date.today() + timedelta(days=1)
+        assert mock_db.query.call_count == 2
+    
+    def test_schedule_videos_single_transaction(self, schedule_manager, mock_db):
+        """Test schedule_videos books every video and reserves quota (uploads also today's) in one session"""
+        from langflix.db.session import db_manager
+        explicit = datetime.combine(date.today() + timedelta(days=5), time(15, 0))
+        requests = [
+            ScheduleRequest("/v/a.mp4", "short"),
+            ScheduleRequest("/v/b.mp4", "final"),
+            ScheduleRequest("/v/c.mp4", "short", publish_time=explicit, youtube_video_id="yt123"),
+            ScheduleRequest("/v/d.mp4", "bad"),
+        ]
+        
+        session = self._patch_session(mock_db)
+        try:
+            results = schedule_manager.schedule_videos(requests)
+            assert db_manager.session.call_count == 1
+        finally:
+            session.stop()
+        
+        assert [ok for ok, _, _ in results] == [True, True, True, False]
+        assert results[0][2] == datetime.combine(date.today() + timedelta(days=1), time(10, 0))
+        assert results[1][2] == datetime.combine(date.today() + timedelta(days=2), time(10, 0))
+        assert results[2][2] == explicit
+        
+        added = [call.args[0] for call in mock_db.add.call_args_list]
+        schedules = [obj for obj in added if isinstance(obj, YouTubeSchedule)]
+        quota_records = [obj for obj in added if isinstance(obj, YouTubeQuotaUsage)]
+        assert [s.video_path for s in schedules] == ["/v/a.mp4", "/v/b.mp4", "/v/c.mp4"]
+        assert schedules[2].upload_status == 'completed' and schedules[2].youtube_video_id == "yt123"
+        # The already uploaded video also spends today's upload quota
+        assert sorted(r.date for r in quota_records) == [date.today()] + [r[2].date() for r in results[:3]]
+        assert all(r.quota_used == 1600 for r in quota_records)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
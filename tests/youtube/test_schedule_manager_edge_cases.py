@@ -10,7 +10,8 @@ from sqlalchemy.exc import OperationalError
 from langflix.youtube.schedule_manager import (
     YouTubeScheduleManager, 
     ScheduleConfig, 
-    DailyQuotaStatus
+    DailyQuotaStatus,
+    SlotPlanner
 )
 from langflix.db.models import YouTubeSchedule, YouTubeQuotaUsage
 from langflix.db.session import db_manager
@@ -209,15 +210,13 @@ class TestSchedulerEdgeCases:
             quota_percentage=0.0
         )
         
-        with patch.object(schedule_manager, 'check_daily_quota', return_value=mock_quota_status):
-            with patch.object(schedule_manager, '_get_available_times_for_date') as mock_available:
-                mock_available.return_value = [datetime.combine(preferred_date, time(10, 0))]
-                
-                slot = schedule_manager.get_next_available_slot('final', preferred_date=preferred_date)
-                
-                assert slot is not None
-                assert slot.date() == preferred_date
-                schedule_manager.check_daily_quota.assert_called_with(preferred_date)
+        planner = SlotPlanner(schedule_manager.config, preferred_date, quota_statuses={preferred_date: mock_quota_status})
+        with patch.object(schedule_manager, 'load_slot_planner', return_value=planner) as mock_load:
+            slot = schedule_manager.get_next_available_slot('final', preferred_date=preferred_date)
+            
+            assert slot is not None
+            assert slot.date() == preferred_date
+            mock_load.assert_called_once_with(preferred_date)
     
     def test_schedule_video_with_invalid_video_type(self, schedule_manager):
         """Test schedule_video rejects invalid video types"""
@@ -0,0 +1,186 @@
+"""
+Unit tests for the content-addressed thumbnail store and its web UI routes.
+"""
+import os
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from langflix.youtube import thumbnail_store
+from langflix.youtube.thumbnail_store import ThumbnailStore
+
+
+def _fake_render(video_path, output_path, timestamp, width):
+    Image.new('RGB', (width or 64, (width or 64) * 16 // 9), 'red').save(output_path, format='JPEG')
+    return True
+
+
+@pytest.fixture(autouse=True)
+def no_probe():
+    with patch.object(thumbnail_store, 'get_duration_seconds', return_value=60.0):
+        yield
+
+
+@pytest.fixture
+def videos(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"short_{i}.mkv"
+        path.write_bytes(b"video" * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def store(tmp_path):
+    render = Mock(side_effect=_fake_render)
+    store = ThumbnailStore(tmp_path / "thumbnails", render=render, max_workers=2)
+    yield store
+    store.shutdown()
+
+
+class TestThumbnailStore:
+    """Tests for ThumbnailStore."""
+
+    def test_rendered_once_per_video_version(self, store, videos):
+        first = store.get_thumbnail(videos[0])
+        second = store.get_thumbnail(videos[0])
+
+        assert first == second
+        assert first.path.exists()
+        assert store._render.call_count == 1
+        assert store.get_stats()['hits'] == 1
+
+        os.utime(videos[0], (1, 1))
+        changed = store.get_thumbnail(videos[0])
+
+        assert changed.key != first.key
+        assert store._render.call_count == 2
+
+    def test_key_depends_on_timestamp_and_preset(self, store, videos):
+        keys = {
+            store.describe(videos[0]).key,
+            store.describe(videos[0], timestamp=1.0).key,
+            store.describe(videos[0], preset='small').key,
+        }
+
+        assert len(keys) == 3
+        with pytest.raises(ValueError):
+            store.describe(videos[0], preset='huge')
+
+    def test_preset_width_and_clamped_timestamp(self, store, videos):
+        with patch.object(thumbnail_store, 'get_duration_seconds', return_value=3.0):
+            store.get_thumbnail(videos[0], timestamp=5.0, preset='small')
+
+        _, _, timestamp, width = store._render.call_args[0]
+        assert (timestamp, width) == (1.5, 320)
+
+    def test_concurrent_requests_share_one_render(self, tmp_path, videos):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_render(*args):
+            started.set()
+            release.wait(5)
+            return _fake_render(*args)
+
+        store = ThumbnailStore(tmp_path / "thumbnails", render=Mock(side_effect=slow_render), max_workers=2)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get_thumbnail(videos[0])))
+                   for _ in range(3)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while store.get_stats()['shared_renders'] < 2:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        store.shutdown()
+
+        assert store._render.call_count == 1
+        assert len(results) == 3 and len({r.key for r in results}) == 1
+
+    def test_failed_render_leaves_no_file(self, tmp_path, videos):
+        store = ThumbnailStore(tmp_path / "thumbnails", render=Mock(return_value=False))
+
+        assert store.get_thumbnail(videos[0]) is None
+        assert [p for p in (tmp_path / "thumbnails").rglob("*") if p.is_file()] == []
+        assert store.get_stats()['failures'] == 1
+        store.shutdown()
+
+    def test_batch_skips_missing_videos(self, store, videos, tmp_path):
+        results = store.get_thumbnails(videos + [str(tmp_path / "missing.mkv")])
+
+        assert set(results) == set(videos)
+        assert store._render.call_count == 3
+
+
+class TestThumbnailSprite:
+    """Tests for per-episode contact sheets."""
+
+    def test_sprite_layout_and_reuse(self, store, videos):
+        sprite = store.get_sprite(videos, columns=2)
+
+        with Image.open(sprite.path) as image:
+            assert image.size == (640, 2 * 568)
+        assert [(t['x'], t['y']) for t in sprite.tiles] == [(0, 0), (320, 0), (0, 568)]
+        assert [t['path'] for t in sprite.tiles] == videos
+
+        again = store.get_sprite(videos, columns=2)
+        assert again.key == sprite.key and again.tiles == sprite.tiles
+        assert store.get_stats()['sprites_composed'] == 1
+        assert store._render.call_count == 3
+
+
+class TestThumbnailRoutes:
+    """Tests for the web UI thumbnail endpoints."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        from langflix.youtube import web_ui
+        monkeypatch.setattr(web_ui.settings, 'get_thumbnail_cache_dir', lambda: str(tmp_path / "thumbnails"))
+        with patch('langflix.youtube.web_ui.YouTubeScheduleManager'), \
+             patch('langflix.youtube.web_ui.YouTubeUploadManager'), \
+             patch('langflix.youtube.web_ui.VideoFileManager'), \
+             patch('langflix.youtube.web_ui.YouTubeMetadataGenerator'):
+            ui = web_ui.VideoManagementUI(str(tmp_path / "output"))
+        ui.video_manager = Mock()
+        ui.video_manager.generate_thumbnail.side_effect = \
+            lambda video_path, output_path, timestamp, width: _fake_render(video_path, output_path, timestamp, width)
+        yield ui, ui.app.test_client()
+        ui.thumbnail_store.shutdown()
+
+    def test_etag_revalidation_skips_rendering(self, client, videos):
+        ui, http = client
+        url = f"/api/thumbnail{videos[0]}?size=small"
+
+        first = http.get(url)
+        assert first.status_code == 200
+        assert first.headers['Content-Type'] == 'image/jpeg'
+        assert first.headers['ETag'] and first.headers['Last-Modified']
+
+        revalidated = http.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == first.headers['ETag']
+        assert ui.video_manager.generate_thumbnail.call_count == 1
+
+    def test_unknown_preset_and_missing_video(self, client, videos, tmp_path):
+        _, http = client
+
+        assert http.get(f"/api/thumbnail{videos[0]}?size=huge").status_code == 400
+        assert http.get(f"/api/thumbnail{tmp_path}/missing.mkv").status_code == 404
+
+    def test_episode_sprite_index(self, client, videos):
+        ui, http = client
+        ui.video_manager.query_videos.return_value = ([Mock(path=p) for p in reversed(videos)], len(videos))
+
+        index = http.get("/api/thumbnails/sprite/S01E01/index?columns=3")
+        sprite = http.get("/api/thumbnails/sprite/S01E01?columns=3")
+
+        assert index.status_code == 200 and sprite.status_code == 200
+        assert [t['path'] for t in index.get_json()['tiles']] == videos
+        assert sprite.headers['ETag'].strip('"') == index.get_json()['etag']
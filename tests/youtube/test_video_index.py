@@ -0,0 +1,158 @@
+"""
+Unit tests for the incremental video index.
+"""
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from langflix.youtube.video_index import VideoIndex
+
+
+def _fake_build(paths):
+    entries = {}
+    for path in paths:
+        name = os.path.basename(path)
+        if name.startswith("broken"):
+            entries[path] = None
+            continue
+        entries[path] = {
+            'path': path,
+            'video_type': 'short' if name.startswith('short') else 'long-form',
+            'episode': 'S01E01' if 'S01E01' in path else 'S01E02',
+            'size_mb': 1.0,
+            'duration_seconds': 30.0,
+            'ready_for_upload': True,
+            'uploadable': name.startswith('short'),
+        }
+    return entries
+
+
+def _touch(path, content=b"video"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "output"
+    _touch(root / "S01E01" / "short_1.mkv")
+    _touch(root / "S01E01" / "long-form_1.mkv")
+    _touch(root / "S01E02" / "short_2.mkv")
+    _touch(root / "S01E02" / "notes.txt")
+    return root
+
+
+@pytest.fixture
+def index(tmp_path, tree):
+    return VideoIndex(tmp_path / "index.sqlite3", tree, build=Mock(side_effect=_fake_build),
+                      min_refresh_interval=0)
+
+
+class TestVideoIndex:
+    def test_first_refresh_indexes_all_videos(self, index):
+        stats = index.refresh()
+
+        assert stats['indexed'] == 3
+        assert index.build.call_count == 1  # one batch, so probes can run in parallel
+        videos, total = index.query()
+        assert total == 3
+        assert [os.path.basename(v['path']) for v in videos] == ['long-form_1.mkv', 'short_1.mkv', 'short_2.mkv']
+
+    def test_unchanged_tree_lists_no_directories(self, index):
+        index.refresh()
+        index.build.reset_mock()
+
+        stats = index.refresh()
+
+        assert stats == {'dirs_listed': 0, 'indexed': 0, 'removed': 0}
+        index.build.assert_not_called()
+
+    def test_only_changed_directory_is_listed(self, index, tree):
+        index.refresh()
+        new_file = _touch(tree / "S01E02" / "short_3.mkv")
+
+        stats = index.refresh()
+
+        assert stats['dirs_listed'] == 1
+        assert index.build.call_args[0][0] == [str(new_file)]
+        assert index.query()[1] == 4
+
+    def test_rewritten_file_and_sidecar_are_reindexed(self, index, tree):
+        index.refresh()
+        video = tree / "S01E01" / "short_1.mkv"
+        _touch(video, b"re-rendered video")
+        index.refresh()
+        assert index.build.call_args[0][0] == [str(video)]
+
+        (tree / "S01E01" / "long-form_1.meta.json").write_text("{}")
+        index.refresh()
+        assert index.build.call_args[0][0] == [str(tree / "S01E01" / "long-form_1.mkv")]
+
+    def test_removed_files_and_directories_are_dropped(self, index, tree):
+        index.refresh()
+        os.remove(tree / "S01E01" / "short_1.mkv")
+        for name in os.listdir(tree / "S01E02"):
+            os.remove(tree / "S01E02" / name)
+        os.rmdir(tree / "S01E02")
+
+        stats = index.refresh()
+
+        assert stats['removed'] == 2
+        assert [os.path.basename(v['path']) for v in index.query()[0]] == ['long-form_1.mkv']
+
+    def test_unreadable_files_are_hidden_until_they_change(self, index, tree):
+        broken = _touch(tree / "S01E01" / "broken.mkv")
+        index.refresh()
+        assert index.query()[1] == 3
+
+        index.refresh(force=True)
+        assert index.build.call_count == 1
+
+        _touch(broken, b"finished writing")
+        index.refresh()
+        assert index.build.call_args[0][0] == [str(broken)]
+
+    def test_filters_and_pagination(self, index):
+        index.refresh()
+
+        shorts, total = index.query(video_type='short', limit=1)
+        assert total == 2 and len(shorts) == 1
+        second, _ = index.query(video_type='short', offset=1, limit=1)
+        assert second[0]['path'] != shorts[0]['path']
+
+        assert index.query(episode='S01E02')[1] == 1
+        assert index.query(uploadable=True)[1] == 2
+        assert index.query(uploadable=False)[1] == 1
+
+    def test_statistics(self, index):
+        index.refresh()
+
+        stats = index.statistics()
+
+        assert stats['total_videos'] == 3
+        assert stats['total_duration_seconds'] == 90.0
+        assert stats['type_distribution'] == {'short': 2, 'long-form': 1}
+        assert sorted(stats['episodes']) == ['S01E01', 'S01E02']
+
+    def test_refresh_is_throttled(self, index, tree):
+        index.min_refresh_interval = 60
+        index.refresh()
+        _touch(tree / "S01E01" / "short_9.mkv")
+
+        assert index.refresh()['indexed'] == 0
+        assert index.refresh(force=True)['indexed'] == 1
+
+    def test_roots_sharing_a_database_stay_separate(self, index, tmp_path, tree):
+        sibling = tmp_path / "output_2"
+        _touch(sibling / "short_x.mkv")
+        other = VideoIndex(index.db_path, sibling, build=_fake_build, min_refresh_interval=0)
+
+        index.refresh()
+        other.refresh()
+
+        assert index.query()[1] == 3
+        assert other.query()[1] == 1
+        other.clear()
+        assert index.query()[1] == 3
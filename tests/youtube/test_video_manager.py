@@ -700,10 +700,10 @@ class TestVideoFileManagerWithFFProbe:
             # Check ffmpeg command
             call_args = mock_run.call_args[0][0]
             assert call_args[0] == "ffmpeg"
-            assert call_args[1] == "-i"
-            assert call_args[2] == video_path
-            assert call_args[3] == "-ss"
-            assert call_args[4] == "5.0"
+            assert call_args[1] == "-ss"
+            assert call_args[2] == "5.0"
+            assert call_args[3] == "-i"
+            assert call_args[4] == video_path
             assert call_args[5] == "-vframes"
             assert call_args[6] == "1"
             assert call_args[7] == "-q:v"
@@ -738,7 +738,19 @@ class TestVideoFileManagerWithFFProbe:
             
             # Check ffmpeg command has custom timestamp
             call_args = mock_run.call_args[0][0]
-            assert call_args[4] == "30.0"  # Custom timestamp
+            assert call_args[2] == "30.0"  # Custom timestamp
+    
+    def test_generate_thumbnail_scaled(self, video_manager, tmp_path):
+        """Test thumbnail generation scaled to a preset width"""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            
+            result = video_manager.generate_thumbnail("in.mp4", "out.jpg", 2.0, width=320)
+            
+            assert result is True
+            call_args = mock_run.call_args[0][0]
+            assert call_args[call_args.index("-vf") + 1] == "scale=320:-2"
+            assert call_args[-1] == "out.jpg"
 
 
 class TestVideoFileManagerIntegration:
@@ -883,6 +895,40 @@ class TestVideoFileManagerIntegration:
                 video_types = [v.video_type for v in uploadable_videos]
                 assert "final" in video_types
                 assert "short" in video_types
+    
+    def test_query_videos_from_index(self, mock_output_dir):
+        """Test filtered, paginated queries are served from the index without re-probing"""
+        manager = VideoFileManager(mock_output_dir)
+        ffprobe_output = {
+            "format": {"duration": "30.0"},
+            "streams": [{"codec_type": "video", "width": 1080, "height": 1920, "codec_name": "h264"}]
+        }
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=json.dumps(ffprobe_output), stderr="", returncode=0)
+            
+            shorts, total = manager.query_videos(video_type="short", limit=4)
+            assert total == 6 and len(shorts) == 4
+            probes = mock_run.call_count
+            
+            rest, _ = manager.query_videos(video_type="short", offset=4)
+            assert len(rest) == 2
+            assert {v.path for v in shorts}.isdisjoint(v.path for v in rest)
+            
+            # A second lookup re-reads nothing from disk
+            manager.refresh_index(force=True)
+            assert mock_run.call_count == probes
+        
+        uploaded_path = shorts[0].path
+        with patch.object(manager, '_get_uploaded_video_ids', side_effect=lambda paths: {
+            p: "yt123" for p in paths if p == uploaded_path
+        }):
+            ready, total = manager.query_videos(video_type="short", upload_ready=True)
+            assert total == 5
+            assert uploaded_path not in [v.path for v in ready]
+            
+            videos, _ = manager.query_videos(video_type="short")
+            assert next(v for v in videos if v.path == uploaded_path).youtube_video_id == "yt123"
 
 
 if __name__ == "__main__":
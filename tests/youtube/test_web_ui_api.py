@@ -27,7 +27,7 @@ class TestVideoManagementUI:
     @pytest.fixture
     def web_ui(self, mock_output_dir):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session') as mock_db_session:
+        with patch('langflix.youtube.web_ui.db_manager') as mock_db_session:
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager') as mock_schedule_manager:
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager') as mock_upload_manager:
                     with patch('langflix.youtube.web_ui.VideoFileManager') as mock_video_manager:
@@ -107,7 +107,7 @@ class TestVideoAPIEndpoints:
     @pytest.fixture
     def web_ui(self, tmp_path):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session'):
+        with patch('langflix.youtube.web_ui.db_manager'):
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager'):
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager'):
                     with patch('langflix.youtube.web_ui.VideoFileManager'):
@@ -142,13 +142,14 @@ class TestVideoAPIEndpoints:
             )
         ]
         
-        web_ui.video_manager.scan_all_videos.return_value = mock_videos
-        web_ui.video_manager.get_uploadable_videos.return_value = mock_videos
+        web_ui.video_manager.query_videos.return_value = (mock_videos, 2)
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/videos')
             
             assert response.status_code == 200
+            web_ui.video_manager.query_videos.assert_called_once_with(uploadable=True, offset=0, limit=None)
+            assert response.headers["X-Total-Count"] == "2"
             data = response.get_json()
             assert len(data) == 2
             assert data[0]["video_type"] == "final"
@@ -156,7 +157,7 @@ class TestVideoAPIEndpoints:
     
     def test_get_videos_error(self, web_ui):
         """Test video retrieval with error"""
-        web_ui.video_manager.scan_all_videos.side_effect = Exception("Scan error")
+        web_ui.video_manager.query_videos.side_effect = Exception("Scan error")
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/videos')
@@ -183,13 +184,13 @@ class TestVideoAPIEndpoints:
             )
         ]
         
-        web_ui.video_manager.scan_all_videos.return_value = mock_videos
-        web_ui.video_manager.get_videos_by_type.return_value = [mock_videos[0]]
+        web_ui.video_manager.query_videos.return_value = ([mock_videos[0]], 1)
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/videos/final')
             
             assert response.status_code == 200
+            web_ui.video_manager.query_videos.assert_called_once_with(video_type="final", offset=0, limit=None)
             data = response.get_json()
             assert len(data) == 1
             assert data[0]["video_type"] == "final"
@@ -211,13 +212,13 @@ class TestVideoAPIEndpoints:
             )
         ]
         
-        web_ui.video_manager.scan_all_videos.return_value = mock_videos
-        web_ui.video_manager.get_videos_by_episode.return_value = [mock_videos[0]]
+        web_ui.video_manager.query_videos.return_value = ([mock_videos[0]], 1)
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/videos/episode/S01E01')
             
             assert response.status_code == 200
+            web_ui.video_manager.query_videos.assert_called_once_with(episode="S01E01", offset=0, limit=None)
             data = response.get_json()
             assert len(data) == 1
             assert data[0]["episode"] == "S01E01"
@@ -234,28 +235,39 @@ class TestVideoAPIEndpoints:
             )
         ]
         
-        web_ui.video_manager.scan_all_videos.return_value = mock_videos
-        web_ui.video_manager.get_upload_ready_videos.return_value = mock_videos
+        web_ui.video_manager.query_videos.return_value = (mock_videos, 1)
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/upload-ready')
             
             assert response.status_code == 200
+            web_ui.video_manager.query_videos.assert_called_once_with(upload_ready=True, offset=0, limit=None)
             data = response.get_json()
             assert len(data) == 1
             assert data[0]["ready_for_upload"] is True
     
-    def test_get_statistics(self, web_ui):
-        """Test getting video statistics"""
+    def test_get_videos_paginated(self, web_ui):
+        """Test offset/limit are passed to the index and the total is reported"""
         mock_videos = [
             VideoMetadata(
-                path="/path/to/video1.mp4", filename="video1.mp4", size_mb=100.0,
+                path="/path/to/final.mp4", filename="final.mp4", size_mb=100.0,
                 duration_seconds=120.0, resolution="1920x1080", format="h264",
                 created_at=datetime.now(), episode="S01E01", expression="Test1",
-                video_type="final", language="ko"
+                video_type="final", language="ko", ready_for_upload=True
             )
         ]
+        web_ui.video_manager.query_videos.return_value = (mock_videos, 25)
         
+        with web_ui.app.test_client() as client:
+            response = client.get('/api/videos?offset=10&limit=1')
+            
+            assert response.status_code == 200
+            web_ui.video_manager.query_videos.assert_called_once_with(uploadable=True, offset=10, limit=1)
+            assert response.headers["X-Total-Count"] == "25"
+            assert len(response.get_json()) == 1
+    
+    def test_get_statistics(self, web_ui):
+        """Test getting video statistics"""
         mock_stats = {
             "total_videos": 1,
             "total_size_mb": 100.0,
@@ -265,8 +277,7 @@ class TestVideoAPIEndpoints:
             "episodes": ["S01E01"]
         }
         
-        web_ui.video_manager.scan_all_videos.return_value = mock_videos
-        web_ui.video_manager.get_statistics.return_value = mock_stats
+        web_ui.video_manager.get_index_statistics.return_value = mock_stats
         
         with web_ui.app.test_client() as client:
             response = client.get('/api/statistics')
@@ -284,7 +295,7 @@ class TestYouTubeAccountAPI:
     @pytest.fixture
     def web_ui(self, tmp_path):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session'):
+        with patch('langflix.youtube.web_ui.db_manager'):
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager'):
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager'):
                     with patch('langflix.youtube.web_ui.VideoFileManager'):
@@ -412,7 +423,7 @@ class TestScheduleAPI:
     @pytest.fixture
     def web_ui(self, tmp_path):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session'):
+        with patch('langflix.youtube.web_ui.db_manager'):
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager'):
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager'):
                     with patch('langflix.youtube.web_ui.VideoFileManager'):
@@ -598,7 +609,7 @@ class TestQuotaAPI:
     @pytest.fixture
     def web_ui(self, tmp_path):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session'):
+        with patch('langflix.youtube.web_ui.db_manager'):
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager'):
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager'):
                     with patch('langflix.youtube.web_ui.VideoFileManager'):
@@ -693,7 +704,7 @@ class TestUploadAPI:
     @pytest.fixture
     def web_ui(self, tmp_path):
         """Create VideoManagementUI with mocked dependencies"""
-        with patch('langflix.youtube.web_ui.get_db_session'):
+        with patch('langflix.youtube.web_ui.db_manager'):
             with patch('langflix.youtube.web_ui.YouTubeScheduleManager'):
                 with patch('langflix.youtube.web_ui.YouTubeUploadManager'):
                     with patch('langflix.youtube.web_ui.VideoFileManager'):
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Offline throughput benchmark for ScriptAgent chunk analysis.
+
+Runs ScriptAgent.analyze_chunks_generator against FakeGeminiClient (no API key,
+no network) with a simulated LLM latency, comparing sequential analysis with
+concurrent analysis and optional rate limiting.
+
+Usage:
+    python tools/benchmark_script_agent.py \
+        [--chunks 8] [--latency 2.0] [--concurrency 1 2 4] \
+        [--rpm 30] [--tpm 200000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import langflix modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langflix.core.fake_llm_client import FakeGeminiClient
+from langflix.core.llm_response_cache import LLMResponseCache
+from langflix.core.rate_limiter import LLMRateLimiter
+from langflix.pipeline.agents.script_agent import ScriptAgent
+
+
+def build_chunks(num_chunks: int, lines_per_chunk: int):
+    """Build synthetic subtitle chunks in the format produced by main.py."""
+    chunks = []
+    for c in range(num_chunks):
+        lines = []
+        for idx in range(lines_per_chunk):
+            second = c * lines_per_chunk * 3 + idx * 3
+            start = f"00:{second // 60 % 60:02d}:{second % 60:02d},000"
+            end = f"00:{(second + 2) // 60 % 60:02d}:{(second + 2) % 60:02d},000"
+            lines.append(f"[{idx}] [{start} --> {end}] Line {idx} of chunk {c + 1}")
+        chunks.append({'chunk_id': c + 1, 'script': '\n'.join(lines)})
+    return chunks
+
+
+def run_once(chunks, latency: float, concurrency: int, rpm: float, tpm: float, max_total: int):
+    client = FakeGeminiClient(latency_seconds=latency)
+    limiter = LLMRateLimiter(requests_per_minute=rpm, tokens_per_minute=tpm)
+    # Response cache disabled so every run measures real (simulated) LLM calls
+    agent = ScriptAgent(
+        show_name="Benchmark",
+        client=client,
+        rate_limiter=limiter,
+        response_cache=LLMResponseCache("unused.sqlite3", enabled=False)
+    )
+
+    start = time.perf_counter()
+    results = list(agent.analyze_chunks_generator(
+        chunks=chunks,
+        target_chunks=chunks,
+        show_bible="",
+        max_total_expressions=max_total,
+        target_language="Korean",
+        target_language_code="ko",
+        source_language="English",
+        source_language_code="en",
+        max_concurrency=concurrency
+    ))
+    elapsed = time.perf_counter() - start
+
+    expressions = sum(len(r.expressions) for r in results)
+    return elapsed, expressions, client.call_count, client.max_in_flight, limiter.total_wait_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ScriptAgent chunk analysis offline")
+    parser.add_argument("--chunks", type=int, default=8, help="Number of chunks (default: 8)")
+    parser.add_argument("--lines", type=int, default=200, help="Subtitle lines per chunk (default: 200)")
+    parser.add_argument("--latency", type=float, default=1.0, help="Simulated LLM latency in seconds (default: 1.0)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4], help="Concurrency levels to compare")
+    parser.add_argument("--rpm", type=float, default=None, help="Requests per minute limit")
+    parser.add_argument("--tpm", type=float, default=None, help="Tokens per minute limit")
+    parser.add_argument("--max-total", type=int, default=None, help="max_total_expressions cap")
+    args = parser.parse_args()
+
+    chunks = build_chunks(args.chunks, args.lines)
+
+    print(f"{'concurrency':>11} | {'wall (s)':>8} | {'chunks/s':>8} | {'calls':>5} | {'peak':>4} | {'rl wait (s)':>11} | {'exprs':>5}")
+    print("-" * 72)
+    for concurrency in args.concurrency:
+        elapsed, expressions, calls, peak, waited = run_once(
+            chunks, args.latency, concurrency, args.rpm, args.tpm, args.max_total
+        )
+        print(
+            f"{concurrency:>11} | {elapsed:>8.2f} | {calls / elapsed:>8.2f} | {calls:>5} | "
+            f"{peak:>4} | {waited:>11.2f} | {expressions:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for dual-subtitle timestamp alignment (fuzzy_match_by_timestamp).
+
+Compares the indexed aligner with the previous all-pairs implementation on a
+real episode pair (--source/--target .srt files) or, by default, on a
+synthetic pair of ~2,000 cues with jittered timings, and checks that both
+produce the same pairs.
+
+Usage:
+    python tools/benchmark_subtitle_alignment.py \
+        [--source "media/Show/3_Korean.srt" --target "media/Show/6_English.srt"] \
+        [--cues 2000] [--repeat 3] [--skip-legacy]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import langflix modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langflix.core.dual_subtitle import (
+    DualSubtitleService,
+    SubtitleEntry,
+    filter_dialogue_entries,
+    fuzzy_match_by_timestamp,
+)
+
+
+def legacy_fuzzy_match_by_timestamp(source_entries, target_entries, tolerance_seconds=1.0):
+    """Previous O(n·m) implementation, kept here as the reference."""
+    matched_pairs = []
+    used_target_indices = set()
+    for source in source_entries:
+        source_start = source.start_seconds
+        source_end = source.end_seconds
+        source_mid = (source_start + source_end) / 2
+        best_match = None
+        best_overlap = -1
+        best_target_idx = -1
+        for idx, target in enumerate(target_entries):
+            if idx in used_target_indices:
+                continue
+            target_start = target.start_seconds
+            target_end = target.end_seconds
+            target_mid = (target_start + target_end) / 2
+            overlap = max(0, min(source_end, target_end) - max(source_start, target_start))
+            mid_distance = abs(source_mid - target_mid)
+            if overlap > 0 or mid_distance < tolerance_seconds:
+                score = overlap if overlap > 0 else (1.0 / (mid_distance + 0.1))
+                if score > best_overlap:
+                    best_overlap = score
+                    best_match = target
+                    best_target_idx = idx
+        if best_match is not None:
+            matched_pairs.append((source, best_match))
+            used_target_indices.add(best_target_idx)
+    return matched_pairs
+
+
+def _timestamp(seconds: float) -> str:
+    millis = int(round(seconds * 1000))
+    return f"{millis // 3600000:02d}:{millis // 60000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def build_synthetic_pair(num_cues: int, seed: int = 42):
+    """Two cue lists of one episode with different segmentation and timing jitter."""
+    rng = random.Random(seed)
+    source, target = [], []
+    t = 5.0
+    for i in range(num_cues):
+        duration = rng.uniform(0.8, 5.0)
+        source.append(SubtitleEntry(index=i + 1, start_time=_timestamp(t), end_time=_timestamp(t + duration), text=f"src {i}"))
+        # Target cues: shifted, occasionally merged/dropped
+        if rng.random() > 0.05:
+            shift = rng.uniform(-0.4, 0.4)
+            target.append(SubtitleEntry(
+                index=len(target) + 1,
+                start_time=_timestamp(max(0.0, t + shift)),
+                end_time=_timestamp(t + duration + shift + rng.uniform(-0.3, 0.6)),
+                text=f"tgt {i}",
+            ))
+        t += duration + rng.uniform(0.05, 2.0)
+    return source, target
+
+
+def load_pair(source_path: str, target_path: str):
+    service = DualSubtitleService()
+    return (
+        filter_dialogue_entries(service._parse_subtitle_file(source_path)),
+        filter_dialogue_entries(service._parse_subtitle_file(target_path)),
+    )
+
+
+def timed(fn, source, target, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(source, target, tolerance_seconds=1.0)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dual-subtitle timestamp alignment")
+    parser.add_argument("--source", help="Source language .srt (default: synthetic)")
+    parser.add_argument("--target", help="Target language .srt (default: synthetic)")
+    parser.add_argument("--cues", type=int, default=2000, help="Synthetic cues per language")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the indexed aligner")
+    args = parser.parse_args()
+
+    if args.source and args.target:
+        source, target = load_pair(args.source, args.target)
+        label = f"{Path(args.source).name} / {Path(args.target).name}"
+    else:
+        source, target = build_synthetic_pair(args.cues)
+        label = "synthetic"
+    print(f"Aligning {len(source)} source / {len(target)} target cues ({label})")
+
+    new_time, new_pairs = timed(fuzzy_match_by_timestamp, source, target, args.repeat)
+    print(f"  indexed aligner: {new_time * 1000:8.1f} ms  ({len(new_pairs)} pairs)")
+
+    if not args.skip_legacy:
+        old_time, old_pairs = timed(legacy_fuzzy_match_by_timestamp, source, target, args.repeat)
+        print(f"  all-pairs scan:  {old_time * 1000:8.1f} ms  ({len(old_pairs)} pairs)")
+        same = [(s.text, t.text) for s, t in new_pairs] == [(s.text, t.text) for s, t in old_pairs]
+        print(f"  speedup: {old_time / new_time:.1f}x, identical pairs: {same}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark for subtitle file parsing (parse_srt_file / parse_smi_file).
+
+Compares the streaming parsers with the previous implementations (whole-file
+chardet, global timestamp regex, pysrt objects per cue) on the repo's sample
+subtitles plus a synthetic full-length episode, and checks that both produce
+the same entries.
+
+Usage:
+    python tools/benchmark_subtitle_parser.py [FILE ...] [--cues 1500] [--repeat 5]
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import langflix modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pysrt
+
+from langflix.core.subtitle_parser import _seconds_to_time_string, parse_smi_file, parse_srt_file
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "subtitles"
+
+
+def _legacy_read(file_path):
+    """Previous encoding handling: chardet over the whole file, then a full text read."""
+    import chardet
+    with open(file_path, 'rb') as f:
+        encoding = chardet.detect(f.read())['encoding'] or 'utf-8'
+    with open(file_path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def legacy_parse_srt_file(file_path):
+    """Previous pysrt-based implementation, kept here as the reference."""
+    content = _legacy_read(file_path)
+    content = re.sub(r'(\d{2}:\d{2}:\d{2})[.,](\d{3})\d*', lambda m: f"{m.group(1)},{m.group(2)}", content)
+    subs = pysrt.from_string(content)
+    return [
+        {'start_time': str(sub.start.to_time()), 'end_time': str(sub.end.to_time()), 'text': sub.text}
+        for sub in subs
+    ]
+
+
+def legacy_parse_smi_file(file_path):
+    """Previous regex implementation (patterns compiled per call and per cue)."""
+    content = _legacy_read(file_path)
+    sync_matches = re.findall(r'<SYNC\s+Start=(\d+)>(.*?)</SYNC>', content, re.DOTALL | re.IGNORECASE)
+    if not sync_matches:
+        sync_matches = re.findall(r'<SYNC\s+Start=(\d+)>(.*?)(?=<SYNC|</BODY>|$)', content, re.DOTALL | re.IGNORECASE)
+    html_entities = {'&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&apos;': "'"}
+    result = []
+    for i, (start_attr, sync_content) in enumerate(sync_matches):
+        start_seconds = int(start_attr) / 1000.0
+        end_seconds = int(sync_matches[i + 1][0]) / 1000.0 if i + 1 < len(sync_matches) else start_seconds + 2.0
+        text_parts = []
+        for p_content in re.findall(r'<P[^>]*>(.*?)</P>', sync_content, re.DOTALL | re.IGNORECASE):
+            text = re.sub(r'<[^>]+>', '', p_content)
+            for entity, char in html_entities.items():
+                text = text.replace(entity, char)
+            text = text.strip()
+            if text:
+                text_parts.append(text)
+        if not text_parts:
+            text = re.sub(r'<[^>]+>', '', sync_content)
+            for entity, char in html_entities.items():
+                text = text.replace(entity, char)
+            text = text.strip()
+            if text:
+                text_parts.append(text)
+        if text_parts:
+            result.append({
+                'start_time': _seconds_to_time_string(start_seconds),
+                'end_time': _seconds_to_time_string(end_seconds),
+                'text': '\n'.join(text_parts),
+            })
+    return result
+
+
+def _timestamp(millis: int) -> str:
+    return f"{millis // 3600000:02d}:{millis // 60000 % 60:02d}:{millis // 1000 % 60:02d},{millis % 1000:03d}"
+
+
+def write_synthetic_files(directory: Path, num_cues: int):
+    """A full-length episode as .srt and .smi (two-line cues, some italics/entities)."""
+    srt_lines, smi_lines = [], ["<SAMI><BODY>"]
+    t = 2000
+    for i in range(num_cues):
+        duration = 800 + (i * 37) % 4200
+        text = f"Line {i}: you can't just walk in here,\n<i>Harvey</i> & Mike - {i * 7 % 1000}"
+        srt_lines.append(f"{i + 1}\n{_timestamp(t)} --> {_timestamp(t + duration)}\n{text}\n")
+        smi_lines.append(f"<SYNC Start={t}><P Class=ENCC>{text.replace('&', '&amp;').replace(chr(10), '<br>')}</P></SYNC>")
+        t += duration + 50 + (i * 13) % 900
+    smi_lines.append("</BODY></SAMI>")
+
+    srt_path = directory / "synthetic_episode.srt"
+    smi_path = directory / "synthetic_episode.smi"
+    srt_path.write_text("\n".join(srt_lines), encoding="utf-8")
+    smi_path.write_text("\n".join(smi_lines), encoding="utf-8")
+    return [srt_path, smi_path]
+
+
+def timed(fn, file_path, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(str(file_path))
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark subtitle file parsing")
+    parser.add_argument("files", nargs="*", help="Subtitle files (default: repo fixtures + synthetic episode)")
+    parser.add_argument("--cues", type=int, default=1500, help="Cues in the synthetic episode")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    identical = True
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(f) for f in args.files]
+        if not files:
+            files = sorted(FIXTURES.glob("*.srt")) + sorted(FIXTURES.glob("*.smi"))
+            files += write_synthetic_files(Path(tmp), args.cues)
+
+        for file_path in files:
+            if file_path.suffix.lower() == ".smi":
+                new_fn, old_fn = parse_smi_file, legacy_parse_smi_file
+            else:
+                new_fn, old_fn = parse_srt_file, legacy_parse_srt_file
+
+            new_time, new_entries = timed(new_fn, file_path, args.repeat)
+            old_time, old_entries = timed(old_fn, file_path, args.repeat)
+            same = new_entries == old_entries
+            identical = identical and same
+            print(f"{file_path.name} ({len(new_entries)} cues)")
+            print(f"  streaming parser: {new_time * 1000:8.2f} ms")
+            print(f"  previous parser:  {old_time * 1000:8.2f} ms")
+            print(f"  speedup: {old_time / new_time:.1f}x, identical entries: {same}")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()